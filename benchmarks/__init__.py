@@ -0,0 +1,3 @@
+"""
+Benchmarks for the TyC compiler front end
+"""
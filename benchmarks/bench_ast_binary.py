@@ -0,0 +1,52 @@
+"""
+Binary AST encoding vs re-parsing.
+
+Parses a large generated program to an AST, encodes it with
+utils.ast_binary, and compares the time to rebuild the AST from the encoding
+(from bytes and from a memory-mapped file) with the time to lex, parse and
+run ASTGeneration again. Also reports the encoded size next to the source
+and printed-AST sizes.
+
+    python -m benchmarks.bench_ast_binary [n_funcs]
+"""
+
+import os
+import sys
+import tempfile
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+    from src.utils.ast_binary import dump, dumps, load, loads
+
+    source = synthetic_program(n_funcs)
+    parse_seconds, ast = timed(lambda: ASTGeneration().visit(parse(make_parser(source))))
+    encode_seconds, data = timed(dumps, ast, repeat=3)
+    decode_seconds, back = timed(loads, data, repeat=3)
+    assert str(back) == str(ast)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "program.tyca")
+        with open(path, "wb") as f:
+            dump(ast, f)
+        mmap_seconds, _ = timed(load, path, repeat=3)
+    print(
+        f"{n_funcs} functions: source {len(source) / 1024:.0f} KiB, "
+        f"str(ast) {len(str(ast)) / 1024:.0f} KiB, encoded {len(data) / 1024:.0f} KiB"
+    )
+    print_table(
+        ["step", "seconds", "vs parse"],
+        [
+            ("lex + parse + ASTGeneration", f"{parse_seconds:.3f}", "1.0x"),
+            ("dumps", f"{encode_seconds:.3f}", f"{parse_seconds / encode_seconds:.1f}x"),
+            ("loads (bytes)", f"{decode_seconds:.3f}", f"{parse_seconds / decode_seconds:.1f}x"),
+            ("load (mmap)", f"{mmap_seconds:.3f}", f"{parse_seconds / mmap_seconds:.1f}x"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
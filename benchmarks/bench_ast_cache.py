@@ -0,0 +1,56 @@
+"""
+Cold vs warm runs of the on-disk AST cache.
+
+Generates a set of distinct programs and builds their ASTs three ways:
+without the cache, through an empty cache (every lookup misses and writes
+an entry), and through the filled cache (every lookup hits).
+
+    python -m benchmarks.bench_ast_cache [n_files] [n_funcs]
+"""
+
+import sys
+import tempfile
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def main():
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    n_funcs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    from src.astgen.ast_cache import ASTCache, build_ast
+
+    # A comment makes every file distinct
+    sources = [f"// file {i}\n" + synthetic_program(n_funcs) for i in range(n_files)]
+
+    def uncached():
+        return [build_ast(s)[0] for s in sources]
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ASTCache(directory)
+
+        def cached():
+            return [cache.generate(s).ast for s in sources]
+
+        plain_seconds, expected = timed(uncached)
+        cold_seconds, _ = timed(cached)
+        warm_seconds, warm = timed(cached, repeat=3)
+        assert [str(a) for a in warm] == [str(a) for a in expected]
+        usage = cache.usage()
+        stats = cache.stats
+
+    print(f"{n_files} files x {n_funcs} functions, cache {usage / 1024:.0f} KiB, {stats}")
+    print_table(
+        ["run", "seconds", "ms/file", "vs uncached"],
+        [
+            (name, f"{t:.3f}", f"{t * 1000 / n_files:.1f}", f"{plain_seconds / t:.1f}x")
+            for name, t in (
+                ("no cache", plain_seconds),
+                ("cold cache (miss + write)", cold_seconds),
+                ("warm cache (hit)", warm_seconds),
+            )
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
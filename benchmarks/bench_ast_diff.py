@@ -0,0 +1,72 @@
+"""
+Comparing ASTs: str() equality vs structural == vs hash-guided diff.
+
+Builds two ASTs of a large generated program that differ in one return
+statement, in the first function or in the last one, and times str(a) ==
+str(b), a == b, and diff(a, b). diff is timed twice: with cold hashes
+(the timing includes clearing them with a walk, then diff hashes both
+trees) and with the hashes already cached, where it only descends along
+the path to the change and confirms the subtrees beside it with equal(),
+as equal hashes may collide.
+
+    python -m benchmarks.bench_ast_diff [n_funcs]
+"""
+
+import sys
+
+from benchmarks.common import FUNC_TEMPLATE, print_table, synthetic_program, timed
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+    from src.utils.ast_diff import clear_hash, diff
+    from src.utils.visitor import ASTWalker
+
+    def build(source):
+        return ASTGeneration().visit(parse(make_parser(source)))
+
+    def clear_all(tree):
+        class Clear(ASTWalker):
+            def pre(self, node, parent):
+                clear_hash(node)
+
+        Clear().walk(tree)
+
+    source = synthetic_program(n_funcs)
+    a = build(source)
+    rows = []
+    for where, i in (("first function", 0), ("last function", n_funcs - 1)):
+        body = FUNC_TEMPLATE.format(i=i, j=max(i - 1, 0))
+        b = build(source.replace(body, body.replace("return s;", "return s + 1;")))
+        str_seconds, same = timed(lambda: str(a) == str(b), repeat=3)
+        eq_seconds, equal = timed(lambda: a == b, repeat=3)
+        assert not same and not equal
+
+        def cold_diff():
+            clear_all(a)
+            clear_all(b)
+            return diff(a, b)
+
+        cold_seconds, changes = timed(cold_diff, repeat=3)
+        warm_seconds, changes = timed(diff, a, b, repeat=3)
+        assert len(changes) == 1
+        rows.append(
+            (
+                where,
+                f"{str_seconds * 1000:.1f} ms",
+                f"{eq_seconds * 1000:.3f} ms",
+                f"{cold_seconds * 1000:.1f} ms",
+                f"{warm_seconds * 1000:.3f} ms",
+            )
+        )
+    print(f"{n_funcs} functions")
+    print_table(
+        ["change in", "str(a) == str(b)", "a == b", "diff (cold hashes)", "diff (cached hashes)"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Memory held by the AST: __slots__ node classes vs per-instance __dict__.
+
+Each variant builds the AST of a large generated program in a fresh
+process. The parse tree is built first and kept alive, so the numbers
+cover the AST only: traced bytes still allocated after ASTGeneration, and
+the growth of the process RSS while the AST is built. The "__dict__"
+variant loads src/utils/nodes.py with its __slots__ declarations removed,
+i.e. the node classes as they were before.
+
+    python -m benchmarks.bench_ast_memory [n_funcs]
+"""
+
+import gc
+import importlib.util
+import json
+import os
+import re
+import sys
+import tracemalloc
+
+from benchmarks.common import (
+    ROOT,
+    current_rss_kb,
+    print_table,
+    run_isolated,
+    synthetic_program,
+    timed,
+)
+
+
+def load_dict_nodes():
+    """Install a copy of src.utils.nodes without __slots__."""
+    path = os.path.join(ROOT, "src", "utils", "nodes.py")
+    with open(path, encoding="utf-8") as f:
+        source = re.sub(r"(?m)^    __slots__ = .*$", "    pass", f.read())
+    spec = importlib.util.spec_from_loader("src.utils.nodes", loader=None)
+    module = importlib.util.module_from_spec(spec)
+    module.__file__ = path
+    exec(compile(source, path, "exec"), module.__dict__)
+    sys.modules["src.utils.nodes"] = module
+
+
+def count_nodes(ast):
+    from src.utils.nodes import ASTNode
+
+    count = 0
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, ASTNode):
+            count += 1
+            fields = node.__dict__ if hasattr(node, "__dict__") else {
+                name: getattr(node, name)
+                for cls in type(node).__mro__
+                for name in getattr(cls, "__slots__", ())
+            }
+            stack.extend(fields.values())
+    return count
+
+
+def child(variant: str, n_funcs: int):
+    if variant == "__dict__":
+        load_dict_nodes()
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+
+    tree = parse(make_parser(synthetic_program(n_funcs)))
+    gc.collect()
+    rss_before = current_rss_kb()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    seconds, ast = timed(ASTGeneration().visit, tree)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    rss_after = current_rss_kb()
+    print(
+        json.dumps(
+            {
+                "nodes": count_nodes(ast),
+                "bytes": held,
+                "rss_kb": rss_after - rss_before,
+                "seconds": seconds,
+            }
+        )
+    )
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rows = []
+    for variant in ("__dict__", "__slots__"):
+        r = run_isolated("benchmarks.bench_ast_memory", "--child", variant, str(n_funcs))
+        rows.append(
+            (
+                variant,
+                r["nodes"],
+                f"{r['bytes'] / 2**20:.1f}",
+                f"{r['bytes'] / r['nodes']:.1f}",
+                f"{r['rss_kb'] / 1024:.1f}",
+                f"{r['seconds']:.2f}",
+            )
+        )
+    print_table(
+        ["node classes", "nodes", "AST MiB", "bytes/node", "AST RSS MiB", "build seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,55 @@
+"""
+Iterative AST printer vs the recursive per-node __str__ it replaced.
+
+Prints a large generated program (wide, shallow tree) and right-nested
+expression chains of growing depth with both. The recursive reference
+copies a node's text once per level above it, so its cost grows with
+size x depth, and it needs a raised recursion limit for deep chains.
+
+    python -m benchmarks.bench_ast_printer [n_funcs]
+"""
+
+import sys
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def chain(depth):
+    from src.utils import nodes
+
+    expr = nodes.Identifier("x")
+    for i in range(depth):
+        expr = nodes.BinaryOp(nodes.IntLiteral(i), "+", expr)
+    return expr
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+    from src.utils.ast_printer import to_string
+    from tests.test_ast_printer import legacy_str
+
+    sys.setrecursionlimit(100_000)
+    program = ASTGeneration().visit(parse(make_parser(synthetic_program(n_funcs))))
+    cases = [(f"program ({n_funcs} functions)", program)]
+    cases += [(f"chain depth {d}", chain(d)) for d in (100, 1000, 5000)]
+    rows = []
+    for name, tree in cases:
+        legacy_seconds, expected = timed(legacy_str, tree, repeat=3)
+        new_seconds, text = timed(to_string, tree, repeat=3)
+        assert text == expected
+        rows.append(
+            (
+                name,
+                f"{len(text) / 1024:.0f}",
+                f"{legacy_seconds * 1000:.1f}",
+                f"{new_seconds * 1000:.1f}",
+                f"{legacy_seconds / new_seconds:.1f}x",
+            )
+        )
+    print_table(["tree", "KiB", "recursive ms", "iterative ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+AST generation on deep inputs: input size vs time and peak memory.
+
+Builds the AST of one `r = x0 + x1 + ...;` chain of growing length, with
+the generated expression rule (a left-recursive parse tree as deep as the
+chain, converted by ASTGeneration's explicit frame stack) and with the
+precedence-climbing parser (the expression nodes are built while parsing).
+Each size runs in a fresh process at the default recursion limit; the
+table shows the parse and AST generation times, the peak traced memory of
+AST generation on top of the parse tree (measured in a second run, as
+tracing slows it down), and the peak RSS of the process.
+
+    python -m benchmarks.bench_astgen_scaling [max_terms]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from benchmarks.common import expression_chain, peak_rss_kb, print_table, run_isolated, timed
+
+
+def child(expressions: str, n_terms: int):
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+
+    parser = make_parser(expression_chain(n_terms), expressions=expressions)
+    parse_seconds, tree = timed(parse, parser)
+    gen_seconds, ast = timed(ASTGeneration().visit, tree)
+    del ast
+    gc.collect()
+    tracemalloc.start()  # a second, traced run: tracing slows it down
+    ast = ASTGeneration().visit(tree)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert ast.decls[0].body.statements[0].expr.rhs.operator == "+"
+    print(
+        json.dumps(
+            {
+                "parse": parse_seconds,
+                "astgen": gen_seconds,
+                "peak_bytes": peak,
+                "peak_rss_kb": peak_rss_kb(),
+            }
+        )
+    )
+
+
+def main():
+    max_terms = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT
+
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= max_terms]
+    rows = []
+    for n_terms in sizes:
+        for expressions in (EXPR_ANTLR, EXPR_PRATT):
+            r = run_isolated(
+                "benchmarks.bench_astgen_scaling", "--child", expressions, str(n_terms)
+            )
+            rows.append(
+                (
+                    n_terms,
+                    expressions,
+                    f"{r['parse']:.2f}",
+                    f"{r['astgen']:.2f}",
+                    f"{r['astgen'] / n_terms * 1e6:.1f}",
+                    f"{r['peak_bytes'] / 2**20:.1f}",
+                    f"{r['peak_rss_kb'] / 1024:.0f}",
+                )
+            )
+    print(f"recursion limit {sys.getrecursionlimit()} (unchanged)")
+    print_table(
+        [
+            "terms",
+            "expressions",
+            "parse s",
+            "astgen s",
+            "astgen us/term",
+            "astgen peak MiB",
+            "peak RSS MiB",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,43 @@
+"""
+Tokenizing many small submissions: a lexer per source vs tokenize_batch().
+
+    python -m benchmarks.bench_batch_tokenize [n_sources] [workers]
+"""
+
+import os
+import sys
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def per_source(sources):
+    from tests.utils import Tokenizer
+
+    return [Tokenizer(s).get_tokens_as_string() for s in sources]
+
+
+def main():
+    from src.frontend.batch import tokenize_batch
+
+    n_sources = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else min(4, os.cpu_count() or 1)
+    sources = [synthetic_program(1).replace("f0", f"g{i}") for i in range(n_sources)]
+    if n_sources > 1:
+        sources[1] = sources[1] + ' "unterminated'
+
+    rows = []
+    seconds, _ = timed(per_source, sources)
+    rows.append(("Tokenizer per source", f"{seconds:.2f}", f"{n_sources / seconds:.0f}"))
+    seconds, batch = timed(tokenize_batch, sources)
+    rows.append(("tokenize_batch", f"{seconds:.2f}", f"{n_sources / seconds:.0f}"))
+    if workers > 1:
+        seconds, _ = timed(tokenize_batch, sources, workers)
+        rows.append(
+            (f"tokenize_batch, {workers} workers", f"{seconds:.2f}", f"{n_sources / seconds:.0f}")
+        )
+    print(f"{n_sources} sources, {batch.token_count} tokens, {len(batch.errors)} lexical errors")
+    print_table(["variant", "seconds", "sources/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Cold vs warm first-parse latency with the persistent DFA cache.
+
+Each measurement runs in a fresh interpreter so the class-level DFAs start
+empty, exactly like a short batch compile job.
+
+    python -m benchmarks.bench_dfa_cache [n_funcs]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import print_table, run_isolated, synthetic_program
+
+
+def child(mode: str, cache_path: str, n_funcs: int):
+    from src.frontend import dfa_cache
+    from src.frontend.parsing import make_parser, parse
+
+    source = synthetic_program(n_funcs)
+    start = time.perf_counter()
+    if mode == "warm":
+        assert dfa_cache.load(cache_path)
+    loaded = time.perf_counter()
+    parse(make_parser(source))
+    first = time.perf_counter()
+    parse(make_parser(source))
+    second = time.perf_counter()
+    print(
+        json.dumps(
+            {
+                "load_ms": (loaded - start) * 1000,
+                "first_ms": (first - loaded) * 1000,
+                "second_ms": (second - first) * 1000,
+            }
+        )
+    )
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "dfa.json")
+        from src.frontend import dfa_cache
+
+        dfa_cache.warm_up([synthetic_program(5)])
+        dfa_cache.save(cache_path)
+        size = os.path.getsize(cache_path)
+
+        rows = []
+        for mode in ("cold", "warm"):
+            runs = [
+                run_isolated("benchmarks.bench_dfa_cache", "--child", mode, cache_path, str(n_funcs))
+                for _ in range(3)
+            ]
+            best = min(runs, key=lambda r: r["load_ms"] + r["first_ms"])
+            rows.append(
+                (
+                    mode,
+                    f"{best['load_ms']:.1f}",
+                    f"{best['first_ms']:.1f}",
+                    f"{best['load_ms'] + best['first_ms']:.1f}",
+                    f"{best['second_ms']:.1f}",
+                )
+            )
+    print(f"Program: {n_funcs} functions; cache file: {size / 1024:.1f} KiB")
+    print_table(
+        ["mode", "load ms", "first parse ms", "total ms", "second parse ms"], rows
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        main()
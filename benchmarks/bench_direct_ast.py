@@ -0,0 +1,88 @@
+"""
+Two-phase parse tree + ASTGeneration vs direct-to-AST parsing.
+
+Each variant turns a large generated program into its AST in a fresh
+process: "two-phase" parses with buildParseTrees on and converts the
+parse tree with ASTGeneration; "direct" runs src.astgen.direct_ast, which
+builds the nodes from parse listener callbacks with buildParseTrees off.
+Both variants first parse a small program to warm the DFA, then time the
+whole pipeline from the source string (lexing included). The table shows
+the wall time, the peak RSS of the process, and its growth over the RSS
+before the pipeline ran.
+
+    python -m benchmarks.bench_direct_ast [n_funcs] [expressions]
+"""
+
+import gc
+import json
+import sys
+
+from benchmarks.common import (
+    current_rss_kb,
+    peak_rss_kb,
+    print_table,
+    run_isolated,
+    synthetic_program,
+    timed,
+)
+
+
+VARIANTS = ("two-phase", "direct")
+
+
+def child(variant: str, n_funcs: int, expressions: str):
+    from src.astgen.ast_generation import ASTGeneration
+    from src.astgen.direct_ast import parse_to_ast
+    from src.frontend.parsing import make_parser, parse
+
+    def two_phase(source):
+        tree = parse(make_parser(source, expressions=expressions))
+        return ASTGeneration().visit(tree)
+
+    def direct(source):
+        return parse_to_ast(make_parser(source, expressions=expressions))
+
+    build = two_phase if variant == "two-phase" else direct
+    build(synthetic_program(20))  # warm the DFA
+    source = synthetic_program(n_funcs)
+    gc.collect()
+    rss_before = current_rss_kb()
+    seconds, ast = timed(build, source)
+    print(
+        json.dumps(
+            {
+                "seconds": seconds,
+                "peak_rss_kb": peak_rss_kb(),
+                "growth_kb": peak_rss_kb() - rss_before,
+                "decls": len(ast.decls),
+            }
+        )
+    )
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    expressions = sys.argv[2] if len(sys.argv) > 2 else "antlr"
+    rows = []
+    for variant in VARIANTS:
+        r = run_isolated(
+            "benchmarks.bench_direct_ast", "--child", variant, str(n_funcs), expressions
+        )
+        assert r["decls"] == n_funcs + 1
+        rows.append(
+            (
+                variant,
+                f"{r['seconds']:.2f}",
+                f"{r['peak_rss_kb'] / 1024:.1f}",
+                f"{r['growth_kb'] / 1024:.1f}",
+            )
+        )
+    print(f"{n_funcs} functions, {expressions} expressions")
+    print_table(["pipeline", "seconds", "peak RSS MiB", "RSS growth MiB"], rows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main()
@@ -0,0 +1,75 @@
+"""
+Object-tree AST vs flat (struct-of-arrays) AST store.
+
+Builds the AST of a large generated program, flattens it, and reports the
+traced bytes each representation holds and the time of a full pre-order
+walk over each (an explicit-stack walk over node fields vs FlatAST.walk),
+plus the conversion times.
+
+    python -m benchmarks.bench_flat_ast [n_funcs]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def walk_tree(root):
+    from src.utils.node_schema import FIELDS, LIST, NODE
+
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        for name, kind in FIELDS[type(node)]:
+            value = getattr(node, name)
+            if kind == NODE:
+                if value is not None:
+                    stack.append(value)
+            elif kind == LIST:
+                stack.extend(value)
+    return count
+
+
+def held_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held, result
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+    from src.utils.flat_ast import FlatAST
+
+    tree = parse(make_parser(synthetic_program(n_funcs)))
+    tree_bytes, ast = held_bytes(lambda: ASTGeneration().visit(tree))
+    del tree
+    flat_bytes, flat = held_bytes(lambda: FlatAST.from_tree(ast))
+    flatten_seconds, _ = timed(FlatAST.from_tree, ast)
+    rebuild_seconds, _ = timed(flat.to_tree)
+    tree_walk, count = timed(walk_tree, ast, repeat=3)
+    flat_walk, _ = timed(lambda: sum(1 for _ in flat.walk()), repeat=3)
+    n = len(flat)
+    assert count == n
+    print_table(
+        ["representation", "nodes", "MiB", "bytes/node", "walk ms", "convert s"],
+        [
+            ("object tree", n, f"{tree_bytes / 2**20:.1f}", f"{tree_bytes / n:.1f}",
+             f"{tree_walk * 1000:.1f}", f"{rebuild_seconds:.2f} (to_tree)"),
+            ("FlatAST", n, f"{flat_bytes / 2**20:.1f}", f"{flat_bytes / n:.1f}",
+             f"{flat_walk * 1000:.1f}", f"{flatten_seconds:.2f} (from_tree)"),
+        ],
+    )  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Edit latency of incremental reparsing against file size.
+
+For generated programs of growing size, a src.frontend.incremental
+IncrementalParser is built once, then a keystroke is simulated in the
+function at the start, in the middle and at the end of the file: one
+character typed into an expression and removed again, each keystroke
+being an edit() whose result is the updated Program. The table shows the
+median latency of a keystroke at each place, next to the time a full
+re-lex and re-parse of the file (parse + ASTGeneration) takes. The
+incremental cost is the edited function: the shift of the tokens and
+spans after the edit is left pending, and the place is located once,
+so the keystrokes do not read the program in between.
+
+    python -m benchmarks.bench_incremental [max_funcs]
+"""
+
+import statistics
+import sys
+import time
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def keystroke_ms(doc, decl_index: int, n_keystrokes: int = 10) -> float:
+    """Median latency of typing one character into decls[decl_index] and deleting it."""
+    samples = []
+    decl = doc.program.decls[decl_index]
+    at = doc.text.index("s + k", decl.start_offset) + 1
+    for _ in range(n_keystrokes):
+        for start, end, text in ((at, at, "1"), (at, at + 1, "")):
+            begin = time.perf_counter()
+            doc.edit(start, end, text)
+            samples.append(time.perf_counter() - begin)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.incremental import IncrementalParser
+    from src.frontend.parsing import make_parser, parse
+
+    max_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    sizes = [n for n in (125, 250, 500, 1000, 2000, 4000) if n <= max_funcs]
+    IncrementalParser(synthetic_program(20))  # warm the DFA
+    rows = []
+    for n_funcs in sizes:
+        source = synthetic_program(n_funcs)
+        full, _ = timed(lambda: ASTGeneration().visit(parse(make_parser(source))))
+        doc = IncrementalParser(source)
+        rows.append(
+            [
+                n_funcs,
+                f"{len(source) / 1024:.0f}",
+                f"{full * 1000:.0f}",
+                *(f"{keystroke_ms(doc, i):.2f}" for i in (1, n_funcs // 2, n_funcs)),
+            ]
+        )
+    print_table(
+        [
+            "functions",
+            "file KiB",
+            "full reparse ms",
+            "edit at start ms",
+            "edit in middle ms",
+            "edit at end ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
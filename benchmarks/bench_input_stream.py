@@ -0,0 +1,80 @@
+"""
+Peak RSS of antlr4.InputStream vs the memory-mapped ByteInputStream.
+
+Each variant opens a large generated TyC file in a fresh process, walks
+every character through LA()/consume() like the lexer does, then lexes
+the first few thousand tokens with TyCLexer.
+
+    python -m benchmarks.bench_input_stream [megabytes]
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from benchmarks.common import peak_rss_kb, print_table, run_isolated, synthetic_program, timed
+
+
+def child(variant: str, path: str):
+    from antlr4 import FileStream
+
+    from build.TyCLexer import TyCLexer
+    from src.frontend.streams import open_source
+
+    baseline = peak_rss_kb()
+
+    def run():
+        stream = FileStream(path) if variant == "InputStream" else open_source(path)
+        lexer = TyCLexer(stream)
+        for _ in range(5000):
+            lexer.nextToken()
+        stream.seek(0)
+        la, consume, checksum = stream.LA, stream.consume, 0
+        for _ in range(stream.size):
+            checksum += la(1)
+            consume()
+        return checksum
+
+    seconds, _ = timed(run)
+    print(
+        json.dumps(
+            {"baseline_kb": baseline, "peak_kb": peak_rss_kb(), "seconds": seconds}
+        )
+    )
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    unit = synthetic_program(50)
+    copies = max(1, int(megabytes * 1e6 / len(unit)))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.tyc")
+        with open(path, "w") as f:
+            for _ in range(copies):
+                f.write(unit)
+        size = os.path.getsize(path)
+        rows = []
+        for variant in ("InputStream", "ByteInputStream (mmap)"):
+            r = run_isolated("benchmarks.bench_input_stream", "--child", variant, path)
+            grown = r["peak_kb"] - r["baseline_kb"]
+            rows.append(
+                (
+                    variant,
+                    f"{r['peak_kb'] / 1024:.1f}",
+                    f"{grown / 1024:.1f}",
+                    f"{grown * 1024 / size:.1f}",
+                    f"{r['seconds']:.2f}",
+                )
+            )
+    print(f"Input: {size / 1e6:.1f} MB")
+    print_table(
+        ["stream", "peak RSS MiB", "growth MiB", "bytes/char", "seconds"], rows
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
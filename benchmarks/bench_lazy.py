@@ -0,0 +1,89 @@
+"""
+Signature-only work over eager vs lazy function bodies.
+
+Each variant turns a large generated program into a Program in a fresh
+process and then lists the signature (name, return type, parameter
+types) of every function, as a struct layout checker or a call-graph
+front end does: "eager" parses everything and converts it with
+ASTGeneration; "lazy" uses src.frontend.lazy.parse_lazy(), which skips
+the function bodies; "lazy, all bodies" does the same and then reads
+every FuncDecl.body, the worst case for a tool that turns out to need
+them all. The DFA is warmed on a small program first. The table shows
+the wall time and the growth of the peak RSS over the RSS before the run.
+
+    python -m benchmarks.bench_lazy [n_funcs] [expressions]
+"""
+
+import gc
+import json
+import sys
+
+from benchmarks.common import (
+    current_rss_kb,
+    peak_rss_kb,
+    print_table,
+    run_isolated,
+    synthetic_program,
+    timed,
+)
+
+
+VARIANTS = ("eager", "lazy", "lazy, all bodies")
+
+
+def child(variant: str, n_funcs: int, expressions: str):
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.lazy import parse_lazy
+    from src.frontend.parsing import make_parser, parse
+    from src.utils.nodes import FuncDecl
+
+    def signatures(program):
+        return [
+            (d.name, d.return_type, [p.param_type for p in d.params])
+            for d in program.decls
+            if isinstance(d, FuncDecl)
+        ]
+
+    def eager(source):
+        return signatures(ASTGeneration().visit(parse(make_parser(source, expressions=expressions))))
+
+    def lazy(source):
+        return signatures(parse_lazy(source, expressions=expressions))
+
+    def lazy_all(source):
+        program = parse_lazy(source, expressions=expressions)
+        for decl in program.decls:
+            if isinstance(decl, FuncDecl):
+                decl.body
+        return signatures(program)
+
+    run = dict(zip(VARIANTS, (eager, lazy, lazy_all)))[variant]
+    run(synthetic_program(20))  # warm the DFA
+    source = synthetic_program(n_funcs)
+    gc.collect()
+    rss_before = current_rss_kb()
+    seconds, result = timed(run, source)
+    print(
+        json.dumps(
+            {"seconds": seconds, "growth_kb": peak_rss_kb() - rss_before, "funcs": len(result)}
+        )
+    )
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    expressions = sys.argv[2] if len(sys.argv) > 2 else "antlr"
+    rows = []
+    for variant in VARIANTS:
+        r = run_isolated("benchmarks.bench_lazy", "--child", variant, str(n_funcs), expressions)
+        assert r["funcs"] == n_funcs
+        rows.append((variant, f"{r['seconds']:.2f}", f"{r['growth_kb'] / 1024:.1f}"))
+    print(f"{n_funcs} functions, {expressions} expressions")
+    print_table(["pipeline", "seconds", "RSS growth MiB"], rows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main()
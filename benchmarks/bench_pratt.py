@@ -0,0 +1,83 @@
+"""
+Expression parsing: generated condExpr rule vs precedence-climbing parser.
+
+Parses expression-heavy inputs with both expression parsers and builds the
+AST. The token stream is filled once beforehand, so the timings cover
+parsing and AST generation only. The DFA cache is warm (the inputs are
+parsed once before timing).
+
+    python -m benchmarks.bench_pratt [repeat]
+"""
+
+import random
+import sys
+
+from benchmarks.common import expression_chain, print_table, synthetic_program, timed
+
+
+def nested_expressions(n_stmts: int, seed: int = 9) -> str:
+    """A function of *n_stmts* assignments of mixed-precedence expressions."""
+    rng = random.Random(seed)
+    ops = ["||", "&&", "==", "<", "+", "-", "*", "/"]
+
+    def expr(depth):
+        if depth == 0:
+            return rng.choice(["a", "b.c", "f(x)", "1", "2.5", "-y", "z++"])
+        kind = rng.randrange(4)
+        if kind == 0:
+            return f"({expr(depth - 1)})"
+        if kind == 1:
+            return f"g({expr(depth - 1)}, {expr(depth - 1)})"
+        return f"{expr(depth - 1)} {rng.choice(ops)} {expr(depth - 1)}"
+
+    body = "".join(f"  r = {expr(5)};\n" for _ in range(n_stmts))
+    return f"void main() {{\n{body}}}\n"
+
+
+INPUTS = [
+    ("chain of 150 '+'", expression_chain(150, "+")),
+    ("chain of 150 mixed ops", expression_chain(150, "*").replace("*", "+", 75)),
+    ("chain of 150 '&&'", expression_chain(150, "&&")),
+    ("300 nested expressions", nested_expressions(300)),
+    ("synthetic program (200 funcs)", synthetic_program(200)),
+]
+
+
+def parse_and_build(source, expressions):
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+
+    parser = make_parser(source, expressions=expressions)
+    parser.getTokenStream().fill()
+    return timed(lambda: ASTGeneration().visit(parse(parser)))
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT
+
+    rows = []
+    for name, source in INPUTS:
+        times = {}
+        asts = {}
+        for expressions in (EXPR_ANTLR, EXPR_PRATT):
+            parse_and_build(source, expressions)  # warm the DFA
+            best = None
+            for _ in range(repeat):
+                seconds, asts[expressions] = parse_and_build(source, expressions)
+                best = seconds if best is None else min(best, seconds)
+            times[expressions] = best
+        assert str(asts[EXPR_ANTLR]) == str(asts[EXPR_PRATT]), name
+        rows.append(
+            (
+                name,
+                f"{times[EXPR_ANTLR] * 1000:.1f}",
+                f"{times[EXPR_PRATT] * 1000:.1f}",
+                f"{times[EXPR_ANTLR] / times[EXPR_PRATT]:.1f}x",
+            )
+        )
+    print_table(["input", "antlr ms", "pratt ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Tokenization throughput: generated TyCLexer vs hand-written TyCScanner.
+
+    python -m benchmarks.bench_scanner [n_funcs]
+"""
+
+import sys
+
+from antlr4 import InputStream
+
+from benchmarks.common import print_table, synthetic_program, timed
+from build.TyCLexer import TyCLexer
+from src.frontend.scanner import TyCScanner
+
+
+def drain(source):
+    count = 0
+    while source.nextToken().type != -1:
+        count += 1
+    return count
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    source = synthetic_program(n_funcs)
+    megabytes = len(source) / 1e6
+
+    drain(TyCLexer(InputStream(source)))  # warm the lexer DFA first
+    rows = []
+    for name, make in (
+        ("TyCLexer (ANTLR)", lambda: TyCLexer(InputStream(source))),
+        ("TyCScanner", lambda: TyCScanner(source)),
+    ):
+        seconds, tokens = timed(lambda: drain(make()), repeat=3)
+        rows.append((name, tokens, f"{seconds:.3f}", f"{megabytes / seconds:.2f}"))
+    print(f"Input: {len(source)} chars")
+    print_table(["lexer", "tokens", "seconds", "MB/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
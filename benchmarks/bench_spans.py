@@ -0,0 +1,124 @@
+"""
+Source positions: eager line/column ints vs packed spans with a line index.
+
+Each variant builds the AST of a large generated program in a fresh
+process, after the parse tree, as in bench_ast_memory. "line/column" is
+the previous layout: src/utils/nodes.py is loaded with a second position
+slot, and ASTGeneration stores the first token's line and column in the
+two. "span" is the current one: one slot holds the packed span, and the
+Program holds the LineIndex that position() bisects. The table shows the
+bytes the AST holds, the build time, and what reading the line and
+column of every node costs.
+
+    python -m benchmarks.bench_spans [n_funcs]
+"""
+
+import gc
+import importlib.util
+import json
+import os
+import sys
+import tracemalloc
+
+from benchmarks.common import ROOT, print_table, run_isolated, synthetic_program, timed
+
+
+def eager_positions():
+    """Give nodes a `column` slot and make ASTGeneration fill (line, column).
+
+    The line goes to the span slot, so the nodes have the two position
+    slots of the previous layout.
+    """
+    path = os.path.join(ROOT, "src", "utils", "nodes.py")
+    with open(path, encoding="utf-8") as f:
+        source = f.read().replace(
+            '__slots__ = ("span", "_hash")', '__slots__ = ("span", "column", "_hash")', 1
+        )
+    spec = importlib.util.spec_from_loader("src.utils.nodes", loader=None)
+    module = importlib.util.module_from_spec(spec)
+    module.__file__ = path
+    exec(compile(source, path, "exec"), module.__dict__)
+    sys.modules["src.utils.nodes"] = module
+
+    from src.astgen.ast_generation import ASTGeneration
+
+    def _at(self, node, ctx):
+        node.span = ctx.start.line
+        node.column = ctx.start.column
+        return node
+
+    ASTGeneration._at = _at
+
+
+def all_nodes(ast):
+    from src.utils.node_schema import FIELDS, LIST, NODE
+
+    result = []
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        result.append(node)
+        for name, kind in FIELDS[type(node)]:
+            if kind == NODE:
+                value = getattr(node, name)
+                if value is not None:
+                    stack.append(value)
+            elif kind == LIST:
+                stack.extend(getattr(node, name))
+    return result
+
+
+def child(variant: str, n_funcs: int):
+    if variant == "line/column":
+        eager_positions()
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+
+    tree = parse(make_parser(synthetic_program(n_funcs)))
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ast = ASTGeneration().visit(tree)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del ast
+    gc.collect()
+    seconds, ast = timed(ASTGeneration().visit, tree, repeat=3)
+    nodes = all_nodes(ast)
+    if variant == "line/column":
+        read = lambda node: (node.span, getattr(node, "column", None))  # noqa: E731
+    else:
+        source = ast.source
+        read = lambda node: node.position(source)  # noqa: E731
+    lookup, _ = timed(lambda: [read(n) for n in nodes], repeat=3)
+    print(
+        json.dumps({"nodes": len(nodes), "bytes": held, "seconds": seconds, "lookup": lookup})
+    )
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rows = []
+    for variant in ("line/column", "span"):
+        r = run_isolated("benchmarks.bench_spans", "--child", variant, str(n_funcs))
+        rows.append(
+            (
+                variant,
+                r["nodes"],
+                f"{r['bytes'] / 2**20:.1f}",
+                f"{r['bytes'] / r['nodes']:.1f}",
+                f"{r['seconds']:.2f}",
+                f"{r['lookup'] / r['nodes'] * 1e9:.0f}",
+            )
+        )
+    print_table(
+        ["positions", "nodes", "AST MiB", "bytes/node", "build seconds", "lookup ns/node"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
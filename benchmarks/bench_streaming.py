@@ -0,0 +1,87 @@
+"""
+Whole-program parsing vs the streaming per-declaration front end.
+
+Writes generated programs of growing size to files and, in a fresh
+process per run, turns each file into ASTs: "whole program" parses the
+file into one parse tree and converts it with ASTGeneration; "streaming"
+iterates src.frontend.streaming.iter_file_decls() and lets each
+declaration go once it is counted, as a tool that processes declarations
+one by one would. Both read the file memory-mapped and warm the DFA on a
+small program first. The table shows the wall time and the growth of the
+peak RSS over the RSS before the run: it grows with the file for the
+whole program, and stays at the size of one declaration when streaming.
+
+    python -m benchmarks.bench_streaming [max_funcs]
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+
+from benchmarks.common import (
+    current_rss_kb,
+    peak_rss_kb,
+    print_table,
+    run_isolated,
+    synthetic_program,
+    timed,
+)
+
+
+VARIANTS = ("whole program", "streaming")
+
+
+def child(variant: str, path: str):
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse, parse_file
+    from src.frontend.streaming import iter_file_decls
+
+    def whole():
+        with parse_file(path) as tree:
+            return len(ASTGeneration().visit(tree).decls)
+
+    def streaming():
+        return sum(1 for _ in iter_file_decls(path))
+
+    ASTGeneration().visit(parse(make_parser(synthetic_program(20))))  # warm the DFA
+    gc.collect()
+    rss_before = current_rss_kb()
+    seconds, decls = timed(whole if variant == VARIANTS[0] else streaming)
+    print(json.dumps({"seconds": seconds, "growth_kb": peak_rss_kb() - rss_before, "decls": decls}))
+
+
+def main():
+    max_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    sizes = [n for n in (250, 500, 1000, 2000, 4000, 8000) if n <= max_funcs]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_funcs in sizes:
+            path = os.path.join(tmp, f"program_{n_funcs}.tyc")
+            with open(path, "w", encoding="ascii") as f:
+                f.write(synthetic_program(n_funcs))
+            row = [n_funcs, f"{os.path.getsize(path) / 1024:.0f}"]
+            for variant in VARIANTS:
+                r = run_isolated("benchmarks.bench_streaming", "--child", variant, path)
+                assert r["decls"] == n_funcs + 1
+                row += [f"{r['seconds']:.2f}", f"{r['growth_kb'] / 1024:.1f}"]
+            rows.append(row)
+    print_table(
+        [
+            "functions",
+            "file KiB",
+            "whole s",
+            "whole RSS growth MiB",
+            "streaming s",
+            "streaming RSS growth MiB",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,73 @@
+"""
+Memory held by the token buffer: CommonTokenStream vs CompactTokenStream.
+
+Each variant lexes a generated program into a fully filled token buffer in
+a fresh process, and reports the traced bytes still allocated once the
+lexer has run, plus the peak RSS of the process.
+
+    python -m benchmarks.bench_token_stream [n_funcs]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from benchmarks.common import peak_rss_kb, print_table, run_isolated, synthetic_program, timed
+
+
+def child(variant: str, n_funcs: int):
+    from antlr4 import CommonTokenStream
+
+    from build.TyCLexer import TyCLexer
+    from src.frontend.streams import make_input_stream
+    from src.frontend.tokens import CompactTokenStream
+
+    source = synthetic_program(n_funcs)
+    stream_class = CommonTokenStream if variant == "CommonTokenStream" else CompactTokenStream
+    chars = make_input_stream(source)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    seconds, tokens = timed(lambda: stream_class(TyCLexer(chars)))
+    fill_seconds, _ = timed(tokens.fill)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    count = len(tokens.tokens) if variant == "CommonTokenStream" else len(tokens)
+    print(
+        json.dumps(
+            {
+                "tokens": count,
+                "bytes": held,
+                "seconds": seconds + fill_seconds,
+                "peak_kb": peak_rss_kb(),
+            }
+        )
+    )
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rows = []
+    for variant in ("CommonTokenStream", "CompactTokenStream"):
+        r = run_isolated("benchmarks.bench_token_stream", "--child", variant, str(n_funcs))
+        rows.append(
+            (
+                variant,
+                r["tokens"],
+                f"{r['bytes'] / 2**20:.1f}",
+                f"{r['bytes'] / r['tokens']:.1f}",
+                f"{r['peak_kb'] / 1024:.1f}",
+                f"{r['seconds']:.2f}",
+            )
+        )
+    print_table(
+        ["token stream", "tokens", "held MiB", "bytes/token", "peak RSS MiB", "lex seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
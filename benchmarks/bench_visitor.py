@@ -0,0 +1,97 @@
+"""
+Double-dispatch visitor vs dispatch-table visitor vs explicit-stack walker.
+
+Counts the identifiers and int literals of a large generated program and of left-nested `+`
+chains of growing depth three ways: BaseVisitor (node.accept() into a
+visit_* method), DispatchVisitor (per-class table) and ASTWalker (explicit
+stack, pre hook). The recursive visitors stop at the recursion limit;
+those cells read RecursionError.
+
+    python -m benchmarks.bench_visitor [n_funcs]
+"""
+
+import sys
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def counters():
+    from src.utils.nodes import Identifier, IntLiteral
+    from src.utils.visitor import ASTWalker, BaseVisitor, DispatchVisitor
+
+    leaves = {Identifier, IntLiteral}
+
+    # The visitors count leaves in their visit_* methods, so visit() itself
+    # is the inherited dispatch being measured; the walker counts in pre()
+    class CountBase(BaseVisitor):
+        def visit_identifier(self, node, o=None):
+            self.count += 1
+
+        visit_int_literal = visit_identifier
+
+    class CountTable(DispatchVisitor):
+        def visit_identifier(self, node, o=None):
+            self.count += 1
+
+        visit_int_literal = visit_identifier
+
+    class CountWalk(ASTWalker):
+        def pre(self, node, parent):
+            if node.__class__ in leaves:
+                self.count += 1
+
+    def run(cls, method):
+        def count(tree):
+            counter = cls()
+            counter.count = 0
+            getattr(counter, method)(tree)
+            return counter.count
+
+        return count
+
+    return [
+        ("BaseVisitor (accept)", run(CountBase, "visit")),
+        ("DispatchVisitor", run(CountTable, "visit")),
+        ("ASTWalker", run(CountWalk, "walk")),
+    ]
+
+
+def chain(depth):
+    from src.utils import nodes
+
+    expr = nodes.Identifier("x")
+    for i in range(depth):
+        expr = nodes.BinaryOp(expr, "+", nodes.IntLiteral(i))
+    return expr
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+
+    program = ASTGeneration().visit(parse(make_parser(synthetic_program(n_funcs))))
+    trees = [(f"program ({n_funcs} functions)", program)]
+    trees += [(f"chain depth {d}", chain(d)) for d in (200, 10_000)]
+    methods = counters()
+    rows = []
+    for name, tree in trees:
+        row = [name]
+        baseline = None
+        for i, (_, count) in enumerate(methods):
+            try:
+                seconds, n = timed(count, tree, repeat=3)
+            except RecursionError:
+                row.append("RecursionError")
+                continue
+            if i == 0:
+                baseline, expected = seconds, n
+            assert baseline is None or n == expected
+            speedup = f" ({baseline / seconds:.1f}x)" if baseline else ""
+            row.append(f"{seconds * 1000:.1f} ms{speedup}")
+        rows.append(row)
+    print_table(["tree"] + [label for label, _ in methods], rows)
+
+
+if __name__ == "__main__":
+    main()
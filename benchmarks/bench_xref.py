@@ -0,0 +1,100 @@
+"""
+Cross-reference queries: full tree walks vs XRef indexes.
+
+On a large generated program, times answering "all calls of f1", "all
+uses of s in the last function", "all accesses of member x" and "the
+parent of every call" by walking the whole tree, against XRef lookups,
+and replacing one FuncDecl with XRef.replace() against rebuilding the
+indexes.
+
+    python -m benchmarks.bench_xref [n_funcs]
+"""
+
+import sys
+
+from benchmarks.common import print_table, synthetic_program, timed
+
+
+def main():
+    n_funcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend.parsing import make_parser, parse
+    from src.utils.nodes import FuncCall, Identifier, MemberAccess, Type
+    from src.utils.visitor import ASTWalker
+    from src.utils.xref import XRef
+
+    program = ASTGeneration().visit(parse(make_parser(synthetic_program(n_funcs))))
+    last = program.decls[-1]
+
+    def collect(root, cls, field, value, parents=False):
+        found = []
+
+        class Find(ASTWalker):
+            def pre(self, node, parent):
+                if isinstance(node, Type):
+                    return False
+                if node.__class__ is cls and getattr(node, field) == value:
+                    found.append((node, parent) if parents else node)
+
+        Find().walk(root)
+        return found
+
+    build_seconds, xref = timed(XRef, program, repeat=3)
+    queries = [
+        (
+            "call sites of f1",
+            lambda: collect(program, FuncCall, "name", "f1"),
+            lambda: xref.call_sites("f1"),
+        ),
+        (
+            "uses of s in one function",
+            lambda: collect(last, Identifier, "name", "s"),
+            lambda: xref.uses(last, "s"),
+        ),
+        (
+            "accesses of member x",
+            lambda: collect(program, MemberAccess, "member", "x"),
+            lambda: xref.member_refs("x"),
+        ),
+        (
+            "parents of printString calls",
+            lambda: collect(program, FuncCall, "name", "printString", parents=True),
+            lambda: [(c, xref.parent(c)) for c in xref.call_sites("printString")],
+        ),
+    ]
+    rows = []
+    for name, walk, lookup in queries:
+        walk_seconds, expected = timed(walk, repeat=3)
+        lookup_seconds, result = timed(lookup, repeat=3)
+        assert len(result) == len(expected)
+        rows.append(
+            (
+                name,
+                f"{walk_seconds * 1000:.2f} ms",
+                f"{lookup_seconds * 1e6:.1f} us",
+                f"{walk_seconds / lookup_seconds:.0f}x",
+            )
+        )
+
+    replacement = ASTGeneration().visit(parse(make_parser(synthetic_program(1)))).decls[1]
+    middle = program.decls[n_funcs // 2]
+
+    def swap_back_and_forth():
+        xref.replace(middle, replacement)
+        xref.replace(replacement, middle)
+
+    swap_seconds, _ = timed(swap_back_and_forth, repeat=3)
+    rows.append(
+        (
+            "replace one FuncDecl",
+            f"{build_seconds * 1000:.2f} ms (rebuild)",
+            f"{swap_seconds / 2 * 1e6:.1f} us",
+            f"{build_seconds / (swap_seconds / 2):.0f}x",
+        )
+    )
+    print(f"{n_funcs} functions")
+    print_table(["query", "full walk", "XRef", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Run any benchmark from the project root after `python3 run.py build`, e.g.
+    python -m benchmarks.bench_dfa_cache
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUILD = os.path.join(ROOT, "build")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BUILD)
+
+
+FUNC_TEMPLATE = """int f{i}(int a, float b) {{
+    auto s = 0;
+    for (int k = 0; k < a; k++) {{
+        if (k % 3 == 0 && b > 1.5) s = s + k * {i};
+        else if (k % 3 == 1) {{ s = s - (k + a) / 2; }}
+        else {{ s++; }}
+    }}
+    while (s > 100) {{ s = s / 2; }}
+    switch (s) {{ case 1: printInt(s); break; default: s = -s; }}
+    Point p = {{s, a}};
+    p.x = p.y + f{j}(s, b);
+    printString("f{i} done\\n");
+    return s;
+}}
+"""
+
+
+def synthetic_program(n_funcs: int) -> str:
+    """A valid TyC program with one struct and *n_funcs* functions."""
+    parts = ["struct Point { int x; int y; };\n"]
+    for i in range(n_funcs):
+        parts.append(FUNC_TEMPLATE.format(i=i, j=max(i - 1, 0)))
+    return "".join(parts)
+
+
+def expression_chain(n_terms: int, op: str = "+") -> str:
+    """A function whose body is one long `a op b op ...` chain."""
+    terms = f" {op} ".join(f"x{i % 10}" for i in range(n_terms))
+    return f"void main() {{ r = {terms}; }}\n"
+
+
+def timed(fn, *args, repeat: int = 1):
+    """Return (best wall time in seconds, last result) of fn(*args)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KiB."""
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def current_rss_kb() -> int:
+    """Current resident set size of this process in KiB (0 if unknown)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def run_isolated(module: str, *args: str) -> dict:
+    """Run `python -m module args...` in a fresh process; parse its JSON output."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join([ROOT, BUILD])
+    out = subprocess.run(
+        [sys.executable, "-m", module, *args],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def print_table(headers, rows):
+    """Print rows as a plain aligned text table."""
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
@@ -0,0 +1,326 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+
+
+def serializedATN():
+    return [
+        4,0,53,395,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,
+        1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,
+        1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,10,1,10,
+        1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,12,
+        1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,
+        1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,
+        1,17,1,17,1,18,1,18,1,19,1,19,1,20,1,20,1,21,1,21,1,21,1,22,1,22,
+        1,22,1,23,1,23,1,24,1,24,1,25,1,25,1,25,1,26,1,26,1,26,1,27,1,27,
+        1,27,1,28,1,28,1,28,1,29,1,29,1,30,1,30,1,30,1,31,1,31,1,31,1,32,
+        1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,1,37,1,37,1,38,1,38,
+        1,39,1,39,1,40,1,40,1,41,1,41,1,42,1,42,1,43,1,43,1,43,5,43,271,
+        8,43,10,43,12,43,274,9,43,3,43,276,8,43,1,44,4,44,279,8,44,11,44,
+        12,44,280,1,44,1,44,5,44,285,8,44,10,44,12,44,288,9,44,1,44,3,44,
+        291,8,44,1,44,1,44,4,44,295,8,44,11,44,12,44,296,1,44,3,44,300,8,
+        44,1,44,4,44,303,8,44,11,44,12,44,304,1,44,3,44,308,8,44,1,45,1,
+        45,3,45,312,8,45,1,45,4,45,315,8,45,11,45,12,45,316,1,46,1,46,1,
+        46,5,46,322,8,46,10,46,12,46,325,9,46,1,46,1,46,1,46,1,47,1,47,1,
+        47,1,48,1,48,5,48,335,8,48,10,48,12,48,338,9,48,1,49,1,49,1,49,1,
+        49,5,49,344,8,49,10,49,12,49,347,9,49,1,49,1,49,1,49,1,49,1,49,1,
+        50,1,50,1,50,1,50,5,50,358,8,50,10,50,12,50,361,9,50,1,50,1,50,1,
+        51,4,51,366,8,51,11,51,12,51,367,1,51,1,51,1,52,1,52,1,52,5,52,375,
+        8,52,10,52,12,52,378,9,52,1,52,1,52,1,52,1,52,1,53,1,53,1,53,5,53,
+        387,8,53,10,53,12,53,390,9,53,1,53,1,53,1,54,1,54,1,345,0,55,1,1,
+        3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,
+        29,15,31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,
+        51,26,53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,
+        73,37,75,38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,0,93,46,
+        95,0,97,47,99,48,101,49,103,50,105,51,107,52,109,53,1,0,11,1,0,49,
+        57,1,0,48,57,2,0,69,69,101,101,2,0,43,43,45,45,4,0,10,10,13,13,34,
+        34,92,92,7,0,34,34,92,92,98,98,102,102,110,110,114,114,116,116,3,
+        0,65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,2,0,10,10,13,13,
+        3,0,9,10,12,13,32,32,9,0,10,10,13,13,34,34,92,92,98,98,102,102,110,
+        110,114,114,116,116,414,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,
+        1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,
+        1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,
+        1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,
+        1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,
+        1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,
+        1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,
+        1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,
+        1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,
+        1,0,0,0,0,89,1,0,0,0,0,93,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,
+        1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,
+        1,111,1,0,0,0,3,116,1,0,0,0,5,122,1,0,0,0,7,127,1,0,0,0,9,136,1,
+        0,0,0,11,144,1,0,0,0,13,149,1,0,0,0,15,155,1,0,0,0,17,159,1,0,0,
+        0,19,162,1,0,0,0,21,166,1,0,0,0,23,173,1,0,0,0,25,180,1,0,0,0,27,
+        187,1,0,0,0,29,194,1,0,0,0,31,199,1,0,0,0,33,205,1,0,0,0,35,207,
+        1,0,0,0,37,209,1,0,0,0,39,211,1,0,0,0,41,213,1,0,0,0,43,215,1,0,
+        0,0,45,218,1,0,0,0,47,221,1,0,0,0,49,223,1,0,0,0,51,225,1,0,0,0,
+        53,228,1,0,0,0,55,231,1,0,0,0,57,234,1,0,0,0,59,237,1,0,0,0,61,239,
+        1,0,0,0,63,242,1,0,0,0,65,245,1,0,0,0,67,247,1,0,0,0,69,249,1,0,
+        0,0,71,251,1,0,0,0,73,253,1,0,0,0,75,255,1,0,0,0,77,257,1,0,0,0,
+        79,259,1,0,0,0,81,261,1,0,0,0,83,263,1,0,0,0,85,265,1,0,0,0,87,275,
+        1,0,0,0,89,307,1,0,0,0,91,309,1,0,0,0,93,318,1,0,0,0,95,329,1,0,
+        0,0,97,332,1,0,0,0,99,339,1,0,0,0,101,353,1,0,0,0,103,365,1,0,0,
+        0,105,371,1,0,0,0,107,383,1,0,0,0,109,393,1,0,0,0,111,112,5,97,0,
+        0,112,113,5,117,0,0,113,114,5,116,0,0,114,115,5,111,0,0,115,2,1,
+        0,0,0,116,117,5,98,0,0,117,118,5,114,0,0,118,119,5,101,0,0,119,120,
+        5,97,0,0,120,121,5,107,0,0,121,4,1,0,0,0,122,123,5,99,0,0,123,124,
+        5,97,0,0,124,125,5,115,0,0,125,126,5,101,0,0,126,6,1,0,0,0,127,128,
+        5,99,0,0,128,129,5,111,0,0,129,130,5,110,0,0,130,131,5,116,0,0,131,
+        132,5,105,0,0,132,133,5,110,0,0,133,134,5,117,0,0,134,135,5,101,
+        0,0,135,8,1,0,0,0,136,137,5,100,0,0,137,138,5,101,0,0,138,139,5,
+        102,0,0,139,140,5,97,0,0,140,141,5,117,0,0,141,142,5,108,0,0,142,
+        143,5,116,0,0,143,10,1,0,0,0,144,145,5,101,0,0,145,146,5,108,0,0,
+        146,147,5,115,0,0,147,148,5,101,0,0,148,12,1,0,0,0,149,150,5,102,
+        0,0,150,151,5,108,0,0,151,152,5,111,0,0,152,153,5,97,0,0,153,154,
+        5,116,0,0,154,14,1,0,0,0,155,156,5,102,0,0,156,157,5,111,0,0,157,
+        158,5,114,0,0,158,16,1,0,0,0,159,160,5,105,0,0,160,161,5,102,0,0,
+        161,18,1,0,0,0,162,163,5,105,0,0,163,164,5,110,0,0,164,165,5,116,
+        0,0,165,20,1,0,0,0,166,167,5,114,0,0,167,168,5,101,0,0,168,169,5,
+        116,0,0,169,170,5,117,0,0,170,171,5,114,0,0,171,172,5,110,0,0,172,
+        22,1,0,0,0,173,174,5,115,0,0,174,175,5,116,0,0,175,176,5,114,0,0,
+        176,177,5,105,0,0,177,178,5,110,0,0,178,179,5,103,0,0,179,24,1,0,
+        0,0,180,181,5,115,0,0,181,182,5,116,0,0,182,183,5,114,0,0,183,184,
+        5,117,0,0,184,185,5,99,0,0,185,186,5,116,0,0,186,26,1,0,0,0,187,
+        188,5,115,0,0,188,189,5,119,0,0,189,190,5,105,0,0,190,191,5,116,
+        0,0,191,192,5,99,0,0,192,193,5,104,0,0,193,28,1,0,0,0,194,195,5,
+        118,0,0,195,196,5,111,0,0,196,197,5,105,0,0,197,198,5,100,0,0,198,
+        30,1,0,0,0,199,200,5,119,0,0,200,201,5,104,0,0,201,202,5,105,0,0,
+        202,203,5,108,0,0,203,204,5,101,0,0,204,32,1,0,0,0,205,206,5,43,
+        0,0,206,34,1,0,0,0,207,208,5,45,0,0,208,36,1,0,0,0,209,210,5,42,
+        0,0,210,38,1,0,0,0,211,212,5,47,0,0,212,40,1,0,0,0,213,214,5,37,
+        0,0,214,42,1,0,0,0,215,216,5,61,0,0,216,217,5,61,0,0,217,44,1,0,
+        0,0,218,219,5,33,0,0,219,220,5,61,0,0,220,46,1,0,0,0,221,222,5,60,
+        0,0,222,48,1,0,0,0,223,224,5,62,0,0,224,50,1,0,0,0,225,226,5,60,
+        0,0,226,227,5,61,0,0,227,52,1,0,0,0,228,229,5,62,0,0,229,230,5,61,
+        0,0,230,54,1,0,0,0,231,232,5,124,0,0,232,233,5,124,0,0,233,56,1,
+        0,0,0,234,235,5,38,0,0,235,236,5,38,0,0,236,58,1,0,0,0,237,238,5,
+        33,0,0,238,60,1,0,0,0,239,240,5,43,0,0,240,241,5,43,0,0,241,62,1,
+        0,0,0,242,243,5,45,0,0,243,244,5,45,0,0,244,64,1,0,0,0,245,246,5,
+        61,0,0,246,66,1,0,0,0,247,248,5,46,0,0,248,68,1,0,0,0,249,250,5,
+        91,0,0,250,70,1,0,0,0,251,252,5,93,0,0,252,72,1,0,0,0,253,254,5,
+        123,0,0,254,74,1,0,0,0,255,256,5,125,0,0,256,76,1,0,0,0,257,258,
+        5,40,0,0,258,78,1,0,0,0,259,260,5,41,0,0,260,80,1,0,0,0,261,262,
+        5,59,0,0,262,82,1,0,0,0,263,264,5,44,0,0,264,84,1,0,0,0,265,266,
+        5,58,0,0,266,86,1,0,0,0,267,276,5,48,0,0,268,272,7,0,0,0,269,271,
+        7,1,0,0,270,269,1,0,0,0,271,274,1,0,0,0,272,270,1,0,0,0,272,273,
+        1,0,0,0,273,276,1,0,0,0,274,272,1,0,0,0,275,267,1,0,0,0,275,268,
+        1,0,0,0,276,88,1,0,0,0,277,279,7,1,0,0,278,277,1,0,0,0,279,280,1,
+        0,0,0,280,278,1,0,0,0,280,281,1,0,0,0,281,282,1,0,0,0,282,286,5,
+        46,0,0,283,285,7,1,0,0,284,283,1,0,0,0,285,288,1,0,0,0,286,284,1,
+        0,0,0,286,287,1,0,0,0,287,290,1,0,0,0,288,286,1,0,0,0,289,291,3,
+        91,45,0,290,289,1,0,0,0,290,291,1,0,0,0,291,308,1,0,0,0,292,294,
+        5,46,0,0,293,295,7,1,0,0,294,293,1,0,0,0,295,296,1,0,0,0,296,294,
+        1,0,0,0,296,297,1,0,0,0,297,299,1,0,0,0,298,300,3,91,45,0,299,298,
+        1,0,0,0,299,300,1,0,0,0,300,308,1,0,0,0,301,303,7,1,0,0,302,301,
+        1,0,0,0,303,304,1,0,0,0,304,302,1,0,0,0,304,305,1,0,0,0,305,306,
+        1,0,0,0,306,308,3,91,45,0,307,278,1,0,0,0,307,292,1,0,0,0,307,302,
+        1,0,0,0,308,90,1,0,0,0,309,311,7,2,0,0,310,312,7,3,0,0,311,310,1,
+        0,0,0,311,312,1,0,0,0,312,314,1,0,0,0,313,315,7,1,0,0,314,313,1,
+        0,0,0,315,316,1,0,0,0,316,314,1,0,0,0,316,317,1,0,0,0,317,92,1,0,
+        0,0,318,323,5,34,0,0,319,322,3,95,47,0,320,322,8,4,0,0,321,319,1,
+        0,0,0,321,320,1,0,0,0,322,325,1,0,0,0,323,321,1,0,0,0,323,324,1,
+        0,0,0,324,326,1,0,0,0,325,323,1,0,0,0,326,327,5,34,0,0,327,328,6,
+        46,0,0,328,94,1,0,0,0,329,330,5,92,0,0,330,331,7,5,0,0,331,96,1,
+        0,0,0,332,336,7,6,0,0,333,335,7,7,0,0,334,333,1,0,0,0,335,338,1,
+        0,0,0,336,334,1,0,0,0,336,337,1,0,0,0,337,98,1,0,0,0,338,336,1,0,
+        0,0,339,340,5,47,0,0,340,341,5,42,0,0,341,345,1,0,0,0,342,344,9,
+        0,0,0,343,342,1,0,0,0,344,347,1,0,0,0,345,346,1,0,0,0,345,343,1,
+        0,0,0,346,348,1,0,0,0,347,345,1,0,0,0,348,349,5,42,0,0,349,350,5,
+        47,0,0,350,351,1,0,0,0,351,352,6,49,1,0,352,100,1,0,0,0,353,354,
+        5,47,0,0,354,355,5,47,0,0,355,359,1,0,0,0,356,358,8,8,0,0,357,356,
+        1,0,0,0,358,361,1,0,0,0,359,357,1,0,0,0,359,360,1,0,0,0,360,362,
+        1,0,0,0,361,359,1,0,0,0,362,363,6,50,1,0,363,102,1,0,0,0,364,366,
+        7,9,0,0,365,364,1,0,0,0,366,367,1,0,0,0,367,365,1,0,0,0,367,368,
+        1,0,0,0,368,369,1,0,0,0,369,370,6,51,1,0,370,104,1,0,0,0,371,376,
+        5,34,0,0,372,375,3,95,47,0,373,375,8,4,0,0,374,372,1,0,0,0,374,373,
+        1,0,0,0,375,378,1,0,0,0,376,374,1,0,0,0,376,377,1,0,0,0,377,379,
+        1,0,0,0,378,376,1,0,0,0,379,380,5,92,0,0,380,381,8,10,0,0,381,382,
+        6,52,2,0,382,106,1,0,0,0,383,388,5,34,0,0,384,387,3,95,47,0,385,
+        387,8,4,0,0,386,384,1,0,0,0,386,385,1,0,0,0,387,390,1,0,0,0,388,
+        386,1,0,0,0,388,389,1,0,0,0,389,391,1,0,0,0,390,388,1,0,0,0,391,
+        392,6,53,3,0,392,108,1,0,0,0,393,394,9,0,0,0,394,110,1,0,0,0,22,
+        0,272,275,280,286,290,296,299,304,307,311,316,321,323,336,345,359,
+        367,374,376,386,388,4,1,46,0,6,0,0,1,52,1,1,53,2
+    ]
+
+class TyCLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    AUTO = 1
+    BREAK = 2
+    CASE = 3
+    CONTINUE = 4
+    DEFAULT = 5
+    ELSE = 6
+    FLOAT = 7
+    FOR = 8
+    IF = 9
+    INT = 10
+    RETURN = 11
+    STRING = 12
+    STRUCT = 13
+    SWITCH = 14
+    VOID = 15
+    WHILE = 16
+    PLUS = 17
+    MINUS = 18
+    MUL = 19
+    DIV = 20
+    MOD = 21
+    EQUAL = 22
+    NOTEQUAL = 23
+    LT = 24
+    GT = 25
+    LE = 26
+    GE = 27
+    OR = 28
+    AND = 29
+    BANG = 30
+    INC = 31
+    DEC = 32
+    ASSIGN = 33
+    DOT = 34
+    LBRACK = 35
+    RBRACK = 36
+    LBRACE = 37
+    RBRACE = 38
+    LPAREN = 39
+    RPAREN = 40
+    SEMI = 41
+    COMMA = 42
+    COLON = 43
+    INT_LITERAL = 44
+    FLOAT_LITERAL = 45
+    STRING_LITERAL = 46
+    ID = 47
+    BLOCK_COMMENT = 48
+    LINE_COMMENT = 49
+    WS = 50
+    ILLEGAL_ESCAPE = 51
+    UNCLOSE_STRING = 52
+    ERROR_CHAR = 53
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'auto'", "'break'", "'case'", "'continue'", "'default'", "'else'", 
+            "'float'", "'for'", "'if'", "'int'", "'return'", "'string'", 
+            "'struct'", "'switch'", "'void'", "'while'", "'+'", "'-'", "'*'", 
+            "'/'", "'%'", "'=='", "'!='", "'<'", "'>'", "'<='", "'>='", 
+            "'||'", "'&&'", "'!'", "'++'", "'--'", "'='", "'.'", "'['", 
+            "']'", "'{'", "'}'", "'('", "')'", "';'", "','", "':'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "AUTO", "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", "FLOAT", 
+            "FOR", "IF", "INT", "RETURN", "STRING", "STRUCT", "SWITCH", 
+            "VOID", "WHILE", "PLUS", "MINUS", "MUL", "DIV", "MOD", "EQUAL", 
+            "NOTEQUAL", "LT", "GT", "LE", "GE", "OR", "AND", "BANG", "INC", 
+            "DEC", "ASSIGN", "DOT", "LBRACK", "RBRACK", "LBRACE", "RBRACE", 
+            "LPAREN", "RPAREN", "SEMI", "COMMA", "COLON", "INT_LITERAL", 
+            "FLOAT_LITERAL", "STRING_LITERAL", "ID", "BLOCK_COMMENT", "LINE_COMMENT", 
+            "WS", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    ruleNames = [ "AUTO", "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", 
+                  "FLOAT", "FOR", "IF", "INT", "RETURN", "STRING", "STRUCT", 
+                  "SWITCH", "VOID", "WHILE", "PLUS", "MINUS", "MUL", "DIV", 
+                  "MOD", "EQUAL", "NOTEQUAL", "LT", "GT", "LE", "GE", "OR", 
+                  "AND", "BANG", "INC", "DEC", "ASSIGN", "DOT", "LBRACK", 
+                  "RBRACK", "LBRACE", "RBRACE", "LPAREN", "RPAREN", "SEMI", 
+                  "COMMA", "COLON", "INT_LITERAL", "FLOAT_LITERAL", "EXPONENT", 
+                  "STRING_LITERAL", "ESCAPE_SEQ", "ID", "BLOCK_COMMENT", 
+                  "LINE_COMMENT", "WS", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", 
+                  "ERROR_CHAR" ]
+
+    grammarFileName = "TyC.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    # Raising mode by default. After collectErrors(), lexical errors are recorded
+    # as LexicalDiagnostic entries in self.diagnostics, the offending token is
+    # moved to the hidden channel and lexing continues to EOF.
+    diagnostics = None
+
+    def collectErrors(self, diagnostics=None):
+        self.diagnostics = [] if diagnostics is None else diagnostics
+        return self.diagnostics
+
+    def lexicalError(self, error, token):
+        if self.diagnostics is None:
+            raise error
+        token.channel = Token.HIDDEN_CHANNEL
+        self.diagnostics.append(LexicalDiagnostic.of(error, token))
+
+    def emit(self):
+        tk = self.type
+        if tk == self.UNCLOSE_STRING:       
+            result = super().emit();
+            self.lexicalError(UncloseString(result.text), result);
+        elif tk == self.ILLEGAL_ESCAPE:
+            result = super().emit();
+            self.lexicalError(IllegalEscape(result.text), result);
+        elif tk == self.ERROR_CHAR:
+            result = super().emit();
+            self.lexicalError(ErrorToken(result.text), result);
+        else:
+            return super().emit();
+        return result
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[46] = self.STRING_LITERAL_action 
+            actions[52] = self.ILLEGAL_ESCAPE_action 
+            actions[53] = self.UNCLOSE_STRING_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+
+    def STRING_LITERAL_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+            self.text = self.text[1:-1]
+     
+
+    def ILLEGAL_ESCAPE_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 1:
+            self.text = self.text[1:]
+     
+
+    def UNCLOSE_STRING_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 2:
+            self.text = self.text[1:]
+     
+
+
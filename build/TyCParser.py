@@ -0,0 +1,3003 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,53,350,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,1,0,5,0,66,8,0,
+        10,0,12,0,69,9,0,1,0,1,0,1,1,1,1,3,1,75,8,1,1,2,1,2,1,2,1,2,5,2,
+        81,8,2,10,2,12,2,84,9,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,4,3,4,94,8,
+        4,1,4,1,4,1,4,3,4,99,8,4,1,4,1,4,1,4,1,5,1,5,3,5,106,8,5,1,6,1,6,
+        1,6,5,6,111,8,6,10,6,12,6,114,9,6,1,7,1,7,1,7,1,8,1,8,1,9,1,9,5,
+        9,123,8,9,10,9,12,9,126,9,9,1,9,1,9,1,10,1,10,3,10,132,8,10,1,11,
+        1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,3,11,144,8,11,1,12,
+        1,12,1,12,1,12,3,12,150,8,12,1,12,1,12,1,12,1,12,1,12,1,12,3,12,
+        158,8,12,3,12,160,8,12,1,12,1,12,3,12,164,8,12,1,13,1,13,1,13,1,
+        13,5,13,170,8,13,10,13,12,13,173,9,13,3,13,175,8,13,1,13,1,13,1,
+        14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,186,8,14,1,15,1,15,1,15,1,
+        15,1,15,1,15,1,16,1,16,3,16,196,8,16,1,16,3,16,199,8,16,1,17,1,17,
+        1,17,1,17,3,17,205,8,17,1,17,1,17,3,17,209,8,17,1,17,1,17,1,17,1,
+        18,1,18,1,18,1,18,1,18,1,18,5,18,220,8,18,10,18,12,18,223,9,18,1,
+        18,1,18,1,19,4,19,228,8,19,11,19,12,19,229,1,19,5,19,233,8,19,10,
+        19,12,19,236,9,19,1,20,1,20,1,20,1,20,1,20,1,20,3,20,244,8,20,1,
+        21,1,21,1,21,1,22,1,22,1,22,1,23,1,23,3,23,254,8,23,1,23,1,23,1,
+        24,1,24,1,24,1,25,1,25,1,26,1,26,1,26,1,26,1,26,3,26,268,8,26,1,
+        27,1,27,1,27,1,27,1,27,1,27,3,27,276,8,27,1,27,1,27,1,27,5,27,281,
+        8,27,10,27,12,27,284,9,27,1,28,1,28,1,28,1,28,1,28,1,28,3,28,292,
+        8,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,3,28,
+        318,8,28,1,28,1,28,1,28,5,28,323,8,28,10,28,12,28,326,9,28,1,29,
+        1,29,1,29,5,29,331,8,29,10,29,12,29,334,9,29,1,30,1,30,1,30,1,30,
+        1,30,1,30,1,30,1,30,1,30,1,30,3,30,346,8,30,1,31,1,31,1,31,0,2,54,
+        56,32,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,
+        42,44,46,48,50,52,54,56,58,60,62,0,8,4,0,7,7,10,10,12,12,47,47,1,
+        0,31,32,2,0,17,18,30,30,1,0,19,21,1,0,17,18,1,0,24,27,1,0,22,23,
+        1,0,44,46,370,0,67,1,0,0,0,2,74,1,0,0,0,4,76,1,0,0,0,6,88,1,0,0,
+        0,8,93,1,0,0,0,10,105,1,0,0,0,12,107,1,0,0,0,14,115,1,0,0,0,16,118,
+        1,0,0,0,18,120,1,0,0,0,20,131,1,0,0,0,22,143,1,0,0,0,24,163,1,0,
+        0,0,26,165,1,0,0,0,28,178,1,0,0,0,30,187,1,0,0,0,32,198,1,0,0,0,
+        34,200,1,0,0,0,36,213,1,0,0,0,38,227,1,0,0,0,40,243,1,0,0,0,42,245,
+        1,0,0,0,44,248,1,0,0,0,46,251,1,0,0,0,48,257,1,0,0,0,50,260,1,0,
+        0,0,52,267,1,0,0,0,54,275,1,0,0,0,56,291,1,0,0,0,58,327,1,0,0,0,
+        60,345,1,0,0,0,62,347,1,0,0,0,64,66,3,2,1,0,65,64,1,0,0,0,66,69,
+        1,0,0,0,67,65,1,0,0,0,67,68,1,0,0,0,68,70,1,0,0,0,69,67,1,0,0,0,
+        70,71,5,0,0,1,71,1,1,0,0,0,72,75,3,4,2,0,73,75,3,8,4,0,74,72,1,0,
+        0,0,74,73,1,0,0,0,75,3,1,0,0,0,76,77,5,13,0,0,77,78,5,47,0,0,78,
+        82,5,37,0,0,79,81,3,6,3,0,80,79,1,0,0,0,81,84,1,0,0,0,82,80,1,0,
+        0,0,82,83,1,0,0,0,83,85,1,0,0,0,84,82,1,0,0,0,85,86,5,38,0,0,86,
+        87,5,41,0,0,87,5,1,0,0,0,88,89,3,16,8,0,89,90,5,47,0,0,90,91,5,41,
+        0,0,91,7,1,0,0,0,92,94,3,10,5,0,93,92,1,0,0,0,93,94,1,0,0,0,94,95,
+        1,0,0,0,95,96,5,47,0,0,96,98,5,39,0,0,97,99,3,12,6,0,98,97,1,0,0,
+        0,98,99,1,0,0,0,99,100,1,0,0,0,100,101,5,40,0,0,101,102,3,18,9,0,
+        102,9,1,0,0,0,103,106,3,16,8,0,104,106,5,15,0,0,105,103,1,0,0,0,
+        105,104,1,0,0,0,106,11,1,0,0,0,107,112,3,14,7,0,108,109,5,42,0,0,
+        109,111,3,14,7,0,110,108,1,0,0,0,111,114,1,0,0,0,112,110,1,0,0,0,
+        112,113,1,0,0,0,113,13,1,0,0,0,114,112,1,0,0,0,115,116,3,16,8,0,
+        116,117,5,47,0,0,117,15,1,0,0,0,118,119,7,0,0,0,119,17,1,0,0,0,120,
+        124,5,37,0,0,121,123,3,20,10,0,122,121,1,0,0,0,123,126,1,0,0,0,124,
+        122,1,0,0,0,124,125,1,0,0,0,125,127,1,0,0,0,126,124,1,0,0,0,127,
+        128,5,38,0,0,128,19,1,0,0,0,129,132,3,24,12,0,130,132,3,22,11,0,
+        131,129,1,0,0,0,131,130,1,0,0,0,132,21,1,0,0,0,133,144,3,18,9,0,
+        134,144,3,28,14,0,135,144,3,30,15,0,136,144,3,34,17,0,137,144,3,
+        36,18,0,138,144,3,42,21,0,139,144,3,44,22,0,140,144,3,46,23,0,141,
+        144,3,48,24,0,142,144,3,50,25,0,143,133,1,0,0,0,143,134,1,0,0,0,
+        143,135,1,0,0,0,143,136,1,0,0,0,143,137,1,0,0,0,143,138,1,0,0,0,
+        143,139,1,0,0,0,143,140,1,0,0,0,143,141,1,0,0,0,143,142,1,0,0,0,
+        144,23,1,0,0,0,145,146,5,1,0,0,146,149,5,47,0,0,147,148,5,33,0,0,
+        148,150,3,52,26,0,149,147,1,0,0,0,149,150,1,0,0,0,150,151,1,0,0,
+        0,151,164,5,41,0,0,152,153,3,16,8,0,153,159,5,47,0,0,154,157,5,33,
+        0,0,155,158,3,52,26,0,156,158,3,26,13,0,157,155,1,0,0,0,157,156,
+        1,0,0,0,158,160,1,0,0,0,159,154,1,0,0,0,159,160,1,0,0,0,160,161,
+        1,0,0,0,161,162,5,41,0,0,162,164,1,0,0,0,163,145,1,0,0,0,163,152,
+        1,0,0,0,164,25,1,0,0,0,165,174,5,37,0,0,166,171,3,52,26,0,167,168,
+        5,42,0,0,168,170,3,52,26,0,169,167,1,0,0,0,170,173,1,0,0,0,171,169,
+        1,0,0,0,171,172,1,0,0,0,172,175,1,0,0,0,173,171,1,0,0,0,174,166,
+        1,0,0,0,174,175,1,0,0,0,175,176,1,0,0,0,176,177,5,38,0,0,177,27,
+        1,0,0,0,178,179,5,9,0,0,179,180,5,39,0,0,180,181,3,52,26,0,181,182,
+        5,40,0,0,182,185,3,22,11,0,183,184,5,6,0,0,184,186,3,22,11,0,185,
+        183,1,0,0,0,185,186,1,0,0,0,186,29,1,0,0,0,187,188,5,16,0,0,188,
+        189,5,39,0,0,189,190,3,52,26,0,190,191,5,40,0,0,191,192,3,22,11,
+        0,192,31,1,0,0,0,193,199,3,24,12,0,194,196,3,52,26,0,195,194,1,0,
+        0,0,195,196,1,0,0,0,196,197,1,0,0,0,197,199,5,41,0,0,198,193,1,0,
+        0,0,198,195,1,0,0,0,199,33,1,0,0,0,200,201,5,8,0,0,201,202,5,39,
+        0,0,202,204,3,32,16,0,203,205,3,52,26,0,204,203,1,0,0,0,204,205,
+        1,0,0,0,205,206,1,0,0,0,206,208,5,41,0,0,207,209,3,52,26,0,208,207,
+        1,0,0,0,208,209,1,0,0,0,209,210,1,0,0,0,210,211,5,40,0,0,211,212,
+        3,22,11,0,212,35,1,0,0,0,213,214,5,14,0,0,214,215,5,39,0,0,215,216,
+        3,52,26,0,216,217,5,40,0,0,217,221,5,37,0,0,218,220,3,38,19,0,219,
+        218,1,0,0,0,220,223,1,0,0,0,221,219,1,0,0,0,221,222,1,0,0,0,222,
+        224,1,0,0,0,223,221,1,0,0,0,224,225,5,38,0,0,225,37,1,0,0,0,226,
+        228,3,40,20,0,227,226,1,0,0,0,228,229,1,0,0,0,229,227,1,0,0,0,229,
+        230,1,0,0,0,230,234,1,0,0,0,231,233,3,20,10,0,232,231,1,0,0,0,233,
+        236,1,0,0,0,234,232,1,0,0,0,234,235,1,0,0,0,235,39,1,0,0,0,236,234,
+        1,0,0,0,237,238,5,3,0,0,238,239,3,56,28,0,239,240,5,43,0,0,240,244,
+        1,0,0,0,241,242,5,5,0,0,242,244,5,43,0,0,243,237,1,0,0,0,243,241,
+        1,0,0,0,244,41,1,0,0,0,245,246,5,2,0,0,246,247,5,41,0,0,247,43,1,
+        0,0,0,248,249,5,4,0,0,249,250,5,41,0,0,250,45,1,0,0,0,251,253,5,
+        11,0,0,252,254,3,52,26,0,253,252,1,0,0,0,253,254,1,0,0,0,254,255,
+        1,0,0,0,255,256,5,41,0,0,256,47,1,0,0,0,257,258,3,52,26,0,258,259,
+        5,41,0,0,259,49,1,0,0,0,260,261,5,41,0,0,261,51,1,0,0,0,262,263,
+        3,54,27,0,263,264,5,33,0,0,264,265,3,52,26,0,265,268,1,0,0,0,266,
+        268,3,56,28,0,267,262,1,0,0,0,267,266,1,0,0,0,268,53,1,0,0,0,269,
+        270,6,27,-1,0,270,276,5,47,0,0,271,272,5,39,0,0,272,273,3,54,27,
+        0,273,274,5,40,0,0,274,276,1,0,0,0,275,269,1,0,0,0,275,271,1,0,0,
+        0,276,282,1,0,0,0,277,278,10,2,0,0,278,279,5,34,0,0,279,281,5,47,
+        0,0,280,277,1,0,0,0,281,284,1,0,0,0,282,280,1,0,0,0,282,283,1,0,
+        0,0,283,55,1,0,0,0,284,282,1,0,0,0,285,286,6,28,-1,0,286,287,7,1,
+        0,0,287,292,3,56,28,9,288,289,7,2,0,0,289,292,3,56,28,8,290,292,
+        3,60,30,0,291,285,1,0,0,0,291,288,1,0,0,0,291,290,1,0,0,0,292,324,
+        1,0,0,0,293,294,10,7,0,0,294,295,7,3,0,0,295,323,3,56,28,8,296,297,
+        10,6,0,0,297,298,7,4,0,0,298,323,3,56,28,7,299,300,10,5,0,0,300,
+        301,7,5,0,0,301,323,3,56,28,6,302,303,10,4,0,0,303,304,7,6,0,0,304,
+        323,3,56,28,5,305,306,10,3,0,0,306,307,5,29,0,0,307,323,3,56,28,
+        4,308,309,10,2,0,0,309,310,5,28,0,0,310,323,3,56,28,3,311,312,10,
+        12,0,0,312,313,5,34,0,0,313,323,5,47,0,0,314,315,10,11,0,0,315,317,
+        5,39,0,0,316,318,3,58,29,0,317,316,1,0,0,0,317,318,1,0,0,0,318,319,
+        1,0,0,0,319,323,5,40,0,0,320,321,10,10,0,0,321,323,7,1,0,0,322,293,
+        1,0,0,0,322,296,1,0,0,0,322,299,1,0,0,0,322,302,1,0,0,0,322,305,
+        1,0,0,0,322,308,1,0,0,0,322,311,1,0,0,0,322,314,1,0,0,0,322,320,
+        1,0,0,0,323,326,1,0,0,0,324,322,1,0,0,0,324,325,1,0,0,0,325,57,1,
+        0,0,0,326,324,1,0,0,0,327,332,3,52,26,0,328,329,5,42,0,0,329,331,
+        3,52,26,0,330,328,1,0,0,0,331,334,1,0,0,0,332,330,1,0,0,0,332,333,
+        1,0,0,0,333,59,1,0,0,0,334,332,1,0,0,0,335,336,5,39,0,0,336,337,
+        3,52,26,0,337,338,5,40,0,0,338,346,1,0,0,0,339,346,5,47,0,0,340,
+        346,3,62,31,0,341,342,5,37,0,0,342,343,3,58,29,0,343,344,5,38,0,
+        0,344,346,1,0,0,0,345,335,1,0,0,0,345,339,1,0,0,0,345,340,1,0,0,
+        0,345,341,1,0,0,0,346,61,1,0,0,0,347,348,7,7,0,0,348,63,1,0,0,0,
+        35,67,74,82,93,98,105,112,124,131,143,149,157,159,163,171,174,185,
+        195,198,204,208,221,229,234,243,253,267,275,282,291,317,322,324,
+        332,345
+    ]
+
+class TyCParser ( Parser ):
+
+    grammarFileName = "TyC.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'auto'", "'break'", "'case'", "'continue'", 
+                     "'default'", "'else'", "'float'", "'for'", "'if'", 
+                     "'int'", "'return'", "'string'", "'struct'", "'switch'", 
+                     "'void'", "'while'", "'+'", "'-'", "'*'", "'/'", "'%'", 
+                     "'=='", "'!='", "'<'", "'>'", "'<='", "'>='", "'||'", 
+                     "'&&'", "'!'", "'++'", "'--'", "'='", "'.'", "'['", 
+                     "']'", "'{'", "'}'", "'('", "')'", "';'", "','", "':'" ]
+
+    symbolicNames = [ "<INVALID>", "AUTO", "BREAK", "CASE", "CONTINUE", 
+                      "DEFAULT", "ELSE", "FLOAT", "FOR", "IF", "INT", "RETURN", 
+                      "STRING", "STRUCT", "SWITCH", "VOID", "WHILE", "PLUS", 
+                      "MINUS", "MUL", "DIV", "MOD", "EQUAL", "NOTEQUAL", 
+                      "LT", "GT", "LE", "GE", "OR", "AND", "BANG", "INC", 
+                      "DEC", "ASSIGN", "DOT", "LBRACK", "RBRACK", "LBRACE", 
+                      "RBRACE", "LPAREN", "RPAREN", "SEMI", "COMMA", "COLON", 
+                      "INT_LITERAL", "FLOAT_LITERAL", "STRING_LITERAL", 
+                      "ID", "BLOCK_COMMENT", "LINE_COMMENT", "WS", "ILLEGAL_ESCAPE", 
+                      "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_globalDecl = 1
+    RULE_structDecl = 2
+    RULE_structMember = 3
+    RULE_funcDecl = 4
+    RULE_returnType = 5
+    RULE_paramList = 6
+    RULE_param = 7
+    RULE_type_ = 8
+    RULE_block = 9
+    RULE_blockItem = 10
+    RULE_stmt = 11
+    RULE_varDecl = 12
+    RULE_structInitializer = 13
+    RULE_ifStmt = 14
+    RULE_whileStmt = 15
+    RULE_forControl = 16
+    RULE_forStmt = 17
+    RULE_switchStmt = 18
+    RULE_switchBlockStatementGroup = 19
+    RULE_switchLabel = 20
+    RULE_breakStmt = 21
+    RULE_continueStmt = 22
+    RULE_returnStmt = 23
+    RULE_exprStmt = 24
+    RULE_semiStmt = 25
+    RULE_expr = 26
+    RULE_lvalue = 27
+    RULE_condExpr = 28
+    RULE_argList = 29
+    RULE_primary = 30
+    RULE_literal = 31
+
+    ruleNames =  [ "program", "globalDecl", "structDecl", "structMember", 
+                   "funcDecl", "returnType", "paramList", "param", "type_", 
+                   "block", "blockItem", "stmt", "varDecl", "structInitializer", 
+                   "ifStmt", "whileStmt", "forControl", "forStmt", "switchStmt", 
+                   "switchBlockStatementGroup", "switchLabel", "breakStmt", 
+                   "continueStmt", "returnStmt", "exprStmt", "semiStmt", 
+                   "expr", "lvalue", "condExpr", "argList", "primary", "literal" ]
+
+    EOF = Token.EOF
+    AUTO=1
+    BREAK=2
+    CASE=3
+    CONTINUE=4
+    DEFAULT=5
+    ELSE=6
+    FLOAT=7
+    FOR=8
+    IF=9
+    INT=10
+    RETURN=11
+    STRING=12
+    STRUCT=13
+    SWITCH=14
+    VOID=15
+    WHILE=16
+    PLUS=17
+    MINUS=18
+    MUL=19
+    DIV=20
+    MOD=21
+    EQUAL=22
+    NOTEQUAL=23
+    LT=24
+    GT=25
+    LE=26
+    GE=27
+    OR=28
+    AND=29
+    BANG=30
+    INC=31
+    DEC=32
+    ASSIGN=33
+    DOT=34
+    LBRACK=35
+    RBRACK=36
+    LBRACE=37
+    RBRACE=38
+    LPAREN=39
+    RPAREN=40
+    SEMI=41
+    COMMA=42
+    COLON=43
+    INT_LITERAL=44
+    FLOAT_LITERAL=45
+    STRING_LITERAL=46
+    ID=47
+    BLOCK_COMMENT=48
+    LINE_COMMENT=49
+    WS=50
+    ILLEGAL_ESCAPE=51
+    UNCLOSE_STRING=52
+    ERROR_CHAR=53
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EOF(self):
+            return self.getToken(TyCParser.EOF, 0)
+
+        def globalDecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.GlobalDeclContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.GlobalDeclContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = TyCParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 67
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488401536) != 0):
+                self.state = 64
+                self.globalDecl()
+                self.state = 69
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 70
+            self.match(TyCParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class GlobalDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def structDecl(self):
+            return self.getTypedRuleContext(TyCParser.StructDeclContext,0)
+
+
+        def funcDecl(self):
+            return self.getTypedRuleContext(TyCParser.FuncDeclContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_globalDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitGlobalDecl" ):
+                return visitor.visitGlobalDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def globalDecl(self):
+
+        localctx = TyCParser.GlobalDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_globalDecl)
+        try:
+            self.state = 74
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [13]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 72
+                self.structDecl()
+                pass
+            elif token in [7, 10, 12, 15, 47]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 73
+                self.funcDecl()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRUCT(self):
+            return self.getToken(TyCParser.STRUCT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def structMember(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StructMemberContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StructMemberContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructDecl" ):
+                return visitor.visitStructDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structDecl(self):
+
+        localctx = TyCParser.StructDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_structDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 76
+            self.match(TyCParser.STRUCT)
+            self.state = 77
+            self.match(TyCParser.ID)
+            self.state = 78
+            self.match(TyCParser.LBRACE)
+            self.state = 82
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488360576) != 0):
+                self.state = 79
+                self.structMember()
+                self.state = 84
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 85
+            self.match(TyCParser.RBRACE)
+            self.state = 86
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructMemberContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.Type_Context,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structMember
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructMember" ):
+                return visitor.visitStructMember(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structMember(self):
+
+        localctx = TyCParser.StructMemberContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_structMember)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 88
+            self.type_()
+            self.state = 89
+            self.match(TyCParser.ID)
+            self.state = 90
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FuncDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def returnType(self):
+            return self.getTypedRuleContext(TyCParser.ReturnTypeContext,0)
+
+
+        def paramList(self):
+            return self.getTypedRuleContext(TyCParser.ParamListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_funcDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFuncDecl" ):
+                return visitor.visitFuncDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def funcDecl(self):
+
+        localctx = TyCParser.FuncDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_funcDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 93
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.state = 92
+                self.returnType()
+
+
+            self.state = 95
+            self.match(TyCParser.ID)
+            self.state = 96
+            self.match(TyCParser.LPAREN)
+            self.state = 98
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488360576) != 0):
+                self.state = 97
+                self.paramList()
+
+
+            self.state = 100
+            self.match(TyCParser.RPAREN)
+            self.state = 101
+            self.block()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.Type_Context,0)
+
+
+        def VOID(self):
+            return self.getToken(TyCParser.VOID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnType
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnType" ):
+                return visitor.visitReturnType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnType(self):
+
+        localctx = TyCParser.ReturnTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_returnType)
+        try:
+            self.state = 105
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [7, 10, 12, 47]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 103
+                self.type_()
+                pass
+            elif token in [15]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 104
+                self.match(TyCParser.VOID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ParamContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ParamContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_paramList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParamList" ):
+                return visitor.visitParamList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paramList(self):
+
+        localctx = TyCParser.ParamListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_paramList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 107
+            self.param()
+            self.state = 112
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==42:
+                self.state = 108
+                self.match(TyCParser.COMMA)
+                self.state = 109
+                self.param()
+                self.state = 114
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.Type_Context,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParam" ):
+                return visitor.visitParam(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def param(self):
+
+        localctx = TyCParser.ParamContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_param)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 115
+            self.type_()
+            self.state = 116
+            self.match(TyCParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Type_Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(TyCParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(TyCParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(TyCParser.STRING, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_type_
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitType_" ):
+                return visitor.visitType_(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def type_(self):
+
+        localctx = TyCParser.Type_Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_type_)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 118
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488360576) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def blockItem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.BlockItemContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.BlockItemContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_block
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = TyCParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 120
+            self.match(TyCParser.LBRACE)
+            self.state = 124
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 266776525365142) != 0):
+                self.state = 121
+                self.blockItem()
+                self.state = 126
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 127
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockItemContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_blockItem
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockItem" ):
+                return visitor.visitBlockItem(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockItem(self):
+
+        localctx = TyCParser.BlockItemContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_blockItem)
+        try:
+            self.state = 131
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 129
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 130
+                self.stmt()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def ifStmt(self):
+            return self.getTypedRuleContext(TyCParser.IfStmtContext,0)
+
+
+        def whileStmt(self):
+            return self.getTypedRuleContext(TyCParser.WhileStmtContext,0)
+
+
+        def forStmt(self):
+            return self.getTypedRuleContext(TyCParser.ForStmtContext,0)
+
+
+        def switchStmt(self):
+            return self.getTypedRuleContext(TyCParser.SwitchStmtContext,0)
+
+
+        def breakStmt(self):
+            return self.getTypedRuleContext(TyCParser.BreakStmtContext,0)
+
+
+        def continueStmt(self):
+            return self.getTypedRuleContext(TyCParser.ContinueStmtContext,0)
+
+
+        def returnStmt(self):
+            return self.getTypedRuleContext(TyCParser.ReturnStmtContext,0)
+
+
+        def exprStmt(self):
+            return self.getTypedRuleContext(TyCParser.ExprStmtContext,0)
+
+
+        def semiStmt(self):
+            return self.getTypedRuleContext(TyCParser.SemiStmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_stmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmt" ):
+                return visitor.visitStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmt(self):
+
+        localctx = TyCParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_stmt)
+        try:
+            self.state = 143
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 133
+                self.block()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 134
+                self.ifStmt()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 135
+                self.whileStmt()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 136
+                self.forStmt()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 137
+                self.switchStmt()
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 138
+                self.breakStmt()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 139
+                self.continueStmt()
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 140
+                self.returnStmt()
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 141
+                self.exprStmt()
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 142
+                self.semiStmt()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def AUTO(self):
+            return self.getToken(TyCParser.AUTO, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.Type_Context,0)
+
+
+        def structInitializer(self):
+            return self.getTypedRuleContext(TyCParser.StructInitializerContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDecl" ):
+                return visitor.visitVarDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDecl(self):
+
+        localctx = TyCParser.VarDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_varDecl)
+        self._la = 0 # Token type
+        try:
+            self.state = 163
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [1]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 145
+                self.match(TyCParser.AUTO)
+                self.state = 146
+                self.match(TyCParser.ID)
+                self.state = 149
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==33:
+                    self.state = 147
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 148
+                    self.expr()
+
+
+                self.state = 151
+                self.match(TyCParser.SEMI)
+                pass
+            elif token in [7, 10, 12, 47]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 152
+                self.type_()
+                self.state = 153
+                self.match(TyCParser.ID)
+                self.state = 159
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==33:
+                    self.state = 154
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 157
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,11,self._ctx)
+                    if la_ == 1:
+                        self.state = 155
+                        self.expr()
+                        pass
+
+                    elif la_ == 2:
+                        self.state = 156
+                        self.structInitializer()
+                        pass
+
+
+
+
+                self.state = 161
+                self.match(TyCParser.SEMI)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructInitializerContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structInitializer
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructInitializer" ):
+                return visitor.visitStructInitializer(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structInitializer(self):
+
+        localctx = TyCParser.StructInitializerContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_structInitializer)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 165
+            self.match(TyCParser.LBRACE)
+            self.state = 174
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 264577502019584) != 0):
+                self.state = 166
+                self.expr()
+                self.state = 171
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==42:
+                    self.state = 167
+                    self.match(TyCParser.COMMA)
+                    self.state = 168
+                    self.expr()
+                    self.state = 173
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 176
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(TyCParser.IF, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def ELSE(self):
+            return self.getToken(TyCParser.ELSE, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_ifStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfStmt" ):
+                return visitor.visitIfStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifStmt(self):
+
+        localctx = TyCParser.IfStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_ifStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 178
+            self.match(TyCParser.IF)
+            self.state = 179
+            self.match(TyCParser.LPAREN)
+            self.state = 180
+            self.expr()
+            self.state = 181
+            self.match(TyCParser.RPAREN)
+            self.state = 182
+            self.stmt()
+            self.state = 185
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
+            if la_ == 1:
+                self.state = 183
+                self.match(TyCParser.ELSE)
+                self.state = 184
+                self.stmt()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class WhileStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def WHILE(self):
+            return self.getToken(TyCParser.WHILE, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_whileStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWhileStmt" ):
+                return visitor.visitWhileStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def whileStmt(self):
+
+        localctx = TyCParser.WhileStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_whileStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 187
+            self.match(TyCParser.WHILE)
+            self.state = 188
+            self.match(TyCParser.LPAREN)
+            self.state = 189
+            self.expr()
+            self.state = 190
+            self.match(TyCParser.RPAREN)
+            self.state = 191
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForControlContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forControl
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class ForInitExprContext(ForControlContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ForControlContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForInitExpr" ):
+                return visitor.visitForInitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ForInitDeclContext(ForControlContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ForControlContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForInitDecl" ):
+                return visitor.visitForInitDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def forControl(self):
+
+        localctx = TyCParser.ForControlContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_forControl)
+        self._la = 0 # Token type
+        try:
+            self.state = 198
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,18,self._ctx)
+            if la_ == 1:
+                localctx = TyCParser.ForInitDeclContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 193
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                localctx = TyCParser.ForInitExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 195
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 264577502019584) != 0):
+                    self.state = 194
+                    self.expr()
+
+
+                self.state = 197
+                self.match(TyCParser.SEMI)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(TyCParser.FOR, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def forControl(self):
+            return self.getTypedRuleContext(TyCParser.ForControlContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForStmt" ):
+                return visitor.visitForStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forStmt(self):
+
+        localctx = TyCParser.ForStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_forStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 200
+            self.match(TyCParser.FOR)
+            self.state = 201
+            self.match(TyCParser.LPAREN)
+            self.state = 202
+            self.forControl()
+            self.state = 204
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 264577502019584) != 0):
+                self.state = 203
+                self.expr()
+
+
+            self.state = 206
+            self.match(TyCParser.SEMI)
+            self.state = 208
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 264577502019584) != 0):
+                self.state = 207
+                self.expr()
+
+
+            self.state = 210
+            self.match(TyCParser.RPAREN)
+            self.state = 211
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SWITCH(self):
+            return self.getToken(TyCParser.SWITCH, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def switchBlockStatementGroup(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.SwitchBlockStatementGroupContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.SwitchBlockStatementGroupContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchStmt" ):
+                return visitor.visitSwitchStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchStmt(self):
+
+        localctx = TyCParser.SwitchStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_switchStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 213
+            self.match(TyCParser.SWITCH)
+            self.state = 214
+            self.match(TyCParser.LPAREN)
+            self.state = 215
+            self.expr()
+            self.state = 216
+            self.match(TyCParser.RPAREN)
+            self.state = 217
+            self.match(TyCParser.LBRACE)
+            self.state = 221
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==3 or _la==5:
+                self.state = 218
+                self.switchBlockStatementGroup()
+                self.state = 223
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 224
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchBlockStatementGroupContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def switchLabel(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.SwitchLabelContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.SwitchLabelContext,i)
+
+
+        def blockItem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.BlockItemContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.BlockItemContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchBlockStatementGroup
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchBlockStatementGroup" ):
+                return visitor.visitSwitchBlockStatementGroup(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchBlockStatementGroup(self):
+
+        localctx = TyCParser.SwitchBlockStatementGroupContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_switchBlockStatementGroup)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 227 
+            self._errHandler.sync(self)
+            _alt = 1
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt == 1:
+                    self.state = 226
+                    self.switchLabel()
+
+                else:
+                    raise NoViableAltException(self)
+                self.state = 229 
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+
+            self.state = 234
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 266776525365142) != 0):
+                self.state = 231
+                self.blockItem()
+                self.state = 236
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchLabelContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CASE(self):
+            return self.getToken(TyCParser.CASE, 0)
+
+        def condExpr(self):
+            return self.getTypedRuleContext(TyCParser.CondExprContext,0)
+
+
+        def COLON(self):
+            return self.getToken(TyCParser.COLON, 0)
+
+        def DEFAULT(self):
+            return self.getToken(TyCParser.DEFAULT, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchLabel
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchLabel" ):
+                return visitor.visitSwitchLabel(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchLabel(self):
+
+        localctx = TyCParser.SwitchLabelContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_switchLabel)
+        try:
+            self.state = 243
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [3]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 237
+                self.match(TyCParser.CASE)
+                self.state = 238
+                self.condExpr(0)
+                self.state = 239
+                self.match(TyCParser.COLON)
+                pass
+            elif token in [5]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 241
+                self.match(TyCParser.DEFAULT)
+                self.state = 242
+                self.match(TyCParser.COLON)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BREAK(self):
+            return self.getToken(TyCParser.BREAK, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_breakStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreakStmt" ):
+                return visitor.visitBreakStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def breakStmt(self):
+
+        localctx = TyCParser.BreakStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_breakStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 245
+            self.match(TyCParser.BREAK)
+            self.state = 246
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinueStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CONTINUE(self):
+            return self.getToken(TyCParser.CONTINUE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_continueStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinueStmt" ):
+                return visitor.visitContinueStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def continueStmt(self):
+
+        localctx = TyCParser.ContinueStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_continueStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 248
+            self.match(TyCParser.CONTINUE)
+            self.state = 249
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(TyCParser.RETURN, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnStmt" ):
+                return visitor.visitReturnStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnStmt(self):
+
+        localctx = TyCParser.ReturnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_returnStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 251
+            self.match(TyCParser.RETURN)
+            self.state = 253
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 264577502019584) != 0):
+                self.state = 252
+                self.expr()
+
+
+            self.state = 255
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_exprStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprStmt" ):
+                return visitor.visitExprStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exprStmt(self):
+
+        localctx = TyCParser.ExprStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_exprStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 257
+            self.expr()
+            self.state = 258
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SemiStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_semiStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSemiStmt" ):
+                return visitor.visitSemiStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def semiStmt(self):
+
+        localctx = TyCParser.SemiStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_semiStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 260
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class AssignmentExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssignmentExpr" ):
+                return visitor.visitAssignmentExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ExprFallbackContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self):
+            return self.getTypedRuleContext(TyCParser.CondExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprFallback" ):
+                return visitor.visitExprFallback(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr(self):
+
+        localctx = TyCParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_expr)
+        try:
+            self.state = 267
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
+            if la_ == 1:
+                localctx = TyCParser.AssignmentExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 262
+                self.lvalue(0)
+                self.state = 263
+                self.match(TyCParser.ASSIGN)
+                self.state = 264
+                self.expr()
+                pass
+
+            elif la_ == 2:
+                localctx = TyCParser.ExprFallbackContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 266
+                self.condExpr(0)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LvalueContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def DOT(self):
+            return self.getToken(TyCParser.DOT, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_lvalue
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLvalue" ):
+                return visitor.visitLvalue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def lvalue(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = TyCParser.LvalueContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 54
+        self.enterRecursionRule(localctx, 54, self.RULE_lvalue, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 275
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [47]:
+                self.state = 270
+                self.match(TyCParser.ID)
+                pass
+            elif token in [39]:
+                self.state = 271
+                self.match(TyCParser.LPAREN)
+                self.state = 272
+                self.lvalue(0)
+                self.state = 273
+                self.match(TyCParser.RPAREN)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 282
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,28,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = TyCParser.LvalueContext(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_lvalue)
+                    self.state = 277
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 278
+                    self.match(TyCParser.DOT)
+                    self.state = 279
+                    self.match(TyCParser.ID) 
+                self.state = 284
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,28,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class CondExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_condExpr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class PrimaryExprRuleContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def primary(self):
+            return self.getTypedRuleContext(TyCParser.PrimaryContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimaryExprRule" ):
+                return visitor.visitPrimaryExprRule(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class PostfixExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self):
+            return self.getTypedRuleContext(TyCParser.CondExprContext,0)
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixExpr" ):
+                return visitor.visitPostfixExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class MultiplicativeExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CondExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CondExprContext,i)
+
+        def MUL(self):
+            return self.getToken(TyCParser.MUL, 0)
+        def DIV(self):
+            return self.getToken(TyCParser.DIV, 0)
+        def MOD(self):
+            return self.getToken(TyCParser.MOD, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMultiplicativeExpr" ):
+                return visitor.visitMultiplicativeExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LogicalOrExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CondExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CondExprContext,i)
+
+        def OR(self):
+            return self.getToken(TyCParser.OR, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLogicalOrExpr" ):
+                return visitor.visitLogicalOrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EqualityExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CondExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CondExprContext,i)
+
+        def EQUAL(self):
+            return self.getToken(TyCParser.EQUAL, 0)
+        def NOTEQUAL(self):
+            return self.getToken(TyCParser.NOTEQUAL, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEqualityExpr" ):
+                return visitor.visitEqualityExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class FunctionCallExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self):
+            return self.getTypedRuleContext(TyCParser.CondExprContext,0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+        def argList(self):
+            return self.getTypedRuleContext(TyCParser.ArgListContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunctionCallExpr" ):
+                return visitor.visitFunctionCallExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AdditiveExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CondExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CondExprContext,i)
+
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAdditiveExpr" ):
+                return visitor.visitAdditiveExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class RelationalExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CondExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CondExprContext,i)
+
+        def LT(self):
+            return self.getToken(TyCParser.LT, 0)
+        def LE(self):
+            return self.getToken(TyCParser.LE, 0)
+        def GT(self):
+            return self.getToken(TyCParser.GT, 0)
+        def GE(self):
+            return self.getToken(TyCParser.GE, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelationalExpr" ):
+                return visitor.visitRelationalExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class MemberAccessExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self):
+            return self.getTypedRuleContext(TyCParser.CondExprContext,0)
+
+        def DOT(self):
+            return self.getToken(TyCParser.DOT, 0)
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMemberAccessExpr" ):
+                return visitor.visitMemberAccessExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class UnaryExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self):
+            return self.getTypedRuleContext(TyCParser.CondExprContext,0)
+
+        def BANG(self):
+            return self.getToken(TyCParser.BANG, 0)
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUnaryExpr" ):
+                return visitor.visitUnaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LogicalAndExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CondExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CondExprContext,i)
+
+        def AND(self):
+            return self.getToken(TyCParser.AND, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLogicalAndExpr" ):
+                return visitor.visitLogicalAndExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class PrefixExprContext(CondExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.CondExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def condExpr(self):
+            return self.getTypedRuleContext(TyCParser.CondExprContext,0)
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrefixExpr" ):
+                return visitor.visitPrefixExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def condExpr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = TyCParser.CondExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 56
+        self.enterRecursionRule(localctx, 56, self.RULE_condExpr, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 291
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [31, 32]:
+                localctx = TyCParser.PrefixExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 286
+                _la = self._input.LA(1)
+                if not(_la==31 or _la==32):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 287
+                self.condExpr(9)
+                pass
+            elif token in [17, 18, 30]:
+                localctx = TyCParser.UnaryExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 288
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1074135040) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 289
+                self.condExpr(8)
+                pass
+            elif token in [37, 39, 44, 45, 46, 47]:
+                localctx = TyCParser.PrimaryExprRuleContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 290
+                self.primary()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 324
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 322
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,31,self._ctx)
+                    if la_ == 1:
+                        localctx = TyCParser.MultiplicativeExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 293
+                        if not self.precpred(self._ctx, 7):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 294
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3670016) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 295
+                        self.condExpr(8)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = TyCParser.AdditiveExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 296
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 297
+                        _la = self._input.LA(1)
+                        if not(_la==17 or _la==18):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 298
+                        self.condExpr(7)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = TyCParser.RelationalExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 299
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 300
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 251658240) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 301
+                        self.condExpr(6)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = TyCParser.EqualityExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 302
+                        if not self.precpred(self._ctx, 4):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
+                        self.state = 303
+                        _la = self._input.LA(1)
+                        if not(_la==22 or _la==23):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 304
+                        self.condExpr(5)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = TyCParser.LogicalAndExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 305
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 306
+                        self.match(TyCParser.AND)
+                        self.state = 307
+                        self.condExpr(4)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = TyCParser.LogicalOrExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 308
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 309
+                        self.match(TyCParser.OR)
+                        self.state = 310
+                        self.condExpr(3)
+                        pass
+
+                    elif la_ == 7:
+                        localctx = TyCParser.MemberAccessExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 311
+                        if not self.precpred(self._ctx, 12):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 12)")
+                        self.state = 312
+                        self.match(TyCParser.DOT)
+                        self.state = 313
+                        self.match(TyCParser.ID)
+                        pass
+
+                    elif la_ == 8:
+                        localctx = TyCParser.FunctionCallExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 314
+                        if not self.precpred(self._ctx, 11):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 11)")
+                        self.state = 315
+                        self.match(TyCParser.LPAREN)
+                        self.state = 317
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if (((_la) & ~0x3f) == 0 and ((1 << _la) & 264577502019584) != 0):
+                            self.state = 316
+                            self.argList()
+
+
+                        self.state = 319
+                        self.match(TyCParser.RPAREN)
+                        pass
+
+                    elif la_ == 9:
+                        localctx = TyCParser.PostfixExprContext(self, TyCParser.CondExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_condExpr)
+                        self.state = 320
+                        if not self.precpred(self._ctx, 10):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
+                        self.state = 321
+                        _la = self._input.LA(1)
+                        if not(_la==31 or _la==32):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        pass
+
+             
+                self.state = 326
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class ArgListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_argList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArgList" ):
+                return visitor.visitArgList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def argList(self):
+
+        localctx = TyCParser.ArgListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_argList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 327
+            self.expr()
+            self.state = 332
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==42:
+                self.state = 328
+                self.match(TyCParser.COMMA)
+                self.state = 329
+                self.expr()
+                self.state = 334
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def literal(self):
+            return self.getTypedRuleContext(TyCParser.LiteralContext,0)
+
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def argList(self):
+            return self.getTypedRuleContext(TyCParser.ArgListContext,0)
+
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_primary
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimary" ):
+                return visitor.visitPrimary(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primary(self):
+
+        localctx = TyCParser.PrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_primary)
+        try:
+            self.state = 345
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [39]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 335
+                self.match(TyCParser.LPAREN)
+                self.state = 336
+                self.expr()
+                self.state = 337
+                self.match(TyCParser.RPAREN)
+                pass
+            elif token in [47]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 339
+                self.match(TyCParser.ID)
+                pass
+            elif token in [44, 45, 46]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 340
+                self.literal()
+                pass
+            elif token in [37]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 341
+                self.match(TyCParser.LBRACE)
+                self.state = 342
+                self.argList()
+                self.state = 343
+                self.match(TyCParser.RBRACE)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LiteralContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT_LITERAL(self):
+            return self.getToken(TyCParser.INT_LITERAL, 0)
+
+        def FLOAT_LITERAL(self):
+            return self.getToken(TyCParser.FLOAT_LITERAL, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(TyCParser.STRING_LITERAL, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_literal
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLiteral" ):
+                return visitor.visitLiteral(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def literal(self):
+
+        localctx = TyCParser.LiteralContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_literal)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 347
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 123145302310912) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[27] = self.lvalue_sempred
+        self._predicates[28] = self.condExpr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def lvalue_sempred(self, localctx:LvalueContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 2)
+         
+
+    def condExpr_sempred(self, localctx:CondExprContext, predIndex:int):
+            if predIndex == 1:
+                return self.precpred(self._ctx, 7)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 6)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 5)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 4)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 3)
+         
+
+            if predIndex == 6:
+                return self.precpred(self._ctx, 2)
+         
+
+            if predIndex == 7:
+                return self.precpred(self._ctx, 12)
+         
+
+            if predIndex == 8:
+                return self.precpred(self._ctx, 11)
+         
+
+            if predIndex == 9:
+                return self.precpred(self._ctx, 10)
+         
+
+
+
+
@@ -0,0 +1,238 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .TyCParser import TyCParser
+else:
+    from TyCParser import TyCParser
+
+# This class defines a complete generic visitor for a parse tree produced by TyCParser.
+
+class TyCVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by TyCParser#program.
+    def visitProgram(self, ctx:TyCParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#globalDecl.
+    def visitGlobalDecl(self, ctx:TyCParser.GlobalDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structDecl.
+    def visitStructDecl(self, ctx:TyCParser.StructDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structMember.
+    def visitStructMember(self, ctx:TyCParser.StructMemberContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#funcDecl.
+    def visitFuncDecl(self, ctx:TyCParser.FuncDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnType.
+    def visitReturnType(self, ctx:TyCParser.ReturnTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#paramList.
+    def visitParamList(self, ctx:TyCParser.ParamListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#param.
+    def visitParam(self, ctx:TyCParser.ParamContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#type_.
+    def visitType_(self, ctx:TyCParser.Type_Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#block.
+    def visitBlock(self, ctx:TyCParser.BlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#blockItem.
+    def visitBlockItem(self, ctx:TyCParser.BlockItemContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#stmt.
+    def visitStmt(self, ctx:TyCParser.StmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDecl.
+    def visitVarDecl(self, ctx:TyCParser.VarDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structInitializer.
+    def visitStructInitializer(self, ctx:TyCParser.StructInitializerContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#ifStmt.
+    def visitIfStmt(self, ctx:TyCParser.IfStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#whileStmt.
+    def visitWhileStmt(self, ctx:TyCParser.WhileStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#ForInitDecl.
+    def visitForInitDecl(self, ctx:TyCParser.ForInitDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#ForInitExpr.
+    def visitForInitExpr(self, ctx:TyCParser.ForInitExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forStmt.
+    def visitForStmt(self, ctx:TyCParser.ForStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchStmt.
+    def visitSwitchStmt(self, ctx:TyCParser.SwitchStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchBlockStatementGroup.
+    def visitSwitchBlockStatementGroup(self, ctx:TyCParser.SwitchBlockStatementGroupContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchLabel.
+    def visitSwitchLabel(self, ctx:TyCParser.SwitchLabelContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#breakStmt.
+    def visitBreakStmt(self, ctx:TyCParser.BreakStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#continueStmt.
+    def visitContinueStmt(self, ctx:TyCParser.ContinueStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnStmt.
+    def visitReturnStmt(self, ctx:TyCParser.ReturnStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#exprStmt.
+    def visitExprStmt(self, ctx:TyCParser.ExprStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#semiStmt.
+    def visitSemiStmt(self, ctx:TyCParser.SemiStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#AssignmentExpr.
+    def visitAssignmentExpr(self, ctx:TyCParser.AssignmentExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#ExprFallback.
+    def visitExprFallback(self, ctx:TyCParser.ExprFallbackContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#lvalue.
+    def visitLvalue(self, ctx:TyCParser.LvalueContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#PrimaryExprRule.
+    def visitPrimaryExprRule(self, ctx:TyCParser.PrimaryExprRuleContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#PostfixExpr.
+    def visitPostfixExpr(self, ctx:TyCParser.PostfixExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#MultiplicativeExpr.
+    def visitMultiplicativeExpr(self, ctx:TyCParser.MultiplicativeExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#LogicalOrExpr.
+    def visitLogicalOrExpr(self, ctx:TyCParser.LogicalOrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#EqualityExpr.
+    def visitEqualityExpr(self, ctx:TyCParser.EqualityExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#FunctionCallExpr.
+    def visitFunctionCallExpr(self, ctx:TyCParser.FunctionCallExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#AdditiveExpr.
+    def visitAdditiveExpr(self, ctx:TyCParser.AdditiveExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#RelationalExpr.
+    def visitRelationalExpr(self, ctx:TyCParser.RelationalExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#MemberAccessExpr.
+    def visitMemberAccessExpr(self, ctx:TyCParser.MemberAccessExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#UnaryExpr.
+    def visitUnaryExpr(self, ctx:TyCParser.UnaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#LogicalAndExpr.
+    def visitLogicalAndExpr(self, ctx:TyCParser.LogicalAndExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#PrefixExpr.
+    def visitPrefixExpr(self, ctx:TyCParser.PrefixExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#argList.
+    def visitArgList(self, ctx:TyCParser.ArgListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#primary.
+    def visitPrimary(self, ctx:TyCParser.PrimaryContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#literal.
+    def visitLiteral(self, ctx:TyCParser.LiteralContext):
+        return self.visitChildren(ctx)
+
+
+
+del TyCParser
\ No newline at end of file
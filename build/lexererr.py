@@ -0,0 +1,50 @@
+from typing import NamedTuple
+
+
+class LexerError(Exception):
+    def __str__(self):
+        return self.message
+
+
+class ErrorToken(LexerError):
+    def __init__(self, s):
+        self.message = "Error Token " + s
+
+
+class UncloseString(LexerError):
+    def __init__(self, s):
+        self.message = "Unclosed String: " + s
+
+
+class IllegalEscape(LexerError):
+    def __init__(self, s):
+        self.message = "Illegal Escape In String: " + s
+
+
+class LexicalDiagnostic(NamedTuple):
+    """A lexical error recorded instead of raised (see TyCLexer.collectErrors)."""
+
+    kind: str  # ErrorToken, UncloseString or IllegalEscape
+    lexeme: str  # the token text carried by the error
+    start: int  # offsets of the offending token in the input
+    stop: int
+    line: int
+    column: int
+
+    @classmethod
+    def of(cls, error, token):
+        return cls(
+            type(error).__name__,
+            token.text,
+            token.start,
+            token.stop,
+            token.line,
+            token.column,
+        )
+
+    @property
+    def message(self):
+        return str(ERRORS[self.kind](self.lexeme))
+
+
+ERRORS = {cls.__name__: cls for cls in (ErrorToken, UncloseString, IllegalEscape)}
@@ -13,6 +13,8 @@ Usage:
     python run.py test-lexer
     python run.py test-parser
     python run.py test-ast
+    python run.py warm-dfa <files>
+    python run.py profile-parser <files>
     python run.py clean
 
     # On macOS/Linux:
@@ -22,6 +24,8 @@ Usage:
     python3 run.py test-lexer
     python3 run.py test-parser
     python3 run.py test-ast
+    python3 run.py warm-dfa <files>
+    python3 run.py profile-parser <files>
     python3 run.py clean
 """
 
@@ -94,7 +98,7 @@ class TyCBuilder:
             self.venv_python3 = self.venv_dir / "bin" / "python"
             self.venv_pip = self.venv_dir / "bin" / "pip"
 
-    def run_command(self, cmd, cwd=None, check=True, capture_output=False):
+    def run_command(self, cmd, cwd=None, check=True, capture_output=False, env=None):
         """Run a shell command."""
         try:
             if isinstance(cmd, str):
@@ -105,6 +109,7 @@ class TyCBuilder:
                     check=check,
                     capture_output=capture_output,
                     text=True,
+                    env=env,
                 )
             else:
                 result = subprocess.run(
@@ -113,6 +118,7 @@ class TyCBuilder:
                     check=check,
                     capture_output=capture_output,
                     text=True,
+                    env=env,
                 )
             return result
         except subprocess.CalledProcessError as e:
@@ -196,6 +202,18 @@ class TyCBuilder:
             )
         )
         print()
+        print(self.colors.green("Performance:"))
+        print(
+            self.colors.yellow(
+                "  python3 run.py warm-dfa <files> - Save a warm DFA cache learned from <files>"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py profile-parser <files> - Profile parser decisions on <files>"
+            )
+        )
+        print()
         print(self.colors.green("Cleaning:"))
         print(
             self.colors.yellow(
@@ -493,6 +511,58 @@ class TyCBuilder:
         )
         self.clean_cache()
 
+    def python_env(self):
+        """Environment for running project modules in the virtual env."""
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join([str(self.root_dir), str(self.build_dir)])
+        return env
+
+    def warm_dfa_cache(self, files):
+        """Parse a warm-up corpus and save the learned DFAs to build/."""
+        if not files:
+            print(self.colors.red("Usage: python3 run.py warm-dfa <file.tyc>..."))
+            sys.exit(1)
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Warming up DFA cache..."))
+        self.run_command(
+            [str(self.venv_python3), "-m", "src.frontend.dfa_cache", *files],
+            env=self.python_env(),
+        )
+        print(
+            self.colors.green(
+                "DFA cache saved. Set TYC_DFA_CACHE=build/dfa_cache.json to load it at startup."
+            )
+        )
+
+    def profile_parser(self, files):
+        """Profile the parser's decisions on <files>; JSON goes to build/."""
+        if not files:
+            print(self.colors.red("Usage: python3 run.py profile-parser <file.tyc>..."))
+            sys.exit(1)
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Profiling parser decisions..."))
+        self.run_command(
+            [
+                str(self.venv_python3),
+                "-m",
+                "src.frontend.profiling",
+                *files,
+                "--json",
+                str(self.build_dir / "parser_profile.json"),
+            ],
+            env=self.python_env(),
+        )
+
 
 def main():
     """Main entry point."""
@@ -517,9 +587,12 @@ def main():
             "test-lexer",
             "test-parser",
             "test-ast",
+            "warm-dfa",
+            "profile-parser",
         ],
         help="Command to execute",
     )
+    parser.add_argument("files", nargs="*", help="Input files for warm-dfa / profile-parser")
 
     args = parser.parse_args()
 
@@ -537,6 +610,8 @@ def main():
         "test-lexer": builder.test_lexer,
         "test-parser": builder.test_parser,
         "test-ast": builder.test_ast,
+        "warm-dfa": lambda: builder.warm_dfa_cache(args.files),
+        "profile-parser": lambda: builder.profile_parser(args.files),
     }
 
     if args.command in commands:
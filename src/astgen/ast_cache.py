@@ -0,0 +1,399 @@
+"""
+Content-addressed on-disk cache for the source -> AST pipeline.
+
+Lexing, parsing and ASTGeneration are pure functions of the source text,
+the grammar and the compiler, so their outcome can be reused across runs.
+ASTCache.generate(source) looks the source up by a key that hashes
+
+    the source text
+    src/grammar/TyC.g4
+    the compiler version: compiler_version(), a hash of COMPILER_MODULES,
+    the ANTLR runtime version and the binary AST schema version
+    the expression parser in use (parsing.EXPR_PARSER)
+
+and on a hit decodes the stored AST with utils.ast_binary without touching
+ANTLR. On a miss it runs the pipeline (the one tests.utils.ASTGenerator
+runs) and stores the AST, or the error message if the pipeline failed.
+
+Entries are files under the cache directory, sharded by the first two hex
+digits of the key. Each is written to a temporary file and renamed into
+place, so concurrent processes never see partial entries; an unreadable
+entry is treated as a miss and removed. Hits refresh the entry's mtime,
+and when the entries outgrow `max_bytes` the least recently used ones are
+deleted until the cache is back under LOW_WATER of the bound.
+
+Usage:
+    python -m src.astgen.ast_cache <file.tyc>... [--dir build/ast_cache]
+    TYC_AST_CACHE=build/ast_cache   # used by tests.utils.ASTGenerator
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from importlib import metadata
+from typing import List, NamedTuple
+
+from src.frontend import parsing
+from src.utils import ast_binary
+
+
+FORMAT_VERSION = 1
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GRAMMAR_FILE = os.path.join(ROOT_DIR, "src", "grammar", "TyC.g4")
+DEFAULT_DIR = os.path.join(ROOT_DIR, "build", "ast_cache")
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# Eviction trims the cache to this fraction of max_bytes
+LOW_WATER = 0.8
+
+# Modules whose code decides what AST or diagnostics a source produces,
+# or how the AST is stored
+COMPILER_MODULES = (
+    "src/astgen/ast_generation.py",
+    "src/frontend/parsing.py",
+    "src/frontend/pratt.py",
+    "src/frontend/streams.py",
+    "src/frontend/tokens.py",
+    "src/grammar/lexererr.py",
+    "src/utils/ast_binary.py",
+    "src/utils/error_listener.py",
+    "src/utils/node_schema.py",
+    "src/utils/nodes.py",
+    "src/utils/spans.py",
+    "build/TyCParser.py",
+    "build/TyCLexer.py",
+    "build/TyCVisitor.py",
+    "build/lexererr.py",
+)
+
+# Entry layout: ENTRY_MAGIC, diagnostics JSON length (4 bytes, little
+# endian), diagnostics JSON (a list of messages), then the AST encoding
+# (absent if the pipeline failed)
+ENTRY_MAGIC = b"TyCC"
+_LENGTH = struct.Struct("<I")
+_HEADER_SIZE = len(ENTRY_MAGIC) + _LENGTH.size
+
+_grammar_hash = None
+_compiler_version = None
+_default_cache = None
+
+
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def grammar_hash() -> str:
+    """Hash of src/grammar/TyC.g4 (computed once per process)."""
+    global _grammar_hash
+    if _grammar_hash is None:
+        _grammar_hash = _file_hash(GRAMMAR_FILE)
+    return _grammar_hash
+
+
+def compiler_version() -> str:
+    """Hash identifying the code that turns sources into ASTs."""
+    global _compiler_version
+    if _compiler_version is None:
+        digest = hashlib.sha256()
+        for name in COMPILER_MODULES:
+            digest.update(name.encode())
+            digest.update(_file_hash(os.path.join(ROOT_DIR, name)).encode())
+        digest.update(metadata.version("antlr4-python3-runtime").encode())
+        digest.update(str(ast_binary.SCHEMA_VERSION).encode())
+        digest.update(str(FORMAT_VERSION).encode())
+        _compiler_version = digest.hexdigest()
+    return _compiler_version
+
+
+def cache_key(source: str, expressions: str = None) -> str:
+    """Key of the pipeline's outcome for *source*."""
+    digest = hashlib.sha256()
+    digest.update(grammar_hash().encode())
+    digest.update(compiler_version().encode())
+    digest.update((expressions or parsing.EXPR_PARSER).encode())
+    digest.update(b"\0")
+    digest.update(source.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def build_ast(source: str, expressions: str = None):
+    """Run the uncached pipeline: (AST, []) or (None, [error message]).
+
+    RecursionError is raised: it depends on the recursion limit, not on
+    the source, so it must not be cached.
+    """
+    from src.astgen.ast_generation import ASTGeneration
+
+    try:
+        tree = parsing.parse(parsing.make_parser(source, expressions=expressions))
+        return ASTGeneration().visit(tree), []
+    except RecursionError:
+        raise
+    except Exception as e:
+        return None, [str(e)]
+
+
+class CacheResult(NamedTuple):
+    """Outcome of ASTCache.generate()."""
+
+    ast: object  # nodes.Program, or None if the pipeline failed
+    diagnostics: List[str]  # error messages, empty on success
+    hit: bool
+
+    @property
+    def ok(self) -> bool:
+        return self.ast is not None
+
+
+class CacheStats:
+    """Counters of one ASTCache."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.corrupt = 0  # unreadable entries, counted as misses too
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "corrupt": self.corrupt,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __str__(self):
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, writes={self.writes}, "
+            f"evictions={self.evictions}, corrupt={self.corrupt})"
+        )
+
+
+class ASTCache:
+    """Size-bounded LRU cache of pipeline outcomes in *directory*."""
+
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(directory or DEFAULT_DIR)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._size = None  # bytes of all entries, scanned on first write
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def generate(self, source: str, expressions: str = None) -> CacheResult:
+        """The AST and diagnostics of *source*, from the cache if possible."""
+        key = cache_key(source, expressions)
+        result = self.get(key)
+        if result is not None:
+            return result
+        try:
+            ast, diagnostics = build_ast(source, expressions)
+        except RecursionError as e:
+            return CacheResult(None, [str(e)], False)
+        self.put(key, ast, diagnostics)
+        return CacheResult(ast, diagnostics, False)
+
+    def get(self, key: str):
+        """The CacheResult stored under *key*, or None (a miss)."""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.stats.misses += 1
+            return None
+        try:
+            ast, diagnostics = _decode_entry(data)
+        except (ast_binary.FormatError, ValueError):
+            self.stats.misses += 1
+            self.stats.corrupt += 1
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        self.stats.hits += 1
+        return CacheResult(ast, diagnostics, True)
+
+    # ------------------------------------------------------------------
+    # Storing
+    # ------------------------------------------------------------------
+
+    def put(self, key: str, ast, diagnostics) -> bool:
+        """Store an outcome under *key*; False if it was not stored."""
+        data = _encode_entry(ast, diagnostics)
+        if len(data) > self.max_bytes:
+            return False
+        path = self.path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        old_size = _file_size(path)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".ast-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            self._remove(tmp)
+            raise
+        self.stats.writes += 1
+        if self._size is None:
+            self._size = self.usage()
+        else:
+            self._size += len(data) - old_size
+        if self._size > self.max_bytes:
+            self.evict()
+        return True
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _entries(self):
+        """(mtime, size, path) of every entry."""
+        entries = []
+        try:
+            shards = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for shard in shards:
+            shard_dir = os.path.join(self.directory, shard)
+            if len(shard) != 2 or not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                if name.startswith("."):
+                    continue  # another process's temporary file
+                path = os.path.join(shard_dir, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue  # evicted concurrently
+                entries.append((st.st_mtime_ns, st.st_size, path))
+        return entries
+
+    def usage(self) -> int:
+        """Bytes held by all entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self):
+        return len(self._entries())
+
+    def evict(self, target: int = None) -> int:
+        """Delete least recently used entries down to *target* bytes."""
+        target = int(self.max_bytes * LOW_WATER) if target is None else target
+        entries = self._entries()
+        size = sum(entry_size for _, entry_size, _ in entries)
+        removed = 0
+        for _, entry_size, path in sorted(entries):
+            if size <= target:
+                break
+            if self._remove(path):
+                removed += 1
+            size -= entry_size
+        self.stats.evictions += removed
+        self._size = size
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry; return how many there were."""
+        return self.evict(0)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.unlink(path)
+            return True
+        except OSError:
+            return False
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _encode_entry(ast, diagnostics) -> bytes:
+    meta = json.dumps(list(diagnostics)).encode("utf-8")
+    body = b"" if ast is None else ast_binary.dumps(ast)
+    return ENTRY_MAGIC + _LENGTH.pack(len(meta)) + meta + body
+
+
+def _decode_entry(data: bytes):
+    if len(data) < _HEADER_SIZE or data[: len(ENTRY_MAGIC)] != ENTRY_MAGIC:
+        raise ast_binary.FormatError("Not an AST cache entry")
+    (length,) = _LENGTH.unpack_from(data, len(ENTRY_MAGIC))
+    start = _HEADER_SIZE + length
+    if start > len(data):
+        raise ast_binary.FormatError("Truncated AST cache entry")
+    diagnostics = json.loads(data[_HEADER_SIZE:start].decode("utf-8"))
+    if start == len(data):
+        if not diagnostics:
+            raise ast_binary.FormatError("AST cache entry without AST or diagnostics")
+        return None, diagnostics
+    return ast_binary.loads(memoryview(data)[start:]), diagnostics
+
+
+def default_cache():
+    """The cache named by $TYC_AST_CACHE, or None if it is not set."""
+    global _default_cache
+    directory = os.environ.get("TYC_AST_CACHE")
+    if not directory:
+        return None
+    if _default_cache is None or _default_cache.directory != os.path.abspath(directory):
+        _default_cache = ASTCache(directory)
+    return _default_cache
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    directory = None
+    if "--dir" in argv:
+        i = argv.index("--dir")
+        directory = argv[i + 1]
+        argv = argv[:i] + argv[i + 2 :]
+    clear = "--clear" in argv
+    argv = [a for a in argv if a != "--clear"]
+    if not argv and not clear:
+        print("usage: python -m src.astgen.ast_cache <file.tyc>... [--dir DIR] [--clear]")
+        return 2
+    cache = ASTCache(directory)
+    if clear:
+        print(f"Removed {cache.clear()} entries from {cache.directory}")
+    failed = 0
+    for name in argv:
+        with open(name, encoding="utf-8") as f:
+            result = cache.generate(f.read())
+        if not result.ok:
+            failed += 1
+            print(f"{name}: {result.diagnostics[0]}")
+    if argv:
+        print(f"{cache.stats} ({len(cache)} entries, {cache.usage() / 1024:.0f} KiB)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,13 +4,424 @@ This module contains the ASTGeneration class that converts parse trees
 into Abstract Syntax Trees using the visitor pattern.
 """
 
-from functools import reduce
+import sys
+from types import GeneratorType
 from build.TyCVisitor import TyCVisitor
 from build.TyCParser import TyCParser
 from src.utils.nodes import *
+from src.utils.spans import SPAN_SHIFT, line_index_of
+
+
+class ASTGenerationError(Exception):
+    """The parse tree cannot be turned into an AST."""
+
+    def __init__(self, msg):
+        self.message = msg
+        super().__init__(msg)
+
+
+class IncompleteTree(ASTGenerationError):
+    """A subtree was left incomplete by syntax error recovery."""
+
+
+# Tokens whose text ends up in the AST: a conjured ("<missing ID>") one
+# makes the enclosing subtree unusable.
+_MEANINGFUL_TOKENS = frozenset(
+    {
+        TyCParser.ID,
+        TyCParser.INT_LITERAL,
+        TyCParser.FLOAT_LITERAL,
+        TyCParser.STRING_LITERAL,
+    }
+)
 
 
 class ASTGeneration(TyCVisitor):
-    """AST Generation visitor for TyC language."""
+    """AST Generation visitor for TyC language.
+
+    Trees of any depth are converted without recursion: the visit methods
+    of composite constructs are generators that yield the child contexts
+    they need and receive the children's nodes in return, and visit()
+    drives them with an explicit stack of pending frames (see run()). Left
+    recursive operator chains, else-if ladders and nested statements are
+    therefore limited by memory, not by the recursion limit. Methods that
+    only forward to one child return that child's result as is (a node or
+    a frame) without adding a frame of their own.
+
+    With partial=True the visitor accepts parse trees produced by the
+    recovering parser (src.frontend.recovery): declarations, struct members,
+    block items and switch groups that were damaged by a syntax error are
+    left out of the AST instead of failing the whole generation.
+    """
+
+    def __init__(self, partial: bool = False):
+        super().__init__()
+        self.partial = partial
+
+    # ------------------------------------------------------------------
+    # Driver
+    # ------------------------------------------------------------------
+
+    def visit(self, tree):
+        return self.run(self._enter(tree))
+
+    def _enter(self, tree):
+        """Start visiting *tree*: its node, or a frame that will build it."""
+        if self.partial:
+            self._check_complete(tree)
+        return tree.accept(self)
+
+    def run(self, frame):
+        """Drive a visit method's result to the node it builds.
+
+        *frame* is a node (returned as is) or a visit generator. The pending
+        generators are kept on an explicit stack: a yielded context is
+        entered, and its node is sent back to the generator that asked for
+        it; an exception is thrown into that generator instead, so partial
+        mode can drop the incomplete item, as with nested calls. Visit
+        methods yield their children in source order, so the error raised
+        is the first one in the source.
+        """
+        if type(frame) is not GeneratorType:
+            return frame
+        stack = [frame]
+        value = None
+        error = None
+        while True:
+            gen = stack[-1]
+            try:
+                if error is None:
+                    child = gen.send(value)
+                else:
+                    child = gen.throw(error)
+                    error = None
+            except StopIteration as stop:
+                error = None
+                stack.pop()
+                if not stack:
+                    return stop.value
+                value = stop.value
+                continue
+            except Exception as e:
+                stack.pop()
+                if not stack:
+                    raise
+                error = e
+                continue
+            try:
+                result = self._enter(child)
+            except Exception as e:
+                error = e
+                continue
+            if type(result) is GeneratorType:
+                stack.append(result)
+                value = None
+            else:
+                value = result
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _check_complete(ctx):
+        if getattr(ctx, "exception", None) is not None:
+            raise IncompleteTree(f"Incomplete {type(ctx).__name__}")
+        for child in getattr(ctx, "children", None) or ():
+            symbol = getattr(child, "symbol", None)
+            if (
+                symbol is not None
+                and symbol.tokenIndex == -1
+                and symbol.type in _MEANINGFUL_TOKENS
+            ):
+                raise IncompleteTree(f"Missing token in {type(ctx).__name__}")
+
+    def _items(self, contexts):
+        """Visit each context; in partial mode drop the incomplete ones."""
+        items = []
+        for ctx in contexts:
+            try:
+                item = yield ctx
+            except IncompleteTree:
+                if not self.partial:
+                    raise
+                continue
+            if item is not None:
+                items.append(item)
+        return items
+
+    def _all(self, contexts):
+        """Visit each context."""
+        items = []
+        for ctx in contexts:
+            items.append((yield ctx))
+        return items
+
+    @staticmethod
+    def _text(node) -> str:
+        """Interned text of a terminal: names and operators are shared strings."""
+        return sys.intern(node.getText())
+
+    def _at(self, node, ctx):
+        """Set the source span of *node* to the tokens of *ctx*."""
+        start = ctx.start
+        begin = start.start
+        if begin < 0:
+            return node  # a token conjured by error recovery
+        stop = ctx.stop
+        end = begin if stop is None else max(begin, stop.stop + 1)
+        node.span = begin << SPAN_SHIFT | end
+        return node
+
+    # ------------------------------------------------------------------
+    # Program and declarations
+    # ------------------------------------------------------------------
+
+    def visitProgram(self, ctx: TyCParser.ProgramContext):
+        decls = yield from self._items(ctx.globalDecl())
+        source = line_index_of(ctx.start.getInputStream())
+        return self._at(Program(decls, source), ctx)
+
+    def visitGlobalDecl(self, ctx: TyCParser.GlobalDeclContext):
+        return self._enter(ctx.getChild(0))
+
+    def visitStructDecl(self, ctx: TyCParser.StructDeclContext):
+        members = yield from self._items(ctx.structMember())
+        return self._at(StructDecl(self._text(ctx.ID()), members), ctx)
+
+    def visitStructMember(self, ctx: TyCParser.StructMemberContext):
+        return self._at(MemberDecl(self.visit(ctx.type_()), self._text(ctx.ID())), ctx)
+
+    def visitFuncDecl(self, ctx: TyCParser.FuncDeclContext):
+        return_type = self.visit(ctx.returnType()) if ctx.returnType() else None
+        params = self.visit(ctx.paramList()) if ctx.paramList() else []
+        body = yield ctx.block()
+        return self._at(FuncDecl(return_type, self._text(ctx.ID()), params, body), ctx)
+
+    def visitReturnType(self, ctx: TyCParser.ReturnTypeContext):
+        if ctx.VOID():
+            return VoidType()
+        return self.visit(ctx.type_())
+
+    def visitParamList(self, ctx: TyCParser.ParamListContext):
+        return [self.visit(p) for p in ctx.param()]
+
+    def visitParam(self, ctx: TyCParser.ParamContext):
+        return self._at(Param(self.visit(ctx.type_()), self._text(ctx.ID())), ctx)
+
+    def visitType_(self, ctx: TyCParser.Type_Context):
+        # Types are shared instances (see nodes.Type) and carry no position
+        if ctx.INT():
+            return IntType()
+        if ctx.FLOAT():
+            return FloatType()
+        if ctx.STRING():
+            return StringType()
+        return StructType(self._text(ctx.ID()))
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def visitBlock(self, ctx: TyCParser.BlockContext):
+        statements = yield from self._items(ctx.blockItem())
+        return self._at(BlockStmt(statements), ctx)
+
+    def visitLazyBlock(self, ctx):
+        """Function body skipped by src.frontend.lazy: its placeholder."""
+        return ctx.body
+
+    def visitBlockItem(self, ctx: TyCParser.BlockItemContext):
+        return self._enter(ctx.getChild(0))
+
+    def visitStmt(self, ctx: TyCParser.StmtContext):
+        return self._enter(ctx.getChild(0))
+
+    def visitVarDecl(self, ctx: TyCParser.VarDeclContext):
+        var_type = None if ctx.AUTO() else self.visit(ctx.type_())
+        if ctx.expr():
+            init = yield ctx.expr()
+        elif ctx.structInitializer():
+            init = yield ctx.structInitializer()
+        else:
+            init = None
+        return self._at(VarDecl(var_type, self._text(ctx.ID()), init), ctx)
+
+    def visitStructInitializer(self, ctx: TyCParser.StructInitializerContext):
+        values = yield from self._all(ctx.expr())
+        return self._at(StructLiteral(values), ctx)
+
+    def visitIfStmt(self, ctx: TyCParser.IfStmtContext):
+        condition = yield ctx.expr()
+        then_stmt = yield ctx.stmt(0)
+        else_stmt = (yield ctx.stmt(1)) if ctx.ELSE() else None
+        return self._at(IfStmt(condition, then_stmt, else_stmt), ctx)
+
+    def visitWhileStmt(self, ctx: TyCParser.WhileStmtContext):
+        condition = yield ctx.expr()
+        body = yield ctx.stmt()
+        return self._at(WhileStmt(condition, body), ctx)
+
+    def visitForInitDecl(self, ctx: TyCParser.ForInitDeclContext):
+        return self._enter(ctx.varDecl())
+
+    def visitForInitExpr(self, ctx: TyCParser.ForInitExprContext):
+        if ctx.expr() is None:
+            return None
+        expr = yield ctx.expr()
+        return self._at(ExprStmt(expr), ctx)
+
+    def visitForStmt(self, ctx: TyCParser.ForStmtContext):
+        # FOR ( forControl expr? ; expr? ) stmt: the optional expressions are
+        # told apart by their position relative to the second ';'
+        semi = ctx.SEMI().symbol.tokenIndex
+        condition = update = None
+        init = yield ctx.forControl()
+        for e in ctx.expr():
+            if e.start.tokenIndex < semi:
+                condition = yield e
+            else:
+                update = yield e
+        body = yield ctx.stmt()
+        return self._at(ForStmt(init, condition, update, body), ctx)
+
+    def visitSwitchStmt(self, ctx: TyCParser.SwitchStmtContext):
+        cases = []
+        default_case = None
+        expr = yield ctx.expr()
+        for group in (yield from self._items(ctx.switchBlockStatementGroup())):
+            for label in group:
+                if isinstance(label, DefaultStmt):
+                    default_case = label
+                else:
+                    cases.append(label)
+        return self._at(SwitchStmt(expr, cases, default_case), ctx)
+
+    def visitSwitchBlockStatementGroup(self, ctx: TyCParser.SwitchBlockStatementGroupContext):
+        # `case 1: case 2: stmts` falls through: only the last label owns
+        # the statements
+        labels = yield from self._all(ctx.switchLabel())
+        statements = yield from self._items(ctx.blockItem())
+        nodes = []
+        for i, (label_ctx, expr) in enumerate(zip(ctx.switchLabel(), labels)):
+            body = statements if i == len(labels) - 1 else []
+            if expr is None:
+                nodes.append(self._at(DefaultStmt(body), label_ctx))
+            else:
+                nodes.append(self._at(CaseStmt(expr, body), label_ctx))
+        return nodes
+
+    def visitSwitchLabel(self, ctx: TyCParser.SwitchLabelContext):
+        return self._enter(ctx.condExpr()) if ctx.CASE() else None
+
+    def visitBreakStmt(self, ctx: TyCParser.BreakStmtContext):
+        return self._at(BreakStmt(), ctx)
+
+    def visitContinueStmt(self, ctx: TyCParser.ContinueStmtContext):
+        return self._at(ContinueStmt(), ctx)
+
+    def visitReturnStmt(self, ctx: TyCParser.ReturnStmtContext):
+        expr = (yield ctx.expr()) if ctx.expr() else None
+        return self._at(ReturnStmt(expr), ctx)
+
+    def visitExprStmt(self, ctx: TyCParser.ExprStmtContext):
+        expr = yield ctx.expr()
+        return self._at(ExprStmt(expr), ctx)
+
+    def visitSemiStmt(self, ctx: TyCParser.SemiStmtContext):
+        return None  # a lone ';' is not a statement
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def visitAssignmentExpr(self, ctx: TyCParser.AssignmentExprContext):
+        lhs = yield ctx.lvalue()
+        rhs = yield ctx.expr()
+        return self._at(AssignExpr(lhs, rhs), ctx)
+
+    def visitExprFallback(self, ctx: TyCParser.ExprFallbackContext):
+        return self._enter(ctx.condExpr())
+
+    def visitLvalue(self, ctx: TyCParser.LvalueContext):
+        if ctx.LPAREN():
+            return (yield ctx.lvalue())
+        if ctx.DOT():
+            obj = yield ctx.lvalue()
+            return self._at(MemberAccess(obj, self._text(ctx.ID())), ctx)
+        return self._at(Identifier(self._text(ctx.ID())), ctx)
+
+    def visitMemberAccessExpr(self, ctx: TyCParser.MemberAccessExprContext):
+        obj = yield ctx.condExpr()
+        return self._at(MemberAccess(obj, self._text(ctx.ID())), ctx)
+
+    def visitFunctionCallExpr(self, ctx: TyCParser.FunctionCallExprContext):
+        callee = ctx.condExpr()
+        primary = callee.primary() if isinstance(callee, TyCParser.PrimaryExprRuleContext) else None
+        if primary is None or primary.ID() is None:
+            raise ASTGenerationError(
+                f"Error on line {callee.start.line} col {callee.start.column}: "
+                f"callee must be a function name, not {callee.getText()}"
+            )
+        args = (yield ctx.argList()) if ctx.argList() else []
+        return self._at(FuncCall(self._text(primary.ID()), args), ctx)
+
+    def visitPostfixExpr(self, ctx: TyCParser.PostfixExprContext):
+        operand = yield ctx.condExpr()
+        return self._at(PostfixOp(self._text(ctx.getChild(1)), operand), ctx)
+
+    def visitPrefixExpr(self, ctx: TyCParser.PrefixExprContext):
+        operand = yield ctx.condExpr()
+        return self._at(PrefixOp(self._text(ctx.getChild(0)), operand), ctx)
+
+    def visitUnaryExpr(self, ctx: TyCParser.UnaryExprContext):
+        operand = yield ctx.condExpr()
+        return self._at(PrefixOp(self._text(ctx.getChild(0)), operand), ctx)
+
+    def _binary(self, ctx):
+        left = yield ctx.condExpr(0)
+        operator = self._text(ctx.getChild(1))
+        right = yield ctx.condExpr(1)
+        return self._at(BinaryOp(left, operator, right), ctx)
+
+    visitMultiplicativeExpr = _binary
+    visitAdditiveExpr = _binary
+    visitRelationalExpr = _binary
+    visitEqualityExpr = _binary
+    visitLogicalAndExpr = _binary
+    visitLogicalOrExpr = _binary
+
+    def visitPrattExpr(self, ctx):
+        """expr/condExpr parsed by src.frontend.pratt: the node is already built."""
+        if ctx.error is not None:
+            raise ctx.error
+        return ctx.ast
+
+    def visitPrimaryExprRule(self, ctx: TyCParser.PrimaryExprRuleContext):
+        return self._enter(ctx.primary())
+
+    def visitArgList(self, ctx: TyCParser.ArgListContext):
+        return (yield from self._all(ctx.expr()))
+
+    def visitPrimary(self, ctx: TyCParser.PrimaryContext):
+        if ctx.LPAREN():
+            return self._enter(ctx.expr())
+        if ctx.ID():
+            return self._at(Identifier(self._text(ctx.ID())), ctx)
+        if ctx.literal():
+            return self._enter(ctx.literal())
+        return self._struct_literal(ctx)
+
+    def _struct_literal(self, ctx):
+        values = yield ctx.argList()
+        return self._at(StructLiteral(values), ctx)
 
-    pass
+    def visitLiteral(self, ctx: TyCParser.LiteralContext):
+        text = ctx.getChild(0).getText()
+        if ctx.INT_LITERAL():
+            node = IntLiteral(int(text))
+        elif ctx.FLOAT_LITERAL():
+            node = FloatLiteral(float(text))
+        else:
+            node = StringLiteral(text)
+        return self._at(node, ctx)
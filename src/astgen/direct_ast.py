@@ -0,0 +1,405 @@
+"""
+Direct-to-AST parsing for TyC: AST nodes are built while parsing.
+
+The two-phase pipeline materializes the whole ANTLR parse tree, a rule
+context for every rule invocation, and then converts it with
+ASTGeneration. parse_to_ast() runs the parser with buildParseTrees off
+and a DirectASTBuilder as parse listener instead: each rule's node is
+built when the rule exits, from the nodes of the rules it invoked, and a
+rule context is dropped as soon as its rule returns. The AST is the one
+ASTGeneration builds from the parse tree: same nodes, interned names and
+operators, and source spans.
+
+The builder keeps a stack of child values. Every rule exit replaces the
+values its children pushed with its own (a node, a list, or None for the
+parts ASTGeneration drops, such as a lone ';'). Left-recursive rules
+(condExpr, lvalue) are entered again around their left operand, which the
+parser signals by re-parenting the context it just exited: that operand's
+value is then already on the stack and becomes the first child.
+
+Without a parse tree, rule contexts only hold their own tokens, so the
+handlers tell optional children apart by token presence, value type or
+position. As with ASTGeneration, a call whose callee is not a name is an
+error raised after the parse, so syntax errors are reported first; when
+several calls are invalid, the first one in the source is reported.
+Recovered (partial) parse trees are not supported: use
+src.frontend.recovery for those.
+
+Usage:
+    from src.astgen.direct_ast import parse_to_ast
+    ast = parse_to_ast(make_parser(source))
+"""
+
+import sys
+from typing import NamedTuple
+
+from antlr4.tree.Tree import ParseTreeListener
+
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGenerationError
+from src.frontend.parsing import parse
+from src.utils.nodes import *
+from src.utils.spans import SPAN_SHIFT, line_index_of
+
+
+# Rules whose value is that of their only child rule: nothing to build
+_PASS_THROUGH = frozenset(
+    {"GlobalDecl", "BlockItem", "Stmt", "ForInitDecl", "ExprFallback", "PrimaryExprRule"}
+)
+_PASS = object()
+_FAILED = object()  # value of a rule whose handler, or a child's, raised
+
+
+class _Label(NamedTuple):
+    """A switch label: its condition (None for default) and span."""
+
+    expr: object
+    span: object
+
+
+class DirectASTBuilder(ParseTreeListener):
+    """Parse listener building the AST of a `program` as it is parsed.
+
+    Handlers are named after the context classes, as in ASTGeneration:
+    exitIfStmt(ctx, values) builds the node of an IfStmtContext from the
+    values of its child rules, in source order.
+    """
+
+    def __init__(self, parser: TyCParser):
+        self._input = parser.getTokenStream()
+        self._handlers = {}
+        self._reset()
+
+    def _reset(self):
+        self._values = []
+        self._marks = []  # per active rule: where its children's values start
+        self._exited = None  # the context that exited last
+        self._error = None  # exception of the first failed handler in the source
+        self._error_at = None  # and the index of its rule's first token
+
+    def result(self):
+        """The Program built by the last parse; raises its deferred error."""
+        if self._error is not None:
+            raise self._error
+        if len(self._values) != 1 or self._marks:
+            raise ASTGenerationError("The parse did not complete")
+        return self._values[0]
+
+    # ------------------------------------------------------------------
+    # Listener protocol
+    # ------------------------------------------------------------------
+
+    def enterEveryRule(self, ctx):
+        exited = self._exited
+        if exited is not None and exited.parentCtx is ctx:
+            # A left-recursive rule re-entered around its left operand
+            self._marks.append(len(self._values) - 1)
+        else:
+            if ctx.parentCtx is None:
+                self._reset()  # the start rule, possibly re-parsed in LL mode
+            self._marks.append(len(self._values))
+
+    def exitEveryRule(self, ctx):
+        self._exited = ctx
+        mark = self._marks.pop()
+        cls = ctx.__class__
+        handler = self._handlers.get(cls)
+        if handler is None:
+            handler = self._handler(cls)
+        if handler is _PASS:
+            if ctx.exception is None:
+                return  # its only child's value stands for it, already in place
+            handler = None
+        values = self._values[mark:]
+        del self._values[mark:]
+        value = None
+        if handler is not None and ctx.exception is None:
+            # A rule exits this way while an error unwinds the parser too:
+            # a handler failure is kept for result() rather than raised
+            # over the error in flight
+            try:
+                if self._error is not None and any(v is _FAILED for v in values):
+                    # Nothing to build over a failed child; only a callee
+                    # enclosing it can be wrong earlier in the source
+                    value = _FAILED
+                    if cls is TyCParser.FunctionCallExprContext:
+                        self._check_callee(ctx, values[0])
+                else:
+                    value = handler(ctx, values)
+            except Exception as e:
+                value = _FAILED
+                self._fail(ctx, e)
+        self._values.append(value)
+
+    def _fail(self, ctx, error):
+        """Keep *error* of *ctx* if it starts first in the source.
+
+        On a tie the enclosing rule, which exits last, wins: ASTGeneration
+        checks a callee before visiting it.
+        """
+        at = ctx.start.tokenIndex
+        if self._error is None or at <= self._error_at:
+            self._error = error
+            self._error_at = at
+
+    def _handler(self, cls):
+        name = cls.__name__.removesuffix("Context")
+        # Generic contexts (ExprContext, ...) only exit after a syntax error
+        handler = _PASS if name in _PASS_THROUGH else getattr(self, "exit" + name, None)
+        self._handlers[cls] = handler
+        return handler
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _text(node) -> str:
+        """Interned text of a terminal: names and operators are shared strings."""
+        return sys.intern(node.getText())
+
+    def _span(self, ctx):
+        """Span of the rule *ctx* exiting now: up to the last consumed token."""
+        start = ctx.start
+        begin = start.start
+        if begin < 0:
+            return None  # a token conjured by error recovery
+        stop = self._input.LT(-1)
+        end = begin if stop is None else max(begin, stop.stop + 1)
+        return begin << SPAN_SHIFT | end
+
+    def _at(self, node, ctx):
+        node.span = self._span(ctx)
+        return node
+
+    # ------------------------------------------------------------------
+    # Program and declarations
+    # ------------------------------------------------------------------
+
+    def exitProgram(self, ctx, values):
+        source = line_index_of(ctx.start.getInputStream())
+        return self._at(Program(values, source), ctx)
+
+    def exitStructDecl(self, ctx, values):
+        return self._at(StructDecl(self._text(ctx.ID()), values), ctx)
+
+    def exitStructMember(self, ctx, values):
+        return self._at(MemberDecl(values[0], self._text(ctx.ID())), ctx)
+
+    def exitFuncDecl(self, ctx, values):
+        # returnType? ID ( paramList? ) block: parameters are a list
+        *head, body = values
+        return_type = params = None
+        for value in head:
+            if isinstance(value, list):
+                params = value
+            else:
+                return_type = value
+        return self._at(
+            FuncDecl(return_type, self._text(ctx.ID()), params or [], body), ctx
+        )
+
+    def exitReturnType(self, ctx, values):
+        return VoidType() if ctx.VOID() else values[0]
+
+    def exitParamList(self, ctx, values):
+        return values
+
+    def exitParam(self, ctx, values):
+        return self._at(Param(values[0], self._text(ctx.ID())), ctx)
+
+    def exitType_(self, ctx, values):
+        if ctx.INT():
+            return IntType()
+        if ctx.FLOAT():
+            return FloatType()
+        if ctx.STRING():
+            return StringType()
+        return StructType(self._text(ctx.ID()))
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def exitBlock(self, ctx, values):
+        return self._at(BlockStmt([v for v in values if v is not None]), ctx)
+
+    def exitVarDecl(self, ctx, values):
+        if ctx.AUTO():
+            var_type = None
+        else:
+            var_type, *values = values
+        init = values[0] if values else None
+        return self._at(VarDecl(var_type, self._text(ctx.ID()), init), ctx)
+
+    def exitStructInitializer(self, ctx, values):
+        return self._at(StructLiteral(values), ctx)
+
+    def exitIfStmt(self, ctx, values):
+        condition, then_stmt, *rest = values
+        else_stmt = rest[0] if rest else None
+        return self._at(IfStmt(condition, then_stmt, else_stmt), ctx)
+
+    def exitWhileStmt(self, ctx, values):
+        return self._at(WhileStmt(values[0], values[1]), ctx)
+
+    def exitForInitExpr(self, ctx, values):
+        return self._at(ExprStmt(values[0]), ctx) if values else None
+
+    def exitForStmt(self, ctx, values):
+        # FOR ( forControl expr? ; expr? ) stmt: the optional expressions are
+        # told apart by their position relative to the second ';'
+        init, *exprs, body = values
+        semi = ctx.SEMI().symbol.start
+        condition = update = None
+        for e in exprs:
+            if e.start_offset < semi:
+                condition = e
+            else:
+                update = e
+        return self._at(ForStmt(init, condition, update, body), ctx)
+
+    def exitSwitchStmt(self, ctx, values):
+        expr, *groups = values
+        cases = []
+        default_case = None
+        for group in groups:
+            for label in group:
+                if isinstance(label, DefaultStmt):
+                    default_case = label
+                else:
+                    cases.append(label)
+        return self._at(SwitchStmt(expr, cases, default_case), ctx)
+
+    def exitSwitchBlockStatementGroup(self, ctx, values):
+        # `case 1: case 2: stmts` falls through: only the last label owns
+        # the statements
+        count = 0
+        while count < len(values) and isinstance(values[count], _Label):
+            count += 1
+        statements = [v for v in values[count:] if v is not None]
+        nodes = []
+        for i, label in enumerate(values[:count]):
+            body = statements if i == count - 1 else []
+            node = DefaultStmt(body) if label.expr is None else CaseStmt(label.expr, body)
+            node.span = label.span
+            nodes.append(node)
+        return nodes
+
+    def exitSwitchLabel(self, ctx, values):
+        return _Label(values[0] if ctx.CASE() else None, self._span(ctx))
+
+    def exitBreakStmt(self, ctx, values):
+        return self._at(BreakStmt(), ctx)
+
+    def exitContinueStmt(self, ctx, values):
+        return self._at(ContinueStmt(), ctx)
+
+    def exitReturnStmt(self, ctx, values):
+        return self._at(ReturnStmt(values[0] if values else None), ctx)
+
+    def exitExprStmt(self, ctx, values):
+        return self._at(ExprStmt(values[0]), ctx)
+
+    def exitSemiStmt(self, ctx, values):
+        return None  # a lone ';' is not a statement
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def exitAssignmentExpr(self, ctx, values):
+        return self._at(AssignExpr(values[0], values[1]), ctx)
+
+    def exitLvalue(self, ctx, values):
+        if ctx.LPAREN():
+            return values[0]
+        if ctx.DOT():
+            return self._at(MemberAccess(values[0], self._text(ctx.ID())), ctx)
+        return self._at(Identifier(self._text(ctx.ID())), ctx)
+
+    def exitMemberAccessExpr(self, ctx, values):
+        return self._at(MemberAccess(values[0], self._text(ctx.ID())), ctx)
+
+    def exitFunctionCallExpr(self, ctx, values):
+        callee, *rest = values
+        args = rest[0] if rest else []
+        self._check_callee(ctx, callee)
+        return self._at(FuncCall(callee.name, args), ctx)
+
+    def _check_callee(self, ctx, callee):
+        start = ctx.start
+        if start.type != TyCParser.ID or type(callee) is not Identifier:
+            callee_end = self._input.get(ctx.LPAREN().symbol.tokenIndex - 1)
+            raise ASTGenerationError(
+                f"Error on line {start.line} col {start.column}: "
+                f"callee must be a function name, not {self._input.getText(start, callee_end)}"
+            )
+
+    def exitPostfixExpr(self, ctx, values):
+        return self._at(PostfixOp(self._text(ctx.getChild(0)), values[0]), ctx)
+
+    def exitPrefixExpr(self, ctx, values):
+        return self._at(PrefixOp(self._text(ctx.getChild(0)), values[0]), ctx)
+
+    exitUnaryExpr = exitPrefixExpr
+
+    def _binary(self, ctx, values):
+        # The operands are rules: the operator is the context's only token
+        return self._at(BinaryOp(values[0], self._text(ctx.getChild(0)), values[1]), ctx)
+
+    exitMultiplicativeExpr = _binary
+    exitAdditiveExpr = _binary
+    exitRelationalExpr = _binary
+    exitEqualityExpr = _binary
+    exitLogicalAndExpr = _binary
+    exitLogicalOrExpr = _binary
+
+    def exitPrattExpr(self, ctx, values):
+        """expr/condExpr parsed by src.frontend.pratt: the node is already built."""
+        if ctx.error is not None:
+            raise ctx.error
+        return ctx.ast
+
+    exitPrattCondExpr = exitPrattExpr
+
+    def exitArgList(self, ctx, values):
+        return values
+
+    def exitPrimary(self, ctx, values):
+        if ctx.LPAREN():
+            return values[0]
+        if ctx.ID():
+            return self._at(Identifier(self._text(ctx.ID())), ctx)
+        if ctx.LBRACE():
+            return self._at(StructLiteral(values[0]), ctx)
+        return values[0]
+
+    def exitLiteral(self, ctx, values):
+        text = ctx.getChild(0).getText()
+        if ctx.INT_LITERAL():
+            node = IntLiteral(int(text))
+        elif ctx.FLOAT_LITERAL():
+            node = FloatLiteral(float(text))
+        else:
+            node = StringLiteral(text)
+        return self._at(node, ctx)
+
+
+def parse_to_ast(parser: TyCParser, mode: str = None, stats=None) -> Program:
+    """Parse a `program` with *parser* and return its AST, without a parse tree.
+
+    *mode* and *stats* are passed to parsing.parse(). Syntax errors surface
+    through the parser's error listeners as usual; the AST errors
+    ASTGeneration would raise are raised once the parse succeeds.
+    """
+    builder = DirectASTBuilder(parser)
+    build_trees = parser.buildParseTrees
+    parser.buildParseTrees = False
+    parser.addParseListener(builder)
+    try:
+        parse(parser, "program", mode, stats)
+    finally:
+        parser.removeParseListener(builder)
+        parser.buildParseTrees = build_trees
+    return builder.result()
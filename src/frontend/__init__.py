@@ -0,0 +1,3 @@
+"""
+Front-end (lexing and parsing) pipeline for TyC
+"""
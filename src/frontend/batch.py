@@ -0,0 +1,174 @@
+"""
+Batch tokenization of many TyC sources.
+
+tokenize_batch() runs one TyCLexer over a whole iterable of sources,
+switching sources through its inputStream setter (the Python runtime's
+setInputStream) instead of building a lexer and its ATN simulator per
+source, and records the results column-wise in a TokenBatch: token types
+and start/stop offsets go into shared array('i') columns, `bounds` marks
+where each source's tokens begin, and lexical errors are collected as
+LexError records instead of being raised.
+
+With workers > 1 the sources are split into chunks that are tokenized in a
+process pool and merged back in order.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Iterable, List, NamedTuple
+
+from antlr4.Token import Token
+
+from build.TyCLexer import TyCLexer
+from lexererr import LexerError
+from src.frontend.streams import make_input_stream
+
+
+class LexError(NamedTuple):
+    """A lexical error in one source of a batch."""
+
+    source: int  # index of the source in the batch
+    kind: str  # ErrorToken, UncloseString or IllegalEscape
+    message: str  # str() of the raised error
+    start: int  # offset of the offending lexeme
+    line: int
+    column: int
+
+
+class TokenBatch:
+    """Columnar tokens of a batch of sources.
+
+    The tokens of source i occupy rows bounds[i] .. bounds[i + 1] - 1 of the
+    `types`, `starts` and `stops` columns. EOF tokens are not stored. A
+    source whose tokenization stopped at an error has a record in `errors`;
+    with all_errors, every lexical error is recorded there instead and the
+    offending tokens are left out of the columns.
+    """
+
+    def __init__(self):
+        self.types = array("i")
+        self.starts = array("i")
+        self.stops = array("i")
+        self.bounds = array("i", [0])
+        self.errors: List[LexError] = []
+
+    def __len__(self):
+        return len(self.bounds) - 1
+
+    @property
+    def token_count(self) -> int:
+        return len(self.types)
+
+    def token_range(self, i: int) -> range:
+        """Row indices of the tokens of source *i*."""
+        return range(self.bounds[i], self.bounds[i + 1])
+
+    def token_types(self, i: int) -> array:
+        return self.types[self.bounds[i] : self.bounds[i + 1]]
+
+    def error(self, i: int):
+        """The (first) LexError of source *i*, or None."""
+        for e in self.errors:
+            if e.source == i:
+                return e
+        return None
+
+    def texts(self, i: int, source: str) -> List[str]:
+        """Token texts of source *i*, sliced from *source* as the lexer would."""
+        out = []
+        for row in self.token_range(i):
+            start, stop = self.starts[row], self.stops[row]
+            if self.types[row] == TyCLexer.STRING_LITERAL:
+                start, stop = start + 1, stop - 1  # the lexer drops the quotes
+            out.append(source[start : stop + 1])
+        return out
+
+    def as_string(self, i: int, source: str) -> str:
+        """Same string as Tokenizer.get_tokens_as_string() for source *i*."""
+        texts = self.texts(i, source)
+        err = self.error(i)
+        if err is None:
+            texts.append("<EOF>")
+        elif texts:
+            texts.append(err.message)
+        else:
+            return err.message
+        return ",".join(texts)
+
+    def extend(self, other: "TokenBatch"):
+        """Append the sources of *other* after the sources of this batch."""
+        base_row, base_source = len(self.types), len(self)
+        self.types.extend(other.types)
+        self.starts.extend(other.starts)
+        self.stops.extend(other.stops)
+        self.bounds.extend(b + base_row for b in other.bounds[1:])
+        self.errors.extend(e._replace(source=e.source + base_source) for e in other.errors)
+
+
+def _tokenize(sources: Iterable[str], all_errors: bool = False) -> TokenBatch:
+    batch = TokenBatch()
+    types, starts, stops = batch.types, batch.starts, batch.stops
+    lexer = TyCLexer(None)
+    diagnostics = lexer.collectErrors() if all_errors else None
+    for index, source in enumerate(sources):
+        lexer.inputStream = make_input_stream(source)  # resets the lexer
+        next_token = lexer.nextToken
+        try:
+            while True:
+                t = next_token()
+                if t.type == Token.EOF:
+                    break
+                if t.channel != Token.DEFAULT_CHANNEL:
+                    continue
+                types.append(t.type)
+                starts.append(t.start)
+                stops.append(t.stop)
+        except LexerError as e:
+            batch.errors.append(
+                LexError(
+                    index,
+                    type(e).__name__,
+                    str(e),
+                    lexer._tokenStartCharIndex,
+                    lexer._tokenStartLine,
+                    lexer._tokenStartColumn,
+                )
+            )
+        if diagnostics:
+            batch.errors.extend(
+                LexError(index, d.kind, d.message, d.start, d.line, d.column) for d in diagnostics
+            )
+            diagnostics.clear()
+        batch.bounds.append(len(types))
+    return batch
+
+
+def _chunks(sources: Iterable[str], size: int):
+    it = iter(sources)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def tokenize_batch(
+    sources: Iterable[str], workers: int = None, chunk_size: int = 500, all_errors: bool = False
+) -> TokenBatch:
+    """Tokenize every source in *sources* into one TokenBatch.
+
+    By default a source stops at its first lexical error, as with a raising
+    lexer; with *all_errors* every source is lexed to EOF and all of its
+    errors are recorded. With *workers* > 1, chunks of *chunk_size* sources
+    are tokenized in a pool of that many processes; the result is the same
+    as a serial run.
+    """
+    if not workers or workers <= 1:
+        return _tokenize(sources, all_errors)
+    batch = TokenBatch()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = _chunks(sources, chunk_size)
+        for part in pool.map(_tokenize, chunks, repeat(all_errors)):
+            batch.extend(part)
+    return batch
@@ -0,0 +1,455 @@
+"""
+Persistent DFA cache for the generated TyC lexer and parser.
+
+ANTLR learns its prediction DFAs lazily, so every fresh process pays the
+adaptivePredict warm-up cost again. This module snapshots the DFA states
+learned by TyCLexer and TyCParser (after parsing a warm-up corpus) into a
+file and loads them back into the class-level `decisionsToDFA` tables.
+
+DFA states reference ATN states, prediction contexts and semantic contexts
+whose hash codes are not stable across processes, so they are written as
+plain tables of ints and rebuilt through the runtime's own constructors on
+load. The file is JSON, so loading it never runs code: a cache file is
+data, whoever wrote it. It is keyed by a hash of `src/grammar/TyC.g4`, the
+generated ATNs and the runtime version; a cache with any other key, or
+tables that do not decode, is ignored.
+
+Usage:
+    python3 run.py warm-dfa <files>         # or: python -m src.frontend.dfa_cache
+    TYC_DFA_CACHE=build/dfa_cache.json      # load automatically in make_parser
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from importlib import metadata
+
+from antlr4.PredictionContext import (
+    ArrayPredictionContext,
+    PredictionContext,
+    SingletonPredictionContext,
+)
+from antlr4.atn.ATNConfig import ATNConfig, LexerATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerAction import LexerIndexedCustomAction
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import (
+    AND,
+    OR,
+    PrecedencePredicate,
+    Predicate,
+    SemanticContext,
+)
+from antlr4.dfa.DFA import DFA
+from antlr4.dfa.DFAState import DFAState, PredPrediction
+
+import build.TyCLexer as lexer_module
+import build.TyCParser as parser_module
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+
+
+FORMAT_VERSION = 2
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GRAMMAR_FILE = os.path.join(ROOT_DIR, "src", "grammar", "TyC.g4")
+DEFAULT_PATH = os.path.join(ROOT_DIR, "build", "dfa_cache.json")
+
+_ERROR = -1  # edge to ATNSimulator.ERROR
+_loaded = False
+
+
+class DFACacheError(Exception):
+    """Raised when a DFA cannot be written to the cache."""
+
+
+def cache_key() -> str:
+    """Hash identifying the grammar the cached DFAs were learned for."""
+    digest = hashlib.sha256()
+    with open(GRAMMAR_FILE, "rb") as f:
+        digest.update(f.read())
+    digest.update(repr(lexer_module.serializedATN()).encode())
+    digest.update(repr(parser_module.serializedATN()).encode())
+    digest.update(metadata.version("antlr4-python3-runtime").encode())
+    digest.update(str(FORMAT_VERSION).encode())
+    return digest.hexdigest()
+
+
+# ============================================================================
+# Encoding
+# ============================================================================
+
+
+class _Encoder:
+    """Flattens the DFAs of one recognizer into tables of plain values."""
+
+    def __init__(self, atn):
+        self.atn = atn
+        self.action_index = {id(a): i for i, a in enumerate(atn.lexerActions or [])}
+        self.contexts = []
+        self.context_ids = {}
+        self.semantics = []
+        self.semantic_ids = {}
+        self.executors = []
+        self.executor_ids = {}
+
+    def encode(self, decisions):
+        dfas = [self.dfa(dfa) for dfa in decisions]
+        return {
+            "contexts": self.contexts,
+            "semantics": self.semantics,
+            "executors": self.executors,
+            "dfas": dfas,
+        }
+
+    def context(self, ctx):
+        if ctx is None:
+            return None
+        key = id(ctx)
+        if key in self.context_ids:
+            return self.context_ids[key]
+        if ctx is PredictionContext.EMPTY:
+            entry = ("E",)
+        elif isinstance(ctx, SingletonPredictionContext):
+            entry = ("S", self.context(ctx.parentCtx), ctx.returnState)
+        elif isinstance(ctx, ArrayPredictionContext):
+            entry = ("A", [self.context(p) for p in ctx.parents], list(ctx.returnStates))
+        else:
+            raise DFACacheError(f"Unsupported prediction context {type(ctx).__name__}")
+        self.context_ids[key] = len(self.contexts)
+        self.contexts.append(entry)
+        return self.context_ids[key]
+
+    def semantic(self, sem):
+        key = id(sem)
+        if key in self.semantic_ids:
+            return self.semantic_ids[key]
+        if sem is SemanticContext.NONE:
+            entry = ("N",)
+        elif isinstance(sem, Predicate):
+            entry = ("P", sem.ruleIndex, sem.predIndex, sem.isCtxDependent)
+        elif isinstance(sem, PrecedencePredicate):
+            entry = ("R", sem.precedence)
+        elif isinstance(sem, AND):
+            entry = ("&", [self.semantic(o) for o in sem.opnds])
+        elif isinstance(sem, OR):
+            entry = ("|", [self.semantic(o) for o in sem.opnds])
+        else:
+            raise DFACacheError(f"Unsupported semantic context {type(sem).__name__}")
+        self.semantic_ids[key] = len(self.semantics)
+        self.semantics.append(entry)
+        return self.semantic_ids[key]
+
+    def action(self, action):
+        if id(action) in self.action_index:
+            return ("a", self.action_index[id(action)])
+        if isinstance(action, LexerIndexedCustomAction):
+            return ("x", action.offset, self.action(action.action))
+        raise DFACacheError(f"Unsupported lexer action {type(action).__name__}")
+
+    def executor(self, executor):
+        if executor is None:
+            return None
+        key = id(executor)
+        if key not in self.executor_ids:
+            self.executor_ids[key] = len(self.executors)
+            self.executors.append([self.action(a) for a in executor.lexerActions])
+        return self.executor_ids[key]
+
+    def config(self, c):
+        base = (
+            c.state.stateNumber,
+            c.alt,
+            self.context(c.context),
+            self.semantic(c.semanticContext),
+            c.reachesIntoOuterContext,
+            c.precedenceFilterSuppressed,
+        )
+        if isinstance(c, LexerATNConfig):
+            return base + (self.executor(c.lexerActionExecutor), c.passedThroughNonGreedyDecision)
+        return base
+
+    def config_set(self, configs):
+        return (
+            configs.fullCtx,
+            configs.readonly,
+            configs.uniqueAlt,
+            None if configs.conflictingAlts is None else sorted(configs.conflictingAlts),
+            configs.hasSemanticContext,
+            configs.dipsIntoOuterContext,
+            [self.config(c) for c in configs.configs],
+        )
+
+    def dfa(self, dfa):
+        states = list(dfa._states.values())
+        stored = len(states)
+        index = {id(s): i for i, s in enumerate(states)}
+        if dfa.s0 is not None and id(dfa.s0) not in index:
+            index[id(dfa.s0)] = len(states)
+            states.append(dfa.s0)
+
+        def ref(target):
+            if target is ATNSimulator.ERROR:
+                return _ERROR
+            if id(target) not in index:
+                index[id(target)] = len(states)
+                states.append(target)
+            return index[id(target)]
+
+        encoded = []
+        i = 0
+        while i < len(states):  # edges may append unstored targets
+            s = states[i]
+            edges = None
+            if s.edges is not None:
+                edges = (len(s.edges), [(t, ref(d)) for t, d in enumerate(s.edges) if d is not None])
+            predicates = None
+            if s.predicates is not None:
+                predicates = [(self.semantic(p.pred), p.alt) for p in s.predicates]
+            encoded.append(
+                (
+                    s.stateNumber,
+                    self.config_set(s.configs),
+                    edges,
+                    s.isAcceptState,
+                    s.prediction,
+                    self.executor(s.lexerActionExecutor),
+                    s.requiresFullContext,
+                    predicates,
+                )
+            )
+            i += 1
+        s0 = None if dfa.s0 is None else index[id(dfa.s0)]
+        return (dfa.decision, dfa.precedenceDfa, stored, s0, encoded)
+
+
+# ============================================================================
+# Decoding
+# ============================================================================
+
+
+class _Decoder:
+    """Rebuilds runtime DFA objects from the tables written by _Encoder."""
+
+    def __init__(self, atn, tables, context_cache=None):
+        self.atn = atn
+        self.context_cache = context_cache
+        self.contexts = []
+        for entry in tables["contexts"]:
+            self.contexts.append(self.context(entry))
+        self.semantics = []
+        for entry in tables["semantics"]:
+            self.semantics.append(self.semantic(entry))
+        self.executors = [
+            LexerActionExecutor([self.action(a) for a in actions])
+            for actions in tables["executors"]
+        ]
+
+    def context(self, entry):
+        # Entries are written children-first, so parents are already decoded
+        tag = entry[0]
+        if tag == "E":
+            return PredictionContext.EMPTY
+        if tag == "S":
+            ctx = SingletonPredictionContext(self.contexts[entry[1]], entry[2])
+        else:
+            parents = [None if p is None else self.contexts[p] for p in entry[1]]
+            ctx = ArrayPredictionContext(parents, entry[2])
+        if self.context_cache is not None:
+            ctx = self.context_cache.add(ctx)
+        return ctx
+
+    def semantic(self, entry):
+        tag = entry[0]
+        if tag == "N":
+            return SemanticContext.NONE
+        if tag == "P":
+            return Predicate(entry[1], entry[2], entry[3])
+        if tag == "R":
+            return PrecedencePredicate(entry[1])
+        sem = AND.__new__(AND) if tag == "&" else OR.__new__(OR)
+        sem.opnds = [self.semantics[o] for o in entry[1]]
+        return sem
+
+    def action(self, entry):
+        if entry[0] == "a":
+            return self.atn.lexerActions[entry[1]]
+        return LexerIndexedCustomAction(entry[1], self.action(entry[2]))
+
+    def config(self, entry):
+        lexer = len(entry) > 6
+        c = LexerATNConfig.__new__(LexerATNConfig) if lexer else ATNConfig.__new__(ATNConfig)
+        c.state = self.atn.states[entry[0]]
+        c.alt = entry[1]
+        c.context = None if entry[2] is None else self.contexts[entry[2]]
+        c.semanticContext = self.semantics[entry[3]]
+        c.reachesIntoOuterContext = entry[4]
+        c.precedenceFilterSuppressed = entry[5]
+        if lexer:
+            c.lexerActionExecutor = None if entry[6] is None else self.executors[entry[6]]
+            c.passedThroughNonGreedyDecision = entry[7]
+        return c
+
+    def config_set(self, entry):
+        full_ctx, readonly, unique_alt, conflicting, has_sem, dips, configs = entry
+        result = ATNConfigSet(full_ctx)
+        for encoded in configs:
+            config = self.config(encoded)
+            if result.getOrAdd(config) is config:
+                result.configs.append(config)
+        result.uniqueAlt = unique_alt
+        result.conflictingAlts = None if conflicting is None else set(conflicting)
+        result.hasSemanticContext = has_sem
+        result.dipsIntoOuterContext = dips
+        result.readonly = readonly
+        return result
+
+    def dfa(self, entry):
+        decision, precedence_dfa, stored, s0, encoded = entry
+        states = []
+        for number, configs, _, accept, prediction, executor, full_ctx, predicates in encoded:
+            s = DFAState(number, self.config_set(configs))
+            s.isAcceptState = accept
+            s.prediction = prediction
+            s.lexerActionExecutor = None if executor is None else self.executors[executor]
+            s.requiresFullContext = full_ctx
+            if predicates is not None:
+                s.predicates = [PredPrediction(self.semantics[p], alt) for p, alt in predicates]
+            states.append(s)
+        for s, (_, _, edges, *_) in zip(states, encoded):
+            if edges is not None:
+                size, targets = edges
+                s.edges = [None] * size
+                for t, d in targets:
+                    s.edges[t] = ATNSimulator.ERROR if d == _ERROR else states[d]
+
+        dfa = DFA(self.atn.decisionToState[decision], decision)
+        dfa.precedenceDfa = precedence_dfa
+        dfa._states = {s: s for s in states[:stored]}
+        dfa.s0 = None if s0 is None else states[s0]
+        return dfa
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+
+def snapshot() -> dict:
+    """Encode the currently learned lexer and parser DFAs."""
+    return {
+        "format": FORMAT_VERSION,
+        "key": cache_key(),
+        "lexer": _Encoder(TyCLexer.atn).encode(TyCLexer.decisionsToDFA),
+        "parser": _Encoder(TyCParser.atn).encode(TyCParser.decisionsToDFA),
+    }
+
+
+def install(data: dict) -> bool:
+    """Replace the class-level DFAs with those in *data* if its key matches."""
+    if data.get("format") != FORMAT_VERSION or data.get("key") != cache_key():
+        return False
+    lexer = _Decoder(TyCLexer.atn, data["lexer"])
+    parser = _Decoder(TyCParser.atn, data["parser"], TyCParser.sharedContextCache)
+    lexer_dfas = [lexer.dfa(d) for d in data["lexer"]["dfas"]]
+    parser_dfas = [parser.dfa(d) for d in data["parser"]["dfas"]]
+    if len(lexer_dfas) != len(TyCLexer.decisionsToDFA) or len(parser_dfas) != len(
+        TyCParser.decisionsToDFA
+    ):
+        return False
+    # Assign in place: live ATN simulators share these lists
+    TyCLexer.decisionsToDFA[:] = lexer_dfas
+    TyCParser.decisionsToDFA[:] = parser_dfas
+    return True
+
+
+def save(path: str = None) -> str:
+    """Write the learned DFAs to *path* atomically and return the path."""
+    path = path or DEFAULT_PATH
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    data = json.dumps(snapshot(), separators=(",", ":"))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".dfa-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return path
+
+
+def load(path: str = None) -> bool:
+    """Load cached DFAs from *path*; False if missing, stale or unreadable."""
+    path = path or DEFAULT_PATH
+    try:
+        with open(path, "rb") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(data, dict):
+        return False
+    try:
+        return install(data)
+    except (LookupError, TypeError, ValueError, AttributeError):
+        return False  # tables that do not fit this grammar's ATNs
+
+
+def ensure_loaded() -> bool:
+    """Load the cache named by $TYC_DFA_CACHE once per process."""
+    global _loaded
+    path = os.environ.get("TYC_DFA_CACHE")
+    if _loaded or not path:
+        return False
+    _loaded = True
+    return load(path)
+
+
+def warm_up(sources) -> int:
+    """Parse every source in *sources* to train the DFAs; return the count."""
+    from src.frontend.parsing import parse_program
+
+    count = 0
+    for source in sources:
+        try:
+            parse_program(source)
+        except Exception:
+            pass  # erroneous inputs still teach the DFAs something
+        count += 1
+    return count
+
+
+USAGE = "usage: python -m src.frontend.dfa_cache <file.tyc>... [-o cache]"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(USAGE)
+        return 2
+    out = None
+    if "-o" in argv:
+        i = argv.index("-o")
+        if i + 1 == len(argv):
+            print(USAGE)
+            return 2
+        out = argv[i + 1]
+        argv = argv[:i] + argv[i + 2 :]
+    sources = []
+    for name in argv:
+        with open(name, encoding="utf-8") as f:
+            sources.append(f.read())
+    warm_up(sources)
+    path = save(out)
+    states = sum(len(d.states) for d in TyCParser.decisionsToDFA)
+    print(f"Saved {states} parser DFA states from {len(sources)} files to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
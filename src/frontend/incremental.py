@@ -0,0 +1,457 @@
+"""
+Incremental reparsing of an edited TyC source.
+
+IncrementalParser keeps a source parsed across text edits, as an editor
+needs after every keystroke. It holds the text, its tokens and its
+Program; edit(start, end, text) replaces the characters start..end (end
+exclusive) and brings the three up to date without redoing the file:
+
+  1. The tokens are re-lexed from the last token before the edit. Lexing
+     stops at the first token past the edit that starts where an old
+     token started, shifted by the change in length: the lexer carries no
+     state between tokens, so the old tokens from there on are reused.
+  2. The top-level declarations holding the re-lexed tokens are parsed
+     again, one `globalDecl` at a time, until the parser reaches the
+     start of an old declaration among the reused tokens. An edit that
+     merges or splits declarations just parses a few more.
+  3. The new declarations are spliced into Program.decls. Every other
+     declaration stays the same object, and the Program's cached hash is
+     cleared.
+
+Everything after an edit moves: the offsets, lines and indexes of the
+reused tokens, the spans of the declarations that follow and the line
+starts in Program.source. As in a gap buffer, an edit does not carry
+these moves out but adds them to the shift pending past a point (see
+_ShiftedTail), and moves the point to where it edits, settling what lies
+in between. The parser settles the tokens it reads, and reading `tokens`
+or `program` settles the rest. The text is edited in place in the
+character stream the tokens read from. An edit thus costs the re-lexing
+and re-parsing of the edited declaration plus the distance from the last
+edit or read, not the length of the file; only `text` is copied.
+
+When the edited text does not lex or parse, edit() raises the error as a
+whole-program parse would (with several errors, it may raise another one
+of them: the edited tokens are all lexed before any is parsed). The new
+text is kept in `text`, but the tokens and the Program stay as they
+were, for the last text that parsed, and `stale` is True. The next edit
+re-lexes and re-parses from the start of the first unparsed edit, so the
+document catches up as soon as it parses again.
+
+Usage:
+    doc = IncrementalParser(source)
+    splice = doc.edit(120, 123, "total")
+    doc.program.decls[splice.index : splice.index + len(splice.added)]
+"""
+
+from array import array
+from typing import List, NamedTuple
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.Token import Token
+
+from build.TyCLexer import TyCLexer
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import ParseStats, make_parser, parse
+from src.frontend.streams import ByteInputStream
+from src.utils.ast_diff import clear_hash
+from src.utils.error_listener import NewErrorListener
+from src.utils.node_schema import FIELDS, LIST, NODE
+from src.utils.nodes import Decl, Program
+from src.utils.spans import SPAN_SHIFT, LineIndex, span_end, span_start
+
+
+class Splice(NamedTuple):
+    """How an edit changed Program.decls.
+
+    The declarations *removed*, which were at *index*, were replaced by
+    *added*; the others are the same objects as before.
+    """
+
+    index: int
+    removed: List[Decl]
+    added: List[Decl]
+
+
+class _TextInputStream(InputStream):
+    """antlr4.InputStream whose text can be edited in place."""
+
+    __slots__ = ()
+
+    def splice(self, start: int, end: int, text: str):
+        """Replace the characters start..end by *text*."""
+        self.strdata = self.strdata[:start] + text + self.strdata[end:]
+        self.data[start:end] = [ord(c) for c in text]
+        self._size = len(self.data)
+
+
+class _ShiftedTail:
+    """A list whose items from `at` on are still to be shifted by `pending`.
+
+    A shift is a tuple of ints, added element-wise; *move*(items, lo, hi,
+    shift) shifts items[lo:hi]. The items before `at` hold their values,
+    the others their value minus `pending`, which may be negative; once
+    all are settled, `pending` starts again from zero. Shifting a tail of
+    the list adds to `pending` once `at` has been moved to where the tail
+    starts, so it costs the distance `at` moves, as the gap of a gap
+    buffer does.
+    """
+
+    __slots__ = ("items", "at", "pending", "_move")
+
+    def __init__(self, items, move, width: int):
+        self.items = items
+        self.at = len(items)
+        self.pending = (0,) * width
+        self._move = move
+
+    def pending_at(self, k: int):
+        """The shift item *k* is still to undergo."""
+        return self.pending if k >= self.at else _NO_SHIFT[len(self.pending)]
+
+    def settle(self, end: int = None):
+        """Carry out the pending shift of the items before *end* (all if None)."""
+        end = len(self.items) if end is None else min(end, len(self.items))
+        if end > self.at:
+            if any(self.pending):
+                self._move(self.items, self.at, end, self.pending)
+            self.at = end
+        if end == len(self.items):
+            self.pending = _NO_SHIFT[len(self.pending)]
+
+    def shift_from(self, start: int, shift):
+        """Shift items[start:] by *shift*."""
+        self.settle(start)
+        if start < self.at:
+            if any(self.pending):
+                self._move(self.items, start, self.at, tuple(-d for d in self.pending))
+            self.at = start
+        self.pending = tuple(p + d for p, d in zip(self.pending, shift))
+
+    def replace(self, lo: int, hi: int, new):
+        """Replace items[lo:hi], which are settled, by *new*."""
+        self.items[lo:hi] = new
+        self.at += len(new) - (hi - lo)
+
+
+_NO_SHIFT = {1: (0,), 3: (0, 0, 0)}
+
+
+# Per node class: ((field name, is a list), ...) for the fields holding nodes
+_CHILD_FIELDS = {
+    cls: tuple((name, kind is LIST) for name, kind in fields if kind in (NODE, LIST))
+    for cls, fields in FIELDS.items()
+}
+
+
+def _shift_spans(roots, delta: int):
+    """Move the spans of the trees under *roots* by *delta* characters."""
+    shift = (delta << SPAN_SHIFT) + delta
+    child_fields = _CHILD_FIELDS
+    stack = list(roots)
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+    while stack:
+        node = pop()
+        span = node.span
+        if span is None:
+            continue  # a shared Type node
+        node.span = span + shift
+        for name, is_list in child_fields[node.__class__]:
+            value = getattr(node, name)
+            if is_list:
+                extend(value)
+            elif value is not None:
+                push(value)
+
+
+def _move_decls(decls, lo: int, hi: int, shift):
+    _shift_spans(decls[lo:hi], shift[0])
+
+
+def _move_tokens(tokens, lo: int, hi: int, shift):
+    """Move tokens[lo:hi] by (characters, positions, lines)."""
+    delta, index_delta, line_delta = shift
+    for k in range(lo, hi):
+        token = tokens[k]
+        token.start += delta
+        token.stop += delta
+        token.tokenIndex += index_delta
+        token.line += line_delta
+
+
+def _move_line_starts(starts, lo: int, hi: int, shift):
+    delta = shift[0]
+    for k in range(lo, hi):
+        starts[k] += delta
+
+
+class _SettlingTokenStream(CommonTokenStream):
+    """CommonTokenStream over the document's tokens, settling those it reaches."""
+
+    def __init__(self, lexer, tokens: _ShiftedTail):
+        super().__init__(lexer)
+        self.tokens = tokens.items
+        self.fetchedEOF = True
+        self._shifted = tokens
+
+    def sync(self, i: int):
+        self._shifted.settle(i + 1)
+        return super().sync(i)
+
+
+def _first_at(items, offset, key, lo=0, hi=None):
+    """Index of the first of the sorted *items* whose key is >= *offset*."""
+    hi = len(items) if hi is None else hi
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key(items[mid]) < offset:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _token_start(token):
+    return token.start
+
+
+class IncrementalParser:
+    """A TyC source, its tokens and its Program, kept up to date by edit().
+
+    *listener*, *expressions*, *mode* and *stats* are as for
+    parsing.make_parser() and parsing.parse(). The initial *text* is
+    parsed like an edit of an empty document; if it does not parse, the
+    constructor raises (start from "" and edit() to keep a document that
+    does not parse yet).
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        listener=NewErrorListener.INSTANCE,
+        expressions: str = None,
+        mode: str = None,
+        stats: ParseStats = None,
+    ):
+        self.listener = listener
+        self.expressions = expressions
+        self.mode = mode
+        self.stats = stats
+        self.text = ""
+        self._pending = None  # (prefix, suffix) unchanged since the parsed text, if stale
+        self._buffer = bytearray()  # the parsed text, while it is ASCII
+        self.stream = ByteInputStream(self._buffer)
+        eof = TyCLexer(self.stream).nextToken()
+        eof.tokenIndex = 0
+        self._tokens = _ShiftedTail([eof], _move_tokens, 3)
+        source = LineIndex("")
+        source.starts = array("q", source.starts)  # signed, for the shift-pending starts
+        self._lines = _ShiftedTail(source.starts, _move_line_starts, 1)
+        self._program = Program([], source).set_span(0, 0)
+        self._decls = _ShiftedTail(self._program.decls, _move_decls, 1)
+        if text:
+            self.edit(0, 0, text)
+
+    @property
+    def tokens(self):
+        """The tokens of the parsed text, EOF last."""
+        self._tokens.settle()
+        return self._tokens.items
+
+    @property
+    def program(self) -> Program:
+        """The Program of the parsed text."""
+        self._decls.settle()
+        self._lines.settle()
+        return self._program
+
+    @property
+    def stale(self) -> bool:
+        """True if the last edits did not parse: tokens and program are older."""
+        return self._pending is not None
+
+    def edit(self, start: int, end: int, text: str) -> Splice:
+        """Replace the characters start..end of the text by *text* and reparse.
+
+        Returns the Splice made in Program.decls. Raises the lexical or
+        syntax error of the new text, if any, leaving the document stale.
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f"Invalid edit range {start}..{end}")
+        self.text = self.text[:start] + text + self.text[end:]
+        suffix = len(self.text) - start - len(text)  # characters after the edit
+        if self._pending is not None:
+            prefix, pending_suffix = self._pending
+            start = min(start, prefix)
+            suffix = min(suffix, pending_suffix)
+        self._pending = (start, suffix)
+        splice = self._reparse(
+            start, self.stream.size - suffix, self.text[start : len(self.text) - suffix]
+        )
+        self._pending = None
+        return splice
+
+    def _splice(self, start: int, end: int, text: str) -> bool:
+        """Replace start..end of the parsed text by *text*; True if that took a new stream.
+
+        The tokens read their text from the stream, so it is edited in
+        place. The first non-ASCII text moves the document from a
+        ByteInputStream to a _TextInputStream for good.
+        """
+        stream = self.stream
+        if isinstance(stream, _TextInputStream):
+            stream.splice(start, end, text)
+            return False
+        if text.isascii():
+            stream.close()  # releases its view of the buffer, which can then be resized
+            self._buffer[start:end] = text.encode("ascii")
+            stream.load(self._buffer)
+            return False
+        old = str(stream)
+        self.stream = _TextInputStream(old[:start] + text + old[end:])
+        self._buffer = None
+        return True
+
+    def _retarget(self, tokens):
+        for token in tokens:
+            token.source = (token.source[0], self.stream)
+
+    def _reparse(self, start: int, end: int, text: str) -> Splice:
+        delta = len(text) - (end - start)
+        edit_end = start + len(text)  # end of the edit in the new text
+        tokens, lines, decls = self._tokens, self._lines, self._decls
+        items = tokens.items
+        starts = lines.items
+
+        # Keys of the old text, whatever is still pending
+        def token_start(k):
+            return items[k].start + tokens.pending_at(k)[0]
+
+        def token_end(k):
+            return items[k].stop + 1 + tokens.pending_at(k)[0]
+
+        def line_start(k):
+            return starts[k] + lines.pending_at(k)[0]
+
+        def decl_span(k):
+            d = decls.pending_at(k)[0]
+            return decls.items[k].span + (d << SPAN_SHIFT) + d
+
+        def decl_start(k):
+            return span_start(decl_span(k))
+
+        def decl_end(k):
+            return span_end(decl_span(k))
+
+        # Where to re-lex from: the last token before the edit, which may
+        # run into it
+        i = _first_at(range(len(items)), start, token_end)
+        if i == 0:
+            first, relex_start, line, column = 0, 0, 1, 0
+        else:
+            first = i - 1
+            tokens.settle(i)
+            relex_start = items[first].start
+            line, column = items[first].line, items[first].column
+        # The first declaration the re-lexed tokens may belong to, and its
+        # first token
+        n_decls = len(decls.items)
+        a = _first_at(range(n_decls), relex_start + 1, decl_end)
+        parse_from = first
+        if a < n_decls:
+            parse_from = _first_at(items, decl_start(a), _token_start, 0, first)
+
+        # The lines that start in the edit, and where the tokens after it go
+        kept = _first_at(range(len(starts)), start + 1, line_start)  # lines up to start
+        after = _first_at(range(len(starts)), end + 1, line_start, kept)  # lines past end
+        inner = array("q", [start + s for s in LineIndex(text).starts[1:]])
+        end_column = end - line_start(after - 1)  # on line `after`
+        new_column = edit_end - (inner[-1] if inner else line_start(kept - 1))
+        line_delta = kept + len(inner) - after
+        column_delta = new_column - end_column
+
+        old_text = self.stream.getText(start, end - 1)
+        retargeted = self._splice(start, end, text)
+        replaced = None
+        moved = []  # old tokens on the last line of the edit, moved along it
+        try:
+            # 1. Re-lex until a token lines up with an old one
+            lexer = TyCLexer(self.stream)
+            self.stream.seek(relex_start)
+            lexer.line = line
+            lexer.column = column
+            fresh = []
+            while True:
+                token = lexer.nextToken()
+                if token.start >= edit_end:
+                    old_start = token.start - delta
+                    j = _first_at(range(len(items)), old_start, token_start, i)
+                    if j < len(items) and token_start(j) == old_start:
+                        break
+                token.tokenIndex = first + len(fresh)
+                fresh.append(token)
+            index_delta = len(fresh) - (j - first)
+            if column_delta:
+                k = j
+                while k < len(items) and items[k].line + tokens.pending_at(k)[2] == after:
+                    items[k].column += column_delta
+                    moved.append(items[k])
+                    k += 1
+            tokens.shift_from(j, (delta, index_delta, line_delta))
+            replaced = items[first:j]
+            tokens.replace(first, j, fresh)
+            if retargeted:
+                self._retarget(items)
+
+            # 2. Parse declarations until one starts where an old one did
+            stream = _SettlingTokenStream(lexer, tokens)
+            stream.index = 0
+            stream.seek(parse_from)
+            parser = make_parser(
+                self.stream,
+                self.listener,
+                expressions=self.expressions,
+                token_stream=lambda _: stream,
+            )
+            generation = ASTGeneration()
+            synced = first + len(fresh)  # new index of the first reused token
+            added = []
+            c = a
+            while True:
+                token = items[stream.index]
+                if token.type == Token.EOF:
+                    c = n_decls
+                    break
+                if stream.index >= synced:
+                    old_start = token.start - delta
+                    while c < n_decls and decl_start(c) < old_start:
+                        c += 1
+                    if c < n_decls and decl_start(c) == old_start:
+                        break
+                added.append(generation.visit(parse(parser, "globalDecl", self.mode, self.stats)))
+        except BaseException:
+            if replaced is not None:
+                tokens.replace(first, first + len(fresh), replaced)
+                tokens.shift_from(j, (-delta, -index_delta, -line_delta))
+            for token in moved:
+                token.column -= column_delta
+            self._splice(start, edit_end, old_text)
+            if retargeted:
+                self._retarget(items)
+            raise
+
+        # 3. Splice the declarations and the lines in
+        lines.shift_from(after, (delta,))
+        lines.replace(kept, after, inner)
+        decls.shift_from(c, (delta,))
+        removed = decls.items[a:c]
+        decls.replace(a, c, added)
+        # as ASTGeneration spans it: up to the last token before EOF
+        begin = token_start(0)
+        end = begin
+        if len(items) > 1:
+            end = max(begin, token_end(len(items) - 2))
+        self._program.set_span(begin, end)
+        clear_hash(self._program)
+        return Splice(a, removed, added)
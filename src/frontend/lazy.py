@@ -0,0 +1,153 @@
+"""
+Lazy function bodies: parse signatures now, bodies on first use.
+
+Tools that only look at declarations (struct layouts, call signatures,
+documentation) pay for every function body when the whole program is
+parsed and converted. parse_lazy() parses the program with LazyTyCParser,
+whose `block` rule only matches the braces of a function body and skips
+the tokens between them by brace depth, without prediction or parse tree
+nodes. ASTGeneration turns the skipped block into a LazyBody holding the
+character offset, line and column of its `{`; it sits in FuncDecl.body
+until the attribute is first read. Importing this module wraps that slot
+in a nodes.LazyField, so the first read lexes and parses the block from
+that offset, builds its BlockStmt and keeps it; without the module the
+slot stays a plain member and eager programs pay nothing on reads.
+
+Nothing else changes: the StructDecl and FuncDecl nodes and their spans
+are the ones an eager parse produces, and so is every built body, with
+spans into the text Program.source indexes. Syntax errors in the signatures and
+unbalanced braces are reported by parse_lazy(); errors inside a body are
+raised by the first read of that FuncDecl.body. The character stream must
+stay readable (an mmap still open) until the bodies have been built.
+
+Usage:
+    program = parse_lazy(source)
+    for decl in program.decls:
+        ...  # decl.params etc. are there; decl.body is parsed on demand
+"""
+
+from antlr4.Token import Token
+from antlr4.error.Errors import RecognitionException
+
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import ParseStats, make_parser, parse
+from src.frontend.streams import make_input_stream
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import FuncDecl, LazyField, LazyNode, Program
+
+
+class LazyBody(LazyNode):
+    """The unparsed block `{ ... }` starting at *offset* of *stream*."""
+
+    __slots__ = ("stream", "offset", "line", "column", "listener", "expressions", "mode", "stats")
+
+    def __init__(self, stream, offset, line, column, listener, expressions, mode, stats):
+        self.stream = stream
+        self.offset = offset
+        self.line = line
+        self.column = column
+        self.listener = listener
+        self.expressions = expressions
+        self.mode = mode
+        self.stats = stats
+
+    def build(self):
+        parser = make_parser(self.stream, self.listener, expressions=self.expressions)
+        lexer = parser.getTokenStream().tokenSource
+        self.stream.seek(self.offset)
+        lexer.line = self.line
+        lexer.column = self.column
+        return ASTGeneration().visit(parse(parser, "block", self.mode, self.stats))
+
+
+# Only programs that may hold a LazyBody pay for the descriptor on reads
+if not isinstance(FuncDecl.__dict__["body"], LazyField):
+    FuncDecl.body = LazyField(FuncDecl.body)
+
+    def __repr__(self):
+        return f"LazyBody(line {self.line} col {self.column})"
+
+
+class LazyBlockContext(TyCParser.BlockContext):
+    """`block` skipped by LazyTyCParser; the placeholder is in `body`."""
+
+    __slots__ = ("body",)
+
+    def __init__(self, parser, parent=None, invokingState: int = -1):
+        super().__init__(parser, parent, invokingState)
+        self.body = None
+
+    def accept(self, visitor):
+        if hasattr(visitor, "visitLazyBlock"):
+            return visitor.visitLazyBlock(self)
+        return visitor.visitChildren(self)
+
+
+class LazyTyCParser(TyCParser):
+    """TyCParser whose `block` rule skips to the matching `}`.
+
+    Only used for function bodies: `block` is not reachable from the
+    signatures or struct declarations. *body_options* are the listener,
+    expression parser, prediction mode and ParseStats the bodies are
+    parsed with.
+    """
+
+    _BLOCK_STATE = TyCParser.atn.ruleToStartState[TyCParser.RULE_block].stateNumber
+
+    body_options = (NewErrorListener.INSTANCE, None, None, None)
+
+    def block(self):
+        localctx = LazyBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, self._BLOCK_STATE, TyCParser.RULE_block)
+        tokens = self._input
+        try:
+            self.enterOuterAlt(localctx, 1)
+            lbrace = self.match(TyCParser.LBRACE)
+            depth = 1
+            while True:
+                ttype = tokens.LA(1)
+                if ttype == TyCParser.LBRACE:
+                    depth += 1
+                elif ttype == TyCParser.RBRACE:
+                    depth -= 1
+                    if depth == 0:
+                        break
+                elif ttype == Token.EOF:
+                    break  # reported as a missing '}' below
+                tokens.consume()
+            self.match(TyCParser.RBRACE)
+            localctx.body = LazyBody(
+                lbrace.getInputStream(),
+                lbrace.start,
+                lbrace.line,
+                lbrace.column,
+                *self.body_options,
+            )
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+def parse_lazy(
+    source,
+    listener=NewErrorListener.INSTANCE,
+    expressions: str = None,
+    mode: str = None,
+    stats: ParseStats = None,
+) -> Program:
+    """The Program of *source* with every FuncDecl.body left unparsed.
+
+    *source* is a string or an opened character stream; *listener*,
+    *expressions*, *mode* and *stats* are as for parsing.make_parser() and
+    parsing.parse(), and apply to the bodies too.
+    """
+    if isinstance(source, str):
+        source = make_input_stream(source)
+    parser = make_parser(source, listener, expressions=expressions, parser_class=LazyTyCParser)
+    parser.body_options = (listener, expressions, mode, stats)
+    return ASTGeneration().visit(parse(parser, "program", mode, stats))
@@ -0,0 +1,203 @@
+"""
+Two-stage parsing for TyC.
+
+The parser is first run in SLL prediction mode with a bail-out error
+strategy. SLL never accepts an invalid program, so when it succeeds the
+result is final; when it fails, the token stream is rewound and the input
+is parsed again in full LL mode with the normal error handling, so syntax
+errors are reported exactly as a plain LL parse would report them.
+"""
+
+import os
+from contextlib import contextmanager
+
+from antlr4 import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.frontend import dfa_cache
+from src.frontend.pratt import PrattTyCParser
+from src.frontend.streams import make_input_stream, open_source
+from src.frontend.tokens import CompactTokenStream
+from src.utils.error_listener import NewErrorListener
+
+
+MODE_AUTO = "auto"  # SLL first, LL only when SLL fails
+MODE_SLL = "sll"  # SLL only
+MODE_LL = "ll"  # full LL only (ANTLR's default)
+
+MODES = (MODE_AUTO, MODE_SLL, MODE_LL)
+
+# Can be forced for a whole run, e.g. TYC_PARSE_MODE=ll python -m pytest
+DEFAULT_MODE = os.environ.get("TYC_PARSE_MODE", MODE_AUTO)
+
+# TYC_COMPACT_TOKENS=1 buffers tokens in a CompactTokenStream by default
+COMPACT_TOKENS = os.environ.get("TYC_COMPACT_TOKENS", "") not in ("", "0")
+
+EXPR_ANTLR = "antlr"  # expressions parsed by the generated condExpr rule
+EXPR_PRATT = "pratt"  # expressions parsed by src.frontend.pratt
+
+EXPR_PARSERS = {EXPR_ANTLR: TyCParser, EXPR_PRATT: PrattTyCParser}
+
+# TYC_EXPR_PARSER=pratt selects the precedence-climbing expression parser
+EXPR_PARSER = os.environ.get("TYC_EXPR_PARSER", EXPR_ANTLR)
+
+
+class ParseStats:
+    """Counters showing how often the SLL stage is enough."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.parses = 0
+        self.sll_successes = 0
+        self.ll_fallbacks = 0
+        self.forced_sll = 0
+        self.forced_ll = 0
+
+    @property
+    def fallback_rate(self) -> float:
+        """Fraction of two-stage parses that needed the LL stage."""
+        attempts = self.sll_successes + self.ll_fallbacks
+        return self.ll_fallbacks / attempts if attempts else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "parses": self.parses,
+            "sll_successes": self.sll_successes,
+            "ll_fallbacks": self.ll_fallbacks,
+            "forced_sll": self.forced_sll,
+            "forced_ll": self.forced_ll,
+            "fallback_rate": self.fallback_rate,
+        }
+
+    def __str__(self):
+        return (
+            f"ParseStats(parses={self.parses}, sll_successes={self.sll_successes}, "
+            f"ll_fallbacks={self.ll_fallbacks}, forced_sll={self.forced_sll}, "
+            f"forced_ll={self.forced_ll})"
+        )
+
+
+# Process-wide counters, used when no ParseStats is passed explicitly
+STATS = ParseStats()
+
+
+def make_parser(
+    source,
+    listener=NewErrorListener.INSTANCE,
+    compact: bool = COMPACT_TOKENS,
+    expressions: str = None,
+    token_stream=None,
+    parser_class=None,
+) -> TyCParser:
+    """Build a TyCParser over *source* reporting errors to *listener*.
+
+    *source* is a string or an already opened character stream. With
+    *compact*, tokens are buffered in a CompactTokenStream instead of a
+    CommonTokenStream; *token_stream*, if given, is the token stream class
+    to use instead of either. *expressions* is EXPR_ANTLR or EXPR_PRATT
+    (EXPR_PARSER if None) and picks the parser used for expressions;
+    *parser_class*, if given, is the TyCParser subclass to use instead.
+    """
+    expressions = expressions or EXPR_PARSER
+    if expressions not in EXPR_PARSERS:
+        raise ValueError(f"Unknown expression parser: {expressions}")
+    dfa_cache.ensure_loaded()
+    stream = make_input_stream(source) if isinstance(source, str) else source
+    lexer = TyCLexer(stream)
+    if token_stream is None:
+        token_stream = CompactTokenStream if compact else CommonTokenStream
+    tokens = token_stream(lexer)
+    parser = (parser_class or EXPR_PARSERS[expressions])(tokens)
+    parser.removeErrorListeners()
+    if listener is not None:
+        parser.addErrorListener(listener)
+    return parser
+
+
+def parse(parser: TyCParser, rule: str = "program", mode: str = None, stats: ParseStats = None):
+    """Invoke start rule *rule* of *parser* in the given prediction mode.
+
+    *mode* is one of MODE_AUTO, MODE_SLL or MODE_LL (DEFAULT_MODE if None).
+    Syntax errors surface through the parser's error listeners as usual.
+    """
+    mode = mode or DEFAULT_MODE
+    if mode not in MODES:
+        raise ValueError(f"Unknown parse mode: {mode}")
+    stats = STATS if stats is None else stats
+    start = getattr(parser, rule)
+    start_index = parser.getTokenStream().index
+    stats.parses += 1
+
+    if mode == MODE_LL:
+        stats.forced_ll += 1
+        parser._interp.predictionMode = PredictionMode.LL
+        return start()
+    parser._interp.predictionMode = PredictionMode.SLL
+    if mode == MODE_SLL:
+        stats.forced_sll += 1
+        return start()
+
+    # Stage 1: SLL, bail out on the first error without reporting it
+    listeners = parser._listeners
+    err_handler = parser._errHandler
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    try:
+        tree = start()
+        stats.sll_successes += 1
+        return tree
+    except ParseCancellationException:
+        pass
+    finally:
+        parser._listeners = listeners
+        parser._errHandler = err_handler
+
+    # Stage 2: rewind and re-parse with full LL
+    stats.ll_fallbacks += 1
+    _rewind(parser, start_index)
+    parser._interp.predictionMode = PredictionMode.LL
+    return start()
+
+
+def _rewind(parser: TyCParser, index: int):
+    """Parser.reset(), but back to token *index* rather than the first token.
+
+    A rule other than `program` may start mid-stream, where the tokens
+    before it may be gone (tokens.StreamingTokenStream). Parser.reset()
+    also removes its (absent) tracer from the parse listeners, which fails
+    if there are any.
+    """
+    parser.getTokenStream().seek(max(index, 0))
+    parser._errHandler.reset(parser)
+    parser._ctx = None
+    parser._syntaxErrors = 0
+    parser._precedenceStack = [0]
+    parser._interp.reset()
+
+
+def parse_program(source: str, mode: str = None, stats: ParseStats = None):
+    """Parse a whole TyC program and return its parse tree."""
+    return parse(make_parser(source), "program", mode, stats)
+
+
+@contextmanager
+def parse_file(path: str, mode: str = None, stats: ParseStats = None):
+    """Parse the TyC file at *path* over a memory-mapped character stream.
+
+    A context manager yielding the parse tree. Its tokens read their text
+    from the mapped file, so the file stays open inside the with block
+    and is unmapped and closed when the block exits.
+    """
+    stream = open_source(path)
+    try:
+        yield parse(make_parser(stream), "program", mode, stats)
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
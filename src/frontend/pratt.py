@@ -0,0 +1,278 @@
+"""
+Precedence-climbing (Pratt) expression parsing for TyC.
+
+TyC.g4 writes `condExpr` as one left-recursive rule; ANTLR turns it into a
+loop guarded by precedence predicates and runs adaptivePredict at every
+operator. PrattTyCParser is a TyCParser whose `expr` and `condExpr` rules
+are replaced by a hand-written precedence-climbing parser that reads the
+same token stream and builds the AST nodes directly, with interned names
+and operators like ASTGeneration. Statements and declarations are still
+parsed by the generated code.
+
+Binding powers follow the operator table of tyc_specification.md, from
+loosest to tightest:
+
+    =  (right)  ||  &&  == !=  < <= > >=  + -  * / %  prefix ++ -- ! + -
+    postfix ++ --, calls f(...), member access .
+
+The rule contexts returned for `expr`/`condExpr` are PrattExprContext /
+PrattCondExprContext: they hold the tokens as terminal children and the
+finished node in `ast`, which ASTGeneration.visitPrattExpr hands back
+unchanged. The resulting AST (node types, operators and source positions)
+is the same as ASTGeneration produces from the ANTLR parse tree.
+"""
+
+import sys
+
+from antlr4.error.Errors import NoViableAltException, RecognitionException
+
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGenerationError
+from src.utils.nodes import (
+    AssignExpr,
+    BinaryOp,
+    FloatLiteral,
+    FuncCall,
+    Identifier,
+    IntLiteral,
+    MemberAccess,
+    PostfixOp,
+    PrefixOp,
+    StringLiteral,
+    StructLiteral,
+)
+from src.utils.spans import SPAN_SHIFT
+
+
+T = TyCParser
+
+BINARY_PRECEDENCE = {
+    T.OR: 1,
+    T.AND: 2,
+    T.EQUAL: 3,
+    T.NOTEQUAL: 3,
+    T.LT: 4,
+    T.LE: 4,
+    T.GT: 4,
+    T.GE: 4,
+    T.PLUS: 5,
+    T.MINUS: 5,
+    T.MUL: 6,
+    T.DIV: 6,
+    T.MOD: 6,
+}
+
+PREFIX_OPERATORS = frozenset({T.INC, T.DEC, T.BANG, T.PLUS, T.MINUS})
+
+POSTFIX_OPERATORS = frozenset({T.INC, T.DEC})
+
+LITERALS = {
+    T.INT_LITERAL: lambda text: IntLiteral(int(text)),
+    T.FLOAT_LITERAL: lambda text: FloatLiteral(float(text)),
+    T.STRING_LITERAL: StringLiteral,
+}
+
+
+class ExpressionSyntaxError(NoViableAltException):
+    """A syntax error found by the precedence-climbing parser.
+
+    Reported at the current token, as "no viable alternative at input ...",
+    through the parser's usual error strategy and listeners.
+    """
+
+    def __init__(self, parser):
+        super().__init__(parser)
+
+
+class PrattExprContext(TyCParser.ExprContext):
+    """`expr` parsed by PrattTyCParser; the AST node is in `ast`."""
+
+    __slots__ = ("ast", "error")
+
+    def __init__(self, parser, parent=None, invokingState: int = -1):
+        super().__init__(parser, parent, invokingState)
+        self.ast = None
+        self.error = None  # ASTGenerationError to raise when visited
+
+    def accept(self, visitor):
+        if hasattr(visitor, "visitPrattExpr"):
+            return visitor.visitPrattExpr(self)
+        return visitor.visitChildren(self)
+
+
+class PrattCondExprContext(TyCParser.CondExprContext):
+    """`condExpr` parsed by PrattTyCParser; the AST node is in `ast`."""
+
+    __slots__ = ("ast", "error")
+
+    def __init__(self, parser, parent=None, invokingState: int = -1):
+        super().__init__(parser, parent, invokingState)
+        self.ast = None
+        self.error = None
+
+    accept = PrattExprContext.accept
+
+
+class PrattTyCParser(TyCParser):
+    """TyCParser with precedence-climbing `expr` and `condExpr` rules."""
+
+    _EXPR_STATE = TyCParser.atn.ruleToStartState[TyCParser.RULE_expr].stateNumber
+    _COND_EXPR_STATE = TyCParser.atn.ruleToStartState[TyCParser.RULE_condExpr].stateNumber
+
+    # ------------------------------------------------------------------
+    # Rule entry points (same protocol as the generated rule methods)
+    # ------------------------------------------------------------------
+
+    def expr(self):
+        return self._rule(PrattExprContext, self._EXPR_STATE, TyCParser.RULE_expr, True)
+
+    def condExpr(self, _p: int = 0):
+        return self._rule(
+            PrattCondExprContext, self._COND_EXPR_STATE, TyCParser.RULE_condExpr, False
+        )
+
+    def _rule(self, context_class, state, rule_index, assignment):
+        localctx = context_class(self, self._ctx, self.state)
+        self.enterRule(localctx, state, rule_index)
+        self._error = None
+        self._error_at = None  # index of the first token of the erroneous call
+        try:
+            if assignment:
+                localctx.ast = self._expression()
+            else:
+                localctx.ast = self._binary(1)[0]
+            localctx.error = self._error
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    # ------------------------------------------------------------------
+    # Token helpers
+    # ------------------------------------------------------------------
+
+    def _at(self, node, start):
+        """Set the span of *node*: from token *start* to the last consumed one."""
+        node.span = start.start << SPAN_SHIFT | self._input.LT(-1).stop + 1
+        return node
+
+    def _take(self):
+        token = self.getCurrentToken()
+        self._errHandler.reportMatch(self)
+        self.consume()
+        return token
+
+    def _expect(self, ttype: int):
+        if self._input.LA(1) != ttype:
+            raise ExpressionSyntaxError(self)
+        return self._take()
+
+    # ------------------------------------------------------------------
+    # Precedence climbing. Every parse function returns
+    # (node, first token, is_lvalue); the first token includes any opening
+    # parenthesis, which is where the ANTLR contexts start too.
+    # ------------------------------------------------------------------
+
+    def _expression(self):
+        """expr: an lvalue followed by '=' is an assignment (right-assoc)."""
+        node, start, is_lvalue = self._binary(1)
+        if self._input.LA(1) == T.ASSIGN and is_lvalue:
+            self._take()
+            return self._at(AssignExpr(node, self._expression()), start)
+        return node
+
+    def _binary(self, min_precedence: int):
+        left, start, is_lvalue = self._unary()
+        while True:
+            precedence = BINARY_PRECEDENCE.get(self._input.LA(1))
+            if precedence is None or precedence < min_precedence:
+                return left, start, is_lvalue
+            operator = sys.intern(self._take().text)
+            right = self._binary(precedence + 1)[0]
+            left = self._at(BinaryOp(left, operator, right), start)
+            is_lvalue = False
+
+    def _unary(self):
+        if self._input.LA(1) in PREFIX_OPERATORS:
+            token = self._take()
+            operand = self._unary()[0]
+            return self._at(PrefixOp(sys.intern(token.text), operand), token), token, False
+        return self._postfix()
+
+    def _postfix(self):
+        node, start, is_lvalue = self._primary()
+        la = self._input.LA
+        while True:
+            ttype = la(1)
+            if ttype == T.DOT:
+                self._take()
+                member = sys.intern(self._expect(T.ID).text)
+                node = self._at(MemberAccess(node, member), start)
+            elif ttype == T.LPAREN:
+                callee_end = self._input.LT(-1)
+                self._take()
+                args = self._arguments() if la(1) != T.RPAREN else []
+                self._expect(T.RPAREN)
+                node = self._call(node, start, callee_end, args)
+                is_lvalue = False
+            elif ttype in POSTFIX_OPERATORS:
+                node = self._at(PostfixOp(sys.intern(self._take().text), node), start)
+                is_lvalue = False
+            else:
+                return node, start, is_lvalue
+
+    def _call(self, callee, start, callee_end, args):
+        if start.type != T.ID or type(callee) is not Identifier:
+            # Only `name(...)` is a call; ASTGeneration rejects anything else
+            # when it visits the tree, so the error is raised from there too.
+            # It checks a callee before the calls in it: the error kept is
+            # that of the call starting first, the outermost one on a tie.
+            if self._error is None or start.tokenIndex <= self._error_at:
+                self._error_at = start.tokenIndex
+                self._error = ASTGenerationError(
+                    f"Error on line {start.line} col {start.column}: "
+                    f"callee must be a function name, not "
+                    f"{self._input.getText(start, callee_end)}"
+                )
+            return self._at(FuncCall(None, args), start)
+        return self._at(FuncCall(callee.name, args), start)
+
+    def _arguments(self):
+        args = [self._expression()]
+        while self._input.LA(1) == T.COMMA:
+            self._take()
+            args.append(self._expression())
+        return args
+
+    def _primary(self):
+        token = self.getCurrentToken()
+        ttype = token.type
+        if ttype == T.ID:
+            self._take()
+            return self._at(Identifier(sys.intern(token.text)), token), token, True
+        literal = LITERALS.get(ttype)
+        if literal is not None:
+            self._take()
+            return self._at(literal(token.text), token), token, False
+        if ttype == T.LPAREN:
+            self._take()
+            node, _, is_lvalue = self._parenthesized()
+            self._expect(T.RPAREN)
+            return node, token, is_lvalue
+        if ttype == T.LBRACE:
+            self._take()
+            values = self._arguments()
+            self._expect(T.RBRACE)
+            return self._at(StructLiteral(values), token), token, False
+        raise ExpressionSyntaxError(self)
+
+    def _parenthesized(self):
+        """`( expr )`: keeps the lvalue flag of a bare parenthesized lvalue."""
+        node, start, is_lvalue = self._binary(1)
+        if self._input.LA(1) == T.ASSIGN and is_lvalue:
+            self._take()
+            return self._at(AssignExpr(node, self._expression()), start), start, False
+        return node, start, is_lvalue
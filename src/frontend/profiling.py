@@ -0,0 +1,322 @@
+"""
+Decision-level profiling of the TyC parser.
+
+ANTLR's Java runtime ships a ProfilingATNSimulator; the Python runtime does
+not, so this module provides the same measurements on top of the Python
+ParserATNSimulator. For every decision of TyCParser (every point where the
+parser must choose between alternatives, loop exits included) it records:
+
+- invocations and the time spent in adaptivePredict,
+- SLL and full-LL lookahead depth (total, min, max), and the input
+  position of the deepest lookahead,
+- DFA transitions (cache hits) and ATN transitions (DFA misses),
+- full-context (LL) fallbacks, context sensitivities, ambiguities and
+  prediction errors.
+
+In MODE_AUTO a parse that fails under SLL is rewound and parsed again
+with full LL; only that second pass is counted, so the decisions of such
+an input are not counted twice (ParseStats.ll_fallbacks tells how many
+inputs fell back).
+
+Decisions are reported with the TyC.g4 rule they belong to and the kind of
+decision state (alternative block, `*`/`+` loop, or the precedence loop of
+the left-recursive condExpr rule).
+
+Usage:
+    python3 run.py profile-parser <files>     # or: python -m src.frontend.profiling
+    python -m src.frontend.profiling <files> --mode ll --json profile.json --top 15
+"""
+
+import json
+import sys
+import time
+
+from antlr4.atn.ATNState import (
+    PlusBlockStartState,
+    PlusLoopbackState,
+    StarBlockStartState,
+    StarLoopEntryState,
+)
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+from build.TyCParser import TyCParser
+from src.frontend.parsing import DEFAULT_MODE, MODES, ParseStats, make_parser, parse
+
+
+class DecisionInfo:
+    """Profiling counters of one parser decision."""
+
+    def __init__(self, decision: int):
+        state = TyCParser.atn.decisionToState[decision]
+        self.decision = decision
+        self.rule = TyCParser.ruleNames[state.ruleIndex]
+        self.kind = _decision_kind(state)
+        self.invocations = 0
+        self.time_ns = 0
+        self.sll_total_look = 0
+        self.sll_min_look = 0
+        self.sll_max_look = 0
+        self.ll_total_look = 0
+        self.ll_min_look = 0
+        self.ll_max_look = 0
+        self.max_look_at = None  # "line:column" of the deepest lookahead
+        self.sll_dfa_transitions = 0
+        self.sll_atn_transitions = 0
+        self.ll_atn_transitions = 0
+        self.ll_fallbacks = 0
+        self.context_sensitivities = 0
+        self.ambiguities = 0
+        self.errors = 0
+
+    def merge(self, other: "DecisionInfo"):
+        """Add the counters of *other*, a profile of the same decision."""
+        if not other.invocations:
+            return
+        if not self.invocations or other.sll_min_look < self.sll_min_look:
+            self.sll_min_look = other.sll_min_look
+        if other.ll_min_look and (not self.ll_min_look or other.ll_min_look < self.ll_min_look):
+            self.ll_min_look = other.ll_min_look
+        if other.sll_max_look > self.sll_max_look or other.ll_max_look > self.ll_max_look:
+            self.max_look_at = other.max_look_at
+        self.sll_max_look = max(self.sll_max_look, other.sll_max_look)
+        self.ll_max_look = max(self.ll_max_look, other.ll_max_look)
+        for name in _SUMMED:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def as_dict(self) -> dict:
+        result = dict(vars(self))
+        result["sll_avg_look"] = self.sll_total_look / self.invocations if self.invocations else 0.0
+        result["ll_avg_look"] = self.ll_total_look / self.ll_fallbacks if self.ll_fallbacks else 0.0
+        return result
+
+
+# Counters that add up across parses
+_SUMMED = (
+    "invocations",
+    "time_ns",
+    "sll_total_look",
+    "ll_total_look",
+    "sll_dfa_transitions",
+    "sll_atn_transitions",
+    "ll_atn_transitions",
+    "ll_fallbacks",
+    "context_sensitivities",
+    "ambiguities",
+    "errors",
+)
+
+
+def _decision_kind(state) -> str:
+    if isinstance(state, StarLoopEntryState):
+        return "precedence loop" if state.isPrecedenceDecision else "* loop"
+    if isinstance(state, StarBlockStartState):
+        return "* block"
+    if isinstance(state, PlusBlockStartState):
+        return "+ block"
+    if isinstance(state, PlusLoopbackState):
+        return "+ loop"
+    return "block"
+
+
+def new_decisions():
+    """One DecisionInfo per decision of TyCParser."""
+    return [DecisionInfo(d) for d in range(len(TyCParser.atn.decisionToState))]
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """ParserATNSimulator that records per-decision statistics.
+
+    A port of the Java runtime's ProfilingATNSimulator. The statistics of
+    the parse are in `decisions`; ParserProfile merges them over inputs.
+    """
+
+    def __init__(self, parser):
+        super().__init__(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+        self.decisions = new_decisions()
+        self._current = None
+        self._sll_stop_index = -1
+        self._ll_stop_index = -1
+
+    def adaptivePredict(self, input, decision, outerContext):
+        self._sll_stop_index = -1
+        self._ll_stop_index = -1
+        info = self._current = self.decisions[decision]
+        start = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info.time_ns += time.perf_counter_ns() - start
+            info.invocations += 1
+            first = self._startIndex
+            sll_k = self._sll_stop_index - first + 1
+            info.sll_total_look += sll_k
+            info.sll_min_look = sll_k if info.invocations == 1 else min(info.sll_min_look, sll_k)
+            if sll_k > info.sll_max_look:
+                info.sll_max_look = sll_k
+                self._record_max(info, first)
+            if self._ll_stop_index >= 0:
+                ll_k = self._ll_stop_index - first + 1
+                info.ll_total_look += ll_k
+                info.ll_min_look = ll_k if info.ll_min_look == 0 else min(info.ll_min_look, ll_k)
+                if ll_k > info.ll_max_look:
+                    info.ll_max_look = ll_k
+                    self._record_max(info, first)
+
+    def reset(self):
+        # The parser is rewound to parse again (parsing.parse() falling back
+        # from SLL to LL): the abandoned pass is not counted
+        super().reset()
+        self.decisions = new_decisions()
+
+    def _record_max(self, info, index):
+        token = self._input.get(index)
+        info.max_look_at = f"{token.line}:{token.column}"
+
+    def getExistingTargetState(self, previousD, t):
+        # Called once per SLL lookahead symbol: marks how far SLL looked
+        self._sll_stop_index = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is not None:
+            self._current.sll_dfa_transitions += 1
+            if existing is self.ERROR:
+                self._current.errors += 1
+        return existing
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self._ll_stop_index = self._input.index
+        reach = super().computeReachSet(closure, t, fullCtx)
+        if fullCtx:
+            self._current.ll_atn_transitions += 1
+        else:
+            self._current.sll_atn_transitions += 1
+        if reach is None:
+            self._current.errors += 1
+        return reach
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        self._current.ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        self._current.context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self._current.ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+class ParserProfile:
+    """Decision profile accumulated over a set of parsed sources."""
+
+    def __init__(self, mode: str = None):
+        self.mode = mode or DEFAULT_MODE
+        self.decisions = new_decisions()
+        self.stats = ParseStats()
+        self.files = 0
+        self.failures = []  # (name, error message)
+        self.parse_ns = 0
+
+    def add(self, source, name: str = "<string>"):
+        """Parse *source* under the profiler and add it to the profile."""
+        parser = make_parser(source)
+        simulator = parser._interp = ProfilingATNSimulator(parser)
+        start = time.perf_counter_ns()
+        try:
+            parse(parser, "program", self.mode, self.stats)
+        except Exception as e:
+            self.failures.append((name, str(e)))
+        finally:
+            self.parse_ns += time.perf_counter_ns() - start
+            self.files += 1
+            for total, info in zip(self.decisions, simulator.decisions):
+                total.merge(info)
+
+    def active(self):
+        """Decisions that were invoked, most expensive first."""
+        used = [d for d in self.decisions if d.invocations]
+        return sorted(used, key=lambda d: d.time_ns, reverse=True)
+
+    def as_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "files": self.files,
+            "failures": [{"file": f, "error": e} for f, e in self.failures],
+            "parse_seconds": self.parse_ns / 1e9,
+            "prediction_seconds": sum(d.time_ns for d in self.decisions) / 1e9,
+            "parse_stats": self.stats.as_dict(),
+            "decisions": [d.as_dict() for d in self.active()],
+        }
+
+    def table(self, top: int = None) -> str:
+        headers = [
+            "decision", "rule", "kind", "calls", "ms", "SLL avg/max k",
+            "LL fallbacks", "LL avg/max k", "ATN trans", "ambig", "deepest at",
+        ]  # fmt: skip
+        rows = []
+        for d in self.active()[:top]:
+            info = d.as_dict()
+            rows.append(
+                [
+                    str(d.decision),
+                    d.rule,
+                    d.kind,
+                    str(d.invocations),
+                    f"{d.time_ns / 1e6:.2f}",
+                    f"{info['sll_avg_look']:.2f}/{d.sll_max_look}",
+                    str(d.ll_fallbacks),
+                    f"{info['ll_avg_look']:.2f}/{d.ll_max_look}" if d.ll_fallbacks else "-",
+                    str(d.sll_atn_transitions + d.ll_atn_transitions),
+                    str(d.ambiguities),
+                    d.max_look_at or "-",
+                ]
+            )
+        widths = [max(len(h), *(len(r[i]) for r in rows)) for i, h in enumerate(headers)]
+        lines = ["  ".join(h.ljust(w) for h, w in zip(headers, widths))]
+        lines += ["  ".join(c.ljust(w) for c, w in zip(r, widths)) for r in rows]
+        return "\n".join(lines)
+
+
+def profile_files(paths, mode: str = None) -> ParserProfile:
+    """Profile parsing every file in *paths*."""
+    profile = ParserProfile(mode)
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            profile.add(f.read(), path)
+    return profile
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    usage = (
+        "usage: python -m src.frontend.profiling <file.tyc>... "
+        "[--mode auto|sll|ll] [--json out.json] [--top N]"
+    )
+    options = {"--mode": None, "--json": None, "--top": None}
+    for option in options:
+        if option in argv:
+            i = argv.index(option)
+            if i + 1 >= len(argv):
+                print(usage)
+                return 2
+            options[option] = argv[i + 1]
+            argv = argv[:i] + argv[i + 2 :]
+    if not argv or (options["--mode"] and options["--mode"] not in MODES):
+        print(usage)
+        return 2
+
+    profile = profile_files(argv, options["--mode"])
+    top = int(options["--top"]) if options["--top"] else None
+    print(profile.table(top))
+    for name, error in profile.failures:
+        print(f"{name}: {error}")
+    if options["--json"]:
+        with open(options["--json"], "w", encoding="utf-8") as f:
+            json.dump(profile.as_dict(), f, indent=2)
+        print(f"Profile of {profile.files} files written to {options['--json']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Recovering parse mode for TyC.
+
+The default pipeline raises SyntaxException on the first syntax error (see
+NewErrorListener). parse_recovering() instead runs the parser with a
+CollectingErrorListener and a SyncErrorStrategy, so a single parse reports
+every syntax error (up to an error budget) and still returns a parse tree.
+Lexical errors are collected as well (TyCLexer.collectErrors), so bad
+tokens do not stop the parse either.
+
+SyncErrorStrategy is ANTLR's DefaultErrorStrategy with a larger
+resynchronisation set: besides the follow sets of the rules being parsed,
+recovery also stops at the keywords that can start a top-level
+declaration (`struct`, `void`, `int`, `float`, `string`) and, inside a
+function body or struct member, at `;` and `}`. A bare ID is deliberately
+not a sync token, since almost every statement starts with one. Junk
+between top-level declarations is skipped up to the next token that can
+start one, so a broken declaration never hides the ones after it. Once
+the error budget is spent, recovery skips to EOF and the parse finishes
+without further reports.
+
+The tree may contain incomplete subtrees; ASTGeneration(partial=True), as
+used by RecoveryResult.ast(), leaves those out of the AST.
+"""
+
+from typing import List, NamedTuple
+
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from antlr4.IntervalSet import IntervalSet
+from antlr4.Token import Token
+
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import ParseStats, make_parser, parse
+
+
+DEFAULT_MAX_ERRORS = 50
+
+# Tokens that can start a globalDecl (ID only matters at the top level)
+DECL_START_TOKENS = (
+    TyCParser.STRUCT,
+    TyCParser.VOID,
+    TyCParser.INT,
+    TyCParser.FLOAT,
+    TyCParser.STRING,
+)
+
+# Statement / member terminators, used inside bodies only
+BODY_SYNC_TOKENS = (TyCParser.SEMI, TyCParser.RBRACE)
+
+
+def _token_set(*groups):
+    result = IntervalSet()
+    for group in groups:
+        for t in group:
+            result.addOne(t)
+    return result
+
+
+class SyntaxDiagnostic(NamedTuple):
+    """One syntax error reported during a recovering parse."""
+
+    line: int
+    column: int
+    text: str  # text of the offending token
+    detail: str  # ANTLR's own description, e.g. "missing ';' at '}'"
+
+    @property
+    def message(self):
+        """Same wording as the SyntaxException raised by NewErrorListener."""
+        return f"Error on line {self.line} col {self.column}: {self.text}"
+
+
+class CollectingErrorListener(ErrorListener):
+    """Records syntax errors instead of raising, up to *max_errors*."""
+
+    def __init__(self, max_errors: int = DEFAULT_MAX_ERRORS):
+        self.max_errors = max_errors
+        self.errors: List[SyntaxDiagnostic] = []
+        self.truncated = False
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        if len(self.errors) >= self.max_errors:
+            self.truncated = True
+            return
+        text = getattr(offendingSymbol, "text", str(offendingSymbol))
+        self.errors.append(SyntaxDiagnostic(line, column, text, msg))
+
+
+class SyncErrorStrategy(DefaultErrorStrategy):
+    """DefaultErrorStrategy that resynchronises on declaration and statement boundaries."""
+
+    DECL_SYNC = _token_set(DECL_START_TOKENS)
+    BODY_SYNC = _token_set(DECL_START_TOKENS, BODY_SYNC_TOKENS)
+    TOP_LEVEL = _token_set(DECL_START_TOKENS, (TyCParser.ID, Token.EOF))
+
+    def __init__(self, max_errors: int = DEFAULT_MAX_ERRORS):
+        super().__init__()
+        self.max_errors = max_errors
+        self.gave_up = False  # set when the rest of the input was skipped
+
+    def exhausted(self, recognizer) -> bool:
+        return recognizer.getNumberOfSyntaxErrors() >= self.max_errors
+
+    @staticmethod
+    def _in_body(recognizer) -> bool:
+        ctx = recognizer._ctx
+        while ctx is not None:
+            if isinstance(ctx, (TyCParser.BlockContext, TyCParser.StructMemberContext)):
+                return True
+            ctx = ctx.parentCtx
+        return False
+
+    def getErrorRecoverySet(self, recognizer):
+        recover_set = super().getErrorRecoverySet(recognizer)
+        recover_set.addSet(self.BODY_SYNC if self._in_body(recognizer) else self.DECL_SYNC)
+        return recover_set
+
+    def _skip_to_eof(self, recognizer):
+        self.beginErrorCondition(recognizer)  # silence the remaining errors
+        stream = recognizer.getTokenStream()
+        while stream.LA(1) != Token.EOF:
+            self.gave_up = True
+            recognizer.consume()
+
+    def recover(self, recognizer, e):
+        if self.exhausted(recognizer):
+            self._skip_to_eof(recognizer)
+            return
+        super().recover(recognizer, e)
+
+    def recoverInline(self, recognizer):
+        if self.exhausted(recognizer):
+            self._skip_to_eof(recognizer)
+        return super().recoverInline(recognizer)
+
+    def sync(self, recognizer):
+        if self.exhausted(recognizer):
+            self._skip_to_eof(recognizer)
+            return
+        if isinstance(recognizer._ctx, TyCParser.ProgramContext):
+            # Between declarations: drop junk instead of ending the program
+            stream = recognizer.getTokenStream()
+            if not self.inErrorRecoveryMode(recognizer) and stream.LA(1) not in self.TOP_LEVEL:
+                self.reportUnwantedToken(recognizer)
+                self.consumeUntil(recognizer, self.TOP_LEVEL)
+            return
+        super().sync(recognizer)
+
+
+class RecoveryResult(NamedTuple):
+    """Outcome of parse_recovering()."""
+
+    tree: TyCParser.ProgramContext
+    errors: List[SyntaxDiagnostic]
+    lexical_errors: list  # lexererr.LexicalDiagnostic entries
+    truncated: bool  # True if the error budget cut the parse short
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.lexical_errors
+
+    def ast(self):
+        """AST of the parts of the program that parsed cleanly."""
+        # The root is never dropped, even if recovery ended inside it
+        generation = ASTGeneration(partial=True)
+        return generation.run(generation.visitProgram(self.tree))
+
+
+def parse_recovering(
+    source,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    mode: str = None,
+    stats: ParseStats = None,
+) -> RecoveryResult:
+    """Parse *source* (string or character stream), collecting all errors."""
+    listener = CollectingErrorListener(max_errors)
+    parser = make_parser(source, listener=listener)
+    lexical_errors = parser.getTokenStream().tokenSource.collectErrors()
+    strategy = parser._errHandler = SyncErrorStrategy(max_errors)
+    tree = parse(parser, "program", mode, stats)
+    truncated = listener.truncated or strategy.gave_up
+    return RecoveryResult(tree, listener.errors, lexical_errors, truncated)
@@ -0,0 +1,183 @@
+"""
+Hand-written, regex-driven scanner for TyC.
+
+TyCScanner is a drop-in TokenSource for CommonTokenStream that produces the
+same token types, texts, channels and positions as the generated TyCLexer,
+and raises the same ErrorToken / UncloseString / IllegalEscape errors from
+`lexererr` (or collects them, after collectErrors()). Instead of simulating
+the lexer ATN one code point at a time, it matches one compiled master
+pattern per token.
+
+The pattern's alternatives are ordered so that Python's first-match
+alternation picks the same token as ANTLR's longest-match rule, with ties
+going to the rule declared first in TyC.g4:
+
+* comments before `/`, floats before ints (a float match is always longer),
+* keywords are IDs looked up in a table,
+* a well-formed string before an illegal escape before an unclosed string
+  (only one of the first two can match; either is longer than the third),
+* two-character operators before one-character ones,
+* any other single character is ERROR_CHAR.
+
+tests/test_scanner.py checks the equivalence against the generated lexer.
+"""
+
+import re
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Lexer import TokenSource
+from antlr4.Token import Token
+
+from build.TyCLexer import TyCLexer
+from lexererr import ErrorToken, IllegalEscape, LexicalDiagnostic, UncloseString
+
+
+_EXPONENT = r"[eE][+-]?[0-9]+"
+_STRING_BODY = r'"(?:\\[bfnrt"\\]|[^"\\\r\n])*'
+
+_RULES = [
+    ("WS", r"[ \t\r\n\f]+"),
+    ("BLOCK_COMMENT", r"/\*[\s\S]*?\*/"),
+    ("LINE_COMMENT", r"//[^\r\n]*"),
+    (
+        "FLOAT_LITERAL",
+        rf"[0-9]+\.[0-9]*(?:{_EXPONENT})?|\.[0-9]+(?:{_EXPONENT})?|[0-9]+{_EXPONENT}",
+    ),
+    ("INT_LITERAL", r"0|[1-9][0-9]*"),
+    ("ID", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+    ("STRING_LITERAL", _STRING_BODY + '"'),
+    ("ILLEGAL_ESCAPE", _STRING_BODY + r'\\[^bfnrt"\\\r\n]'),
+    ("UNCLOSE_STRING", _STRING_BODY),
+    ("OP", r"==|!=|<=|>=|\|\||&&|\+\+|--|[-+*/%<>!=.\[\]{}();,:]"),
+    ("ERROR_CHAR", r"[\s\S]"),
+]
+
+MASTER = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in _RULES))
+
+SKIPPED = frozenset({"WS", "BLOCK_COMMENT", "LINE_COMMENT"})
+
+KEYWORDS = {
+    name.lower(): getattr(TyCLexer, name)
+    for name in (
+        "AUTO", "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", "FLOAT", "FOR",
+        "IF", "INT", "RETURN", "STRING", "STRUCT", "SWITCH", "VOID", "WHILE",
+    )
+}
+
+OPERATORS = {
+    literal.strip("'"): i
+    for i, literal in enumerate(TyCLexer.literalNames)
+    if literal.startswith("'") and not literal[1:-1].isalpha()
+}
+
+RULE_TYPES = {
+    name: getattr(TyCLexer, name)
+    for name, _ in _RULES
+    if name not in SKIPPED and name not in ("OP", "ID")
+}
+
+
+class TyCScanner(TokenSource):
+    """TokenSource equivalent to TyCLexer, driven by one master regex."""
+
+    diagnostics = None  # see TyCLexer.collectErrors
+
+    def __init__(self, input=None):
+        self._factory = CommonTokenFactory.DEFAULT
+        self.sourceName = "<scanner>"
+        self.setInputStream(input if input is not None else "")
+
+    def setInputStream(self, input):
+        """Start scanning *input*, a string or an antlr4 InputStream."""
+        if isinstance(input, str):
+            self._source = input
+            self.inputStream = None
+        else:
+            self._source = str(input)
+            self.inputStream = input
+        self._tokenFactorySourcePair = (self, self.inputStream)
+        self.reset()
+
+    def reset(self):
+        self.pos = 0
+        self.line = 1
+        self.column = 0
+
+    def getCharIndex(self):
+        return self.pos
+
+    def getSourceName(self):
+        return self.sourceName
+
+    def getInputStream(self):
+        return self.inputStream
+
+    def collectErrors(self, diagnostics=None):
+        """Record lexical errors in a list and keep scanning, like TyCLexer."""
+        self.diagnostics = [] if diagnostics is None else diagnostics
+        return self.diagnostics
+
+    def _lexical_error(self, error, token):
+        if self.diagnostics is None:
+            raise error
+        token.channel = Token.HIDDEN_CHANNEL
+        self.diagnostics.append(LexicalDiagnostic.of(error, token))
+
+    def _advance(self, lexeme: str):
+        newlines = lexeme.count("\n")
+        if newlines:
+            self.line += newlines
+            self.column = len(lexeme) - lexeme.rfind("\n") - 1
+        else:
+            self.column += len(lexeme)
+
+    def nextToken(self):
+        text = self._source
+        size = len(text)
+        match = MASTER.match
+        while self.pos < size:
+            m = match(text, self.pos)
+            kind = m.lastgroup
+            lexeme = m.group()
+            start, line, column = self.pos, self.line, self.column
+            self.pos = m.end()
+            self._advance(lexeme)
+            if kind in SKIPPED:
+                continue
+            if kind == "ID":
+                ttype = KEYWORDS.get(lexeme, TyCLexer.ID)
+            elif kind == "OP":
+                ttype = OPERATORS[lexeme]
+            else:
+                ttype = RULE_TYPES[kind]
+            if kind == "STRING_LITERAL":
+                lexeme = lexeme[1:-1]
+            elif kind == "UNCLOSE_STRING" or kind == "ILLEGAL_ESCAPE":
+                lexeme = lexeme[1:]
+            token = self._factory.create(
+                self._tokenFactorySourcePair,
+                ttype,
+                lexeme,
+                Token.DEFAULT_CHANNEL,
+                start,
+                self.pos - 1,
+                line,
+                column,
+            )
+            if kind == "UNCLOSE_STRING":
+                self._lexical_error(UncloseString(lexeme), token)
+            elif kind == "ILLEGAL_ESCAPE":
+                self._lexical_error(IllegalEscape(lexeme), token)
+            elif kind == "ERROR_CHAR":
+                self._lexical_error(ErrorToken(lexeme), token)
+            return token
+        return self._factory.create(
+            self._tokenFactorySourcePair,
+            Token.EOF,
+            "<EOF>",
+            Token.DEFAULT_CHANNEL,
+            self.pos,
+            self.pos - 1,
+            self.line,
+            self.column,
+        )
@@ -0,0 +1,73 @@
+"""
+Streaming front end for huge TyC files: one top-level declaration at a time.
+
+parse(make_parser(...)) builds the parse tree of the whole `program`, and
+a CommonTokenStream keeps every token of the file, before ASTGeneration
+can start. iter_decls() instead parses the file one `globalDecl` at a
+time, converts each to its StructDecl/FuncDecl with ASTGeneration and
+yields it. The parse tree of a declaration is dropped before it is
+yielded, and a StreamingTokenStream discards the tokens consumed so far,
+so peak memory follows the largest declaration rather than the whole
+file; the AST of the declarations the caller keeps is theirs to hold.
+
+The file itself stays in memory only as a character stream (use
+iter_file_decls() for a memory-mapped one). No LineIndex is built: the
+caller resolves the nodes' spans with one of its own (ASTNode.position).
+Each declaration goes through parsing.parse() with the usual SLL/LL
+stages and error reporting; a syntax error stops the iteration with the
+same exception a whole-program parse raises. The
+declarations are the ones `Program.decls` holds after a whole-program
+parse, with the same spans.
+
+Usage:
+    for decl in iter_file_decls("huge.tyc"):
+        ...
+"""
+
+from typing import Iterator
+
+from antlr4.Token import Token
+
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import ParseStats, make_parser, parse
+from src.frontend.streams import open_source
+from src.frontend.tokens import StreamingTokenStream
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import Decl
+
+
+def iter_decls(
+    source,
+    listener=NewErrorListener.INSTANCE,
+    expressions: str = None,
+    mode: str = None,
+    stats: ParseStats = None,
+) -> Iterator[Decl]:
+    """Yield the top-level declarations of *source*, parsing one at a time.
+
+    *source* is a string or an opened character stream; *listener*,
+    *expressions*, *mode* and *stats* are as for parsing.make_parser() and
+    parsing.parse().
+    """
+    parser = make_parser(
+        source, listener, expressions=expressions, token_stream=StreamingTokenStream
+    )
+    tokens = parser.getTokenStream()
+    generation = ASTGeneration()
+    while tokens.LA(1) != Token.EOF:
+        tree = parse(parser, "globalDecl", mode, stats)
+        decl = generation.visit(tree)
+        del tree
+        tokens.discard()
+        yield decl
+
+
+def iter_file_decls(path: str, **options) -> Iterator[Decl]:
+    """iter_decls() over the file at *path*, memory-mapped when ASCII."""
+    stream = open_source(path)
+    try:
+        yield from iter_decls(stream, **options)
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
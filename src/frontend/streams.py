@@ -0,0 +1,142 @@
+"""
+Compact character streams for large TyC sources.
+
+antlr4.InputStream copies the whole source into a Python list with one
+entry per character before lexing starts. TyC is ASCII-only, so
+ByteInputStream serves LA() and getText() straight from a bytes-like buffer
+(bytes, memoryview or a read-only mmap of the file) without any
+per-character objects: indexing a byte buffer yields cached small ints and
+getText() decodes only the requested slice.
+
+Sources that are not pure ASCII fall back to antlr4.InputStream, so code
+points seen by the lexer never differ from the standard stream.
+"""
+
+import mmap
+import re
+
+from antlr4 import InputStream
+from antlr4.Token import Token
+
+
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+
+class ByteInputStream:
+    """CharStream over an ASCII bytes-like buffer."""
+
+    __slots__ = ("name", "line_index", "_buf", "_index", "_size", "_owner")
+
+    def __init__(self, data, name: str = "<bytes>", owner=None):
+        self.name = name
+        self._buf = data if isinstance(data, memoryview) else memoryview(data)
+        self._index = 0
+        self._size = len(self._buf)
+        self._owner = owner  # keeps a mapped file open while the stream lives
+        self.line_index = None  # utils.spans.LineIndex, built on demand
+
+    @property
+    def buffer(self):
+        """The underlying buffer (released by close())."""
+        return self._buf
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def size(self):
+        return self._size
+
+    def reset(self):
+        self._index = 0
+
+    def consume(self):
+        if self._index >= self._size:
+            raise Exception("cannot consume EOF")
+        self._index += 1
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0  # undefined
+        if offset < 0:
+            offset += 1  # LA(-1) is the previous character
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        return self._buf[pos]
+
+    def LT(self, offset: int):
+        return self.LA(offset)
+
+    # The whole buffer is always available, so marks are no-ops
+    def mark(self):
+        return -1
+
+    def release(self, marker: int):
+        pass
+
+    def seek(self, index: int):
+        self._index = min(index, self._size)
+
+    def load(self, data):
+        """Serve *data* in place of the current buffer, from the start.
+
+        Tokens read their text from their stream, so a source that is
+        edited in place (src.frontend.incremental) keeps one stream and
+        loads every new version of the text into it.
+        """
+        self._buf = data if isinstance(data, memoryview) else memoryview(data)
+        self._index = 0
+        self._size = len(self._buf)
+
+    def getText(self, start: int, stop: int):
+        if stop >= self._size:
+            stop = self._size - 1
+        if start >= self._size:
+            return ""
+        return str(self._buf[start : stop + 1], "ascii")
+
+    def close(self):
+        """Release the buffer (and the mapped file, if any)."""
+        self._buf.release()
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return str(self._buf, "ascii")
+
+
+def is_ascii(data) -> bool:
+    """True if the bytes-like *data* holds only 7-bit characters."""
+    return _NON_ASCII.search(data) is None
+
+
+def make_input_stream(source: str):
+    """Best character stream for an in-memory source string."""
+    if source.isascii():
+        return ByteInputStream(source.encode("ascii"))
+    return InputStream(source)
+
+
+def open_source(path: str):
+    """Character stream over the file at *path*, memory-mapped when ASCII."""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return ByteInputStream(b"", name=path)
+    if is_ascii(mapped):
+        return ByteInputStream(mapped, name=path, owner=mapped)
+    text = mapped[:].decode("utf-8")
+    mapped.close()
+    stream = InputStream(text)
+    stream.name = path
+    return stream
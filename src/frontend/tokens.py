@@ -0,0 +1,483 @@
+"""
+Compact, array-backed token stream for TyC.
+
+CommonTokenStream keeps one CommonToken object (type, channel, start, stop,
+line, column, text, source, index) per token for the whole parse.
+CompactTokenStream stores the same fields in parallel array('i') columns
+and hands out TokenView objects only when the parser asks for a token via
+LT()/get(). LA() reads the type column directly, so adaptive prediction,
+which mostly looks at token types, creates no token objects at all.
+
+Token text is not stored: a view slices it from the lexer's character
+stream on demand. Tokens whose text was rewritten by a lexer action (e.g.
+STRING_LITERAL, which drops its quotes) keep their text in a sparse side
+table instead.
+
+StreamingTokenStream keeps ordinary tokens, but only a window of them: the
+tokens before the current one can be dropped once the parser is done with
+them, for parsing huge inputs one declaration at a time.
+"""
+
+from array import array
+
+from antlr4.Token import Token
+from antlr4.error.Errors import IllegalStateException
+
+
+class TokenView:
+    """Lightweight Token over one row of a CompactTokenStream."""
+
+    __slots__ = ("_stream", "tokenIndex")
+
+    def __init__(self, stream: "CompactTokenStream", index: int):
+        self._stream = stream
+        self.tokenIndex = index
+
+    @property
+    def type(self):
+        return self._stream.types[self.tokenIndex]
+
+    @property
+    def channel(self):
+        return self._stream.channels[self.tokenIndex]
+
+    @property
+    def start(self):
+        return self._stream.starts[self.tokenIndex]
+
+    @property
+    def stop(self):
+        return self._stream.stops[self.tokenIndex]
+
+    @property
+    def line(self):
+        return self._stream.lines[self.tokenIndex]
+
+    @property
+    def column(self):
+        return self._stream.columns[self.tokenIndex]
+
+    @property
+    def text(self):
+        return self._stream.tokenText(self.tokenIndex)
+
+    @property
+    def source(self):
+        return (self._stream.tokenSource, self._stream.charStream)
+
+    def getTokenSource(self):
+        return self._stream.tokenSource
+
+    def getInputStream(self):
+        return self._stream.charStream
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, TokenView)
+            and other._stream is self._stream
+            and other.tokenIndex == self.tokenIndex
+        )
+
+    def __hash__(self):
+        return hash((id(self._stream), self.tokenIndex))
+
+    def __str__(self):
+        txt = self.text
+        if txt is not None:
+            txt = txt.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+        else:
+            txt = "<no text>"
+        channel = f",channel={self.channel}" if self.channel > 0 else ""
+        return (
+            f"[@{self.tokenIndex},{self.start}:{self.stop}='{txt}',"
+            f"<{self.type}>{channel},{self.line}:{self.column}]"
+        )
+
+
+class CompactTokenStream:
+    """Drop-in replacement for CommonTokenStream with columnar storage."""
+
+    def __init__(self, tokenSource, channel: int = Token.DEFAULT_CHANNEL):
+        self.channel = channel
+        self.setTokenSource(tokenSource)
+
+    def setTokenSource(self, tokenSource):
+        if getattr(tokenSource, "inputStream", None) is None:
+            raise ValueError("CompactTokenStream needs a token source with a character stream")
+        self.tokenSource = tokenSource
+        self.charStream = tokenSource.inputStream
+        self.types = array("i")
+        self.channels = array("i")
+        self.starts = array("i")
+        self.stops = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+        self.texts = {}  # token index -> text differing from the source slice
+        self.index = -1
+        self.fetchedEOF = False
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.types)
+
+    @property
+    def size(self):
+        return len(self.types)
+
+    def fetch(self, n: int) -> int:
+        if self.fetchedEOF:
+            return 0
+        source = self.tokenSource
+        chars = self.charStream
+        for i in range(n):
+            t = source.nextToken()
+            index = len(self.types)
+            start, stop = t.start, t.stop
+            self.types.append(t.type)
+            self.channels.append(t.channel)
+            self.starts.append(start)
+            self.stops.append(stop)
+            self.lines.append(t.line)
+            self.columns.append(t.column)
+            text = t._text
+            if text is not None and t.type != Token.EOF:
+                if len(text) != stop - start + 1 or text != chars.getText(start, stop):
+                    self.texts[index] = text
+            if t.type == Token.EOF:
+                self.fetchedEOF = True
+                return i + 1
+        return n
+
+    def sync(self, i: int) -> bool:
+        n = i - len(self.types) + 1
+        if n > 0:
+            return self.fetch(n) >= n
+        return True
+
+    def fill(self):
+        self.lazyInit()
+        while self.fetch(1000) == 1000:
+            pass
+
+    def tokenText(self, i: int):
+        text = self.texts.get(i)
+        if text is not None:
+            return text
+        if self.types[i] == Token.EOF:
+            return "<EOF>"
+        return self.charStream.getText(self.starts[i], self.stops[i])
+
+    # ------------------------------------------------------------------
+    # TokenStream interface (same semantics as CommonTokenStream)
+    # ------------------------------------------------------------------
+
+    def lazyInit(self):
+        if self.index == -1:
+            self.sync(0)
+            self.index = self.nextTokenOnChannel(0, self.channel)
+
+    def mark(self):
+        return 0
+
+    def release(self, marker: int):
+        pass
+
+    def reset(self):
+        self.seek(0)
+
+    def seek(self, index: int):
+        self.lazyInit()
+        self.index = self.nextTokenOnChannel(index, self.channel)
+
+    def get(self, index: int):
+        self.lazyInit()
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError(index)
+        return TokenView(self, index)
+
+    def consume(self):
+        if self.index >= 0:
+            if self.fetchedEOF:
+                skip_eof_check = self.index < len(self.types) - 1
+            else:
+                skip_eof_check = self.index < len(self.types)
+        else:
+            skip_eof_check = False
+        if not skip_eof_check and self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        if self.sync(self.index + 1):
+            self.index = self.nextTokenOnChannel(self.index + 1, self.channel)
+
+    def nextTokenOnChannel(self, i: int, channel: int) -> int:
+        self.sync(i)
+        if i >= len(self.types):
+            return len(self.types) - 1
+        channels, types = self.channels, self.types
+        while channels[i] != channel:
+            if types[i] == Token.EOF:
+                return i
+            i += 1
+            self.sync(i)
+        return i
+
+    def previousTokenOnChannel(self, i: int, channel: int) -> int:
+        while i >= 0 and self.channels[i] != channel:
+            i -= 1
+        return i
+
+    def _lt_index(self, k: int):
+        """Row index of LT(k), or None where LT(k) would be None."""
+        self.lazyInit()
+        if k == 0:
+            return None
+        if k < 0:
+            i = self.index
+            for _ in range(-k):
+                i = self.previousTokenOnChannel(i - 1, self.channel)
+            return i if i >= 0 else None
+        i = self.index
+        for _ in range(k - 1):
+            if self.sync(i + 1):
+                i = self.nextTokenOnChannel(i + 1, self.channel)
+        return i
+
+    def LT(self, k: int):
+        i = self._lt_index(k)
+        return None if i is None else TokenView(self, i)
+
+    def LA(self, k: int):
+        if k == 1 and self.index >= 0:
+            return self.types[self.index]
+        i = self._lt_index(k)
+        return None if i is None else self.types[i]
+
+    def getTokens(self, start: int, stop: int, types: set = None):
+        if start < 0 or stop < 0:
+            return None
+        self.lazyInit()
+        stop = min(stop, len(self.types) - 1)
+        subset = []
+        for i in range(start, stop):
+            if self.types[i] == Token.EOF:
+                break
+            if types is None or self.types[i] in types:
+                subset.append(TokenView(self, i))
+        return subset
+
+    def getText(self, start=None, stop=None):
+        """Concatenated token texts, as BufferedTokenStream.getText."""
+        self.lazyInit()
+        self.fill()
+        if isinstance(start, (Token, TokenView)):
+            start = start.tokenIndex
+        elif start is None:
+            start = 0
+        if isinstance(stop, (Token, TokenView)):
+            stop = stop.tokenIndex
+        elif stop is None or stop >= len(self.types):
+            stop = len(self.types) - 1
+        if start < 0 or stop < 0 or stop < start:
+            return ""
+        parts = []
+        for i in range(start, stop + 1):
+            if self.types[i] == Token.EOF:
+                break
+            parts.append(self.tokenText(i))
+        return "".join(parts)
+
+    def getSourceText(self, start: int, stop: int) -> str:
+        """Source characters spanned by tokens start..stop, whitespace included."""
+        return self.charStream.getText(self.starts[start], self.stops[stop])
+
+    def getSourceName(self):
+        return self.tokenSource.getSourceName()
+
+    def getNumberOfOnChannelTokens(self):
+        self.fill()
+        n = 0
+        for i in range(len(self.types)):
+            if self.channels[i] == self.channel:
+                n += 1
+            if self.types[i] == Token.EOF:
+                break
+        return n
+
+    def nbytes(self) -> int:
+        """Bytes held by the token columns (excluding the text side table)."""
+        return sum(
+            col.itemsize * len(col)
+            for col in (self.types, self.channels, self.starts, self.stops, self.lines, self.columns)
+        )
+
+
+class StreamingTokenStream:
+    """CommonTokenStream that lets go of the tokens a parse is done with.
+
+    Tokens are pulled from the lexer on demand, as by CommonTokenStream,
+    and kept in a window: discard() drops every token before the current
+    one (but LT(-1)), so parsing a long input one rule at a time (see
+    src.frontend.streaming) holds the tokens of the rule being parsed
+    only. Token indexes stay absolute; seeking, get() or getText() before
+    the window raise IndexError.
+    """
+
+    def __init__(self, tokenSource, channel: int = Token.DEFAULT_CHANNEL):
+        self.tokenSource = tokenSource
+        self.channel = channel
+        self.tokens = []  # the window: tokens offset, offset + 1, ...
+        self.offset = 0
+        self.index = -1
+        self.fetchedEOF = False
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return self.offset + len(self.tokens)
+
+    @property
+    def size(self):
+        return len(self)
+
+    def fetch(self, n: int) -> int:
+        if self.fetchedEOF:
+            return 0
+        for i in range(n):
+            t = self.tokenSource.nextToken()
+            t.tokenIndex = len(self)
+            self.tokens.append(t)
+            if t.type == Token.EOF:
+                self.fetchedEOF = True
+                return i + 1
+        return n
+
+    def sync(self, i: int) -> bool:
+        n = i - len(self) + 1
+        if n > 0:
+            return self.fetch(n) >= n
+        return True
+
+    def discard(self):
+        """Drop the tokens before the current one, except LT(-1)."""
+        if self.index < 0:
+            return
+        keep = max(self.offset, self.previousTokenOnChannel(self.index - 1, self.channel))
+        del self.tokens[: keep - self.offset]
+        self.offset = keep
+
+    def _token(self, i: int):
+        if i < self.offset:
+            raise IndexError(f"token {i} was discarded")
+        return self.tokens[i - self.offset]
+
+    # ------------------------------------------------------------------
+    # TokenStream interface (same semantics as CommonTokenStream)
+    # ------------------------------------------------------------------
+
+    def lazyInit(self):
+        if self.index == -1:
+            self.sync(0)
+            self.index = self.nextTokenOnChannel(0, self.channel)
+
+    def mark(self):
+        return 0
+
+    def release(self, marker: int):
+        pass
+
+    def reset(self):
+        self.seek(self.offset)
+
+    def seek(self, index: int):
+        self.lazyInit()
+        if index < self.offset:
+            raise IndexError(f"token {index} was discarded")
+        self.index = self.nextTokenOnChannel(index, self.channel)
+
+    def get(self, index: int):
+        self.lazyInit()
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._token(index)
+
+    def consume(self):
+        if self.index >= 0:
+            if self.fetchedEOF:
+                skip_eof_check = self.index < len(self) - 1
+            else:
+                skip_eof_check = self.index < len(self)
+        else:
+            skip_eof_check = False
+        if not skip_eof_check and self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        if self.sync(self.index + 1):
+            self.index = self.nextTokenOnChannel(self.index + 1, self.channel)
+
+    def nextTokenOnChannel(self, i: int, channel: int) -> int:
+        self.sync(i)
+        if i >= len(self):
+            return len(self) - 1
+        token = self._token(i)
+        while token.channel != channel:
+            if token.type == Token.EOF:
+                return i
+            i += 1
+            self.sync(i)
+            token = self._token(i)
+        return i
+
+    def previousTokenOnChannel(self, i: int, channel: int) -> int:
+        while i >= self.offset and self._token(i).channel != channel:
+            i -= 1
+        return i if i >= self.offset else -1
+
+    def LT(self, k: int):
+        self.lazyInit()
+        if k == 0:
+            return None
+        if k < 0:
+            i = self.index
+            for _ in range(-k):
+                i = self.previousTokenOnChannel(i - 1, self.channel)
+            return None if i < 0 else self._token(i)
+        i = self.index
+        for _ in range(k - 1):
+            if self.sync(i + 1):
+                i = self.nextTokenOnChannel(i + 1, self.channel)
+        return self._token(i)
+
+    def LA(self, k: int):
+        if k == 1 and self.index >= 0:
+            return self.tokens[self.index - self.offset].type
+        token = self.LT(k)
+        return None if token is None else token.type
+
+    def getText(self, start=None, stop=None):
+        """Concatenated texts of the fetched tokens start..stop."""
+        self.lazyInit()
+        if isinstance(start, Token):
+            start = start.tokenIndex
+        elif start is None:
+            start = self.offset
+        if isinstance(stop, Token):
+            stop = stop.tokenIndex
+        elif stop is None or stop >= len(self):
+            stop = len(self) - 1
+        if start < 0 or stop < 0 or stop < start:
+            return ""
+        parts = []
+        for i in range(start, stop + 1):
+            token = self._token(i)
+            if token.type == Token.EOF:
+                break
+            parts.append(token.text)
+        return "".join(parts)
+
+    def getSourceName(self):
+        return self.tokenSource.getSourceName()
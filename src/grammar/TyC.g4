@@ -5,19 +5,35 @@ from lexererr import *
 }
 
 @lexer::members {
+# Raising mode by default. After collectErrors(), lexical errors are recorded
+# as LexicalDiagnostic entries in self.diagnostics, the offending token is
+# moved to the hidden channel and lexing continues to EOF.
+diagnostics = None
+
+def collectErrors(self, diagnostics=None):
+    self.diagnostics = [] if diagnostics is None else diagnostics
+    return self.diagnostics
+
+def lexicalError(self, error, token):
+    if self.diagnostics is None:
+        raise error
+    token.channel = Token.HIDDEN_CHANNEL
+    self.diagnostics.append(LexicalDiagnostic.of(error, token))
+
 def emit(self):
     tk = self.type
     if tk == self.UNCLOSE_STRING:       
         result = super().emit();
-        raise UncloseString(result.text);
+        self.lexicalError(UncloseString(result.text), result);
     elif tk == self.ILLEGAL_ESCAPE:
         result = super().emit();
-        raise IllegalEscape(result.text);
+        self.lexicalError(IllegalEscape(result.text), result);
     elif tk == self.ERROR_CHAR:
         result = super().emit();
-        raise ErrorToken(result.text); 
+        self.lexicalError(ErrorToken(result.text), result);
     else:
         return super().emit();
+    return result
 }
 
 options{
@@ -192,18 +208,20 @@ lvalue
     ;
 
 // Conditional/Logic Expressions (Everything EXCEPT assignment)
+// Alternatives are listed from highest to lowest precedence, following the
+// operator table of the specification.
 condExpr
-    : condExpr (INC | DEC)                  # PostfixExpr
+    : condExpr DOT ID                       # MemberAccessExpr
+    | condExpr LPAREN argList? RPAREN       # FunctionCallExpr
+    | condExpr (INC | DEC)                  # PostfixExpr
     | (INC | DEC) condExpr                  # PrefixExpr
     | (BANG | PLUS | MINUS) condExpr        # UnaryExpr
-    | condExpr DOT ID                       # MemberAccessExpr
     | condExpr (MUL | DIV | MOD) condExpr   # MultiplicativeExpr
     | condExpr (PLUS | MINUS) condExpr      # AdditiveExpr
     | condExpr (LT | LE | GT | GE) condExpr # RelationalExpr
     | condExpr (EQUAL | NOTEQUAL) condExpr  # EqualityExpr
     | condExpr AND condExpr                 # LogicalAndExpr
     | condExpr OR condExpr                  # LogicalOrExpr
-    | condExpr LPAREN argList? RPAREN       # FunctionCallExpr
     | primary                               # PrimaryExprRule
     ;
 
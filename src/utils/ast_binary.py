@@ -0,0 +1,411 @@
+"""
+Compact binary encoding of TyC ASTs.
+
+Layout of an encoded AST:
+
+    header   MAGIC (b"TyCA"), then SCHEMA_VERSION as a varint
+    records  one record per node, in post-order (children before parents)
+
+A record is a tag byte, the node kind code from node_schema.NODE_KINDS, or
+NONE_TAG for an absent optional child. After the tag comes the node's
+source span (Type nodes have no position and skip it):
+
+    SPAN   varint, 0 if the node has no span, else 1 + the zigzag of its
+           start offset minus the previous span's start; then the span
+           length as a varint
+
+A Program record follows it with the LineIndex of the source:
+
+    SOURCE varint line count, 0 if the Program has none; then its name
+           as a NAME and the length of every line but the last as varints
+
+Then come the node's non-node fields in node_schema.FIELDS order:
+
+    NAME   string reference varint: 0 = None, 1 = a new string follows
+           (varint byte length + UTF-8 bytes, it is appended to the string
+           table), n >= 2 = string table entry n - 2
+    OP     one byte, the node_schema.OPERATORS code
+    INT    zigzag varint (any size)
+    FLOAT  8 bytes, little-endian IEEE-754 double
+    LIST   varint item count (the items are the records just before)
+
+Node fields and list items are not encoded in the record: post-order puts
+them on the decoder's value stack. The string table is built as strings
+first appear, so neither side needs a second pass. ASTWriter streams
+records to a binary file in chunks; loads() decodes straight from any
+buffer (bytes, memoryview, mmap) without copying it, and load() maps a file
+into memory. A different SCHEMA_VERSION in the header is rejected.
+"""
+
+import mmap
+import struct
+
+from src.utils.node_schema import (
+    FIELDS,
+    FLOAT,
+    INT,
+    KIND_CODES,
+    LIST,
+    NAME,
+    NODE,
+    NODE_KINDS,
+    OP,
+    OPERATOR_CODES,
+    OPERATORS,
+    is_type,
+)
+from src.utils.nodes import Program
+from src.utils.spans import LineIndex, pack_span, span_end, span_start
+
+
+MAGIC = b"TyCA"
+
+# Bump whenever the record layout or node_schema's codes change
+SCHEMA_VERSION = 3
+
+NONE_TAG = 0xFF
+
+CHUNK_SIZE = 1 << 16
+
+_DOUBLE = struct.Struct("<d")
+
+# Per kind code: (class, has position, non-node fields, number of node
+# fields)
+_LAYOUT = []
+for _cls in NODE_KINDS:
+    _LAYOUT.append(
+        (
+            _cls,
+            not is_type(_cls),
+            tuple((name, kind) for name, kind in FIELDS[_cls] if kind != NODE),
+            sum(1 for _, kind in FIELDS[_cls] if kind == NODE),
+        )
+    )
+
+
+_PROGRAM = KIND_CODES[Program]
+
+
+class FormatError(ValueError):
+    """The data is not a (complete) encoded AST."""
+
+
+class SchemaVersionError(FormatError):
+    """The data was written with another schema version."""
+
+
+# ----------------------------------------------------------------------
+# Writing
+# ----------------------------------------------------------------------
+
+
+def _varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+class ASTWriter:
+    """Streams the encoding of an AST to a binary file object."""
+
+    def __init__(self, stream, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._strings = {}
+        self._start = 0  # start offset of the previous span
+
+    def write(self, root):
+        """Write the header and all records of the tree rooted at *root*."""
+        out = self._buffer
+        out += MAGIC
+        _varint(out, SCHEMA_VERSION)
+        # Post-order without recursion: (node, expanded) entries
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node is None:
+                out.append(NONE_TAG)
+            elif expanded:
+                self._record(node)
+            else:
+                stack.append((node, True))
+                children = []
+                try:
+                    fields = FIELDS[type(node)]
+                except KeyError:
+                    raise TypeError(f"Not an AST node: {node!r}") from None
+                for name, kind in fields:
+                    if kind == NODE:
+                        children.append(getattr(node, name))
+                    elif kind == LIST:
+                        children.extend(getattr(node, name))
+                stack.extend((child, False) for child in reversed(children))
+            if len(out) >= self.chunk_size:
+                self.flush()
+        self.flush()
+
+    def _record(self, node):
+        out = self._buffer
+        kind = KIND_CODES[type(node)]
+        out.append(kind)
+        _, positioned, scalars, _ = _LAYOUT[kind]
+        if positioned:
+            self._span(node)
+        if kind == _PROGRAM:
+            self._source(node.source)
+        for name, field_kind in scalars:
+            value = getattr(node, name)
+            if field_kind == NAME:
+                self._string(value)
+            elif field_kind == OP:
+                out.append(OPERATOR_CODES[value])
+            elif field_kind == INT:
+                _varint(out, _zigzag(value))
+            elif field_kind == FLOAT:
+                out += _DOUBLE.pack(value)
+            else:  # LIST
+                _varint(out, len(value))
+
+    def _span(self, node):
+        out = self._buffer
+        span = node.span
+        if span is None:
+            out.append(0)
+            return
+        start = span_start(span)
+        _varint(out, _zigzag(start - self._start) + 1)
+        _varint(out, span_end(span) - start)
+        self._start = start
+
+    def _source(self, source):
+        out = self._buffer
+        if source is None:
+            out.append(0)
+            return
+        starts = source.starts
+        _varint(out, len(starts))
+        self._string(source.name)
+        for i in range(1, len(starts)):
+            _varint(out, starts[i] - starts[i - 1])
+
+    def _string(self, value):
+        out = self._buffer
+        if value is None:
+            out.append(0)
+            return
+        index = self._strings.get(value)
+        if index is not None:
+            _varint(out, index + 2)
+            return
+        self._strings[value] = len(self._strings)
+        data = value.encode("utf-8")
+        out.append(1)
+        _varint(out, len(data))
+        out += data
+
+    def flush(self):
+        if self._buffer:
+            self.stream.write(bytes(self._buffer))
+            self._buffer.clear()
+
+
+class _BytesSink:
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(data)
+
+
+def dump(node, stream):
+    """Write the encoding of *node* to the binary file object *stream*."""
+    ASTWriter(stream).write(node)
+
+
+def dumps(node) -> bytes:
+    """The encoding of *node* as bytes."""
+    sink = _BytesSink()
+    ASTWriter(sink).write(node)
+    return b"".join(sink.parts)
+
+
+# ----------------------------------------------------------------------
+# Reading
+# ----------------------------------------------------------------------
+
+
+def _read_varint(buf, pos: int):
+    result = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _header(buf) -> int:
+    if len(buf) < len(MAGIC) + 1 or bytes(buf[: len(MAGIC)]) != MAGIC:
+        raise FormatError("Not an encoded TyC AST")
+    version, pos = _read_varint(buf, len(MAGIC))
+    if version != SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"AST schema version {version} is not supported (expected {SCHEMA_VERSION})"
+        )
+    return pos
+
+
+def loads(buffer):
+    """Decode an AST from *buffer* (bytes, bytearray, memoryview or mmap)."""
+    buf = buffer if isinstance(buffer, mmap.mmap) else memoryview(buffer)
+    try:
+        return _decode(buf, _header(buf))
+    except (IndexError, struct.error):
+        raise FormatError("Truncated AST data") from None
+    finally:
+        if isinstance(buf, memoryview):
+            buf.release()
+
+
+def load(path: str):
+    """Decode the AST stored in the file at *path* through a memory map."""
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            raise FormatError("Not an encoded TyC AST")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return loads(mapped)
+
+
+def _decode(buf, pos: int):
+    end = len(buf)
+    layouts = _LAYOUT
+    strings = []
+    previous_start = 0
+    values = []  # decoded nodes waiting for their parent
+    push = values.append
+    unpack_double = _DOUBLE.unpack_from
+    while pos < end:
+        tag = buf[pos]
+        pos += 1
+        if tag == NONE_TAG:
+            push(None)
+            continue
+        if tag >= len(layouts):
+            raise FormatError(f"Unknown node tag {tag} at offset {pos - 1}")
+        cls, positioned, scalars, n_nodes = layouts[tag]
+        span = None
+        if positioned:
+            delta = buf[pos]
+            pos += 1
+            if delta > 0x7F:
+                delta, pos = _read_varint(buf, pos - 1)
+            if delta:
+                delta -= 1
+                start = previous_start + (delta >> 1 if not delta & 1 else -((delta + 1) >> 1))
+                length, pos = _read_varint(buf, pos)
+                span = pack_span(start, start + length)
+                previous_start = start
+        if tag == _PROGRAM:
+            source, pos = _read_source(buf, pos, strings)
+        scalar_values = []
+        n_items = 0
+        for _, field_kind in scalars:
+            if field_kind == NAME:
+                ref = buf[pos]
+                pos += 1
+                if ref > 0x7F:
+                    ref, pos = _read_varint(buf, pos - 1)
+                if ref == 0:
+                    scalar_values.append(None)
+                elif ref == 1:
+                    length, pos = _read_varint(buf, pos)
+                    if pos + length > end:
+                        raise FormatError("Truncated AST data")
+                    text = str(buf[pos : pos + length], "utf-8")
+                    pos += length
+                    strings.append(text)
+                    scalar_values.append(text)
+                else:
+                    scalar_values.append(strings[ref - 2])
+            elif field_kind == OP:
+                scalar_values.append(OPERATORS[buf[pos]])
+                pos += 1
+            elif field_kind == INT:
+                value, pos = _read_varint(buf, pos)
+                scalar_values.append(value >> 1 if not value & 1 else -((value + 1) >> 1))
+            elif field_kind == FLOAT:
+                scalar_values.append(unpack_double(buf, pos)[0])
+                pos += 8
+            else:  # LIST
+                n_items, pos = _read_varint(buf, pos)
+        n_children = n_nodes + n_items
+        if n_children > len(values):
+            raise FormatError(f"Malformed AST record at offset {pos}")
+        if n_children:
+            children = values[-n_children:]
+            del values[-n_children:]
+        else:
+            children = ()
+        node = cls(*_arguments(cls, children, scalar_values, n_items))
+        if span is not None:
+            node.span = span
+        if tag == _PROGRAM:
+            node.source = source
+        push(node)
+    if len(values) != 1:
+        raise FormatError("Truncated AST data")
+    return values[0]
+
+
+def _read_string(buf, pos: int, strings):
+    """Decode a NAME field: (string or None, new position)."""
+    ref, pos = _read_varint(buf, pos)
+    if ref == 0:
+        return None, pos
+    if ref >= 2:
+        return strings[ref - 2], pos
+    length, pos = _read_varint(buf, pos)
+    if pos + length > len(buf):
+        raise FormatError("Truncated AST data")
+    text = str(buf[pos : pos + length], "utf-8")
+    strings.append(text)
+    return text, pos + length
+
+
+def _read_source(buf, pos: int, strings):
+    """Decode a SOURCE field: (LineIndex or None, new position)."""
+    count, pos = _read_varint(buf, pos)
+    if count == 0:
+        return None, pos
+    name, pos = _read_string(buf, pos, strings)
+    starts = [0]
+    for _ in range(count - 1):
+        length, pos = _read_varint(buf, pos)
+        starts.append(starts[-1] + length)
+    return LineIndex.from_starts(starts, name), pos
+
+
+def _arguments(cls, children, scalar_values, n_items):
+    """Constructor arguments of *cls* in FIELDS order."""
+    args = []
+    child = 0
+    scalar = 0
+    for _, field_kind in FIELDS[cls]:
+        if field_kind == NODE:
+            args.append(children[child])
+            child += 1
+        elif field_kind == LIST:
+            args.append(list(children[child : child + n_items]))
+            child += n_items
+        else:
+            args.append(scalar_values[scalar])
+            scalar += 1
+    return args
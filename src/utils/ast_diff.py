@@ -0,0 +1,252 @@
+"""
+Structural equality, hashing and diffing of TyC ASTs.
+
+Two nodes are structurally equal when they have the same class, equal
+non-node fields and structurally equal children; source positions are
+ignored. ASTNode.__eq__ and __hash__ delegate to equal() and
+structural_hash() here:
+
+    equal(a, b)            compares the trees pair by pair with an explicit
+                           stack and returns at the first difference
+    structural_hash(node)  hashes the subtree bottom-up and caches every
+                           node's hash in its _hash slot, so a subtree is
+                           hashed once however often it is compared
+    diff(a, b)             the Changes turning *a* into *b*, found by
+                           descending only into subtrees that differ:
+                           subtrees with equal hashes are confirmed with
+                           equal() rather than diffed, and subtrees shared
+                           by both trees are skipped without a visit
+
+A cached hash assumes the subtree below it does not change. Code that
+edits a tree in place must call clear_hash() on the nodes above the
+edit (their hashes cover it); freshly built nodes start without one.
+
+Type nodes are hash-consed, so they compare and hash by identity.
+"""
+
+from difflib import SequenceMatcher
+from typing import Any, List, NamedTuple, Tuple
+
+from src.utils.node_schema import FIELDS, LIST, NODE
+from src.utils.nodes import ASTNode, Type
+
+
+# Per node class: ((field name, kind), ...) with kind NODE, LIST or None for
+# a scalar field
+_LAYOUT = {
+    cls: tuple((name, kind if kind in (NODE, LIST) else None) for name, kind in fields)
+    for cls, fields in FIELDS.items()
+}
+
+# Class -> _OTHER, _TREE (a node class) or _TYPE (a Type class), filled on demand
+_OTHER, _TREE, _TYPE = 0, 1, 2
+_CLASS_KINDS = {}
+
+
+def _layout(cls):
+    """Field layout of *cls*: that of its nearest class in FIELDS (cached)."""
+    layout = _LAYOUT.get(cls)
+    if layout is None:
+        layout = next((_LAYOUT[base] for base in cls.__mro__ if base in _LAYOUT), ())
+        _LAYOUT[cls] = layout
+    return layout
+
+
+def _class_kind(cls) -> int:
+    kind = _CLASS_KINDS.get(cls)
+    if kind is None:
+        if not issubclass(cls, ASTNode):
+            kind = _OTHER
+        else:
+            kind = _TYPE if issubclass(cls, Type) else _TREE
+        _CLASS_KINDS[cls] = kind
+    return kind
+
+
+def _hash_of(value) -> int:
+    """Hash of a field value whose subtree hash, if any, is cached."""
+    if _class_kind(value.__class__) == _OTHER:
+        return hash(value)
+    return value._hash  # Type nodes carry theirs from creation
+
+
+def structural_hash(root: ASTNode) -> int:
+    """Hash of the subtree rooted at *root*, cached on every node."""
+    h = root._hash
+    if h is not None:
+        return h
+    layouts = _LAYOUT
+    stack = [(root, False)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, expanded = pop()
+        cls = node.__class__
+        layout = layouts.get(cls)
+        if layout is None:
+            layout = _layout(cls)
+        if expanded:
+            parts = [cls]
+            for name, kind in layout:
+                value = getattr(node, name)
+                if kind is LIST:
+                    parts.append(len(value))
+                    parts.extend(map(_hash_of, value))
+                elif kind is NODE:
+                    parts.append(None if value is None else _hash_of(value))
+                else:
+                    parts.append(value)
+            node._hash = hash(tuple(parts))
+            continue
+        push((node, True))
+        for name, kind in layout:
+            if kind is None:
+                continue
+            value = getattr(node, name)
+            if kind is NODE:
+                if value is not None and getattr(value, "_hash", 0) is None:
+                    push((value, False))
+                continue
+            for child in value:
+                if getattr(child, "_hash", 0) is None:
+                    push((child, False))
+    return root._hash
+
+
+def clear_hash(*nodes: ASTNode):
+    """Forget the cached hashes of *nodes* (after editing below them)."""
+    for node in nodes:
+        if not isinstance(node, Type):
+            node._hash = None
+
+
+def equal(a, b) -> bool:
+    """True if *a* and *b* are structurally equal trees."""
+    stack = [(a, b)]
+    pop = stack.pop
+    while stack:
+        x, y = pop()
+        if x is y:
+            continue
+        cls = x.__class__
+        if cls is not y.__class__:
+            return False
+        kind = _CLASS_KINDS.get(cls)
+        if kind is None:
+            kind = _class_kind(cls)
+        if kind != _TREE:
+            if kind == _TYPE or x != y:
+                return False  # (distinct Type nodes are distinct types)
+            continue
+        hx = x._hash
+        if hx is not None:
+            hy = y._hash
+            if hy is not None and hx != hy:
+                return False
+        pairs = []
+        for name, kind in _layout(cls):
+            vx = getattr(x, name)
+            vy = getattr(y, name)
+            if kind is None:
+                if vx != vy:
+                    return False
+            elif kind is NODE:
+                pairs.append((vx, vy))
+            else:
+                if len(vx) != len(vy):
+                    return False
+                pairs.extend(zip(vx, vy))
+        pairs.reverse()  # first child compared first
+        stack.extend(pairs)
+    return True
+
+
+class Change(NamedTuple):
+    """One difference: the value at *path* is *old* in a and *new* in b.
+
+    path is the chain of field names and list indexes from the root, e.g.
+    ("decls", 2, "body", "statements", 0); list indexes are positions in b,
+    except for a deleted item (new is None), whose index is its position
+    in a. An inserted item has old None.
+    """
+
+    path: Tuple[Any, ...]
+    old: Any
+    new: Any
+
+
+def _same(x, y) -> bool:
+    """Equal subtrees: different cached structural hashes settle it quickly."""
+    if x is y:
+        return True
+    cls = x.__class__
+    if cls is not y.__class__:
+        return False
+    if _class_kind(cls) == _OTHER:
+        return x == y
+    # Equal hashes may be a collision: only a mismatch is conclusive
+    return structural_hash(x) == structural_hash(y) and equal(x, y)
+
+
+def diff(a: ASTNode, b: ASTNode) -> List[Change]:
+    """The changes turning tree *a* into tree *b*, in tree order.
+
+    Nodes of different classes are reported as one change; for nodes of
+    the same class, each differing scalar field is a change and the
+    children are compared. List items are aligned on their hashes, so an
+    inserted or deleted item does not make the following ones differ.
+    """
+    changes = []
+    stack = [((), a, b)]  # (path, old, new) to compare, or a Change to report
+    while stack:
+        item = stack.pop()
+        if item.__class__ is Change:
+            changes.append(item)
+            continue
+        path, x, y = item
+        if _same(x, y):
+            continue
+        cls = x.__class__
+        if cls is not y.__class__ or _class_kind(cls) != _TREE:
+            changes.append(Change(path, x, y))
+            continue
+        pending = []
+        for name, kind in _layout(cls):
+            vx = getattr(x, name)
+            vy = getattr(y, name)
+            if kind is None:
+                if vx != vy:
+                    pending.append(Change(path + (name,), vx, vy))
+            elif kind is NODE:
+                pending.append((path + (name,), vx, vy))
+            else:
+                pending.extend(_diff_lists(path + (name,), vx, vy))
+        pending.reverse()
+        stack.extend(pending)
+    return changes
+
+
+def _key(value):
+    return hash(value) if _class_kind(value.__class__) == _OTHER else structural_hash(value)
+
+
+def _diff_lists(path, xs, ys):
+    """Stack entries for two lists: item pairs to compare, and Changes."""
+    keys_x = [_key(x) for x in xs]
+    keys_y = [_key(y) for y in ys]
+    entries = []
+    matcher = SequenceMatcher(None, keys_x, keys_y, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            # Equal keys may be a collision: the items are compared as well
+            for k in range(i2 - i1):
+                entries.append((path + (j1 + k,), xs[i1 + k], ys[j1 + k]))
+            continue
+        common = min(i2 - i1, j2 - j1) if op == "replace" else 0
+        for k in range(common):
+            entries.append((path + (j1 + k,), xs[i1 + k], ys[j1 + k]))
+        for i in range(i1 + common, i2):
+            entries.append(Change(path + (i,), xs[i], None))
+        for j in range(j1 + common, j2):
+            entries.append(Change(path + (j,), None, ys[j]))
+    return entries
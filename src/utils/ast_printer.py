@@ -0,0 +1,203 @@
+"""
+Iterative AST printer for TyC.
+
+Produces the textual form of an AST (the str() format the tests compare
+against, e.g. "BinaryOp(Identifier(a), +, IntLiteral(1))") in one pass over
+the tree. Nothing is built per subtree: each node class has an expander
+that returns the node's text as a sequence of pieces (literal text, field
+values, child nodes), and an explicit stack interleaves the children's
+pieces in place. Every piece is emitted exactly once, so printing is linear
+in the output size whatever the tree's depth, and very deep trees print
+without recursion.
+
+to_string() returns the text (ASTNode.__str__ delegates to it); write()
+streams it to a text file object in chunks.
+
+Node classes outside this module's table print through the expander of
+their nearest base class, or through their own __str__ if they define one.
+"""
+
+from src.utils.nodes import (
+    ASTNode,
+    AssignExpr,
+    BinaryOp,
+    BlockStmt,
+    BreakStmt,
+    CaseStmt,
+    ContinueStmt,
+    DefaultStmt,
+    ExprStmt,
+    FloatLiteral,
+    FloatType,
+    ForStmt,
+    FuncCall,
+    FuncDecl,
+    Identifier,
+    IfStmt,
+    IntLiteral,
+    IntType,
+    MemberAccess,
+    MemberDecl,
+    Param,
+    PostfixOp,
+    PrefixOp,
+    Program,
+    ReturnStmt,
+    StringLiteral,
+    StringType,
+    StructDecl,
+    StructLiteral,
+    StructType,
+    SwitchStmt,
+    VarDecl,
+    VoidType,
+    WhileStmt,
+)
+
+
+# Pieces buffered by write() before they are written out
+CHUNK_PIECES = 1 << 12
+
+
+def _join(open_text, items, close_text):
+    """Pieces of `open_text + ", ".join(items) + close_text`."""
+    pieces = [open_text]
+    if items:
+        for item in items:
+            pieces.append(item)
+            pieces.append(", ")
+        pieces[-1] = close_text
+    else:
+        pieces.append(close_text)
+    return pieces
+
+
+def _func_decl(n):
+    pieces = ["FuncDecl(", n.return_type if n.return_type else "auto", f", {n.name}, "]
+    pieces += _join("[", n.params, "], ")
+    pieces += (n.body, ")")
+    return pieces
+
+
+def _var_decl(n):
+    return (
+        "VarDecl(",
+        "auto" if n.var_type is None else n.var_type,
+        f", {n.name}",
+        " = " if n.init_value else "",
+        n.init_value if n.init_value else "",
+        ")",
+    )
+
+
+def _switch_stmt(n):
+    pieces = ["SwitchStmt(switch ", n.expr]
+    pieces += _join(" cases [", n.cases, "]")
+    if n.default_case:
+        pieces += (", default ", n.default_case)
+    pieces.append(")")
+    return pieces
+
+
+# Node class -> expander: returns the node's text, or its pieces in order.
+# A piece is text, a node (printed in place) or any other value (printed
+# with str()).
+_EXPANDERS = {
+    Program: lambda n: _join("Program([", n.decls, "])"),
+    StructDecl: lambda n: _join(f"StructDecl({n.name}, [", n.members, "])"),
+    MemberDecl: lambda n: ("MemberDecl(", n.member_type, f", {n.name})"),
+    FuncDecl: _func_decl,
+    Param: lambda n: ("Param(", n.param_type, f", {n.name})"),
+    IntType: lambda n: "IntType()",
+    FloatType: lambda n: "FloatType()",
+    StringType: lambda n: "StringType()",
+    VoidType: lambda n: "VoidType()",
+    StructType: lambda n: f"StructType({n.struct_name})",
+    BlockStmt: lambda n: _join("BlockStmt([", n.statements, "])"),
+    VarDecl: _var_decl,
+    IfStmt: lambda n: (
+        "IfStmt(if ", n.condition, " then ", n.then_stmt,
+        ", else " if n.else_stmt else "", n.else_stmt if n.else_stmt else "", ")",
+    ),  # fmt: skip
+    WhileStmt: lambda n: ("WhileStmt(while ", n.condition, " do ", n.body, ")"),
+    ForStmt: lambda n: (
+        "ForStmt(for ", n.init if n.init else "None",
+        "; ", n.condition if n.condition else "None",
+        "; ", n.update if n.update else "None",
+        " do ", n.body, ")",
+    ),  # fmt: skip
+    SwitchStmt: _switch_stmt,
+    CaseStmt: lambda n: ["CaseStmt(case ", n.expr] + _join(": [", n.statements, "])"),
+    DefaultStmt: lambda n: _join("DefaultStmt(default: [", n.statements, "])"),
+    BreakStmt: lambda n: "BreakStmt()",
+    ContinueStmt: lambda n: "ContinueStmt()",
+    ReturnStmt: lambda n: ("ReturnStmt(return ", n.expr, ")") if n.expr else "ReturnStmt(return)",
+    ExprStmt: lambda n: ("ExprStmt(", n.expr, ")"),
+    BinaryOp: lambda n: ("BinaryOp(", n.left, f", {n.operator}, ", n.right, ")"),
+    PrefixOp: lambda n: (f"PrefixOp({n.operator}", n.operand, ")"),
+    PostfixOp: lambda n: ("PostfixOp(", n.operand, f"{n.operator})"),
+    AssignExpr: lambda n: ("AssignExpr(", n.lhs, " = ", n.rhs, ")"),
+    MemberAccess: lambda n: ("MemberAccess(", n.obj, f".{n.member})"),
+    FuncCall: lambda n: _join(f"FuncCall({n.name}, [", n.args, "])"),
+    Identifier: lambda n: f"Identifier({n.name})",
+    StructLiteral: lambda n: _join("StructLiteral({", n.values, "})"),
+    IntLiteral: lambda n: f"IntLiteral({n.value})",
+    FloatLiteral: lambda n: f"FloatLiteral({n.value})",
+    StringLiteral: lambda n: f"StringLiteral({n.value!r})",
+}
+
+
+def _expander(cls):
+    """Expander for a class missing from _EXPANDERS (cached there)."""
+    if not issubclass(cls, ASTNode):
+        expander = str
+    elif cls.__str__ is not ASTNode.__str__:
+        expander = cls.__str__  # the class prints itself
+    else:
+        expander = next(
+            (_EXPANDERS[base] for base in cls.__mro__ if base in _EXPANDERS),
+            lambda n: f"{n.__class__.__name__}()",
+        )
+    _EXPANDERS[cls] = expander
+    return expander
+
+
+def _print(root, pieces, flush=None):
+    """Append the text of *root* to *pieces*, calling flush() when it fills up."""
+    emit = pieces.append
+    expanders = _EXPANDERS
+    stack = [root]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        item = pop()
+        if item.__class__ is str:
+            emit(item)
+            continue
+        expand = expanders.get(item.__class__) or _expander(item.__class__)
+        result = expand(item)
+        if result.__class__ is str:
+            emit(result)
+        else:
+            extend(reversed(result))
+        if flush is not None and len(pieces) >= CHUNK_PIECES:
+            flush()
+
+
+def to_string(node) -> str:
+    """The text of *node*, identical to the str() format of nodes.py."""
+    pieces = []
+    _print(node, pieces)
+    return "".join(pieces)
+
+
+def write(node, stream):
+    """Write the text of *node* to the text file object *stream*."""
+    pieces = []
+
+    def flush():
+        stream.write("".join(pieces))
+        pieces.clear()
+
+    _print(node, pieces, flush)
+    flush()
@@ -0,0 +1,337 @@
+"""
+Flat (struct-of-arrays) AST store for TyC.
+
+A FlatAST holds a whole AST in parallel `array` columns indexed by integer
+node id instead of one Python object per node:
+
+    kinds         node kind code (node_schema.NODE_KINDS index)
+    starts/ends   source span (offsets, end exclusive), -1 where the node
+                  has none; lines and columns come from `source`, the
+                  spans.LineIndex of the text (Program.source)
+    payloads      the node's scalar field: string table index for names and
+                  string literals, operator code, int literal value, or the
+                  IEEE-754 bits of a float literal
+    parents       parent node id, -1 for the root
+    child_starts/ the node's child slots, a range of `children`: one slot per
+    child_counts  node field (-1 if the field is None) and one per list item,
+                  in constructor-argument order
+    children      node ids
+
+Every node class has at most one scalar field and at most one list field,
+so a node's slots decode unambiguously with node_schema.FIELDS. Int
+literals that do not fit in 64 bits are kept in the sparse `big_ints` dict.
+The root is node 0 and children always have larger ids than their parent.
+
+FlatAST.from_tree() and to_tree() convert losslessly from and to the
+nodes.py object tree (types come back as the shared Type instances). walk()
+and FlatVisitor traverse the flat form; FlatVisitor dispatches to the same
+visit_<node> method names as utils.visitor.ASTVisitor, with node ids in
+place of node objects.
+"""
+
+import struct
+from array import array
+
+from src.utils.node_schema import (
+    FIELDS,
+    INT,
+    KIND_CODES,
+    LIST,
+    NAME,
+    NODE,
+    NODE_KINDS,
+    OP,
+    OPERATOR_CODES,
+    OPERATORS,
+    VISIT_METHODS,
+    is_type,
+)
+from src.utils.nodes import Program
+from src.utils.spans import pack_span, span_end, span_start
+
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+# Per kind code: (scalar field name, field kind) or None
+_SCALAR = []
+# Per kind code: the NODE/LIST fields, and how many NODE fields there are
+_CHILD_FIELDS = []
+_NODE_FIELD_COUNT = []
+for _cls in NODE_KINDS:
+    _scalars = [f for f in FIELDS[_cls] if f[1] not in (NODE, LIST)]
+    _lists = [f for f in FIELDS[_cls] if f[1] == LIST]
+    assert len(_scalars) <= 1 and len(_lists) <= 1, _cls
+    _SCALAR.append(_scalars[0] if _scalars else None)
+    _CHILD_FIELDS.append(tuple(f for f in FIELDS[_cls] if f[1] in (NODE, LIST)))
+    _NODE_FIELD_COUNT.append(sum(1 for f in FIELDS[_cls] if f[1] == NODE))
+_IS_TYPE = [is_type(cls) for cls in NODE_KINDS]
+
+
+def _float_bits(value: float) -> int:
+    return struct.unpack("<q", struct.pack("<d", value))[0]
+
+
+def _bits_float(bits: int) -> float:
+    return struct.unpack("<d", struct.pack("<q", bits))[0]
+
+
+class FlatAST:
+    """An AST stored column-wise; node ids index every column."""
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.starts = array("i")
+        self.ends = array("i")
+        self.payloads = array("q")
+        self.parents = array("i")
+        self.child_starts = array("i")
+        self.child_counts = array("i")
+        self.children = array("i")
+        self.strings = []  # string table
+        self.big_ints = {}  # node id -> int literal outside the int64 range
+        self.source = None  # spans.LineIndex of the nodes' source
+        self._string_ids = {}
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_tree(cls, root, source=None) -> "FlatAST":
+        """Flatten the object tree rooted at *root* (root becomes node 0).
+
+        *source* is the LineIndex of the text; a Program root has its own.
+        """
+        flat = cls()
+        if isinstance(root, Program) and root.source is not None:
+            source = root.source
+        flat.source = source
+        children = flat.children
+        stack = [(root, flat._append(root, -1))]
+        while stack:
+            node, i = stack.pop()
+            start = len(children)
+            pending = []
+            for name, field_kind in _CHILD_FIELDS[flat.kinds[i]]:
+                value = getattr(node, name)
+                if field_kind == NODE:
+                    if value is None:
+                        children.append(-1)
+                        continue
+                    value = (value,)
+                for child in value:
+                    child_id = flat._append(child, i)
+                    children.append(child_id)
+                    pending.append((child, child_id))
+            flat.child_starts[i] = start
+            flat.child_counts[i] = len(children) - start
+            pending.reverse()
+            stack.extend(pending)
+        return flat
+
+    def _append(self, node, parent: int) -> int:
+        try:
+            kind = KIND_CODES[type(node)]
+        except KeyError:
+            raise TypeError(f"Not an AST node: {node!r}") from None
+        i = len(self.kinds)
+        self.kinds.append(kind)
+        span = node.span
+        if span is None:
+            self.starts.append(-1)
+            self.ends.append(-1)
+        else:
+            self.starts.append(span_start(span))
+            self.ends.append(span_end(span))
+        payload = 0
+        scalar = _SCALAR[kind]
+        if scalar is not None:
+            name, field_kind = scalar
+            value = getattr(node, name)
+            if field_kind == NAME:
+                payload = self._string(value)
+            elif field_kind == OP:
+                payload = OPERATOR_CODES[value]
+            elif field_kind == INT:
+                if _INT64_MIN <= value <= _INT64_MAX:
+                    payload = value
+                else:
+                    self.big_ints[i] = value
+            else:
+                payload = _float_bits(value)
+        self.payloads.append(payload)
+        self.parents.append(parent)
+        self.child_starts.append(0)
+        self.child_counts.append(0)
+        return i
+
+    def _string(self, value) -> int:
+        if value is None:
+            return -1
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def to_tree(self, root: int = 0):
+        """Rebuild the object tree of the subtree rooted at node *root*."""
+        ids = range(len(self.kinds) - 1, root - 1, -1) if root == 0 else sorted(
+            self.walk(root), reverse=True
+        )
+        built = {}
+        kinds, children = self.kinds, self.children
+        for i in ids:  # children have larger ids, so they are built first
+            kind = kinds[i]
+            start = self.child_starts[i]
+            count = self.child_counts[i]
+            slot = start
+            args = []
+            for name, field_kind in FIELDS[NODE_KINDS[kind]]:
+                if field_kind == NODE:
+                    child = children[slot]
+                    slot += 1
+                    args.append(None if child < 0 else built.pop(child))
+                elif field_kind == LIST:
+                    n_items = count - _NODE_FIELD_COUNT[kind]
+                    args.append([built.pop(c) for c in children[slot : slot + n_items]])
+                    slot += n_items
+                else:
+                    args.append(self._scalar(i, field_kind))
+            node = NODE_KINDS[kind](*args)
+            if not _IS_TYPE[kind] and self.starts[i] >= 0:
+                node.span = pack_span(self.starts[i], self.ends[i])
+            built[i] = node
+        node = built[root]
+        if isinstance(node, Program):
+            node.source = self.source
+        return node
+
+    # ------------------------------------------------------------------
+    # Node access
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def node_class(self, i: int):
+        """The nodes.py class of node *i*."""
+        return NODE_KINDS[self.kinds[i]]
+
+    def span(self, i: int):
+        start = self.starts[i]
+        return None if start < 0 else pack_span(start, self.ends[i])
+
+    def position(self, i: int):
+        """(line, column) of node *i*, or None."""
+        start = self.starts[i]
+        if start < 0 or self.source is None:
+            return None
+        return self.source.position(start)
+
+    def line(self, i: int):
+        position = self.position(i)
+        return None if position is None else position[0]
+
+    def column(self, i: int):
+        position = self.position(i)
+        return None if position is None else position[1]
+
+    def parent(self, i: int):
+        parent = self.parents[i]
+        return None if parent < 0 else parent
+
+    def child_ids(self, i: int):
+        """Ids of the children of node *i* in field order (absent ones skipped)."""
+        start = self.child_starts[i]
+        return [c for c in self.children[start : start + self.child_counts[i]] if c >= 0]
+
+    def value(self, i: int):
+        """The scalar field of node *i* (name, operator or literal), or None."""
+        scalar = _SCALAR[self.kinds[i]]
+        return None if scalar is None else self._scalar(i, scalar[1])
+
+    def _scalar(self, i: int, field_kind: str):
+        payload = self.payloads[i]
+        if field_kind == NAME:
+            return None if payload < 0 else self.strings[payload]
+        if field_kind == OP:
+            return OPERATORS[payload]
+        if field_kind == INT:
+            return self.big_ints.get(i, payload)
+        return _bits_float(payload)
+
+    def fields(self, i: int) -> dict:
+        """Fields of node *i* by name: child ids (None if absent), id lists, scalars."""
+        kind = self.kinds[i]
+        start = self.child_starts[i]
+        slot = start
+        result = {}
+        for name, field_kind in FIELDS[NODE_KINDS[kind]]:
+            if field_kind == NODE:
+                child = self.children[slot]
+                result[name] = None if child < 0 else child
+                slot += 1
+            elif field_kind == LIST:
+                n_items = self.child_counts[i] - _NODE_FIELD_COUNT[kind]
+                result[name] = self.children[slot : slot + n_items].tolist()
+                slot += n_items
+            else:
+                result[name] = self._scalar(i, field_kind)
+        return result
+
+    def field(self, i: int, name: str):
+        return self.fields(i)[name]
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+
+    def walk(self, root: int = 0):
+        """Node ids of the subtree at *root* in pre-order (iterative)."""
+        children, starts, counts = self.children, self.child_starts, self.child_counts
+        stack = [root]
+        while stack:
+            i = stack.pop()
+            yield i
+            start = starts[i]
+            for c in reversed(children[start : start + counts[i]]):
+                if c >= 0:
+                    stack.append(c)
+
+    def ids_of(self, *classes):
+        """Ids of all nodes that are instances of exactly one of *classes*."""
+        wanted = {KIND_CODES[cls] for cls in classes}
+        return [i for i, kind in enumerate(self.kinds) if kind in wanted]
+
+    def nbytes(self) -> int:
+        """Bytes held by the columns (string table and big ints excluded)."""
+        columns = (
+            self.kinds, self.starts, self.ends, self.payloads, self.parents,
+            self.child_starts, self.child_counts, self.children,
+        )  # fmt: skip
+        return sum(c.itemsize * len(c) for c in columns)
+
+
+class FlatVisitor:
+    """Visitor over a FlatAST.
+
+    visit(i) calls the visit_<node> method for the kind of node *i* (the
+    names of utils.visitor.ASTVisitor, e.g. visit_binary_op(i, o)); kinds
+    without a method fall back to generic_visit, which visits the children.
+    """
+
+    def __init__(self, ast: FlatAST):
+        self.ast = ast
+        self._dispatch = [
+            getattr(self, VISIT_METHODS[cls], self.generic_visit) for cls in NODE_KINDS
+        ]
+
+    def visit(self, i: int, o=None):
+        return self._dispatch[self.ast.kinds[i]](i, o)
+
+    def generic_visit(self, i: int, o=None):
+        for child in self.ast.child_ids(i):
+            self.visit(child, o)
+        return None
@@ -0,0 +1,153 @@
+"""
+Field layout of the AST node classes in nodes.py.
+
+Representations other than the object tree (the flat AST store, the binary
+encoding) describe a node by its kind code and its fields. This module is
+the single table they share: NODE_KINDS fixes a code for every concrete
+node class, FIELDS lists each class's fields in constructor-argument order
+with the kind of value they hold, and OPERATORS fixes a code for every
+operator. Appending to these tuples keeps existing codes valid; reordering
+them does not.
+"""
+
+import re
+
+from src.utils.nodes import (
+    AssignExpr,
+    BinaryOp,
+    BlockStmt,
+    BreakStmt,
+    CaseStmt,
+    ContinueStmt,
+    DefaultStmt,
+    ExprStmt,
+    FloatLiteral,
+    FloatType,
+    ForStmt,
+    FuncCall,
+    FuncDecl,
+    Identifier,
+    IfStmt,
+    IntLiteral,
+    IntType,
+    MemberAccess,
+    MemberDecl,
+    Param,
+    PostfixOp,
+    PrefixOp,
+    Program,
+    ReturnStmt,
+    StringLiteral,
+    StringType,
+    StructDecl,
+    StructLiteral,
+    StructType,
+    SwitchStmt,
+    Type,
+    VarDecl,
+    VoidType,
+    WhileStmt,
+)
+
+
+# Field kinds
+NODE = "node"  # a child node, or None
+LIST = "list"  # a list of child nodes
+NAME = "name"  # a string (name, or string literal text), or None
+OP = "op"  # an operator, one of OPERATORS
+INT = "int"  # an int literal value
+FLOAT = "float"  # a float literal value
+
+# Kind code of a node class = its index in NODE_KINDS
+NODE_KINDS = (
+    Program,
+    StructDecl,
+    MemberDecl,
+    FuncDecl,
+    Param,
+    IntType,
+    FloatType,
+    StringType,
+    VoidType,
+    StructType,
+    BlockStmt,
+    VarDecl,
+    IfStmt,
+    WhileStmt,
+    ForStmt,
+    SwitchStmt,
+    CaseStmt,
+    DefaultStmt,
+    BreakStmt,
+    ContinueStmt,
+    ReturnStmt,
+    ExprStmt,
+    BinaryOp,
+    PrefixOp,
+    PostfixOp,
+    AssignExpr,
+    MemberAccess,
+    FuncCall,
+    Identifier,
+    StructLiteral,
+    IntLiteral,
+    FloatLiteral,
+    StringLiteral,
+)
+
+KIND_CODES = {cls: code for code, cls in enumerate(NODE_KINDS)}
+
+FIELDS = {
+    Program: (("decls", LIST),),
+    StructDecl: (("name", NAME), ("members", LIST)),
+    MemberDecl: (("member_type", NODE), ("name", NAME)),
+    FuncDecl: (("return_type", NODE), ("name", NAME), ("params", LIST), ("body", NODE)),
+    Param: (("param_type", NODE), ("name", NAME)),
+    IntType: (),
+    FloatType: (),
+    StringType: (),
+    VoidType: (),
+    StructType: (("struct_name", NAME),),
+    BlockStmt: (("statements", LIST),),
+    VarDecl: (("var_type", NODE), ("name", NAME), ("init_value", NODE)),
+    IfStmt: (("condition", NODE), ("then_stmt", NODE), ("else_stmt", NODE)),
+    WhileStmt: (("condition", NODE), ("body", NODE)),
+    ForStmt: (("init", NODE), ("condition", NODE), ("update", NODE), ("body", NODE)),
+    SwitchStmt: (("expr", NODE), ("cases", LIST), ("default_case", NODE)),
+    CaseStmt: (("expr", NODE), ("statements", LIST)),
+    DefaultStmt: (("statements", LIST),),
+    BreakStmt: (),
+    ContinueStmt: (),
+    ReturnStmt: (("expr", NODE),),
+    ExprStmt: (("expr", NODE),),
+    BinaryOp: (("left", NODE), ("operator", OP), ("right", NODE)),
+    PrefixOp: (("operator", OP), ("operand", NODE)),
+    PostfixOp: (("operator", OP), ("operand", NODE)),
+    AssignExpr: (("lhs", NODE), ("rhs", NODE)),
+    MemberAccess: (("obj", NODE), ("member", NAME)),
+    FuncCall: (("name", NAME), ("args", LIST)),
+    Identifier: (("name", NAME),),
+    StructLiteral: (("values", LIST),),
+    IntLiteral: (("value", INT),),
+    FloatLiteral: (("value", FLOAT),),
+    StringLiteral: (("value", NAME),),
+}
+
+# Operator code = index in OPERATORS
+OPERATORS = (
+    "+", "-", "*", "/", "%",
+    "<", "<=", ">", ">=", "==", "!=",
+    "&&", "||", "!", "++", "--",
+)  # fmt: skip
+
+OPERATOR_CODES = {op: code for code, op in enumerate(OPERATORS)}
+
+# ASTVisitor method name for each node class, e.g. BinaryOp -> visit_binary_op
+VISIT_METHODS = {
+    cls: "visit_" + re.sub(r"(?<!^)(?=[A-Z])", "_", cls.__name__).lower() for cls in NODE_KINDS
+}
+
+
+def is_type(cls) -> bool:
+    """Type classes are hash-consed and have no source position."""
+    return issubclass(cls, Type)
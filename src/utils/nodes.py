@@ -2,10 +2,32 @@
 AST Node classes for TyC programming language.
 This module defines all the AST node types used to represent
 the abstract syntax tree for TyC programs.
+
+Every node class declares __slots__ (the attributes its constructor sets),
+so nodes carry no per-instance __dict__; large programs produce millions
+of them. Type nodes are additionally hash-consed (see Type).
+
+Source positions are kept as a packed span (see spans.py). The LineIndex
+of the source is held once, by the Program root; position() computes a
+node's line and column from it when asked.
+
+Nodes compare and hash structurally, ignoring positions (see ast_diff.py);
+the hash is cached in the node.
+
+FuncDecl.body may hold a LazyNode placeholder instead of the BlockStmt
+once src.frontend.lazy is imported, which wraps the slot in a LazyField;
+the block is built when the attribute is first read and replaces the
+placeholder. Without that module every slot stays a plain member.
+
+str() of a node is produced by the iterative printer in ast_printer.py,
+which holds the textual format of every node class.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Union, TYPE_CHECKING
+from typing import Any, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from .spans import SPAN_SHIFT, pack_span, span_end
 
 if TYPE_CHECKING:
     from .visitor import ASTVisitor
@@ -14,9 +36,36 @@ if TYPE_CHECKING:
 class ASTNode(ABC):
     """Base class for all AST nodes."""
 
+    __slots__ = ("span", "_hash")
+
     def __init__(self):
-        self.line = None
-        self.column = None
+        self.span = None  # start << SPAN_SHIFT | end, None if unknown
+        self._hash = None  # structural hash, computed on demand
+
+    def set_span(self, start: int, end: int):
+        """Set the source range start..end (offsets, end exclusive)."""
+        self.span = pack_span(start, end)
+        return self
+
+    @property
+    def start_offset(self) -> Optional[int]:
+        span = self.span
+        return None if span is None else span >> SPAN_SHIFT
+
+    @property
+    def end_offset(self) -> Optional[int]:
+        span = self.span
+        return None if span is None else span_end(span)
+
+    def position(self, source) -> Optional[Tuple[int, int]]:
+        """(line, column) of the node's first character, or None.
+
+        *source* is the spans.LineIndex of the text, Program.source of the
+        tree's root. Lines are 1-based and columns 0-based.
+        """
+        if self.span is None or source is None:
+            return None
+        return source.position(self.span >> SPAN_SHIFT)
 
     @abstractmethod
     def accept(self, visitor: "ASTVisitor", o: Any = None):
@@ -24,8 +73,83 @@ class ASTNode(ABC):
         pass
 
     def __str__(self):
-        """Default string representation."""
-        return f"{self.__class__.__name__}()"
+        """Textual form of the subtree, e.g. "Identifier(x)" (see ast_printer)."""
+        from .ast_printer import to_string
+
+        return to_string(self)
+
+    def __eq__(self, other):
+        """Structural equality of the subtrees (see ast_diff.equal)."""
+        if not isinstance(other, ASTNode):
+            return NotImplemented
+        from .ast_diff import equal
+
+        return equal(self, other)
+
+    def __hash__(self):
+        h = self._hash
+        if h is None:
+            from .ast_diff import structural_hash
+
+            h = structural_hash(self)
+        return h
+
+    # Pickling and copying leave the cached hash out: str hashes differ
+    # from one process to the next
+    def __getstate__(self):
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if name != "_hash"
+        }
+
+    def __setstate__(self, state):
+        self._hash = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class LazyNode(ABC):
+    """Placeholder for a subtree that is built on first use (see LazyField)."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def build(self) -> ASTNode:
+        """Build and return the subtree."""
+
+
+class LazyField:
+    """A slot whose value may be a LazyNode, built when first read.
+
+    Wraps the slot's member descriptor: reading the attribute returns the
+    stored node, or builds the LazyNode stored in its place, stores the
+    result and returns it. Every reader (visitors, printers, ast_diff,
+    serialization) therefore sees a plain node. Errors raised by build()
+    propagate from the read and leave the placeholder in place.
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, node, cls=None):
+        if node is None:
+            return self
+        value = self.slot.__get__(node, cls)
+        if isinstance(value, LazyNode):
+            value = value.build()
+            self.slot.__set__(node, value)
+        return value
+
+    def __set__(self, node, value):
+        self.slot.__set__(node, value)
+
+    def is_built(self, node) -> bool:
+        """Whether the value of *node* is there without building anything."""
+        return not isinstance(self.slot.__get__(node), LazyNode)
 
 
 # ============================================================================
@@ -34,28 +158,34 @@ class ASTNode(ABC):
 
 
 class Program(ASTNode):
-    """Root node representing the entire TyC program."""
+    """Root node representing the entire TyC program.
 
-    def __init__(self, decls: List["Decl"]):
+    source is the spans.LineIndex of the program text, shared by the spans
+    of every node in the tree (None if unknown); it is not compared.
+    """
+
+    __slots__ = ("decls", "source")
+
+    def __init__(self, decls: List["Decl"], source=None):
         super().__init__()
         self.decls = decls
+        self.source = source
 
     def accept(self, visitor, o=None):
         return visitor.visit_program(self, o)
 
-    def __str__(self):
-        decls_str = ", ".join(str(d) for d in self.decls) if self.decls else ""
-        return f"Program([{decls_str}])"
-
 
 class Decl(ASTNode):
     """Base class for declarations (struct or function)."""
-    pass
+
+    __slots__ = ()
 
 
 class StructDecl(Decl):
     """Struct declaration node."""
 
+    __slots__ = ("name", "members")
+
     def __init__(self, name: str, members: List["MemberDecl"]):
         super().__init__()
         self.name = name
@@ -64,14 +194,12 @@ class StructDecl(Decl):
     def accept(self, visitor, o=None):
         return visitor.visit_struct_decl(self, o)
 
-    def __str__(self):
-        members_str = ", ".join(str(m) for m in self.members) if self.members else ""
-        return f"StructDecl({self.name}, [{members_str}])"
-
 
 class MemberDecl(ASTNode):
     """Struct member declaration node."""
 
+    __slots__ = ("member_type", "name")
+
     def __init__(self, member_type: "Type", name: str):
         super().__init__()
         self.member_type = member_type
@@ -80,19 +208,18 @@ class MemberDecl(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_member_decl(self, o)
 
-    def __str__(self):
-        return f"MemberDecl({self.member_type}, {self.name})"
-
 
 class FuncDecl(Decl):
     """Function declaration node."""
 
+    __slots__ = ("return_type", "name", "params", "body")
+
     def __init__(
         self,
         return_type: Optional["Type"],
         name: str,
         params: List["Param"],
-        body: "BlockStmt",
+        body: Union["BlockStmt", LazyNode],
     ):
         super().__init__()
         self.return_type = return_type
@@ -103,15 +230,12 @@ class FuncDecl(Decl):
     def accept(self, visitor, o=None):
         return visitor.visit_func_decl(self, o)
 
-    def __str__(self):
-        return_type_str = str(self.return_type) if self.return_type else "auto"
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        return f"FuncDecl({return_type_str}, {self.name}, [{params_str}], {self.body})"
-
 
 class Param(ASTNode):
     """Function parameter node."""
 
+    __slots__ = ("param_type", "name")
+
     def __init__(self, param_type: "Type", name: str):
         super().__init__()
         self.param_type = param_type
@@ -120,9 +244,6 @@ class Param(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_param(self, o)
 
-    def __str__(self):
-        return f"Param({self.param_type}, {self.name})"
-
 
 # ============================================================================
 # Type System
@@ -130,75 +251,104 @@ class Param(ASTNode):
 
 
 class Type(ASTNode):
-    """Base class for type annotations."""
-    pass
+    """Base class for type annotations.
+
+    Types are hash-consed: calling a type class returns one shared instance
+    per distinct type (IntType() is IntType(), StructType("P") is
+    StructType("P")), so types compare equal exactly when they are the
+    same object. The shared instances are immutable and, as they stand for
+    every occurrence of the type, carry no source position.
+    """
+
+    __slots__ = ()
+
+    _interned = {}  # (class, *fields) -> the canonical instance
+
+    def __new__(cls):
+        return cls._canonical()
+
+    def __init__(self):
+        pass  # built by __new__
+
+    @classmethod
+    def _canonical(cls, *fields):
+        """The shared instance of *cls* whose slots hold *fields*."""
+        key = (cls, *fields)
+        node = Type._interned.get(key)
+        if node is None:
+            node = object.__new__(cls)
+            object.__setattr__(node, "span", None)
+            object.__setattr__(node, "_hash", object.__hash__(node))
+            for name, value in zip(cls.__slots__, fields):
+                object.__setattr__(node, name, value)
+            node = Type._interned.setdefault(key, node)
+        return node
+
+    # One shared instance per type: equality is identity
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is shared and immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is shared and immutable")
+
+    def __reduce__(self):
+        # Unpickling and copying go back through the canonicalizing __new__
+        return type(self), tuple(getattr(self, name) for name in type(self).__slots__)
 
 
 class IntType(Type):
     """Integer type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_type(self, o)
 
-    def __str__(self):
-        return "IntType()"
-
 
 class FloatType(Type):
     """Float type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_type(self, o)
 
-    def __str__(self):
-        return "FloatType()"
-
 
 class StringType(Type):
     """String type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_type(self, o)
 
-    def __str__(self):
-        return "StringType()"
-
 
 class VoidType(Type):
     """Void type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_void_type(self, o)
 
-    def __str__(self):
-        return "VoidType()"
-
 
 class StructType(Type):
     """Struct type node."""
 
+    __slots__ = ("struct_name",)
+
+    def __new__(cls, struct_name: str):
+        return cls._canonical(sys.intern(struct_name))
+
     def __init__(self, struct_name: str):
-        super().__init__()
-        self.struct_name = struct_name
+        pass  # built by __new__
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_type(self, o)
 
-    def __str__(self):
-        return f"StructType({self.struct_name})"
-
 
 # ============================================================================
 # Statements
@@ -207,12 +357,15 @@ class StructType(Type):
 
 class Stmt(ASTNode):
     """Base class for all statement nodes."""
-    pass
+
+    __slots__ = ()
 
 
 class BlockStmt(Stmt):
     """Block statement containing statements."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -220,16 +373,14 @@ class BlockStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_block_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"BlockStmt([{stmts_str}])"
-
 
 class VarDecl(Stmt):
     """Variable declaration statement.
     If var_type is None, it means 'auto' (type inference).
     """
 
+    __slots__ = ("var_type", "name", "init_value")
+
     def __init__(
         self,
         var_type: Optional["Type"],
@@ -244,15 +395,12 @@ class VarDecl(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_var_decl(self, o)
 
-    def __str__(self):
-        type_str = "auto" if self.var_type is None else str(self.var_type)
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"VarDecl({type_str}, {self.name}{init_str})"
-
 
 class IfStmt(Stmt):
     """If statement."""
 
+    __slots__ = ("condition", "then_stmt", "else_stmt")
+
     def __init__(
         self, condition: "Expr", then_stmt: Stmt, else_stmt: Optional[Stmt] = None
     ):
@@ -264,14 +412,12 @@ class IfStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_if_stmt(self, o)
 
-    def __str__(self):
-        else_str = f", else {self.else_stmt}" if self.else_stmt else ""
-        return f"IfStmt(if {self.condition} then {self.then_stmt}{else_str})"
-
 
 class WhileStmt(Stmt):
     """While statement."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: "Expr", body: Stmt):
         super().__init__()
         self.condition = condition
@@ -280,13 +426,12 @@ class WhileStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_while_stmt(self, o)
 
-    def __str__(self):
-        return f"WhileStmt(while {self.condition} do {self.body})"
-
 
 class ForStmt(Stmt):
     """For statement."""
 
+    __slots__ = ("init", "condition", "update", "body")
+
     def __init__(
         self,
         init: Optional[Union["VarDecl", "ExprStmt"]],
@@ -303,16 +448,12 @@ class ForStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_for_stmt(self, o)
 
-    def __str__(self):
-        init_str = str(self.init) if self.init else "None"
-        cond_str = str(self.condition) if self.condition else "None"
-        update_str = str(self.update) if self.update else "None"
-        return f"ForStmt(for {init_str}; {cond_str}; {update_str} do {self.body})"
-
 
 class SwitchStmt(Stmt):
     """Switch statement."""
 
+    __slots__ = ("expr", "cases", "default_case")
+
     def __init__(
         self,
         expr: "Expr",
@@ -327,15 +468,12 @@ class SwitchStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_switch_stmt(self, o)
 
-    def __str__(self):
-        cases_str = ", ".join(str(c) for c in self.cases) if self.cases else ""
-        default_str = f", default {self.default_case}" if self.default_case else ""
-        return f"SwitchStmt(switch {self.expr} cases [{cases_str}]{default_str})"
-
 
 class CaseStmt(ASTNode):
     """Case statement in switch."""
 
+    __slots__ = ("expr", "statements")
+
     def __init__(self, expr: "Expr", statements: List[Stmt]):
         super().__init__()
         self.expr = expr
@@ -344,14 +482,12 @@ class CaseStmt(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_case_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"CaseStmt(case {self.expr}: [{stmts_str}])"
-
 
 class DefaultStmt(ASTNode):
     """Default statement in switch."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -359,40 +495,36 @@ class DefaultStmt(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_default_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"DefaultStmt(default: [{stmts_str}])"
-
 
 class BreakStmt(Stmt):
     """Break statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_break_stmt(self, o)
 
-    def __str__(self):
-        return "BreakStmt()"
-
 
 class ContinueStmt(Stmt):
     """Continue statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_continue_stmt(self, o)
 
-    def __str__(self):
-        return "ContinueStmt()"
-
 
 class ReturnStmt(Stmt):
     """Return statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Optional["Expr"] = None):
         super().__init__()
         self.expr = expr
@@ -400,14 +532,12 @@ class ReturnStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_return_stmt(self, o)
 
-    def __str__(self):
-        expr_str = f" {self.expr}" if self.expr else ""
-        return f"ReturnStmt(return{expr_str})"
-
 
 class ExprStmt(Stmt):
     """Expression statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: "Expr"):
         super().__init__()
         self.expr = expr
@@ -415,9 +545,6 @@ class ExprStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_expr_stmt(self, o)
 
-    def __str__(self):
-        return f"ExprStmt({self.expr})"
-
 
 # ============================================================================
 # Expressions
@@ -426,12 +553,15 @@ class ExprStmt(Stmt):
 
 class Expr(ASTNode):
     """Base class for all expression nodes."""
-    pass
+
+    __slots__ = ()
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: str, right: Expr):
         super().__init__()
         self.left = left
@@ -441,13 +571,12 @@ class BinaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_binary_op(self, o)
 
-    def __str__(self):
-        return f"BinaryOp({self.left}, {self.operator}, {self.right})"
-
 
 class PrefixOp(Expr):
     """Prefix unary operation expression (++x, --x, +x, -x, !x)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--', '+', '-', '!'
@@ -456,13 +585,12 @@ class PrefixOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_prefix_op(self, o)
 
-    def __str__(self):
-        return f"PrefixOp({self.operator}{self.operand})"
-
 
 class PostfixOp(Expr):
     """Postfix unary operation expression (x++, x--)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--'
@@ -471,15 +599,14 @@ class PostfixOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_op(self, o)
 
-    def __str__(self):
-        return f"PostfixOp({self.operand}{self.operator})"
-
 
 class AssignExpr(Expr):
     """Assignment expression (can be used in expressions like (a = 5) + 7).
     lhs can be Identifier or MemberAccess.
     """
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs: "Expr", rhs: "Expr"):
         super().__init__()
         self.lhs = lhs  # Identifier or MemberAccess
@@ -488,9 +615,6 @@ class AssignExpr(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_assign_expr(self, o)
 
-    def __str__(self):
-        return f"AssignExpr({self.lhs} = {self.rhs})"
-
 
 class MemberAccess(Expr):
     """Member access expression (struct member access).
@@ -498,6 +622,8 @@ class MemberAccess(Expr):
     Can be nested: MemberAccess(MemberAccess(obj, "member1"), "member2")
     """
 
+    __slots__ = ("obj", "member")
+
     def __init__(self, obj: Expr, member: str):
         super().__init__()
         self.obj = obj
@@ -506,13 +632,12 @@ class MemberAccess(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_member_access(self, o)
 
-    def __str__(self):
-        return f"MemberAccess({self.obj}.{self.member})"
-
 
 class FuncCall(Expr):
     """Function call expression."""
 
+    __slots__ = ("name", "args")
+
     def __init__(self, name: str, args: List[Expr]):
         super().__init__()
         self.name = name
@@ -521,14 +646,12 @@ class FuncCall(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_func_call(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f"FuncCall({self.name}, [{args_str}])"
-
 
 class Identifier(Expr):
     """Identifier expression."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -536,13 +659,12 @@ class Identifier(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_identifier(self, o)
 
-    def __str__(self):
-        return f"Identifier({self.name})"
-
 
 class StructLiteral(Expr):
     """Struct literal expression (initialization with {})."""
 
+    __slots__ = ("values",)
+
     def __init__(self, values: List[Expr]):
         super().__init__()
         self.values = values
@@ -550,10 +672,6 @@ class StructLiteral(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_struct_literal(self, o)
 
-    def __str__(self):
-        values_str = ", ".join(str(v) for v in self.values) if self.values else ""
-        return f"StructLiteral({{{values_str}}})"
-
 
 # ============================================================================
 # Literal Expressions
@@ -563,6 +681,8 @@ class StructLiteral(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -571,37 +691,34 @@ class Literal(Expr):
 class IntLiteral(Literal):
     """Integer literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_literal(self, o)
 
-    def __str__(self):
-        return f"IntLiteral({self.value})"
-
 
 class FloatLiteral(Literal):
     """Float literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_literal(self, o)
 
-    def __str__(self):
-        return f"FloatLiteral({self.value})"
-
 
 class StringLiteral(Literal):
     """String literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_literal(self, o)
-
-    def __str__(self):
-        return f"StringLiteral({self.value!r})"
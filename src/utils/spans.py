@@ -0,0 +1,101 @@
+"""
+Packed source spans for TyC AST nodes.
+
+A node does not store its line and column. It stores its source range as
+one int, `span = start << SPAN_SHIFT | end` (character offsets into the
+source, end exclusive). The LineIndex of the source is held once, by the
+Program root (Program.source), and passed to ASTNode.position(). It holds
+the offset at which each line starts, so a position is only computed,
+with a binary search, when one is asked for (diagnostics, tests):
+building nodes never pays for it.
+
+Lines are 1-based and columns 0-based, and only "\\n" starts a new line,
+as in ANTLR tokens.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+
+
+SPAN_SHIFT = 32
+_END_MASK = (1 << SPAN_SHIFT) - 1
+
+_NEWLINE = re.compile("\n")
+_NEWLINE_BYTES = re.compile(b"\n")
+
+
+def pack_span(start: int, end: int) -> int:
+    """The span of the offsets start..end (end exclusive)."""
+    if not 0 <= start <= end <= _END_MASK:
+        raise ValueError(f"Invalid span {start}..{end}")
+    return start << SPAN_SHIFT | end
+
+
+def span_start(span: int) -> int:
+    return span >> SPAN_SHIFT
+
+
+def span_end(span: int) -> int:
+    return span & _END_MASK
+
+
+class LineIndex:
+    """Offsets of the line starts of one source text."""
+
+    __slots__ = ("name", "starts")
+
+    def __init__(self, text, name: str = "<string>"):
+        """Index *text*, a str or an ASCII bytes-like buffer."""
+        newline = _NEWLINE if isinstance(text, str) else _NEWLINE_BYTES
+        self.name = name
+        self.starts = array("I", [0])
+        self.starts.extend(m.end() for m in newline.finditer(text))
+
+    @classmethod
+    def from_starts(cls, starts, name: str = "<string>") -> "LineIndex":
+        """Index with the given line start offsets (the first one is 0)."""
+        index = cls.__new__(cls)
+        index.name = name
+        index.starts = array("I", starts)
+        return index
+
+    @classmethod
+    def of_stream(cls, stream) -> "LineIndex":
+        """Index of the text of a character stream."""
+        name = getattr(stream, "name", "<string>")
+        buffer = getattr(stream, "buffer", None)  # streams.ByteInputStream
+        if buffer is None:
+            buffer = getattr(stream, "strdata", None)  # antlr4.InputStream
+        if buffer is None:
+            buffer = stream.getText(0, stream.size - 1)
+        return cls(buffer, name)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def position(self, offset: int):
+        """(line, column) of the character at *offset*."""
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1]
+
+    def offset(self, line: int, column: int) -> int:
+        """Offset of the character at (*line*, *column*)."""
+        return self.starts[line - 1] + column
+
+    def __repr__(self):
+        return f"LineIndex({self.name!r}, {len(self.starts)} lines)"
+
+
+def line_index_of(stream):
+    """The LineIndex of a character stream, built once and kept on it."""
+    if stream is None:
+        return None
+    index = getattr(stream, "line_index", None)
+    if index is None:
+        index = LineIndex.of_stream(stream)
+        try:
+            stream.line_index = index
+        except AttributeError:
+            pass  # a stream without room for it: indexed on every call
+    return index
@@ -2,11 +2,18 @@
 Visitor interface for AST traversal in TyC programming language.
 This module defines the abstract visitor pattern interface for traversing
 and processing AST nodes.
+
+ASTVisitor and BaseVisitor double-dispatch through node.accept() and
+recurse on the Python stack. DispatchVisitor replaces the double dispatch
+with a per-class table; ASTWalker traverses with an explicit stack and
+pre/post hooks, for trees too deep to recurse over.
 """
 
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from src.utils.node_schema import FIELDS, LIST, NODE, VISIT_METHODS
+
 if TYPE_CHECKING:
     from .nodes import *
 
@@ -297,3 +304,126 @@ class BaseVisitor(ASTVisitor):
 
     def visit_string_literal(self, node: "StringLiteral", o: Any = None):
         pass
+
+
+class DispatchVisitor(BaseVisitor):
+    """BaseVisitor whose visit() dispatches through a per-class table.
+
+    The table maps each node class straight to this visitor class's
+    visit_* function, so visit() costs one dict lookup and one call instead
+    of going through node.accept(). The inherited visit_* methods visit
+    children through self.visit(), so every node of the tree, not only the
+    root, goes through the table. It is built once per visitor class,
+    when the class is defined. Nodes of classes outside
+    node_schema.NODE_KINDS still go through accept().
+    """
+
+    _dispatch_table = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_dispatch_table()
+
+    @classmethod
+    def _build_dispatch_table(cls):
+        cls._dispatch_table = {
+            node_cls: getattr(cls, name) for node_cls, name in VISIT_METHODS.items()
+        }
+
+    @classmethod
+    def dispatch_table(cls) -> dict:
+        """Node class -> visit_* function of this visitor class."""
+        return cls._dispatch_table
+
+    def visit(self, node: "ASTNode", o: Any = None):
+        method = self._dispatch_table.get(type(node))
+        if method is None:
+            return node.accept(self, o)
+        return method(self, node, o)
+
+
+DispatchVisitor._build_dispatch_table()
+
+
+# Per node class: (field name, is list) of the fields holding child nodes
+_CHILD_FIELDS = {
+    cls: tuple((name, kind == LIST) for name, kind in fields if kind in (NODE, LIST))
+    for cls, fields in FIELDS.items()
+}
+# The same, last field first (the order children are pushed on a stack)
+_PUSH_FIELDS = {cls: fields[::-1] for cls, fields in _CHILD_FIELDS.items()}
+
+
+def children(node: "ASTNode") -> list:
+    """The child nodes of *node* in field order (absent optional ones skipped)."""
+    result = []
+    for name, is_list in _CHILD_FIELDS[node.__class__]:
+        value = getattr(node, name)
+        if is_list:
+            result.extend(value)
+        elif value is not None:
+            result.append(value)
+    return result
+
+
+class ASTWalker:
+    """Non-recursive AST traversal with pre- and post-order hooks.
+
+    walk(root) visits every node of the tree with an explicit stack, calling
+    pre(node, parent) before the node's children and post(node, parent)
+    after them (parent is None for the root). If pre() returns False, the
+    node's children are skipped; post() is still called. Children come in
+    node_schema.FIELDS order, the order BaseVisitor visits them in. Trees of
+    any depth can be walked.
+    """
+
+    def pre(self, node: "ASTNode", parent: "ASTNode"):
+        pass
+
+    def post(self, node: "ASTNode", parent: "ASTNode"):
+        pass
+
+    def walk(self, root: "ASTNode"):
+        if type(self).post is ASTWalker.post:
+            self._walk_pre(root)
+            return
+        pre = self.pre
+        post = self.post
+        push_fields = _PUSH_FIELDS
+        stack = [(root, None, False)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, parent, leaving = pop()
+            if leaving:
+                post(node, parent)
+                continue
+            push((node, parent, True))
+            if pre(node, parent) is False:
+                continue
+            for name, is_list in push_fields[node.__class__]:
+                value = getattr(node, name)
+                if is_list:
+                    for child in reversed(value):
+                        push((child, node, False))
+                elif value is not None:
+                    push((value, node, False))
+
+    def _walk_pre(self, root):
+        # walk() without post-order entries on the stack
+        pre = self.pre
+        push_fields = _PUSH_FIELDS
+        stack = [(root, None)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, parent = pop()
+            if pre(node, parent) is False:
+                continue
+            for name, is_list in push_fields[node.__class__]:
+                value = getattr(node, name)
+                if is_list:
+                    for child in reversed(value):
+                        push((child, node))
+                elif value is not None:
+                    push((value, node))
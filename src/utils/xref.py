@@ -0,0 +1,180 @@
+"""
+Cross-reference indexes over a TyC AST.
+
+XRef(program) walks the program once and keeps hash-map indexes for the
+queries that would otherwise re-walk the whole tree:
+
+    parent(node)         the node's parent (None for the root; Type nodes
+                         are shared by every occurrence and have none)
+    function(name)       the FuncDecl named *name*
+    call_sites(name)     every FuncCall of *name*
+    callers(name)        the FuncDecls containing a call of *name*
+    callees(func)        name -> FuncCall nodes, for the calls made by *func*
+    uses(func, name)     the Identifier nodes named *name* inside *func*
+    member_refs(member)  every MemberAccess of *member*
+
+Nodes are keyed by id(), so the indexes do not depend on how nodes
+compare. Calls, uses and member accesses are filed under the top-level
+declaration containing them, so replace(old, new) swaps one declaration
+of the program and re-indexes only that declaration: its cost is
+proportional to the two declarations, whatever the size of the program.
+"""
+
+from typing import Dict, List, Optional
+
+from src.utils.ast_diff import clear_hash
+from src.utils.nodes import (
+    ASTNode,
+    Decl,
+    FuncCall,
+    FuncDecl,
+    Identifier,
+    MemberAccess,
+    Program,
+    Type,
+)
+from src.utils.visitor import ASTWalker
+
+
+class _DeclRefs:
+    """References found inside one top-level declaration."""
+
+    __slots__ = ("calls", "uses", "members")
+
+    def __init__(self):
+        self.calls = {}  # callee name -> [FuncCall]
+        self.uses = {}  # identifier name -> [Identifier]
+        self.members = {}  # member name -> [MemberAccess]
+
+
+class _Indexer(ASTWalker):
+    """Fills the parent map and the _DeclRefs of one declaration."""
+
+    def __init__(self, parents: dict, refs: _DeclRefs):
+        self.parents = parents
+        self.refs = refs
+
+    def pre(self, node, parent):
+        if isinstance(node, Type):
+            return False
+        self.parents[id(node)] = parent
+        cls = node.__class__
+        if cls is Identifier:
+            self.refs.uses.setdefault(node.name, []).append(node)
+        elif cls is FuncCall:
+            if node.name is not None:
+                self.refs.calls.setdefault(node.name, []).append(node)
+        elif cls is MemberAccess:
+            self.refs.members.setdefault(node.member, []).append(node)
+
+
+class _Remover(ASTWalker):
+    """Drops the parent entries of a subtree."""
+
+    def __init__(self, parents: dict):
+        self.parents = parents
+
+    def pre(self, node, parent):
+        if isinstance(node, Type):
+            return False
+        self.parents.pop(id(node), None)
+
+
+class XRef:
+    """Cross-reference indexes of one Program."""
+
+    def __init__(self, program: Program):
+        self.program = program
+        self._parents = {id(program): None}  # id(node) -> parent node
+        self._refs = {}  # id(decl) -> _DeclRefs
+        self._positions = {}  # id(decl) -> index in program.decls
+        self._functions = {}  # name -> {id(decl): FuncDecl}
+        self._callers = {}  # callee name -> {id(decl): decl}
+        self._member_users = {}  # member name -> {id(decl): decl}
+        for position, decl in enumerate(program.decls):
+            self._add(decl, position)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def parent(self, node: ASTNode) -> Optional[ASTNode]:
+        return self._parents.get(id(node))
+
+    def __contains__(self, node: ASTNode) -> bool:
+        """True if *node* is a (non-type) node of the indexed program."""
+        return id(node) in self._parents
+
+    def function(self, name: str) -> Optional[FuncDecl]:
+        """The FuncDecl named *name* (one of them if it is redeclared)."""
+        funcs = self._functions.get(name)
+        return next(iter(funcs.values())) if funcs else None
+
+    def callers(self, name: str) -> List[Decl]:
+        return list(self._callers.get(name, {}).values())
+
+    def call_sites(self, name: str) -> List[FuncCall]:
+        return [
+            call
+            for decl in self._callers.get(name, {}).values()
+            for call in self._refs[id(decl)].calls[name]
+        ]
+
+    def callees(self, func: Decl) -> Dict[str, List[FuncCall]]:
+        return self._refs[id(func)].calls
+
+    def uses(self, func: Decl, name: str) -> List[Identifier]:
+        return self._refs[id(func)].uses.get(name, [])
+
+    def member_refs(self, member: str) -> List[MemberAccess]:
+        return [
+            access
+            for decl in self._member_users.get(member, {}).values()
+            for access in self._refs[id(decl)].members[member]
+        ]
+
+    # ------------------------------------------------------------------
+    # Incremental update
+    # ------------------------------------------------------------------
+
+    def replace(self, old: Decl, new: Decl):
+        """Put *new* in place of the declaration *old* in the program.
+
+        The program's cached structural hash is cleared (see ast_diff).
+        """
+        position = self._positions.get(id(old))
+        if position is None or self.program.decls[position] is not old:
+            raise ValueError(f"Not a declaration of the indexed program: {old!r}")
+        self._remove(old)
+        self.program.decls[position] = new
+        clear_hash(self.program)
+        self._add(new, position)
+
+    def _add(self, decl: Decl, position: int):
+        key = id(decl)
+        refs = _DeclRefs()
+        _Indexer(self._parents, refs).walk(decl)
+        self._parents[key] = self.program
+        self._refs[key] = refs
+        self._positions[key] = position
+        if isinstance(decl, FuncDecl):
+            self._functions.setdefault(decl.name, {})[key] = decl
+        for name in refs.calls:
+            self._callers.setdefault(name, {})[key] = decl
+        for member in refs.members:
+            self._member_users.setdefault(member, {})[key] = decl
+
+    def _remove(self, decl: Decl):
+        key = id(decl)
+        refs = self._refs.pop(key)
+        del self._positions[key]
+        _Remover(self._parents).walk(decl)
+        indexes = [(self._callers, refs.calls), (self._member_users, refs.members)]
+        if isinstance(decl, FuncDecl):
+            indexes.append((self._functions, (decl.name,)))
+        for index, names in indexes:
+            for name in names:
+                decls = index[name]
+                del decls[key]
+                if not decls:
+                    del index[name]
@@ -0,0 +1,150 @@
+"""
+Binary AST encoding test cases for TyC compiler
+"""
+
+import io
+import math
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.utils import nodes
+from src.utils.ast_binary import (
+    MAGIC,
+    SCHEMA_VERSION,
+    ASTWriter,
+    FormatError,
+    SchemaVersionError,
+    dump,
+    dumps,
+    load,
+    loads,
+)
+from src.utils.spans import LineIndex
+from tests.utils import PARSER_CORPUS, SOURCE, ASTGenerator, ast_gen_corpus, positions
+
+
+def assert_round_trip(tree):
+    back = loads(dumps(tree))
+    assert str(back) == str(tree)
+    assert positions(back) == positions(tree)
+
+
+def test_round_trip_ast_gen_corpus():
+    sources = ast_gen_corpus()
+    assert len(sources) > 20
+    for source in sources:
+        tree = ASTGenerator(source).generate()
+        if isinstance(tree, nodes.Program):
+            assert_round_trip(tree)
+
+
+def test_round_trip_parser_corpus():
+    for source in PARSER_CORPUS:
+        tree = ASTGenerator(source).generate()
+        if isinstance(tree, nodes.Program):
+            assert_round_trip(tree)
+
+
+def test_round_trip_scalars():
+    values = [
+        nodes.IntLiteral(0),
+        nodes.IntLiteral(-1),
+        nodes.IntLiteral(2**80),
+        nodes.IntLiteral(-(2**70)),
+        nodes.FloatLiteral(-0.0),
+        nodes.FloatLiteral(math.inf),
+        nodes.StringLiteral(""),
+        nodes.StringLiteral("café \\n"),
+        nodes.StringLiteral("café \\n"),
+        nodes.FuncCall(None, []),
+    ]
+    back = loads(dumps(nodes.StructLiteral(values)))
+    assert [type(v) for v in back.values] == [type(v) for v in values]
+    assert [getattr(v, "value", None) for v in back.values] == [
+        getattr(v, "value", None) for v in values
+    ]
+    assert math.copysign(1, back.values[4].value) == -1
+    assert back.values[-1].name is None
+    assert back.span is None and back.position(LineIndex("x")) is None
+
+
+def test_strings_are_encoded_once():
+    one = dumps(nodes.Identifier("long_variable_name"))
+    many = dumps(nodes.StructLiteral([nodes.Identifier("long_variable_name")] * 10))
+    assert one.count(b"long_variable_name") == many.count(b"long_variable_name") == 1
+
+
+def test_types_come_back_shared():
+    point, f, _ = loads(dumps(ASTGenerator(SOURCE).generate())).decls
+    assert point.members[0].member_type is nodes.IntType()
+    assert f.params[1].param_type is nodes.StructType("Point")
+
+
+def test_header():
+    data = dumps(nodes.Program([]))
+    assert data.startswith(MAGIC)
+    assert data[len(MAGIC)] == SCHEMA_VERSION
+
+
+def test_buffer_types():
+    data = dumps(ASTGenerator(SOURCE).generate())
+    expected = str(loads(data))
+    assert str(loads(bytearray(data))) == expected
+    assert str(loads(memoryview(data))) == expected
+
+
+def test_dump_and_load_file(tmp_path):
+    tree = ASTGenerator(SOURCE).generate()
+    path = tmp_path / "main.tyca"
+    with open(path, "wb") as f:
+        dump(tree, f)
+    back = load(str(path))
+    assert str(back) == str(tree)
+    assert positions(back) == positions(tree)
+
+
+def test_chunked_writer():
+    tree = ASTGenerator(SOURCE).generate()
+    stream = io.BytesIO()
+    chunks = []
+    stream.write = lambda data: chunks.append(data) or len(data)
+    ASTWriter(stream, chunk_size=16).write(tree)
+    assert len(chunks) > 10
+    assert b"".join(chunks) == dumps(tree)
+
+
+def test_deep_tree():
+    expr = nodes.Identifier("x")
+    for _ in range(50_000):
+        expr = nodes.PrefixOp("-", expr)
+    back = loads(dumps(expr))
+    depth = 0
+    while isinstance(back, nodes.PrefixOp):
+        back = back.operand
+        depth += 1
+    assert depth == 50_000 and back.name == "x"
+
+
+def test_rejects_bad_data(tmp_path):
+    data = dumps(ASTGenerator(SOURCE).generate())
+    with pytest.raises(FormatError):
+        loads(b"")
+    with pytest.raises(FormatError):
+        loads(b"XXXX" + data[4:])
+    with pytest.raises(SchemaVersionError):
+        loads(MAGIC + bytes([SCHEMA_VERSION + 1]) + data[5:])
+    for cut in (len(data) // 3, len(data) - 1):
+        with pytest.raises(FormatError):
+            loads(data[:cut])
+    with pytest.raises(FormatError):
+        loads(data + bytes([0xFE]))
+    empty = tmp_path / "empty.tyca"
+    empty.write_bytes(b"")
+    with pytest.raises(FormatError):
+        load(str(empty))
+
+
+def test_rejects_non_nodes():
+    with pytest.raises(TypeError):
+        dumps(nodes.Program(["not a node"]))
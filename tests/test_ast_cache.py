@@ -0,0 +1,190 @@
+"""
+On-disk AST cache test cases for TyC compiler
+"""
+
+import multiprocessing
+import os
+
+import pytest
+
+import tests.utils  # sets up the build path
+from src.astgen import ast_cache
+from src.astgen.ast_cache import ASTCache, cache_key
+from src.frontend import parsing
+from tests.utils import SOURCE, ASTGenerator, positions
+
+
+BAD_SOURCE = "void main() { x = ; }"
+
+
+def sources(n):
+    return [f"int f{i}() {{ return {i} * 2; }}" for i in range(n)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ASTCache(str(tmp_path / "cache"))
+
+
+def test_miss_then_hit(cache):
+    first = cache.generate(SOURCE)
+    second = cache.generate(SOURCE)
+    assert not first.hit and second.hit
+    assert second.ok and second.diagnostics == []
+    assert str(second.ast) == str(first.ast) == str(ASTGenerator(SOURCE, cache=False).generate())
+    assert positions(second.ast) == positions(first.ast)
+    assert cache.stats.as_dict() == {
+        "hits": 1, "misses": 1, "writes": 1, "evictions": 0, "corrupt": 0, "hit_rate": 0.5,
+    }  # fmt: skip
+
+
+def test_hit_skips_antlr(cache, monkeypatch):
+    expected = str(cache.generate(SOURCE).ast)
+
+    def no_parser(*args, **kwargs):
+        raise AssertionError("ANTLR used on a cache hit")
+
+    monkeypatch.setattr(parsing, "make_parser", no_parser)
+    assert str(cache.generate(SOURCE).ast) == expected
+
+
+def test_diagnostics_are_cached(cache):
+    first = cache.generate(BAD_SOURCE)
+    second = cache.generate(BAD_SOURCE)
+    assert second.hit and not second.ok
+    assert second.diagnostics == first.diagnostics == ["Error on line 1 col 18: ;"]
+
+
+def test_ast_generator_uses_cache(cache):
+    for source in (SOURCE, BAD_SOURCE, "void main() { auto s = \"\\q\"; }"):
+        expected = str(ASTGenerator(source, cache=False).generate())
+        assert str(ASTGenerator(source, cache=cache).generate()) == expected
+        assert str(ASTGenerator(source, cache=cache).generate()) == expected
+    assert cache.stats.hits == 3
+
+
+def test_ast_generator_builds_no_lexer_on_a_hit(cache, monkeypatch):
+    expected = str(cache.generate(SOURCE).ast)
+
+    def no_lexer(*args, **kwargs):
+        raise AssertionError("lexer built on a cache hit")
+
+    monkeypatch.setattr(tests.utils, "TyCLexer", no_lexer)
+    assert str(ASTGenerator(SOURCE, cache=cache).generate()) == expected
+
+
+def test_default_cache_from_environment(tmp_path, monkeypatch):
+    monkeypatch.delenv("TYC_AST_CACHE", raising=False)
+    assert ast_cache.default_cache() is None
+    monkeypatch.setenv("TYC_AST_CACHE", str(tmp_path))
+    assert ast_cache.default_cache().directory == str(tmp_path)
+    assert ASTGenerator(SOURCE).cache is ast_cache.default_cache()
+
+
+def test_key_covers_grammar_compiler_and_parser(monkeypatch):
+    key = cache_key(SOURCE)
+    assert cache_key(SOURCE) == key
+    assert cache_key(SOURCE + " ") != key
+    assert cache_key(SOURCE, parsing.EXPR_PRATT) != cache_key(SOURCE, parsing.EXPR_ANTLR)
+    monkeypatch.setattr(ast_cache, "_grammar_hash", "0" * 64)
+    assert cache_key(SOURCE) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(ast_cache, "_compiler_version", "0" * 64)
+    assert cache_key(SOURCE) != key
+
+
+def test_compiler_modules_cover_the_pipeline():
+    import lexererr
+    from src.utils import error_listener
+
+    for name in ast_cache.COMPILER_MODULES:
+        assert os.path.isfile(os.path.join(ast_cache.ROOT_DIR, name)), name
+    # the modules whose messages end up in cached diagnostics
+    for module in (lexererr, error_listener, parsing):
+        path = os.path.relpath(module.__file__, ast_cache.ROOT_DIR)
+        assert path.replace(os.sep, "/") in ast_cache.COMPILER_MODULES, path
+
+
+def test_lru_eviction(tmp_path):
+    probe = ASTCache(str(tmp_path / "probe"))
+    probe.generate(sources(1)[0])
+    entry_size = probe.usage()
+    cache = ASTCache(str(tmp_path / "cache"), max_bytes=entry_size * 4)
+    first, *rest = sources(5)
+    for i, source in enumerate([first] + rest[:3]):
+        cache.generate(source)
+        os.utime(cache.path(cache_key(source)), (1000 + i, 1000 + i))  # in this order
+    assert cache.generate(first).hit  # refreshes the first entry
+    cache.generate(rest[3])  # fifth entry: over the bound
+    assert cache.stats.evictions >= 1
+    assert cache.usage() <= cache.max_bytes
+    assert cache.generate(first).hit
+    assert not cache.generate(rest[0]).hit  # the least recently used one
+
+
+def test_oversized_entry_is_not_stored(tmp_path):
+    cache = ASTCache(str(tmp_path), max_bytes=16)
+    assert cache.generate(SOURCE).ok
+    assert len(cache) == 0 and cache.stats.writes == 0
+
+
+def test_corrupt_entry_is_a_miss(cache):
+    cache.generate(SOURCE)
+    path = cache.path(cache_key(SOURCE))
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) // 2)
+    result = cache.generate(SOURCE)
+    assert not result.hit and result.ok
+    assert cache.stats.corrupt == 1
+    assert cache.generate(SOURCE).hit
+
+
+def test_recursion_error_is_not_cached(cache, monkeypatch):
+    def too_deep(source, expressions=None):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    monkeypatch.setattr(ast_cache, "build_ast", too_deep)
+    result = cache.generate(SOURCE)
+    assert not result.ok and "recursion" in result.diagnostics[0]
+    assert len(cache) == 0
+
+
+def test_clear(cache):
+    for source in sources(3):
+        cache.generate(source)
+    assert len(cache) == 3
+    assert cache.clear() == 3
+    assert len(cache) == 0 and cache.usage() == 0
+
+
+def _fill(directory):
+    cache = ASTCache(directory)
+    return [str(cache.generate(source).ast) for source in sources(20)]
+
+
+def test_concurrent_writers(tmp_path):
+    directory = str(tmp_path / "cache")
+    with multiprocessing.get_context("spawn").Pool(3) as pool:
+        results = pool.map(_fill, [directory] * 3)
+    assert results[0] == results[1] == results[2]
+    cache = ASTCache(directory)
+    assert len(cache) == 20
+    assert [str(cache.generate(s).ast) for s in sources(20)] == results[0]
+    assert cache.stats.hits == 20
+    leftovers = [n for d in os.listdir(directory) for n in os.listdir(os.path.join(directory, d))]
+    assert not [n for n in leftovers if n.startswith(".")]
+
+
+def test_main(tmp_path, capsys):
+    good = tmp_path / "good.tyc"
+    good.write_text(SOURCE)
+    bad = tmp_path / "bad.tyc"
+    bad.write_text(BAD_SOURCE)
+    directory = str(tmp_path / "cache")
+    assert ast_cache.main([str(good), "--dir", directory]) == 0
+    assert ast_cache.main([str(good), str(bad), "--dir", directory]) == 1
+    out = capsys.readouterr().out
+    assert "bad.tyc: Error on line 1 col 18: ;" in out
+    assert "CacheStats(hits=1, misses=1" in out
+    assert ast_cache.main(["--clear", "--dir", directory]) == 0
+    assert ast_cache.main([]) == 2
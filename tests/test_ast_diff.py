@@ -0,0 +1,174 @@
+"""
+Structural equality, hashing and AST diff test cases for TyC compiler
+"""
+
+import copy
+import pickle
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT, make_parser, parse
+from src.utils import ast_binary, ast_diff, nodes
+from src.utils.ast_diff import Change, clear_hash, diff, equal
+from src.utils.xref import XRef
+from tests.utils import SOURCE, ast_gen_corpus
+
+
+def ast_of(source, expressions=None):
+    return ASTGeneration().visit(parse(make_parser(source, expressions=expressions)))
+
+
+def program(n):
+    return "".join(f"int f{i}(int a) {{ return a * {i} + g(a); }}\n" for i in range(n))
+
+
+class Untouchable:
+    """A field value that fails the test if it is ever compared or hashed."""
+
+    def __eq__(self, other):
+        raise AssertionError("compared")
+
+    def __hash__(self):
+        raise AssertionError("hashed")
+
+
+def test_equal_ignores_positions():
+    a = ast_of(SOURCE)
+    b = ast_of("\n\n" + SOURCE.replace(" ", "  "))
+    assert a.span != b.span
+    assert a == b and hash(a) == hash(b) and not a != b
+    assert a == ast_binary.loads(ast_binary.dumps(a))
+
+
+def test_equal_on_corpus():
+    sources = [s for s in ast_gen_corpus() if s.strip()]
+    for source in sources:
+        try:
+            a = ast_of(source, EXPR_ANTLR)
+        except Exception:
+            continue
+        b = ast_of(source, EXPR_PRATT)
+        assert a == b and hash(a) == hash(b)
+        assert (a == ast_of(sources[0])) == (str(a) == str(ast_of(sources[0])))
+
+
+def test_not_equal():
+    base = ast_of("void main() { x = a + 1; }")
+    for other in (
+        "void main() { x = a + 2; }",
+        "void main() { x = a - 1; }",
+        "void main() { x = b + 1; }",
+        "void main() { x = a + 1.0; }",
+        "void main() { x = a + 1; x; }",
+        "int main() { x = a + 1; }",
+    ):
+        assert base != ast_of(other), other
+    assert base != str(base) and base != None  # noqa: E711
+    assert nodes.IntLiteral(1) != nodes.FloatLiteral(1.0)
+
+
+def test_types_compare_by_identity():
+    assert nodes.StructType("P") == nodes.StructType("P")
+    assert nodes.StructType("P") != nodes.StructType("Q")
+    assert nodes.Param(nodes.IntType(), "a") != nodes.Param(nodes.FloatType(), "a")
+    assert hash(nodes.IntType()) == hash(nodes.IntType())
+
+
+def test_equality_short_circuits():
+    shared = nodes.Identifier("x")
+    a = nodes.BinaryOp(nodes.IntLiteral(Untouchable()), "+", shared)
+    b = nodes.BinaryOp(nodes.IntLiteral(Untouchable()), "-", shared)
+    assert not equal(a, b)  # the operators differ: the operands are never compared
+    c = nodes.BinaryOp(nodes.IntLiteral(1), "+", nodes.IntLiteral(Untouchable()))
+    d = nodes.BinaryOp(nodes.IntLiteral(2), "+", nodes.IntLiteral(Untouchable()))
+    assert not equal(c, d)  # the first difference ends the comparison
+
+
+def test_hash_is_cached():
+    ast = ast_of(SOURCE)
+    h = hash(ast)
+    func = ast.decls[1]
+    assert func._hash is not None and func.body._hash is not None
+    func.name = "renamed"
+    assert hash(ast) == h  # stale until cleared
+    clear_hash(ast, func)
+    assert hash(ast) != h
+    for back in (pickle.loads(pickle.dumps(ast)), copy.deepcopy(ast)):
+        assert back._hash is None and back.decls[1]._hash is None
+        assert back == ast and hash(back) == hash(ast)
+
+
+def test_xref_replace_clears_program_hash():
+    ast = ast_of(program(3))
+    h = hash(ast)
+    XRef(ast).replace(ast.decls[1], ast_of("void h() {}").decls[0])
+    assert hash(ast) != h
+
+
+def test_deep_trees():
+    depth = 100_000
+
+    def chain(last):
+        expr = nodes.Identifier("x")
+        for _ in range(depth):
+            expr = nodes.PrefixOp("-", expr)
+        return nodes.BinaryOp(expr, "+", nodes.IntLiteral(last))
+
+    a, b, c = chain(1), chain(1), chain(2)
+    assert a == b and a != c
+    assert hash(a) == hash(b) != hash(c)
+    assert diff(a, c) == [Change(("right", "value"), 1, 2)]
+
+
+def test_diff():
+    a = ast_of(program(5))
+    b = ast_of(program(5).replace("a * 3", "a * 30").replace("int f1(", "float f1("))
+    assert diff(a, a) == [] and diff(a, ast_of(program(5))) == []
+    assert diff(a, b) == [
+        Change(("decls", 1, "return_type"), nodes.IntType(), nodes.FloatType()),
+        Change(
+            ("decls", 3, "body", "statements", 0, "expr", "left", "right", "value"), 3, 30
+        ),
+    ]
+    c = ast_of("void g() {}\n" + program(5).replace("int f4(int a) { return a * 4 + g(a); }\n", ""))
+    assert diff(a, c) == [
+        Change(("decls", 0), None, c.decls[0]),
+        Change(("decls", 4), a.decls[4], None),
+    ]
+    d = ast_of("void main() { x = f(1); }")
+    e = ast_of("void main() { x = f(1).y; }")
+    ((path, old, new),) = diff(d, e)
+    assert path == ("decls", 0, "body", "statements", 0, "expr", "rhs")
+    assert type(old) is nodes.FuncCall and type(new) is nodes.MemberAccess
+
+
+def test_diff_skips_identical_subtrees(monkeypatch):
+    a = ast_of(program(300))
+    b = ast_of(program(300).replace("a * 150", "a * 151"))
+    hash(a), hash(b)
+    visited = []
+    diff_lists = ast_diff._diff_lists
+
+    def counting_diff_lists(path, xs, ys):
+        visited.append(path)
+        return diff_lists(path, xs, ys)
+
+    monkeypatch.setattr(ast_diff, "_diff_lists", counting_diff_lists)
+    assert len(diff(a, b)) == 1
+    assert len(visited) < 10  # the lists on the path to the change, not every list
+
+
+def test_diff_survives_hash_collisions():
+    a = ast_of("void main() { x = 1; y = 2; }")
+    b = ast_of("void main() { x = 1; y = 3; }")
+    a._hash = b._hash = 1  # as if the trees collided
+    assert a != b
+    assert diff(a, b) == [
+        Change(("decls", 0, "body", "statements", 1, "expr", "rhs", "value"), 2, 3)
+    ]
+    c = ast_of("void main() { x = 1; y = 2; }")
+    d = ast_of("void main() { x = 1; y = 3; }")
+    c.decls[0].body.statements[1]._hash = d.decls[0].body.statements[1]._hash = 1
+    assert diff(c, d) == [
+        Change(("decls", 0, "body", "statements", 1, "expr", "rhs", "value"), 2, 3)
+    ]
@@ -1,18 +1,299 @@
 """
 AST Generation test cases for TyC compiler.
-TODO: Implement 100 test cases for AST generation
 """
 
+import sys
+
 import pytest
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT, make_parser, parse
+from src.frontend.recovery import parse_recovering
 from tests.utils import ASTGenerator
 
 
-def test_ast_gen_placeholder():
-    """Placeholder test - replace with actual test cases"""
-    source = """void main() {
-}"""
-    # TODO: Add actual test assertions
-    # Example:
-    # expected = "Program([FuncDecl(VoidType(), main, [], BlockStmt([]))])"
-    # assert str(ASTGenerator(source).generate()) == expected
-    assert True
+def gen(body):
+    """AST string of `void main() { <body> }`."""
+    return str(ASTGenerator("void main() { " + body + " }").generate())
+
+
+def wrap(*stmts):
+    return f"Program([FuncDecl(VoidType(), main, [], BlockStmt([{', '.join(stmts)}]))])"
+
+
+# --- Declarations ---
+def test_ast_empty_program():
+    """An empty file is an empty Program."""
+    assert str(ASTGenerator("").generate()) == "Program([])"
+
+def test_ast_empty_main():
+    source = "void main() {}"
+    expected = "Program([FuncDecl(VoidType(), main, [], BlockStmt([]))])"
+    assert str(ASTGenerator(source).generate()) == expected
+
+def test_ast_inferred_return_type():
+    """An omitted return type is None, printed as auto."""
+    source = "main() {}"
+    expected = "Program([FuncDecl(auto, main, [], BlockStmt([]))])"
+    assert str(ASTGenerator(source).generate()) == expected
+
+def test_ast_params_and_types():
+    source = "float f(int a, float b, string c, Point p) { return b; }"
+    expected = (
+        "Program([FuncDecl(FloatType(), f, [Param(IntType(), a), Param(FloatType(), b), "
+        "Param(StringType(), c), Param(StructType(Point), p)], "
+        "BlockStmt([ReturnStmt(return Identifier(b))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+def test_ast_struct_decl():
+    source = "struct Point { int x; float y; string name; };"
+    expected = (
+        "Program([StructDecl(Point, [MemberDecl(IntType(), x), "
+        "MemberDecl(FloatType(), y), MemberDecl(StringType(), name)])])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+def test_ast_struct_return_type():
+    source = "struct P { int x; }; P make() { P p = {1}; return p; }"
+    expected = (
+        "Program([StructDecl(P, [MemberDecl(IntType(), x)]), FuncDecl(StructType(P), make, [], "
+        "BlockStmt([VarDecl(StructType(P), p = StructLiteral({IntLiteral(1)})), "
+        "ReturnStmt(return Identifier(p))]))])"
+    )
+    assert str(ASTGenerator(source).generate()) == expected
+
+def test_ast_var_decls():
+    assert gen("auto a; auto b = 1; int c; float d = 2.5; string e = \"s\";") == wrap(
+        "VarDecl(auto, a)",
+        "VarDecl(auto, b = IntLiteral(1))",
+        "VarDecl(IntType(), c)",
+        "VarDecl(FloatType(), d = FloatLiteral(2.5))",
+        "VarDecl(StringType(), e = StringLiteral('s'))",
+    )
+
+def test_ast_lone_semicolon_is_dropped():
+    assert gen("; x = 1;;") == wrap("ExprStmt(AssignExpr(Identifier(x) = IntLiteral(1)))")
+
+# --- Statements ---
+def test_ast_if_else():
+    assert gen("if (a) b = 1; else { c = 2; }") == wrap(
+        "IfStmt(if Identifier(a) then ExprStmt(AssignExpr(Identifier(b) = IntLiteral(1))), "
+        "else BlockStmt([ExprStmt(AssignExpr(Identifier(c) = IntLiteral(2)))]))"
+    )
+
+def test_ast_dangling_else():
+    """else binds to the nearest if."""
+    assert gen("if (a) if (b) x++; else y++;") == wrap(
+        "IfStmt(if Identifier(a) then IfStmt(if Identifier(b) then "
+        "ExprStmt(PostfixOp(Identifier(x)++)), else ExprStmt(PostfixOp(Identifier(y)++))))"
+    )
+
+def test_ast_while():
+    assert gen("while (i < 3) { i++; break; continue; }") == wrap(
+        "WhileStmt(while BinaryOp(Identifier(i), <, IntLiteral(3)) do "
+        "BlockStmt([ExprStmt(PostfixOp(Identifier(i)++)), BreakStmt(), ContinueStmt()]))"
+    )
+
+def test_ast_for_with_decl():
+    assert gen("for (int i = 0; i < n; ++i) {}") == wrap(
+        "ForStmt(for VarDecl(IntType(), i = IntLiteral(0)); "
+        "BinaryOp(Identifier(i), <, Identifier(n)); PrefixOp(++Identifier(i)) do BlockStmt([]))"
+    )
+
+def test_ast_for_with_expr_init_and_missing_parts():
+    assert gen("for (i = 0; ; i = i + 1) {} for (;;) {} for (; i;) {}") == wrap(
+        "ForStmt(for ExprStmt(AssignExpr(Identifier(i) = IntLiteral(0))); None; "
+        "AssignExpr(Identifier(i) = BinaryOp(Identifier(i), +, IntLiteral(1))) do BlockStmt([]))",
+        "ForStmt(for None; None; None do BlockStmt([]))",
+        "ForStmt(for None; Identifier(i); None do BlockStmt([]))",
+    )
+
+def test_ast_for_update_only():
+    assert gen("for (;; i++) {}") == wrap(
+        "ForStmt(for None; None; PostfixOp(Identifier(i)++) do BlockStmt([]))"
+    )
+
+def test_ast_switch():
+    assert gen("switch (x) { case 1: case 2: y = 1; break; default: y = 0; }") == wrap(
+        "SwitchStmt(switch Identifier(x) cases [CaseStmt(case IntLiteral(1): []), "
+        "CaseStmt(case IntLiteral(2): [ExprStmt(AssignExpr(Identifier(y) = IntLiteral(1))), "
+        "BreakStmt()])], default DefaultStmt(default: "
+        "[ExprStmt(AssignExpr(Identifier(y) = IntLiteral(0)))]))"
+    )
+
+def test_ast_switch_empty():
+    assert gen("switch (x) {}") == wrap("SwitchStmt(switch Identifier(x) cases [])")
+
+def test_ast_return_forms():
+    assert gen("return; return x + 1;") == wrap(
+        "ReturnStmt(return)", "ReturnStmt(return BinaryOp(Identifier(x), +, IntLiteral(1)))"
+    )
+
+def test_ast_nested_blocks():
+    assert gen("{ { } int x; }") == wrap("BlockStmt([BlockStmt([]), VarDecl(IntType(), x)])")
+
+# --- Expressions ---
+def test_ast_multiplicative_binds_tighter():
+    assert gen("x = 1 + 2 * 3;") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = BinaryOp(IntLiteral(1), +, "
+        "BinaryOp(IntLiteral(2), *, IntLiteral(3)))))"
+    )
+
+def test_ast_left_associative():
+    assert gen("x = a - b - c;") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = BinaryOp(BinaryOp(Identifier(a), -, "
+        "Identifier(b)), -, Identifier(c))))"
+    )
+
+def test_ast_assignment_right_associative():
+    assert gen("x = y = z = 10;") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = AssignExpr(Identifier(y) = "
+        "AssignExpr(Identifier(z) = IntLiteral(10)))))"
+    )
+
+def test_ast_assignment_in_expression():
+    assert gen("int y = (x = 5) + 7;") == wrap(
+        "VarDecl(IntType(), y = BinaryOp(AssignExpr(Identifier(x) = IntLiteral(5)), +, IntLiteral(7)))"
+    )
+
+def test_ast_precedence_ladder():
+    assert gen("a || b && c == d < e + f * -g;") == wrap(
+        "ExprStmt(BinaryOp(Identifier(a), ||, BinaryOp(Identifier(b), &&, "
+        "BinaryOp(Identifier(c), ==, BinaryOp(Identifier(d), <, BinaryOp(Identifier(e), +, "
+        "BinaryOp(Identifier(f), *, PrefixOp(-Identifier(g)))))))))"
+    )
+
+def test_ast_call_binds_tighter_than_binary():
+    """Function calls are postfix-level, above every binary operator."""
+    assert gen("x = 1 + f(2) * g();") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = BinaryOp(IntLiteral(1), +, "
+        "BinaryOp(FuncCall(f, [IntLiteral(2)]), *, FuncCall(g, [])))))"
+    )
+
+def test_ast_member_access_binds_tighter_than_unary():
+    assert gen("x = !p.ok; y = -p.a.b;") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = PrefixOp(!MemberAccess(Identifier(p).ok))))",
+        "ExprStmt(AssignExpr(Identifier(y) = PrefixOp(-MemberAccess(MemberAccess(Identifier(p).a).b))))",
+    )
+
+def test_ast_postfix_binds_tighter_than_prefix():
+    assert gen("x = -y++; ++z--;") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = PrefixOp(-PostfixOp(Identifier(y)++))))",
+        "ExprStmt(PrefixOp(++PostfixOp(Identifier(z)--)))",
+    )
+
+def test_ast_member_of_call_result():
+    assert gen("x = make(1).y;") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = MemberAccess(FuncCall(make, [IntLiteral(1)]).y)))"
+    )
+
+def test_ast_member_assignment():
+    assert gen("p.q.r = 1; (a) = 2;") == wrap(
+        "ExprStmt(AssignExpr(MemberAccess(MemberAccess(Identifier(p).q).r) = IntLiteral(1)))",
+        "ExprStmt(AssignExpr(Identifier(a) = IntLiteral(2)))",
+    )
+
+def test_ast_parentheses_are_transparent():
+    assert gen("x = (1 + 2) * 3;") == wrap(
+        "ExprStmt(AssignExpr(Identifier(x) = BinaryOp(BinaryOp(IntLiteral(1), +, "
+        "IntLiteral(2)), *, IntLiteral(3))))"
+    )
+
+def test_ast_literals():
+    assert gen('f(0, 42, 1.5, .5, 1e3, "a\\tb", {1, 2});') == wrap(
+        "ExprStmt(FuncCall(f, [IntLiteral(0), IntLiteral(42), FloatLiteral(1.5), "
+        "FloatLiteral(0.5), FloatLiteral(1000.0), StringLiteral('a\\\\tb'), "
+        "StructLiteral({IntLiteral(1), IntLiteral(2)})]))"
+    )
+
+def test_ast_callee_must_be_a_name():
+    """Only `<identifier>(<args>)` is a function call."""
+    result = ASTGenerator("void main() { (f)(1); }").generate()
+    assert result == "AST Generation Error: Error on line 1 col 14: callee must be a function name, not (f)"
+
+@pytest.mark.parametrize(
+    "source, error",
+    [
+        ("void m(){ if (f(1)(2)) x=1; else y = g(3)(4); }", "col 14: callee must be a function name, not f(1)"),
+        ("void m(){ for (a(1)(2);; b(1)(2)) c(1)(2); }", "col 15: callee must be a function name, not a(1)"),
+        ("void m(){ for (;a(1)(2); b(1)(2)) c(1)(2); }", "col 16: callee must be a function name, not a(1)"),
+        ("void m(){ switch (a(1)(2)) { case 1: b(1)(2); } }", "col 18: callee must be a function name, not a(1)"),
+    ],
+)
+def test_ast_reports_first_error_in_source(source, error):
+    """With two bad callees in one statement, the first one is reported."""
+    assert ASTGenerator(source, cache=False).generate() == f"AST Generation Error: Error on line 1 {error}"
+
+def test_ast_syntax_error_is_reported():
+    assert ASTGenerator("void main() { x = ; }").generate() == (
+        "AST Generation Error: Error on line 1 col 18: ;"
+    )
+
+def test_ast_positions():
+    """Nodes carry the line and column of their first token."""
+    program = ASTGenerator("void main() {\n  int x = a + 1;\n}").generate()
+    decl = program.decls[0].body.statements[0]
+    assert decl.position(program.source) == (2, 2)
+    assert decl.init_value.right.position(program.source) == (2, 14)
+
+
+# --- Deep inputs (no recursion in ASTGeneration) ---
+
+def build(source, expressions=EXPR_ANTLR):
+    return ASTGeneration().visit(parse(make_parser(source, expressions=expressions)))
+
+def test_ast_long_binary_chain():
+    n = 10 * sys.getrecursionlimit()
+    source = "void main() { r = " + " - ".join(f"x{i}" for i in range(n)) + "; }"
+    ast = build(source)
+    expr = ast.decls[0].body.statements[0].expr.rhs
+    for i in range(n - 1, 0, -1):
+        assert (expr.operator, expr.right.name) == ("-", f"x{i}")
+        expr = expr.left
+    assert expr.name == "x0"
+    assert ast == build(source, EXPR_PRATT)
+
+def test_ast_long_postfix_and_member_chains():
+    n = 10 * sys.getrecursionlimit()
+    ast = build("void main() { x" + "++" * n + "; r = p" + ".m" * n + "; }")
+    postfix, assign = (s.expr for s in ast.decls[0].body.statements)
+    member = assign.rhs
+    for _ in range(n):
+        assert type(postfix).__name__ == "PostfixOp" and member.member == "m"
+        postfix, member = postfix.operand, member.obj
+    assert postfix.name == "x" and member.name == "p"
+
+def test_ast_else_if_ladder():
+    n = 300  # deeper ladders overflow the generated parser's own recursion
+    ast = build("void main() { " + " else ".join(f"if (x == {i}) y = {i};" for i in range(n)) + " }")
+    stmt = ast.decls[0].body.statements[0]
+    for i in range(n):
+        assert stmt.condition.right.value == i
+        stmt = stmt.else_stmt
+    assert stmt is None
+
+@pytest.mark.parametrize("expressions", [EXPR_ANTLR, EXPR_PRATT])
+def test_ast_else_if_ladder_reports_first_error(expressions):
+    """Frames are driven in source order: a bad rung is reported before the final else."""
+    n = 300
+    rungs = [f"if (x == {i}) y = {'(g)(1)' if i == n // 2 else i};" for i in range(n)]
+    source = "void main() { " + " else ".join(rungs) + " else z = (h)(2); }"
+    with pytest.raises(Exception, match=f"col {source.index('(g)')}: callee must be a function name, not \\(g\\)"):
+        build(source, expressions)
+
+def test_ast_deeply_nested_blocks():
+    n = 150  # as deep as the generated parser goes; recursive generation stopped near 100
+    ast = build("void main() " + "{ while (x) " * n + "{ x = x - 1; }" + " }" * n)
+    stmt = ast.decls[0].body
+    for _ in range(n):
+        stmt = stmt.statements[0].body
+    assert str(stmt) == "BlockStmt([ExprStmt(AssignExpr(Identifier(x) = BinaryOp(Identifier(x), -, IntLiteral(1))))])"
+
+def test_ast_partial_drops_damaged_items():
+    ast = parse_recovering("int f() { int = 2; y = 1 + 2 + 3; }\nvoid g() { }").ast()
+    assert [d.name for d in ast.decls] == ["f", "g"]
+    assert str(ast.decls[0].body) == (
+        "BlockStmt([ExprStmt(AssignExpr(Identifier(y) = BinaryOp(BinaryOp(IntLiteral(1), +, "
+        "IntLiteral(2)), +, IntLiteral(3))))])"
+    )
@@ -0,0 +1,138 @@
+"""
+Iterative AST printer test cases for TyC compiler
+"""
+
+import io
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.utils import ast_printer, nodes
+from src.utils.ast_printer import to_string, write
+from tests.utils import PARSER_CORPUS, SOURCE, ASTGenerator, ast_gen_corpus
+
+
+def _items(values):
+    return ", ".join(legacy_str(v) for v in values) if values else ""
+
+
+# The recursive per-class str() format the printer replaced, as a reference
+LEGACY_FORMATS = {
+    nodes.Program: lambda n: f"Program([{_items(n.decls)}])",
+    nodes.StructDecl: lambda n: f"StructDecl({n.name}, [{_items(n.members)}])",
+    nodes.MemberDecl: lambda n: f"MemberDecl({s(n.member_type)}, {n.name})",
+    nodes.FuncDecl: lambda n: (
+        f"FuncDecl({s(n.return_type) if n.return_type else 'auto'}, {n.name}, "
+        f"[{_items(n.params)}], {s(n.body)})"
+    ),
+    nodes.Param: lambda n: f"Param({s(n.param_type)}, {n.name})",
+    nodes.StructType: lambda n: f"StructType({n.struct_name})",
+    nodes.BlockStmt: lambda n: f"BlockStmt([{_items(n.statements)}])",
+    nodes.VarDecl: lambda n: (
+        f"VarDecl({'auto' if n.var_type is None else s(n.var_type)}, {n.name}"
+        f"{f' = {s(n.init_value)}' if n.init_value else ''})"
+    ),
+    nodes.IfStmt: lambda n: (
+        f"IfStmt(if {s(n.condition)} then {s(n.then_stmt)}"
+        f"{f', else {s(n.else_stmt)}' if n.else_stmt else ''})"
+    ),
+    nodes.WhileStmt: lambda n: f"WhileStmt(while {s(n.condition)} do {s(n.body)})",
+    nodes.ForStmt: lambda n: (
+        f"ForStmt(for {s(n.init) if n.init else 'None'}; "
+        f"{s(n.condition) if n.condition else 'None'}; "
+        f"{s(n.update) if n.update else 'None'} do {s(n.body)})"
+    ),
+    nodes.SwitchStmt: lambda n: (
+        f"SwitchStmt(switch {s(n.expr)} cases [{_items(n.cases)}]"
+        f"{f', default {s(n.default_case)}' if n.default_case else ''})"
+    ),
+    nodes.CaseStmt: lambda n: f"CaseStmt(case {s(n.expr)}: [{_items(n.statements)}])",
+    nodes.DefaultStmt: lambda n: f"DefaultStmt(default: [{_items(n.statements)}])",
+    nodes.ReturnStmt: lambda n: f"ReturnStmt(return{f' {s(n.expr)}' if n.expr else ''})",
+    nodes.ExprStmt: lambda n: f"ExprStmt({s(n.expr)})",
+    nodes.BinaryOp: lambda n: f"BinaryOp({s(n.left)}, {n.operator}, {s(n.right)})",
+    nodes.PrefixOp: lambda n: f"PrefixOp({n.operator}{s(n.operand)})",
+    nodes.PostfixOp: lambda n: f"PostfixOp({s(n.operand)}{n.operator})",
+    nodes.AssignExpr: lambda n: f"AssignExpr({s(n.lhs)} = {s(n.rhs)})",
+    nodes.MemberAccess: lambda n: f"MemberAccess({s(n.obj)}.{n.member})",
+    nodes.FuncCall: lambda n: f"FuncCall({n.name}, [{_items(n.args)}])",
+    nodes.Identifier: lambda n: f"Identifier({n.name})",
+    nodes.StructLiteral: lambda n: f"StructLiteral({{{_items(n.values)}}})",
+    nodes.IntLiteral: lambda n: f"IntLiteral({n.value})",
+    nodes.FloatLiteral: lambda n: f"FloatLiteral({n.value})",
+    nodes.StringLiteral: lambda n: f"StringLiteral({n.value!r})",
+}
+
+
+def legacy_str(n):
+    """The recursive str() format the printer replaced, as a reference."""
+    if not isinstance(n, nodes.ASTNode):
+        return str(n)
+    legacy = LEGACY_FORMATS.get(type(n))
+    return legacy(n) if legacy else f"{type(n).__name__}()"
+
+
+s = legacy_str  # short name for LEGACY_FORMATS
+
+
+def test_matches_legacy_format_on_corpus():
+    for source in ast_gen_corpus() + PARSER_CORPUS + [SOURCE]:
+        ast = ASTGenerator(source).generate()
+        if isinstance(ast, nodes.Program):
+            assert to_string(ast) == str(ast) == legacy_str(ast)
+
+
+def test_missing_and_non_node_fields():
+    cases = [
+        nodes.FuncDecl(None, "f", [], None),
+        nodes.FuncDecl(nodes.VoidType(), "g", [nodes.Param(nodes.IntType(), "a"), None], None),
+        nodes.VarDecl(None, "x"),
+        nodes.VarDecl(nodes.StructType("P"), "p", nodes.StructLiteral([])),
+        nodes.ForStmt(None, None, None, nodes.BlockStmt([])),
+        nodes.IfStmt(None, nodes.BreakStmt()),
+        nodes.SwitchStmt(nodes.Identifier("x"), [], nodes.DefaultStmt([])),
+        nodes.SwitchStmt(nodes.Identifier("x"), None),
+        nodes.ReturnStmt(),
+        nodes.FuncCall(None, [nodes.IntLiteral(1), "text", 2.5]),
+        nodes.StringLiteral("it's"),
+        nodes.Program([]),
+    ]
+    for node in cases:
+        assert to_string(node) == legacy_str(node), node
+
+
+def test_subclasses():
+    class Negative(nodes.IntLiteral):
+        __slots__ = ()
+
+    class Named(nodes.Identifier):
+        __slots__ = ()
+
+        def __str__(self):
+            return f"Named<{self.name}>"
+
+    tree = nodes.BinaryOp(Negative(-1), "+", Named("n"))
+    assert str(tree) == "BinaryOp(IntLiteral(-1), +, Named<n>)"
+
+
+def test_write_streams_in_chunks(monkeypatch):
+    ast = ASTGenerator(SOURCE).generate()
+    chunks = []
+    stream = io.StringIO()
+    stream.write = chunks.append
+    monkeypatch.setattr(ast_printer, "CHUNK_PIECES", 8)
+    write(ast, stream)
+    assert len(chunks) > 10
+    assert "".join(chunks) == str(ast)
+
+
+def test_deep_trees():
+    depth = 100_000
+    expr = nodes.Identifier("x")
+    for _ in range(depth):
+        expr = nodes.PrefixOp("-", expr)
+    assert str(expr) == "PrefixOp(-" * depth + "Identifier(x)" + ")" * depth
+    block = nodes.BlockStmt([])
+    for _ in range(depth):
+        block = nodes.BlockStmt([nodes.BreakStmt(), block])
+    out = io.StringIO()
+    write(block, out)
+    assert out.getvalue() == "BlockStmt([BreakStmt(), " * depth + "BlockStmt([])" + "])" * depth
@@ -0,0 +1,61 @@
+"""
+Batch tokenization test cases for TyC compiler
+"""
+
+from antlr4.Token import Token
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from build.TyCLexer import TyCLexer
+from src.frontend.batch import LexError, tokenize_batch
+from tests.utils import LEXER_CORPUS, Tokenizer, lex
+
+
+def test_matches_tokenizer_on_lexer_corpus():
+    """One reused lexer gives the same output as a lexer per source."""
+    batch = tokenize_batch(LEXER_CORPUS)
+    assert len(batch) == len(LEXER_CORPUS)
+    for i, source in enumerate(LEXER_CORPUS):
+        assert batch.as_string(i, source) == Tokenizer(source).get_tokens_as_string(), source
+
+
+def test_columns_match_token_fields():
+    """Types and offsets agree with the tokens of a fresh lexer."""
+    batch = tokenize_batch(LEXER_CORPUS)
+    for i, source in enumerate(LEXER_CORPUS):
+        tokens, _ = lex(source)
+        expected = [(t[0], t[3], t[4]) for t in tokens if t[0] != Token.EOF]
+        rows = batch.token_range(i)
+        assert [(batch.types[r], batch.starts[r], batch.stops[r]) for r in rows] == expected
+
+
+def test_error_records():
+    """An error ends its own source only, and is recorded with its span."""
+    sources = ["int x;", "a\n  b @ c", '"abc', "", 'x = "a\\qb";']
+    batch = tokenize_batch(sources)
+    assert list(batch.token_types(0)) == [TyCLexer.INT, TyCLexer.ID, TyCLexer.SEMI]
+    assert batch.errors == [
+        LexError(1, "ErrorToken", "Error Token @", 6, 2, 4),
+        LexError(2, "UncloseString", "Unclosed String: abc", 0, 1, 0),
+        LexError(4, "IllegalEscape", "Illegal Escape In String: a\\q", 4, 1, 4),
+    ]
+    assert batch.error(0) is None and batch.error(3) is None
+    assert batch.as_string(3, "") == "<EOF>"
+    assert batch.texts(1, sources[1]) == ["a", "b"]
+
+
+def test_process_pool_matches_serial():
+    """Chunks tokenized in worker processes merge back in order."""
+    sources = LEXER_CORPUS * 3
+    serial = tokenize_batch(sources)
+    pooled = tokenize_batch(iter(sources), workers=2, chunk_size=37)
+    for column in ("types", "starts", "stops", "bounds", "errors"):
+        assert getattr(pooled, column) == getattr(serial, column)
+
+
+def test_extend_offsets_rows_and_sources():
+    """Merged batches shift row bounds and error source indices."""
+    first, second = tokenize_batch(["int x;"]), tokenize_batch(["@", "y;"])
+    first.extend(second)
+    assert len(first) == 3 and first.token_count == 5
+    assert list(first.bounds) == [0, 3, 3, 5]
+    assert first.errors[0].source == 1
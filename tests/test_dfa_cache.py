@@ -0,0 +1,129 @@
+"""
+Persistent DFA cache test cases for TyC compiler
+"""
+
+import json
+
+import pytest
+from antlr4.dfa.DFA import DFA
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.frontend import dfa_cache
+from src.frontend.parsing import MODE_LL, MODE_SLL, ParseStats, make_parser, parse
+
+
+SOURCE = """struct Point { int x; int y; };
+int f(int n) { if (n < 2) return 1; return n * f(n - 1); }
+void main() {
+    Point p = {1, 2};
+    auto s = "a\\tb";
+    for (int i = 0; i < 10; i++) { p.x = p.x + i * 2.5e1; }
+    switch (p.x) { case 1: break; default: printInt(-p.y++); }
+}"""
+
+
+def _tree(mode):
+    parser = make_parser(SOURCE)
+    return parse(parser, mode=mode, stats=ParseStats()).toStringTree(recog=parser)
+
+
+def _clear():
+    TyCLexer.decisionsToDFA[:] = [
+        DFA(s, i) for i, s in enumerate(TyCLexer.atn.decisionToState)
+    ]
+    TyCParser.decisionsToDFA[:] = [
+        DFA(s, i) for i, s in enumerate(TyCParser.atn.decisionToState)
+    ]
+
+
+def _state_counts():
+    return (
+        [len(d.states) for d in TyCLexer.decisionsToDFA],
+        [len(d.states) for d in TyCParser.decisionsToDFA],
+    )
+
+
+@pytest.fixture
+def warm_snapshot():
+    dfa_cache.warm_up([SOURCE])
+    _tree(MODE_LL)
+    return dfa_cache.snapshot()
+
+
+def test_snapshot_roundtrip(warm_snapshot):
+    """Reinstalled DFAs have the same states and re-encode identically."""
+    counts = _state_counts()
+    _clear()
+    assert dfa_cache.install(json.loads(json.dumps(warm_snapshot)))
+    assert _state_counts() == counts
+    assert dfa_cache.snapshot()["parser"] == warm_snapshot["parser"]
+
+
+def test_loaded_dfas_parse_identically(warm_snapshot):
+    """Parsing with a loaded cache gives the same trees and learns nothing new."""
+    expected = _tree(MODE_LL)
+    _clear()
+    dfa_cache.install(warm_snapshot)
+    counts = _state_counts()
+    assert _tree(MODE_LL) == expected
+    assert _tree(MODE_SLL) == expected
+    assert _state_counts() == counts
+
+
+def test_stale_key_is_ignored(warm_snapshot):
+    """A cache learned for another grammar is never installed."""
+    stale = dict(warm_snapshot, key="0" * 64)
+    _clear()
+    assert not dfa_cache.install(stale)
+    assert sum(_state_counts()[1]) == 0
+
+
+def test_save_and_load(tmp_path, warm_snapshot):
+    """save/load go through an on-disk file."""
+    path = dfa_cache.save(str(tmp_path / "dfa.json"))
+    _clear()
+    assert dfa_cache.load(path)
+    assert _tree(MODE_LL) == _tree(MODE_SLL)
+
+
+def test_missing_or_corrupt_file(tmp_path):
+    """Unreadable cache files are reported as not loaded."""
+    assert not dfa_cache.load(str(tmp_path / "missing.json"))
+    bad = tmp_path / "bad.json"
+    bad.write_bytes(b"not json")
+    assert not dfa_cache.load(str(bad))
+    # well-formed JSON under the right key, but tables that do not decode
+    bad.write_text(json.dumps({"format": dfa_cache.FORMAT_VERSION, "key": dfa_cache.cache_key()}))
+    assert not dfa_cache.load(str(bad))
+
+
+def test_pickle_payload_is_not_executed(tmp_path, monkeypatch):
+    """A cache file is data: a pickle in its place is rejected, not run."""
+    import pickle
+
+    class Payload:
+        def __reduce__(self):
+            return (exec, ("raise SystemExit('executed')",))
+
+    path = tmp_path / "dfa.json"
+    path.write_bytes(pickle.dumps(Payload()))
+    monkeypatch.setenv("TYC_DFA_CACHE", str(path))
+    monkeypatch.setattr(dfa_cache, "_loaded", False)
+    assert not dfa_cache.ensure_loaded()
+
+
+def test_main_usage_errors(capsys):
+    assert dfa_cache.main([]) == 2
+    assert dfa_cache.main(["prog.tyc", "-o"]) == 2
+    assert capsys.readouterr().out.count("usage:") == 2
+
+
+def test_cache_key_tracks_grammar(monkeypatch, tmp_path):
+    """The key changes when TyC.g4 changes."""
+    key = dfa_cache.cache_key()
+    grammar = tmp_path / "TyC.g4"
+    grammar.write_text(open(dfa_cache.GRAMMAR_FILE).read() + "\n// edited\n")
+    monkeypatch.setattr(dfa_cache, "GRAMMAR_FILE", str(grammar))
+    assert dfa_cache.cache_key() != key
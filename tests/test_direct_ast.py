@@ -0,0 +1,113 @@
+"""
+Direct-to-AST parsing test cases for TyC compiler
+"""
+
+import sys
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.astgen.direct_ast import parse_to_ast
+from src.frontend.parsing import (
+    EXPR_ANTLR,
+    EXPR_PRATT,
+    MODE_LL,
+    MODE_SLL,
+    ParseStats,
+    make_parser,
+    parse,
+)
+from tests.utils import PARSER_CORPUS, SOURCE, ast_gen_corpus, positions
+
+
+def outcome(build, source):
+    try:
+        ast = build(source)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", None
+    return str(ast), positions(ast)
+
+
+@pytest.mark.parametrize("expressions", [EXPR_ANTLR, EXPR_PRATT])
+def test_matches_ast_generation(expressions):
+    def two_phase(source):
+        return ASTGeneration().visit(parse(make_parser(source, expressions=expressions)))
+
+    def direct(source):
+        return parse_to_ast(make_parser(source, expressions=expressions))
+
+    for source in [SOURCE, *ast_gen_corpus(), *PARSER_CORPUS]:
+        assert outcome(direct, source) == outcome(two_phase, source), source
+
+
+def test_errors():
+    def direct(source):
+        return outcome(lambda s: parse_to_ast(make_parser(s)), source)[0]
+
+    assert direct("void main() { x = ; }") == "SyntaxException: Error on line 1 col 18: ;"
+    callee = (
+        "ASTGenerationError: Error on line 1 col 14: callee must be a function name, not (f)"
+    )
+    assert direct("void main() { (f)(1); }") == callee
+    assert direct("void main() { (f)(1); (g)(2); }") == callee
+    # the call starting first, not the innermost one
+    assert direct("void main() { h((a)(1))(2); }") == (
+        "ASTGenerationError: Error on line 1 col 14: callee must be a function name, not h((a)(1))"
+    )
+    # the parse is finished first: a later syntax error wins
+    assert direct("void main() { (f)(1); x = ; }").startswith("SyntaxException")
+
+
+INVALID_CALLEES = [
+    "void m(){ h((a)(1))(2); }",
+    "void m(){ (a)(a)(a); }",
+    "void m(){ x = g((a)(1), (b)(2)); }",
+    "void m(){ x = 1 + (a)(1) * (b)(2); }",
+    "void m(){ if (f(1)(2)) x=1; else y = g(3)(4); }",
+    "void m(){ for (a(1)(2);; b(1)(2)) c(1)(2); }",
+    "void m(){ for (;a(1)(2); b(1)(2)) c(1)(2); }",
+    "void m(){ switch (a(1)(2)) { case 1: b(1)(2); } }",
+    "void m(){ switch (x) { case 1: b(1)(2); default: c(3)(4); } }",
+    "void m(){ auto s = {f(1), (g)(2)}; return (h)(3); }",
+]
+
+
+@pytest.mark.parametrize("expressions", [EXPR_ANTLR, EXPR_PRATT])
+def test_invalid_callees_match_ast_generation(expressions):
+    """With several invalid calls, the error reported is ASTGeneration's."""
+
+    def two_phase(source):
+        return ASTGeneration().visit(parse(make_parser(source, expressions=expressions)))
+
+    def direct(source):
+        return parse_to_ast(make_parser(source, expressions=expressions))
+
+    for source in INVALID_CALLEES:
+        assert outcome(direct, source) == outcome(two_phase, source), source
+
+
+def test_prediction_modes():
+    expected = ASTGeneration().visit(parse(make_parser(SOURCE)))
+    for mode in (MODE_SLL, MODE_LL):
+        ast = parse_to_ast(make_parser(SOURCE), mode=mode)
+        assert ast == expected and positions(ast) == positions(expected)
+    # the SLL stage fails, the parser is reset and the LL stage reports it
+    stats = ParseStats()
+    parser = make_parser("void main() { x = 1 +; }")
+    with pytest.raises(Exception, match="col 21"):
+        parse_to_ast(parser, stats=stats)
+    assert stats.ll_fallbacks == 1
+    assert parser.buildParseTrees and parser.getParseListeners() == []
+
+
+def test_long_chains():
+    n = 10 * sys.getrecursionlimit()
+    terms = " + ".join(f"x{i % 10}" for i in range(n))
+    source = "void main() { r = " + terms + "; p.q" + ".m" * n + " = 1; }"
+    ast = parse_to_ast(make_parser(source, expressions=EXPR_ANTLR))
+    assert ast == parse_to_ast(make_parser(source, expressions=EXPR_PRATT))
+    chain = ast.decls[0].body.statements[0].expr.rhs
+    for _ in range(n - 1):
+        chain = chain.left
+    assert chain.name == "x0"
@@ -0,0 +1,146 @@
+"""
+Flat (struct-of-arrays) AST store test cases for TyC compiler
+"""
+
+import math
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.utils import nodes
+from src.utils.flat_ast import FlatAST, FlatVisitor
+from src.utils.node_schema import FIELDS, NODE_KINDS, VISIT_METHODS
+from src.utils.visitor import ASTVisitor
+from tests.utils import PARSER_CORPUS, SOURCE, ASTGenerator, positions
+
+
+def ast_of(source):
+    ast = ASTGenerator(source).generate()
+    assert isinstance(ast, nodes.Program), ast
+    return ast
+
+
+def assert_round_trip(ast):
+    back = FlatAST.from_tree(ast).to_tree()
+    assert str(back) == str(ast)
+    assert positions(back) == positions(ast)
+
+
+def test_schema_covers_every_node_class():
+    assert set(FIELDS) == set(NODE_KINDS)
+    for cls in NODE_KINDS:
+        assert hasattr(ASTVisitor, VISIT_METHODS[cls]), cls
+        slots = [s for c in cls.__mro__ for s in getattr(c, "__slots__", ())]
+        assert {name for name, _ in FIELDS[cls]} == set(slots) - {"span", "source", "_hash"}
+
+
+def test_round_trip():
+    assert_round_trip(ast_of(SOURCE))
+
+
+def test_round_trip_parser_corpus():
+    for source in PARSER_CORPUS:
+        ast = ASTGenerator(source).generate()
+        if isinstance(ast, nodes.Program):
+            assert_round_trip(ast)
+
+
+def test_round_trip_scalars():
+    values = [
+        nodes.IntLiteral(0),
+        nodes.IntLiteral(2**63 - 1),
+        nodes.IntLiteral(2**80),
+        nodes.IntLiteral(-(2**70)),
+        nodes.FloatLiteral(-0.0),
+        nodes.FloatLiteral(1e308),
+        nodes.FloatLiteral(math.inf),
+        nodes.StringLiteral(""),
+        nodes.StringLiteral("a\\nb"),
+        nodes.FuncCall(None, []),
+    ]
+    back = FlatAST.from_tree(nodes.StructLiteral(values)).to_tree()
+    assert [type(v) for v in back.values] == [type(v) for v in values]
+    assert [getattr(v, "value", None) for v in back.values] == [
+        getattr(v, "value", None) for v in values
+    ]
+    assert math.copysign(1, back.values[4].value) == -1
+    assert back.values[-1].name is None
+
+
+def test_types_come_back_shared():
+    back = FlatAST.from_tree(ast_of(SOURCE)).to_tree()
+    point, f, _ = back.decls
+    assert point.members[0].member_type is nodes.IntType()
+    assert f.params[1].param_type is nodes.StructType("Point")
+
+
+def test_columns():
+    flat = FlatAST.from_tree(ast_of("void main() { x = a + 1; }"))
+    assert len(flat) == 10
+    assert flat.node_class(0) is nodes.Program and flat.parent(0) is None
+    (binary,) = flat.ids_of(nodes.BinaryOp)
+    fields = flat.fields(binary)
+    assert fields["operator"] == "+" == flat.value(binary)
+    assert flat.node_class(fields["left"]) is nodes.Identifier
+    assert flat.value(fields["left"]) == "a"
+    assert flat.value(fields["right"]) == 1
+    assert (flat.line(binary), flat.column(binary)) == (1, 18)
+    assert flat.node_class(flat.parent(binary)) is nodes.AssignExpr
+    (func,) = flat.ids_of(nodes.FuncDecl)
+    assert flat.fields(func)["params"] == []
+    assert flat.line(flat.field(func, "return_type")) is None  # shared type node
+    assert flat.strings == ["main", "x", "a"]
+    assert flat.nbytes() == len(flat) * (1 + 4 * 5 + 8) + 4 * len(flat.children)
+
+
+def test_children_follow_parents():
+    flat = FlatAST.from_tree(ast_of(SOURCE))
+    for i in range(len(flat)):
+        for c in flat.child_ids(i):
+            assert c > i and flat.parent(c) == i
+
+
+def test_walk_is_preorder():
+    ast = ast_of(SOURCE)
+    flat = FlatAST.from_tree(ast)
+    flat_order = [
+        (flat.node_class(i).__name__, flat.position(i), flat.span(i))
+        for i in flat.walk()
+    ]
+    assert flat_order == positions(ast)
+
+
+def test_subtree_to_tree():
+    flat = FlatAST.from_tree(ast_of(SOURCE))
+    (while_stmt,) = flat.ids_of(nodes.WhileStmt)
+    assert str(flat.to_tree(while_stmt)) == (
+        "WhileStmt(while PrefixOp(!BinaryOp(MemberAccess(Identifier(p).x), >=, "
+        "IntLiteral(3))) do ExprStmt(PrefixOp(--MemberAccess(Identifier(p).x))))"
+    )
+
+
+def test_flat_visitor():
+    class Names(FlatVisitor):
+        def __init__(self, ast):
+            super().__init__(ast)
+            self.names = []
+
+        def visit_identifier(self, i, o=None):
+            self.names.append(self.ast.value(i))
+
+        def visit_func_call(self, i, o=None):
+            self.names.append(self.ast.value(i) + "()")
+            self.generic_visit(i, o)
+
+    flat = FlatAST.from_tree(ast_of(SOURCE))
+    visitor = Names(flat)
+    visitor.visit(0)
+    assert visitor.names == [
+        "p", "a", "a", "i", "i", "i", "p", "f()", "i", "p",
+        "p", "p", "p", "printInt()",
+    ]  # fmt: skip
+
+
+def test_rejects_non_nodes():
+    with pytest.raises(TypeError):
+        FlatAST.from_tree(nodes.Program(["not a node"]))
@@ -0,0 +1,175 @@
+"""
+Incremental reparsing test cases for TyC compiler
+"""
+
+import random
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.incremental import IncrementalParser
+from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT, make_parser, parse
+from src.utils.error_listener import SyntaxException
+from src.utils.nodes import FuncDecl
+from tests.utils import SOURCE, ast_gen_corpus, positions
+
+
+PROGRAM = "".join(
+    f"struct S{i} {{ int x; }};\n"
+    f"int f{i}(int a) {{\n  while (a > {i}) {{ a = a - 1; }}\n  return a;\n}}\n"
+    for i in range(20)
+)
+
+
+def token_fields(tokens):
+    return [(t.type, t.text, t.start, t.stop, t.line, t.column, t.tokenIndex) for t in tokens]
+
+
+def assert_matches_full_parse(doc, expressions=None):
+    parser = make_parser(doc.text, expressions=expressions)
+    program = ASTGeneration().visit(parse(parser))
+    assert not doc.stale
+    assert doc.program == program and positions(doc.program) == positions(program)
+    assert doc.program.span == program.span
+    assert token_fields(doc.tokens) == token_fields(parser.getTokenStream().tokens)
+
+
+def parses(text):
+    try:
+        parse(make_parser(text))
+        return True
+    except Exception:
+        return False
+
+
+def try_edit(doc, start, end, text):
+    """Edit *doc*; check it against a full parse if the new text parses."""
+    try:
+        doc.edit(start, end, text)
+    except Exception:
+        assert doc.stale and not parses(doc.text)
+        return
+    assert_matches_full_parse(doc)
+
+
+def type_text(doc, start, end, text):
+    """Replace start..end by *text* as typed: one character at a time."""
+    try_edit(doc, start, end, "")
+    for i, char in enumerate(text):
+        try_edit(doc, start + i, start + i, char)
+
+
+@pytest.mark.parametrize("expressions", [EXPR_ANTLR, EXPR_PRATT])
+def test_edits_match_full_parse(expressions):
+    doc = IncrementalParser(PROGRAM, expressions=expressions)
+    assert_matches_full_parse(doc, expressions)
+    edits = [
+        ("return a;", "a = a * 2;\n  return a;"),  # a statement
+        ("return a;\n}", "return a;\n\n\n}"),  # lines added before the rest
+        ("a = a * 2;\n  ", ""),  # a deletion
+        ("(a > 12)", "(a > 12 && a < 100)"),  # a longer expression
+        ("int f15(int a)", "float f15(int a, float b)"),  # a signature
+    ]
+    for old, new in edits:
+        at = doc.text.index(old, len(doc.text) // 3)
+        doc.edit(at, at + len(old), new)
+        assert_matches_full_parse(doc, expressions)
+    doc.edit(0, 0, "/* header\n */ ")  # a comment before everything
+    assert_matches_full_parse(doc, expressions)
+    doc.edit(len(doc.text), len(doc.text), "void tail() { }")  # a declaration at the end
+    assert_matches_full_parse(doc, expressions)
+
+
+def test_untouched_declarations_are_reused():
+    doc = IncrementalParser(PROGRAM)
+    decls = list(doc.program.decls)
+    tokens = list(doc.tokens)
+    s4_offset = decls[8].start_offset
+    f3 = decls[7]
+    at = PROGRAM.index("a - 1", f3.start_offset)
+    splice = doc.edit(at, at + 1, "total")
+    assert (splice.index, splice.removed) == (7, [f3])
+    assert [d.name for d in splice.added] == ["f3"]
+    assert all(new is old for new, old in zip(doc.program.decls, decls) if new.name != "f3")
+    # only the edited token was lexed again; the tokens after it were moved
+    assert sum(new is not old for new, old in zip(doc.tokens, tokens)) == 2
+    assert doc.tokens[-1] is tokens[-1]
+    moved = doc.program.decls[8]
+    assert moved.name == "S4" and moved.start_offset == s4_offset + 4
+    assert moved.position(doc.program.source) == (21, 0)
+    assert_matches_full_parse(doc)
+
+
+def test_scattered_edits_without_reads():
+    """Edits back and forth, with the shifts they leave pending in between."""
+    rng = random.Random(7)
+    doc = IncrementalParser(PROGRAM)
+    for n in range(80):
+        comments = [i for i in range(len(doc.text)) if doc.text.startswith("/* x\n */", i)]
+        if comments and rng.random() < 0.4:
+            at = rng.choice(comments)
+            doc.edit(at, at + 8, "")
+        elif rng.random() < 0.2:
+            at = doc.text.index("a - ", rng.randrange(len(doc.text) // 2)) + 4
+            doc.edit(at, at + 1, str(rng.randrange(100)))
+        else:
+            at = rng.choice([i for i, c in enumerate(doc.text) if c in " \n"])
+            doc.edit(at, at, rng.choice(["\n", "  ", "\n\n  ", "/* x\n */"]))
+        if n % 40 == 39:
+            assert_matches_full_parse(doc)
+
+
+def test_declarations_split_and_merge():
+    doc = IncrementalParser(PROGRAM)
+    at = PROGRAM.index("return a;")
+    # a brace and a header inside f0 split it in two
+    splice = doc.edit(at, at, "}\nvoid g() {\n  ")
+    assert [d.name for d in splice.removed] == ["f0"]
+    assert [d.name for d in splice.added] == ["f0", "g"]
+    assert [d.name for d in doc.program.decls[:4]] == ["S0", "f0", "g", "S1"]
+    assert_matches_full_parse(doc)
+    splice = doc.edit(at, at + 14, "")
+    assert [d.name for d in splice.removed] == ["f0", "g"]
+    assert len(doc.program.decls) == 40
+    assert_matches_full_parse(doc)
+
+
+def test_typing_through_errors():
+    program = PROGRAM[: PROGRAM.index("struct S3")]
+    for source in [SOURCE, *ast_gen_corpus()[:4]]:
+        if not parses(source):
+            continue
+        doc = IncrementalParser(program)
+        at = doc.program.decls[3].start_offset
+        type_text(doc, at, at, source + "\n")
+        assert_matches_full_parse(doc)
+        type_text(doc, at, at + len(source) + 1, "")
+        assert doc.text == program
+        assert_matches_full_parse(doc)
+
+
+def test_stale_document_catches_up():
+    doc = IncrementalParser("void f() { }\n")
+    with pytest.raises(SyntaxException, match="line 2 col 14"):
+        doc.edit(13, 13, "int g() { x = ; }")
+    assert doc.stale and doc.text.endswith("x = ; }") and len(doc.program.decls) == 1
+    with pytest.raises(Exception):
+        doc.edit(0, 0, "é")  # a lexical error
+    with pytest.raises(SyntaxException):
+        doc.edit(0, 1, "")  # back to the text before, which does not parse either
+    doc.edit(27, 28, "1;")
+    assert_matches_full_parse(doc)
+    assert isinstance(doc.program.decls[1], FuncDecl) and doc.program.decls[1].name == "g"
+    with pytest.raises(ValueError):
+        doc.edit(5, 100, "")
+
+
+def test_non_ascii_text():
+    doc = IncrementalParser(SOURCE)
+    at = SOURCE.index('"text"') + 1
+    doc.edit(at, at + 4, "tëxt")
+    assert_matches_full_parse(doc)
+    doc.edit(0, 0, 'void k() { auto s = "ü"; }\n')
+    assert_matches_full_parse(doc)
+    assert doc.program.decls[0].body.statements[0].init_value.value == "ü"
@@ -0,0 +1,91 @@
+"""
+Lazy function body test cases for TyC compiler
+"""
+
+import copy
+import pickle
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.lazy import LazyBody, parse_lazy
+from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT, ParseStats, make_parser, parse
+from src.utils.error_listener import SyntaxException
+from src.utils.nodes import BlockStmt, FuncDecl, IntType, LazyNode, StructDecl
+from tests.utils import PARSER_CORPUS, SOURCE, ast_gen_corpus, positions
+
+
+def is_built(func):
+    return FuncDecl.body.is_built(func)
+
+
+def outcome(build, source):
+    try:
+        ast = build(source)
+        return str(ast), positions(ast)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", None
+
+
+@pytest.mark.parametrize("expressions", [EXPR_ANTLR, EXPR_PRATT])
+def test_bodies_match_eager_parse(expressions):
+    def eager(source):
+        return ASTGeneration().visit(parse(make_parser(source, expressions=expressions)))
+
+    for source in [SOURCE, *ast_gen_corpus(), *PARSER_CORPUS]:
+        assert outcome(lambda s: parse_lazy(s, expressions=expressions), source) == outcome(
+            eager, source
+        ), source
+
+
+def test_signatures_without_bodies():
+    program = parse_lazy(
+        "struct P { int x; };\nint f(int a, P p) { if (a) { return {1}; } }\nvoid g() { }"
+    )
+    struct, f, g = program.decls
+    assert isinstance(struct, StructDecl) and struct.members[0].name == "x"
+    assert (f.name, f.return_type, [p.name for p in f.params]) == ("f", IntType(), ["a", "p"])
+    assert (f.position(program.source), g.position(program.source)) == ((2, 0), (3, 0))
+    assert not is_built(f) and not is_built(g)
+    assert isinstance(FuncDecl.body.slot.__get__(f), LazyBody)
+
+    body = f.body
+    assert isinstance(body, BlockStmt) and body.position(program.source) == (2, 18)
+    assert is_built(f) and f.body is body and not is_built(g)
+
+
+def test_bodies_count_in_the_callers_stats():
+    stats = ParseStats()
+    program = parse_lazy("void f() { }\nvoid g() { return; }", stats=stats)
+    assert stats.parses == 1
+    for decl in program.decls:
+        decl.body
+    assert stats.parses == 3
+
+
+def test_body_errors_surface_on_access():
+    program = parse_lazy("void f() { x = ; }\nvoid g() { (h)(1); }\nvoid k() { }")
+    f, g, k = program.decls
+    assert k.body.statements == []
+    with pytest.raises(SyntaxException, match="line 1 col 15"):
+        f.body
+    assert not is_built(f)  # still unparsed: the next read raises again
+    with pytest.raises(Exception, match="line 2 col 11: callee must be a function name"):
+        g.body
+    # braces are matched when the program is parsed
+    with pytest.raises(SyntaxException, match="line 1 col 21: <EOF>"):
+        parse_lazy("void f() { { x = 1; }")
+    with pytest.raises(SyntaxException):
+        parse_lazy("int f( { }")
+
+
+def test_copies_build_the_body():
+    program = parse_lazy(SOURCE)
+    eager = ASTGeneration().visit(parse(make_parser(SOURCE)))
+    restored = pickle.loads(pickle.dumps(program))
+    assert restored == eager and positions(restored) == positions(eager)
+    funcs = [d for d in program.decls if isinstance(d, FuncDecl)]
+    assert all(is_built(f) for f in funcs)
+    assert copy.deepcopy(parse_lazy(SOURCE)) == eager
+    assert not isinstance(restored.decls[-1].body, LazyNode)
@@ -0,0 +1,88 @@
+"""
+Non-throwing lexer error mode test cases for TyC compiler
+"""
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.Token import Token
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from build.TyCLexer import TyCLexer
+from lexererr import ErrorToken, LexicalDiagnostic
+from src.frontend.batch import LexError, tokenize_batch
+from src.frontend.scanner import TyCScanner
+from tests.utils import LEXER_CORPUS, fuzz_cases
+
+
+SOURCE = 'int @x = 1;\nx = "a\\q;\nprintString("open\n  y # z;'
+
+
+def collect(source, scanner=False):
+    lexer = TyCScanner(InputStream(source)) if scanner else TyCLexer(InputStream(source))
+    diagnostics = lexer.collectErrors()
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    tokens = [(t.type, t.text, t.channel, t.start, t.stop) for t in stream.tokens]
+    return tokens, diagnostics
+
+
+def test_raising_is_the_default():
+    with pytest.raises(ErrorToken, match="Error Token @"):
+        CommonTokenStream(TyCLexer(InputStream(SOURCE))).fill()
+
+
+def test_all_errors_in_one_pass():
+    """Every lexical error is recorded with kind, lexeme and span."""
+    tokens, diagnostics = collect(SOURCE)
+    assert diagnostics == [
+        LexicalDiagnostic("ErrorToken", "@", 4, 4, 1, 4),
+        LexicalDiagnostic("IllegalEscape", "a\\q", 16, 19, 2, 4),
+        LexicalDiagnostic("UncloseString", "open", 34, 38, 3, 12),
+        LexicalDiagnostic("ErrorToken", "#", 44, 44, 4, 4),
+    ]
+    assert [d.message for d in diagnostics] == [
+        "Error Token @",
+        "Illegal Escape In String: a\\q",
+        "Unclosed String: open",
+        "Error Token #",
+    ]
+    assert tokens[-1][0] == Token.EOF
+
+
+def test_error_tokens_are_hidden_from_the_parser():
+    tokens, _ = collect("int @x;")
+    visible = [text for _, text, channel, _, _ in tokens if channel == Token.DEFAULT_CHANNEL]
+    assert visible == ["int", "x", ";", "<EOF>"]
+
+
+def test_caller_supplied_list():
+    lexer = TyCLexer(InputStream("@ #"))
+    sink = []
+    assert lexer.collectErrors(sink) is sink
+    CommonTokenStream(lexer).fill()
+    assert [d.lexeme for d in sink] == ["@", "#"]
+
+
+def test_messages_match_raising_mode():
+    """The first diagnostic is exactly the error the raising lexer throws."""
+    for source in LEXER_CORPUS:
+        try:
+            CommonTokenStream(TyCLexer(InputStream(source))).fill()
+            expected = None
+        except Exception as e:
+            expected = str(e)
+        _, diagnostics = collect(source)
+        assert (diagnostics[0].message if diagnostics else None) == expected, source
+
+
+def test_scanner_collects_the_same_diagnostics():
+    for source in [SOURCE, *LEXER_CORPUS, *fuzz_cases(300)]:
+        assert collect(source, scanner=True) == collect(source), repr(source)
+
+
+def test_batch_all_errors():
+    batch = tokenize_batch(["int @x;", SOURCE, "ok;"], all_errors=True)
+    assert [e.source for e in batch.errors] == [0, 1, 1, 1, 1]
+    assert batch.errors[0] == LexError(0, "ErrorToken", "Error Token @", 4, 1, 4)
+    assert batch.texts(0, "int @x;") == ["int", "x", ";"]
+    assert batch.texts(2, "ok;") == ["ok", ";"]
@@ -0,0 +1,113 @@
+"""
+AST node class test cases for TyC compiler
+"""
+
+import inspect
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.utils import nodes
+from src.utils.spans import LineIndex
+from tests.utils import ASTGenerator
+
+
+NODE_CLASSES = [
+    cls
+    for _, cls in inspect.getmembers(nodes, inspect.isclass)
+    if issubclass(cls, nodes.ASTNode)
+]
+
+
+@pytest.mark.parametrize("cls", NODE_CLASSES, ids=lambda cls: cls.__name__)
+def test_every_class_declares_slots(cls):
+    assert "__slots__" in vars(cls)
+
+
+def test_nodes_have_no_instance_dict():
+    ast = ASTGenerator(
+        "struct P { int x; }; int f(int a) { P p = {a}; return p.x + 1; } void main() { f(1); }"
+    ).generate()
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        assert not hasattr(node, "__dict__"), type(node).__name__
+        for cls in type(node).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                value = getattr(node, name)
+                if isinstance(value, nodes.ASTNode):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(value)
+
+
+def test_constructors_and_str_unchanged():
+    node = nodes.VarDecl(None, "x", nodes.BinaryOp(nodes.IntLiteral(1), "+", nodes.FloatLiteral(2.5)))
+    assert str(node) == "VarDecl(auto, x = BinaryOp(IntLiteral(1), +, FloatLiteral(2.5)))"
+    source = LineIndex("ab\ncd\nefgh")
+    assert (node.position(source), node.span) == (None, None)
+    node.set_span(6, 10)
+    assert node.position(source) == (3, 0) and node.position(None) is None
+    assert (node.start_offset, node.end_offset) == (6, 10)
+    assert str(nodes.StringLiteral("a")) == "StringLiteral('a')"
+
+
+def test_unknown_attributes_are_rejected():
+    with pytest.raises(AttributeError):
+        nodes.Identifier("x").typ = nodes.IntType()
+
+
+def test_types_are_shared():
+    assert nodes.IntType() is nodes.IntType()
+    assert nodes.VoidType() is not nodes.IntType()
+    assert nodes.StructType("Point") is nodes.StructType("".join(["Po", "int"]))
+    assert nodes.StructType("Point") is not nodes.StructType("Line")
+    assert nodes.StructType("Point") != nodes.StructType("Line")
+    assert str(nodes.StructType("Point")) == "StructType(Point)"
+
+
+def test_type_constructor_signatures():
+    assert nodes.StructType(struct_name="Point") is nodes.StructType("Point")
+    with pytest.raises(TypeError):
+        nodes.IntType(5)
+    with pytest.raises(TypeError):
+        nodes.VoidType(name="v")
+    with pytest.raises(TypeError):
+        nodes.StructType()
+    with pytest.raises(TypeError):
+        nodes.StructType("Point", "Line")
+
+
+def test_types_are_immutable():
+    point = nodes.StructType("Point")
+    with pytest.raises(AttributeError):
+        point.struct_name = "Line"
+    with pytest.raises(AttributeError):
+        nodes.IntType().span = 1
+    with pytest.raises(AttributeError):
+        del point.struct_name
+    assert point.position(LineIndex("Point")) is None
+
+
+def test_types_survive_pickle_and_copy():
+    import copy
+    import pickle
+
+    for node in (nodes.FloatType(), nodes.StructType("Point")):
+        assert pickle.loads(pickle.dumps(node)) is node
+        assert copy.deepcopy(node) is node
+
+
+def test_generated_types_and_names_are_shared():
+    ast = ASTGenerator(
+        "struct P { int x; int y; }; int f(int a, P p) { int b = a; P q = p; return q.x; }"
+    ).generate()
+    struct, func = ast.decls
+    x, y = struct.members
+    assert x.member_type is y.member_type is func.return_type is nodes.IntType()
+    assert func.params[1].param_type is nodes.StructType("P")
+    decl_b, decl_q, ret = func.body.statements
+    assert decl_q.var_type is func.params[1].param_type
+    assert decl_b.init_value.name is func.params[0].name
+    assert decl_q.init_value.name is func.params[1].name
+    assert ret.expr.member is x.name
@@ -0,0 +1,95 @@
+"""
+Two-stage (SLL then LL) parse mode test cases for TyC compiler
+"""
+
+import pytest
+from tests.utils import Parser
+from src.frontend.parsing import (
+    MODE_AUTO,
+    MODE_LL,
+    MODE_SLL,
+    ParseStats,
+    make_parser,
+    parse,
+    parse_program,
+)
+from src.utils.error_listener import SyntaxException
+
+
+VALID = """struct Point { int x; int y; };
+int add(int a, int b) { return a + b; }
+void main() {
+    Point p = {1, 2};
+    auto s = add(p.x, p.y) * 3;
+    for (int i = 0; i < 10; i++) { if (i % 2 == 0) continue; s = s - i; }
+    switch (s) { case 1: break; default: printInt(s); }
+}"""
+
+
+def test_auto_mode_sll_success():
+    """A valid program is accepted by the SLL stage alone."""
+    stats = ParseStats()
+    tree = parse_program(VALID, MODE_AUTO, stats)
+    assert tree.getChildCount() == 4
+    assert stats.sll_successes == 1
+    assert stats.ll_fallbacks == 0
+    assert stats.fallback_rate == 0.0
+
+
+def test_modes_build_same_tree():
+    """SLL, LL and two-stage parses produce identical parse trees."""
+    trees = []
+    for mode in (MODE_AUTO, MODE_SLL, MODE_LL):
+        parser = make_parser(VALID)
+        tree = parse(parser, mode=mode, stats=ParseStats())
+        trees.append(tree.toStringTree(recog=parser))
+    assert trees[0] == trees[1] == trees[2]
+
+
+def test_forced_ll_mode():
+    """Forcing LL skips the SLL stage."""
+    stats = ParseStats()
+    parse_program(VALID, MODE_LL, stats)
+    assert stats.forced_ll == 1
+    assert stats.sll_successes == 0
+
+
+def test_forced_sll_mode():
+    """Forcing SLL never falls back."""
+    stats = ParseStats()
+    parse_program(VALID, MODE_SLL, stats)
+    assert stats.forced_sll == 1
+    assert stats.ll_fallbacks == 0
+
+
+def test_syntax_error_falls_back_to_ll():
+    """Errors are reported by the LL stage with the usual message."""
+    stats = ParseStats()
+    with pytest.raises(SyntaxException) as exc:
+        parse_program("void f() { int x = 5 }", MODE_AUTO, stats)
+    assert str(exc.value) == "Error on line 1 col 21: }"
+    assert stats.ll_fallbacks == 1
+    assert stats.fallback_rate == 1.0
+
+
+def test_error_message_matches_ll():
+    """The two-stage mode reports the same error as a plain LL parse."""
+    source = "void f() { x = a + * b; }"
+    messages = []
+    for mode in (MODE_AUTO, MODE_LL):
+        with pytest.raises(SyntaxException) as exc:
+            parse_program(source, mode, ParseStats())
+        messages.append(str(exc.value))
+    assert messages[0] == messages[1]
+
+
+def test_unknown_mode():
+    """Unknown modes are rejected."""
+    with pytest.raises(ValueError):
+        parse_program(VALID, "fast", ParseStats())
+
+
+def test_parser_wrapper_uses_two_stage():
+    """The test Parser wrapper still reports success and errors."""
+    assert Parser(VALID).parse() == "success"
+    assert Parser("void f() ;").parse() != "success"
@@ -0,0 +1,164 @@
+"""
+Precedence-climbing expression parser test cases for TyC compiler
+"""
+
+import random
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT, make_parser, parse
+from src.frontend.pratt import PrattExprContext, PrattTyCParser
+from src.frontend.recovery import parse_recovering
+from tests.utils import PARSER_CORPUS, positions
+
+
+def outcome(source, expressions):
+    """AST string and positions, or the error message, for one parser."""
+    try:
+        ast = ASTGeneration().visit(parse(make_parser(source, expressions=expressions)))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return str(ast), positions(ast)
+
+
+def assert_same(source):
+    assert outcome(source, EXPR_PRATT) == outcome(source, EXPR_ANTLR), source
+
+
+EXPRESSIONS = [
+    "a = b = c + 1",
+    "x = 1 + 2 * 3 - 4 / 5 % 6",
+    "x = a || b && c || !d",
+    "x = a < b == c >= d != e",
+    "x = -a * +b - !c",
+    "x = - -a",
+    "x = ++a + b++ - --c - d--",
+    "x = ++a.b",
+    "x = a.b.c.d",
+    "x = f(1, g(2), h())",
+    "x = f(a = 1, b)",
+    "(x) = 1",
+    "(a).b = 2",
+    "((a.b)).c = (d = e)",
+    "x = ((1 + 2)) * (3)",
+    "x = (a + b).c",
+    "x = f().c",
+    "x = {1, 2}.a",
+    "printString(\"a\" + \"b\")",
+    "x = 1.5e3 * .5 + 2.",
+    "a++",
+    "(a + b)",
+]
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_expressions(expression):
+    assert_same("void main() { " + expression + "; }")
+
+
+def test_expression_contexts():
+    """Every statement that holds an expression or a case label."""
+    assert_same(
+        "struct P { int x; }; int f(int a) { return a * 2; }\n"
+        "void main() {\n"
+        "  auto a = 1 + 2; int b = f(a); P p = {a, b};\n"
+        "  if (a < b) a = b; else { b = a; }\n"
+        "  while (a != 0) --a;\n"
+        "  for (int i = 0; i < 10; ++i) p.x = p.x + i;\n"
+        "  for (a = 1; ; ) break;\n"
+        "  switch (a + 1) { case 1 + 2: case -3: a++; break; default: return; }\n"
+        "}"
+    )
+
+
+def test_parser_corpus():
+    for source in PARSER_CORPUS:
+        assert_same(source)
+
+
+def random_expression(rng, depth):
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice(["a", "b", "1", "2.5", '"s"', "f()", "p.x"])
+    choice = rng.randrange(8)
+    sub = lambda: random_expression(rng, depth - 1)  # noqa: E731
+    if choice < 3:
+        op = rng.choice(["||", "&&", "==", "!=", "<", "<=", ">", ">=", "+", "-", "*", "/", "%"])
+        return f"{sub()} {op} {sub()}"
+    if choice == 3:
+        return f"{rng.choice(['!', '-', '+', '++', '--'])}{sub()}"
+    if choice == 4:
+        return f"({sub()})"
+    if choice == 5:
+        return f"g({sub()}, {sub()})"
+    if choice == 6:
+        return f"({sub()}).m"
+    return f"a{rng.choice(['++', '--'])}"
+
+
+def test_random_expressions():
+    rng = random.Random(2026)
+    for _ in range(300):
+        assert_same(f"void main() {{ x = {random_expression(rng, 5)}; }}")
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "void main() { x = 1 + ; }",
+        "void main() { x = (1 + 2; }",
+        "void main() { x = f(1, ); }",
+        "void main() { x = a. ; }",
+        "void main() { x = a.1; }",
+        "void main() { x = {}; }",
+        "void main() { a + b = c; }",
+        "void main() { x = * 2; }",
+        "void main() { x = (f)(1); }",
+        "void main() { x = a.b(1); }",
+        "void main() { (a)(a)(a); }",
+        "void main() { h((a)(1))(2); }",
+        "void main() { x = (g(1)(2))(3) + (b)(4); }",
+        "void main() { x = 1 2; }",
+        "void main() { switch (x) { case : } }",
+    ],
+)
+def test_errors(source):
+    """Syntax and AST errors are reported at the same token."""
+    assert_same(source)
+
+
+def test_contexts_carry_the_ast():
+    parser = make_parser("a + b * c", expressions=EXPR_PRATT)
+    assert isinstance(parser, PrattTyCParser)
+    ctx = parser.expr()
+    assert isinstance(ctx, PrattExprContext)
+    assert str(ctx.ast) == "BinaryOp(Identifier(a), +, BinaryOp(Identifier(b), *, Identifier(c)))"
+    assert ctx.getText() == "a+b*c"
+    assert (ctx.start.text, ctx.stop.text) == ("a", "c")
+
+
+def test_unknown_expression_parser():
+    with pytest.raises(ValueError):
+        make_parser("", expressions="yacc")
+
+
+def test_recovery_with_pratt(monkeypatch):
+    """The recovering parse mode resynchronises after expression errors too.
+
+    ANTLR repairs single missing/extra tokens inside an expression, the
+    Pratt parser drops the whole expression instead, so only the first error
+    is the same.
+    """
+    source = "void f() { x = 1 + ; y = 2; }\nvoid g() { z = (3; }\nvoid main() {}"
+    expected = parse_recovering(source)
+    monkeypatch.setattr("src.frontend.parsing.EXPR_PARSER", EXPR_PRATT)
+    result = parse_recovering(source)
+    assert [e.message for e in result.errors] == [
+        "Error on line 1 col 19: ;",
+        "Error on line 2 col 17: ;",
+    ]
+    assert result.errors[0].message == expected.errors[0].message
+    f, g, main = result.ast().decls
+    assert str(f.body) == "BlockStmt([ExprStmt(AssignExpr(Identifier(y) = IntLiteral(2)))])"
+    assert (g.name, main.name) == ("g", "main")
@@ -0,0 +1,127 @@
+"""
+Decision-level parser profiling test cases for TyC compiler
+"""
+
+import json
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from build.TyCParser import TyCParser
+from src.frontend.parsing import MODE_AUTO, MODE_LL, MODE_SLL, ParseStats, make_parser, parse
+from src.frontend.profiling import ParserProfile, ProfilingATNSimulator, main
+
+
+SOURCE = """struct P { int x; int y; };
+int f(int n) { if (n < 2) return 1; else return n * f(n - 1); }
+void main() {
+    P p = {1, 2};
+    P q;
+    q = p;
+    (p).x = -q.y++;
+}"""
+
+
+def by_rule(profile):
+    result = {}
+    for d in profile.active():
+        result.setdefault(d.rule, []).append(d)
+    return result
+
+
+def test_profiled_parse_builds_the_same_tree():
+    expected = make_parser(SOURCE)
+    expected_tree = parse(expected, mode=MODE_LL, stats=ParseStats())
+    parser = make_parser(SOURCE)
+    parser._interp = ProfilingATNSimulator(parser)
+    tree = parse(parser, mode=MODE_LL, stats=ParseStats())
+    assert tree.toStringTree(recog=parser) == expected_tree.toStringTree(recog=expected)
+    assert any(d.invocations for d in parser._interp.decisions)
+
+
+def test_decisions_map_to_rules():
+    profile = ParserProfile(MODE_SLL)
+    profile.add(SOURCE)
+    rules = by_rule(profile)
+    assert {"blockItem", "expr", "condExpr"} <= set(rules)
+    assert set(rules) <= set(TyCParser.ruleNames)
+    kinds = {d.kind for d in rules["condExpr"]}
+    assert "precedence loop" in kinds
+    for d in profile.active():
+        assert d.sll_min_look >= 1
+        assert d.sll_min_look <= d.sll_total_look / d.invocations <= d.sll_max_look
+        assert d.sll_dfa_transitions + d.sll_atn_transitions >= d.invocations
+        assert d.ll_fallbacks == 0 and d.ll_total_look == 0  # SLL only
+
+
+def test_blockitem_needs_two_tokens():
+    """`P q;` vs `q = p;`: blockItem cannot decide on the first ID alone."""
+    profile = ParserProfile(MODE_SLL)
+    profile.add("void main() { P q; q = p; }")
+    (block_item,) = by_rule(profile)["blockItem"]
+    assert block_item.invocations == 2
+    assert block_item.sll_max_look == 2
+
+
+def test_full_context_fallbacks_in_ll_mode():
+    """The struct initializer `{1, 2}` is ambiguous with a struct-literal expr."""
+    profile = ParserProfile(MODE_LL)
+    profile.add(SOURCE)
+    (var_decl,) = by_rule(profile)["varDecl"]
+    assert var_decl.ll_fallbacks >= 1
+    assert var_decl.ambiguities >= 1
+    assert var_decl.ll_max_look >= 1 and var_decl.max_look_at is not None
+    assert var_decl.ll_atn_transitions >= var_decl.ll_fallbacks
+
+
+def test_ll_fallback_counts_the_ll_pass_only():
+    """An input that SLL cannot parse is profiled as its LL pass alone."""
+    source = SOURCE + "\nvoid g() { int x = 5 }"
+
+    def counts(profile):
+        return {
+            d.decision: (d.invocations, d.sll_total_look, d.ll_total_look, d.ll_fallbacks)
+            for d in profile.active()
+        }
+
+    auto = ParserProfile(MODE_AUTO)
+    auto.add(source)
+    ll = ParserProfile(MODE_LL)
+    ll.add(source)
+    assert auto.stats.ll_fallbacks == 1 and len(auto.failures) == 1
+    assert counts(auto) == counts(ll)
+
+
+def test_profile_accumulates_over_sources():
+    profile = ParserProfile(MODE_SLL)
+    profile.add(SOURCE)
+    once = {d.decision: d.invocations for d in profile.active()}
+    profile.add(SOURCE)
+    twice = {d.decision: d.invocations for d in profile.active()}
+    assert twice == {k: 2 * v for k, v in once.items()}
+    assert profile.files == 2 and profile.stats.parses == 2
+
+
+def test_failures_are_recorded():
+    profile = ParserProfile()
+    profile.add("void main() { x = ; }", "bad.tyc")
+    assert profile.failures == [("bad.tyc", "Error on line 1 col 18: ;")]
+
+
+def test_cli_writes_json(tmp_path, capsys):
+    source = tmp_path / "a.tyc"
+    source.write_text(SOURCE)
+    out = tmp_path / "profile.json"
+    assert main([str(source), "--mode", "ll", "--json", str(out), "--top", "3"]) == 0
+    table = capsys.readouterr().out.splitlines()
+    assert table[0].split()[:3] == ["decision", "rule", "kind"]
+    assert len(table) == 1 + 3 + 1
+    data = json.loads(out.read_text())
+    assert data["mode"] == "ll" and data["files"] == 1
+    assert data["decisions"][0]["time_ns"] >= data["decisions"][-1]["time_ns"]
+    assert {"rule", "invocations", "sll_max_look", "ll_fallbacks", "sll_avg_look"} <= set(
+        data["decisions"][0]
+    )
+
+
+def test_cli_usage():
+    assert main([]) == 2
+    assert main(["a.tyc", "--mode", "fast"]) == 2
@@ -0,0 +1,95 @@
+"""
+Recovering (multi-error) parse mode test cases for TyC compiler
+"""
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.frontend.recovery import parse_recovering
+from tests.utils import PARSER_CORPUS, ASTGenerator, Parser
+
+
+BROKEN = """int f() { int x = ; return 1; }
+void g() { x = 1 + * 2; y = 3; }
+struct S { int a; float ; int b; };
+void h() { if (x { y = 1; } z = 2; }
+void k() { a = b @ c; }
+void main() { printInt(1); }
+"""
+
+
+def messages(result):
+    return [e.message for e in result.errors]
+
+
+def test_all_errors_in_one_parse():
+    result = parse_recovering(BROKEN)
+    assert messages(result) == [
+        "Error on line 1 col 18: ;",
+        "Error on line 2 col 19: *",
+        "Error on line 3 col 24: ;",
+        "Error on line 4 col 17: {",
+        "Error on line 5 col 19: c",
+    ]
+    assert [d.message for d in result.lexical_errors] == ["Error Token @"]
+    assert not result.ok and not result.truncated
+
+
+def test_first_error_matches_raising_mode():
+    """The first recorded error is the one the raising pipeline stops at."""
+    for source in PARSER_CORPUS + [BROKEN.replace("@", "")]:
+        outcome = Parser(source).parse()
+        result = parse_recovering(source)
+        if outcome == "success":
+            assert result.ok, source
+        else:
+            firsts = messages(result)[:1] + [d.message for d in result.lexical_errors][:1]
+            assert outcome in firsts, source
+
+
+def test_partial_ast_keeps_intact_parts():
+    """Damaged statements and members are dropped, everything else survives."""
+    ast = parse_recovering(BROKEN).ast()
+    assert [d.name for d in ast.decls] == ["f", "g", "S", "h", "k", "main"]
+    f, g, s, h = ast.decls[:4]
+    assert str(f.body) == "BlockStmt([ReturnStmt(return IntLiteral(1))])"
+    assert len(g.body.statements) == 2
+    assert [m.name for m in s.members] == ["a", "b"]
+    assert str(h.body.statements[1]) == "ExprStmt(AssignExpr(Identifier(z) = IntLiteral(2)))"
+
+
+@pytest.mark.parametrize(
+    "source, names",
+    [
+        ("void f( { }  void main() {}", ["main"]),
+        ("int x;  void main() {}", ["main"]),
+        ("} ) void main() {} ; ; int g() { return 1; }", ["main", "g"]),
+        ("struct { int a; }; void main() {}", ["main"]),
+        ("void main() { x = 1; ", ["main"]),
+    ],
+)
+def test_top_level_resync(source, names):
+    """A broken declaration never hides the declarations after it."""
+    result = parse_recovering(source)
+    assert result.errors
+    assert [d.name for d in result.ast().decls] == names
+
+
+def test_error_budget():
+    source = "void main() { " + "x = ; " * 80 + "}\nvoid after() {}"
+    result = parse_recovering(source, max_errors=10)
+    assert len(result.errors) == 10
+    assert result.truncated
+    assert [d.name for d in result.ast().decls] == ["main"]
+
+
+def test_clean_source_matches_ast_generation():
+    source = "struct P { int x; }; int f(P p) { return p.x + 1; } void main() { printInt(f({2})); }"
+    result = parse_recovering(source)
+    assert result.ok
+    assert str(result.ast()) == str(ASTGenerator(source).generate())
+
+
+@pytest.mark.parametrize("mode", ["auto", "sll", "ll"])
+def test_all_prediction_modes(mode):
+    assert messages(parse_recovering(BROKEN, mode=mode)) == messages(parse_recovering(BROKEN))
@@ -0,0 +1,81 @@
+"""
+Differential test cases: hand-written TyCScanner vs the generated TyCLexer
+"""
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.frontend.scanner import TyCScanner
+from tests.utils import LEXER_CORPUS, PARSER_CORPUS, fuzz_cases, lex
+
+
+def lex_through_errors(source, scanner=False, limit=200):
+    """Keep lexing after errors, like a caller that catches and retries."""
+    lexer = TyCScanner(source) if scanner else TyCLexer(InputStream(source))
+    events = []
+    for _ in range(limit):
+        try:
+            t = lexer.nextToken()
+        except Exception as e:
+            events.append((type(e).__name__, str(e)))
+            continue
+        events.append((t.type, t.text, t.start, t.stop, t.line, t.column))
+        if t.type == -1:
+            break
+    return events
+
+
+def test_corpus_is_not_empty():
+    """The differential corpus really picks up the lexer tests."""
+    assert len(LEXER_CORPUS) >= 100
+    assert len(PARSER_CORPUS) >= 100
+
+
+@pytest.mark.parametrize("source", LEXER_CORPUS)
+def test_lexer_corpus_equivalence(source):
+    """Same tokens, positions and errors on every lexer test input."""
+    assert lex(source, scanner=True) == lex(source)
+
+
+def test_parser_corpus_equivalence():
+    """Same tokens on every parser test input."""
+    for source in PARSER_CORPUS:
+        assert lex(source, scanner=True) == lex(source), source
+
+
+def test_fuzz_equivalence():
+    """Same tokens and errors on random inputs, including after errors."""
+    for source in fuzz_cases():
+        assert lex_through_errors(source, scanner=True) == lex_through_errors(source), repr(source)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "/* unclosed comment",
+        "0123 00.5 1.e5 1.5e+ 1e 1E5x .5 . 1..2 a.5",
+        '"abc\\',
+        '"ab\\"',
+        '"a\\qb"',
+        '"line\nbreak"',
+        "a||b&&c|d&e",
+        "/**/ /***/ // tail",
+        "\r\n\r\n  x",
+    ],
+)
+def test_edge_cases(source):
+    """Longest-match corner cases of TyC.g4."""
+    assert lex_through_errors(source, scanner=True) == lex_through_errors(source)
+
+
+def test_scanner_as_token_source():
+    """The scanner plugs into CommonTokenStream and the generated parser."""
+    source = "struct P { int x; }; void main() { P p = {1}; printInt(p.x + 2); }"
+    parser = TyCParser(CommonTokenStream(TyCScanner(source)))
+    reference = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+    assert parser.program().toStringTree(recog=parser) == reference.program().toStringTree(
+        recog=reference
+    )
@@ -0,0 +1,128 @@
+"""
+Packed source span test cases for TyC compiler
+"""
+
+import pytest
+from antlr4 import InputStream
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT, make_parser, parse
+from src.frontend.streams import ByteInputStream, open_source
+from src.utils import ast_binary, nodes
+from src.utils.flat_ast import FlatAST
+from src.utils.spans import LineIndex, line_index_of, pack_span, span_end, span_start
+from tests.utils import PARSER_CORPUS, SOURCE, positions
+
+
+def ast_of(source, expressions=None):
+    return ASTGeneration().visit(parse(make_parser(source, expressions=expressions)))
+
+
+def test_pack_span():
+    span = pack_span(7, 2**31)
+    assert (span_start(span), span_end(span)) == (7, 2**31)
+    assert pack_span(0, 0) == 0
+    for start, end in ((-1, 2), (3, 2), (0, 2**32)):
+        with pytest.raises(ValueError):
+            pack_span(start, end)
+
+
+def test_line_index():
+    for text in ("ab\ncd\r\n\nefg", b"ab\ncd\r\n\nefg"):
+        index = LineIndex(text)
+        assert list(index.starts) == [0, 3, 7, 8] and len(index) == 4
+        assert index.position(0) == (1, 0)
+        assert index.position(2) == (1, 2)  # the newline ends its line
+        assert index.position(5) == (2, 2)  # "\r" is an ordinary character
+        assert index.position(7) == (3, 0)
+        assert index.position(10) == (4, 2)
+        assert index.offset(4, 2) == 10
+    assert list(LineIndex("").starts) == [0]
+
+
+def test_positions_match_tokens():
+    """Every token's line and column agree with the LineIndex of its stream."""
+    checked = 0
+    for source in PARSER_CORPUS + [SOURCE, "\n\n  int x;\r\n\tint y;"]:
+        stream = make_parser(source, compact=False).getTokenStream()
+        try:
+            stream.fill()
+        except Exception:
+            continue  # lexical error
+        for token in stream.tokens:
+            index = line_index_of(token.getInputStream())
+            assert index.position(token.start) == (token.line, token.column)
+            checked += 1
+    assert checked > 1000
+
+
+def test_node_spans_cover_their_text():
+    source = "void main() {\n  int x = (a + 1) * f(b);\n  x++;\n}"
+    for expressions in (EXPR_ANTLR, EXPR_PRATT):
+        program = ast_of(source, expressions)
+        decl = program.decls[0].body.statements[0]
+
+        def text(node):
+            return source[node.start_offset : node.end_offset]
+
+        assert text(program) == source
+        assert text(decl) == "int x = (a + 1) * f(b);"
+        assert text(decl.init_value) == "(a + 1) * f(b)"
+        assert text(decl.init_value.left) == "a + 1"
+        assert text(decl.init_value.right) == "f(b)"
+        assert text(program.decls[0].body.statements[1]) == "x++;"
+        assert decl.position(program.source) == (2, 2)
+        assert decl.init_value.right.position(program.source) == (2, 20)
+    assert positions(ast_of(source, EXPR_ANTLR)) == positions(ast_of(source, EXPR_PRATT))
+
+
+def test_the_program_holds_the_line_index():
+    program = ast_of(SOURCE)
+    assert program.source.name == "<bytes>"
+    assert not any(hasattr(node, "source") for node in nodes_of(program.decls))
+
+
+def test_streams(tmp_path):
+    path = tmp_path / "main.tyc"
+    path.write_text("void main() {\n  x = 1;\n}")
+    with open_source(str(path)) as stream:
+        program = ASTGeneration().visit(parse(make_parser(stream)))
+    statement = program.decls[0].body.statements[0]
+    assert statement.position(program.source) == (2, 2)  # the file is closed by now
+    assert program.source.name == str(path)
+    unicode = ast_of('void main() {\n  s = "é"; t = 1;\n}')  # an antlr4.InputStream
+    t = unicode.decls[0].body.statements[1]
+    assert (t.position(unicode.source), t.start_offset) == ((2, 11), 25)
+    assert line_index_of(InputStream("a\nb")).position(2) == (2, 0)
+    stream = ByteInputStream(b"a\nb")
+    assert line_index_of(stream) is line_index_of(stream)
+
+
+def test_spans_survive_binary_and_flat_round_trips():
+    program = ast_of(SOURCE)
+    for back in (ast_binary.loads(ast_binary.dumps(program)), FlatAST.from_tree(program).to_tree()):
+        assert positions(back) == positions(program)
+        assert list(back.source.starts) == list(program.source.starts)
+        assert back.source.name == program.source.name
+
+
+def test_flat_ast_of_a_subtree_takes_the_source():
+    program = ast_of(SOURCE)
+    decl = program.decls[-1]
+    flat = FlatAST.from_tree(decl, program.source)
+    assert flat.position(0) == decl.position(program.source) != None
+    assert FlatAST.from_tree(decl).position(0) is None
+
+
+def nodes_of(root):
+    result = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, nodes.ASTNode) and not isinstance(node, nodes.Type):
+            result.append(node)
+            stack.extend(getattr(node, name) for name in type(node).__slots__)
+    return result
@@ -0,0 +1,75 @@
+"""
+Streaming (per-declaration) front end test cases for TyC compiler
+"""
+
+import pytest
+from antlr4.Token import Token
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import EXPR_ANTLR, EXPR_PRATT, make_parser, parse
+from src.frontend.streaming import iter_decls, iter_file_decls
+from src.frontend.tokens import StreamingTokenStream
+from src.utils.error_listener import SyntaxException
+from src.utils.nodes import FuncDecl, Program, StructDecl
+from src.utils.spans import LineIndex
+from tests.utils import PARSER_CORPUS, ast_gen_corpus, positions
+
+
+PROGRAM = "".join(
+    f"struct S{i} {{ int x; }};\nint f{i}(int a) {{ while (a > {i}) {{ a = a - 1; }} return a; }}\n"
+    for i in range(50)
+)
+
+
+def outcome(decls):
+    try:
+        decls = list(decls())
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return str(Program(decls)), positions(decls)
+
+
+@pytest.mark.parametrize("expressions", [EXPR_ANTLR, EXPR_PRATT])
+def test_matches_whole_program_parse(expressions):
+    def whole(source):
+        return ASTGeneration().visit(parse(make_parser(source, expressions=expressions))).decls
+
+    for source in [PROGRAM, *ast_gen_corpus(), *PARSER_CORPUS]:
+        assert outcome(lambda: iter_decls(source, expressions=expressions)) == outcome(
+            lambda: whole(source)
+        ), source
+
+
+def test_declarations_are_yielded_as_parsed():
+    decls = iter_decls("struct P { int x; };\nvoid f() {}\nvoid g() { x = ; }")
+    assert isinstance(next(decls), StructDecl)
+    assert isinstance(next(decls), FuncDecl)
+    with pytest.raises(SyntaxException, match="line 3 col 15"):
+        next(decls)
+
+
+def test_token_window_stays_small():
+    parser = make_parser(PROGRAM, token_stream=StreamingTokenStream)
+    tokens = parser.getTokenStream()
+    largest = 0
+    while tokens.LA(1) != Token.EOF:
+        parse(parser, "globalDecl")
+        largest = max(largest, len(tokens.tokens))
+        tokens.discard()
+        assert len(tokens.tokens) <= 2  # LT(-1) and the next token
+    assert largest < 40 and len(tokens) > 50 * 30
+    with pytest.raises(IndexError):
+        tokens.get(0)
+    with pytest.raises(IndexError):
+        tokens.seek(0)
+    last = tokens.LT(-1)
+    assert last.text == "}" and tokens.get(last.tokenIndex) is last
+
+
+def test_file(tmp_path):
+    path = tmp_path / "big.tyc"
+    path.write_text(PROGRAM)
+    decls = list(iter_file_decls(str(path)))
+    assert len(decls) == 100 and decls == list(iter_decls(PROGRAM))
+    assert decls[-1].body.statements[0].position(LineIndex(PROGRAM))[0] == 100
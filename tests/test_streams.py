@@ -0,0 +1,121 @@
+"""
+Byte-buffer / memory-mapped character stream test cases for TyC compiler
+"""
+
+import pytest
+from antlr4 import InputStream
+from antlr4.Token import Token
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from build.TyCLexer import TyCLexer
+from src.frontend.parsing import ParseStats, parse_file
+from src.frontend.scanner import TyCScanner
+from src.frontend.streams import ByteInputStream, make_input_stream, open_source
+from tests.utils import LEXER_CORPUS, lex
+
+
+SOURCE = 'void main() {\n  string s = "hi\\n";\n  printString(s);\n}\n'
+
+
+def lex_stream(stream):
+    lexer = TyCLexer(stream)
+    tokens = []
+    while True:
+        try:
+            t = lexer.nextToken()
+        except Exception as e:
+            return tokens, (type(e).__name__, str(e))
+        tokens.append((t.type, t.text, t.channel, t.start, t.stop, t.line, t.column))
+        if t.type == -1:
+            return tokens, None
+
+
+def test_la_and_text_match_input_stream():
+    """LA, consume, seek and getText behave like antlr4.InputStream."""
+    ours, ref = ByteInputStream(SOURCE.encode()), InputStream(SOURCE)
+    for offset in (-1, 0, 1, 5, len(SOURCE) + 3):
+        assert ours.LA(offset) == ref.LA(offset)
+    for _ in range(7):
+        ours.consume()
+        ref.consume()
+    assert ours.index == ref.index
+    assert [ours.LA(i) for i in (-1, 1, 2)] == [ref.LA(i) for i in (-1, 1, 2)]
+    assert ours.getText(5, 9) == ref.getText(5, 9)
+    assert ours.getText(3, 10**6) == ref.getText(3, 10**6)
+    assert ours.getText(10**6, 10**6 + 1) == ""
+    ours.seek(10**6)
+    assert ours.index == len(SOURCE)
+    assert ours.LA(1) == Token.EOF
+
+
+def test_no_per_character_storage():
+    """The stream keeps the caller's buffer instead of a code point list."""
+    data = SOURCE.encode()
+    stream = ByteInputStream(data)
+    assert not hasattr(stream, "data")
+    assert stream._buf.obj is data
+
+
+def test_lexer_corpus_through_byte_stream():
+    """TyCLexer gives identical tokens over the byte stream."""
+    for source in LEXER_CORPUS:
+        assert lex(source) == lex_stream(make_input_stream(source)), source
+
+
+def test_non_ascii_falls_back():
+    """Non-ASCII sources keep the standard code point stream."""
+    assert isinstance(make_input_stream('"café"'), InputStream)
+    assert isinstance(make_input_stream("int x;"), ByteInputStream)
+
+
+def test_open_source_maps_file(tmp_path):
+    """ASCII files are memory-mapped and parse normally."""
+    path = tmp_path / "prog.tyc"
+    path.write_text(SOURCE)
+    with open_source(str(path)) as stream:
+        assert isinstance(stream, ByteInputStream)
+        assert stream.getText(0, 3) == "void"
+        assert lex_stream(stream) == lex(SOURCE)
+    with parse_file(str(path), stats=ParseStats()) as tree:
+        assert tree.getChildCount() == 2
+
+
+def test_parse_file_closes_the_mapping(tmp_path, monkeypatch):
+    """The file stays mapped inside the with block and is closed after it."""
+    from src.astgen.ast_generation import ASTGeneration
+    from src.frontend import parsing
+
+    path = tmp_path / "prog.tyc"
+    path.write_text(SOURCE)
+    opened = []
+
+    def recording_open_source(path):
+        opened.append(open_source(path))
+        return opened[-1]
+
+    monkeypatch.setattr(parsing, "open_source", recording_open_source)
+    expected = ASTGeneration().visit(parsing.parse(parsing.make_parser(SOURCE)))
+    with parse_file(str(path), stats=ParseStats()) as tree:
+        assert opened[0]._owner is not None
+        assert ASTGeneration().visit(tree) == expected
+    assert opened[0]._owner is None  # the mapping is closed
+    with pytest.raises(ValueError):
+        opened[0].getText(0, 3)
+
+
+def test_open_source_non_ascii_and_empty(tmp_path):
+    """UTF-8 files fall back to InputStream; empty files still work."""
+    path = tmp_path / "utf8.tyc"
+    path.write_bytes('string s = "é";'.encode("utf-8"))
+    stream = open_source(str(path))
+    assert isinstance(stream, InputStream)
+    assert stream.name == str(path)
+    empty = tmp_path / "empty.tyc"
+    empty.write_bytes(b"")
+    assert open_source(str(empty)).LA(1) == Token.EOF
+
+
+def test_scanner_over_byte_stream():
+    """The hand-written scanner accepts the byte stream too."""
+    scanner = TyCScanner(make_input_stream(SOURCE))
+    assert scanner.nextToken().text == "void"
@@ -0,0 +1,105 @@
+"""
+Compact array-backed token stream test cases for TyC compiler
+"""
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.frontend.parsing import make_parser, parse
+from src.frontend.scanner import TyCScanner
+from src.frontend.streams import make_input_stream
+from src.frontend.tokens import CompactTokenStream, TokenView
+from tests.utils import PARSER_CORPUS
+
+
+SOURCE = 'void main() {\n  string s = "hi\\n";\n  printString(s);\n}\n'
+
+
+def token_tuples(tokens):
+    return [
+        (t.type, t.text, t.channel, t.start, t.stop, t.line, t.column, t.tokenIndex)
+        for t in tokens
+    ]
+
+
+def tree_or_error(source, compact):
+    parser = make_parser(source, compact=compact)
+    try:
+        return parse(parser, mode="ll").toStringTree(recog=parser)
+    except Exception as e:
+        return (type(e).__name__, str(e))
+
+
+def test_tokens_match_common_token_stream():
+    """Every token view carries the same fields as the CommonToken."""
+    ours = CompactTokenStream(TyCLexer(make_input_stream(SOURCE)))
+    ref = CommonTokenStream(TyCLexer(InputStream(SOURCE)))
+    ours.fill()
+    ref.fill()
+    assert len(ours) == len(ref.tokens)
+    assert token_tuples(ours.get(i) for i in range(len(ours))) == token_tuples(ref.tokens)
+    assert [str(ours.get(i)) for i in range(len(ours))] == [str(t) for t in ref.tokens]
+    assert ours.getText() == ref.getText()
+
+
+def test_string_text_is_kept_in_side_table():
+    """Only tokens whose text differs from the source slice store a string."""
+    stream = CompactTokenStream(TyCLexer(make_input_stream(SOURCE)))
+    stream.fill()
+    assert list(stream.texts.values()) == ["hi\\n"]
+    assert stream.getSourceText(4, 4) == "{"
+    assert stream.getSourceText(0, 5) == "void main() {\n  string"
+
+
+def test_lookahead_creates_no_views():
+    """LA reads the type column; LT/get build views only on demand."""
+    stream = CompactTokenStream(TyCLexer(make_input_stream(SOURCE)))
+    assert stream.LA(1) == TyCLexer.VOID
+    assert stream.LA(3) == TyCLexer.LPAREN
+    view = stream.LT(2)
+    assert isinstance(view, TokenView)
+    assert (view.text, view.line, view.column) == ("main", 1, 5)
+    assert view == stream.get(1)
+    assert stream.LT(0) is None and stream.LT(-1) is None
+    stream.consume()
+    assert stream.LT(-1).text == "void"
+
+
+@pytest.mark.parametrize("source", PARSER_CORPUS)
+def test_parser_corpus_equivalence(source):
+    """Parse trees and syntax errors are identical to CommonTokenStream."""
+    assert tree_or_error(source, compact=True) == tree_or_error(source, compact=False)
+
+
+def test_two_stage_parse_rewinds_compact_stream():
+    """The SLL-to-LL fallback re-parses from the same compact buffer."""
+    source = "void main() { int x = 1 + ; }"
+    assert tree_or_error(source, compact=True) == tree_or_error(source, compact=False)
+
+
+def test_lexer_errors_surface_while_parsing():
+    """Tokens are fetched lazily, so lexer errors are raised mid-parse."""
+    parser = TyCParser(CompactTokenStream(TyCLexer(make_input_stream('void main() { "abc'))))
+    with pytest.raises(Exception, match="Unclosed String: abc"):
+        parser.program()
+
+
+def test_requires_character_stream():
+    """A scanner fed a plain string has no stream to slice text from."""
+    with pytest.raises(ValueError):
+        CompactTokenStream(TyCScanner("int x;"))
+    stream = CompactTokenStream(TyCScanner(make_input_stream("int x;")))
+    stream.fill()
+    assert stream.texts == {}
+    assert [stream.get(i).text for i in range(len(stream))] == ["int", "x", ";", "<EOF>"]
+
+
+def test_columns_are_smaller_than_token_objects():
+    """Four bytes per field instead of one object per token."""
+    source = "void main() { " + "x = x + 1; " * 2000 + "}"
+    stream = CompactTokenStream(TyCLexer(make_input_stream(source)))
+    stream.fill()
+    assert stream.nbytes() == 24 * len(stream)
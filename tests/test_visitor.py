@@ -0,0 +1,174 @@
+"""
+Visitor dispatch and AST walker test cases for TyC compiler
+"""
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.utils import nodes
+from src.utils.node_schema import NODE_KINDS, VISIT_METHODS
+from src.utils.visitor import ASTWalker, BaseVisitor, DispatchVisitor, children
+from tests.utils import SOURCE, ASTGenerator, positions
+
+
+class Recorder:
+    """Mixin recording the class name of every visited node."""
+
+    def __init__(self):
+        self.seen = []
+
+    def visit(self, node, o=None):
+        self.seen.append(type(node).__name__)
+        return super().visit(node, o)
+
+
+class DoubleDispatch(Recorder, BaseVisitor):
+    pass
+
+
+class TableDispatch(Recorder, DispatchVisitor):
+    pass
+
+
+class Walker(ASTWalker):
+    def __init__(self):
+        self.events = []
+
+    def pre(self, node, parent):
+        self.events.append(("pre", type(node).__name__, type(parent).__name__))
+
+    def post(self, node, parent):
+        self.events.append(("post", type(node).__name__, type(parent).__name__))
+
+
+def test_dispatch_visitor_visits_like_base_visitor():
+    ast = ASTGenerator(SOURCE).generate()
+    base, table = DoubleDispatch(), TableDispatch()
+    base.visit(ast)
+    table.visit(ast)
+    assert table.seen == base.seen
+    assert len(table.seen) == len(positions(ast)) > 50
+
+
+def test_dispatch_table_is_per_class():
+    class Names(DispatchVisitor):
+        def __init__(self):
+            self.names = []
+
+        def visit_identifier(self, node, o=None):
+            self.names.append((node.name, o))
+
+    visitor = Names()
+    visitor.visit(ASTGenerator("void main() { a = b + c(d); }").generate(), "ctx")
+    assert visitor.names == [("a", "ctx"), ("b", "ctx"), ("d", "ctx")]
+    assert Names.dispatch_table()[nodes.Identifier] is Names.visit_identifier
+    assert DispatchVisitor.dispatch_table()[nodes.Identifier] is BaseVisitor.visit_identifier
+    assert set(Names.dispatch_table()) == set(NODE_KINDS)
+
+
+def test_dispatch_visitor_falls_back_to_accept():
+    class Wrapped(nodes.Identifier):
+        __slots__ = ()
+
+    seen = TableDispatch()
+    seen.visit(nodes.ExprStmt(Wrapped("x")))
+    assert seen.seen == ["ExprStmt", "Wrapped"]
+
+
+def test_dispatch_visitor_visits_children_through_visit(monkeypatch):
+    stmt = nodes.ExprStmt(nodes.Identifier("x"))
+    expr = nodes.Identifier("y")
+    for _ in range(50):
+        stmt = nodes.IfStmt(nodes.Identifier("c"), nodes.BreakStmt(), stmt)
+        expr = nodes.BinaryOp(expr, "+", nodes.IntLiteral(1))
+    tree = nodes.BlockStmt([stmt, nodes.ExprStmt(expr)])
+    accepted = []
+    for cls in NODE_KINDS:
+        monkeypatch.setattr(cls, "accept", lambda node, visitor, o=None: accepted.append(node))
+    visitor = TableDispatch()
+    visitor.visit(tree)
+    assert accepted == []  # no double dispatch, at any depth
+    assert len(visitor.seen) == len(positions(tree)) == 1 + 3 * 50 + 2 + 1 + 2 * 50 + 1
+
+
+def test_children_order():
+    (func,) = ASTGenerator("int f(int a, float b) { return a; }").generate().decls
+    assert [type(c).__name__ for c in children(func)] == ["IntType", "Param", "Param", "BlockStmt"]
+    assert children(nodes.VarDecl(None, "x")) == []
+    assert children(nodes.Identifier("x")) == []
+
+
+def test_walker_pre_and_post_order():
+    ast = ASTGenerator("void main() { x = 1; }").generate()
+    walker = Walker()
+    walker.walk(ast)
+    assert walker.events == [
+        ("pre", "Program", "NoneType"),
+        ("pre", "FuncDecl", "Program"),
+        ("pre", "VoidType", "FuncDecl"),
+        ("post", "VoidType", "FuncDecl"),
+        ("pre", "BlockStmt", "FuncDecl"),
+        ("pre", "ExprStmt", "BlockStmt"),
+        ("pre", "AssignExpr", "ExprStmt"),
+        ("pre", "Identifier", "AssignExpr"),
+        ("post", "Identifier", "AssignExpr"),
+        ("pre", "IntLiteral", "AssignExpr"),
+        ("post", "IntLiteral", "AssignExpr"),
+        ("post", "AssignExpr", "ExprStmt"),
+        ("post", "ExprStmt", "BlockStmt"),
+        ("post", "BlockStmt", "FuncDecl"),
+        ("post", "FuncDecl", "Program"),
+        ("post", "Program", "NoneType"),
+    ]
+
+
+def test_walker_matches_visitor_order():
+    ast = ASTGenerator(SOURCE).generate()
+    visitor = DoubleDispatch()
+    visitor.visit(ast)
+    walker = Walker()
+    walker.walk(ast)
+    assert [name for kind, name, _ in walker.events if kind == "pre"] == visitor.seen
+
+
+def test_walker_skips_children():
+    class Statements(ASTWalker):
+        def __init__(self):
+            self.kinds = []
+
+        def pre(self, node, parent):
+            self.kinds.append(type(node).__name__)
+            return not isinstance(node, nodes.Stmt) or isinstance(node, nodes.BlockStmt)
+
+    walker = Statements()
+    walker.walk(ASTGenerator("void main() { x = 1; { return; } }").generate())
+    assert walker.kinds == [
+        "Program", "FuncDecl", "VoidType", "BlockStmt", "ExprStmt", "BlockStmt", "ReturnStmt",
+    ]  # fmt: skip
+
+
+def test_walker_handles_deep_trees():
+    depth = 100_000
+    stmt = nodes.ExprStmt(nodes.Identifier("x"))
+    expr = nodes.Identifier("y")
+    for _ in range(depth):
+        stmt = nodes.IfStmt(nodes.Identifier("c"), nodes.BreakStmt(), stmt)
+        expr = nodes.BinaryOp(expr, "+", nodes.IntLiteral(1))
+
+    class Depth(ASTWalker):
+        depth = max_depth = 0
+
+        def pre(self, node, parent):
+            self.depth += 1
+            self.max_depth = max(self.max_depth, self.depth)
+
+        def post(self, node, parent):
+            self.depth -= 1
+
+    for tree, leaf_depth in ((stmt, 2), (expr, 1)):  # ExprStmt(Identifier) / Identifier
+        walker = Depth()
+        walker.walk(tree)
+        assert walker.depth == 0 and walker.max_depth == depth + leaf_depth
+
+
+def test_schema_names_every_visit_method():
+    for cls in NODE_KINDS:
+        assert callable(getattr(DispatchVisitor, VISIT_METHODS[cls]))
@@ -0,0 +1,135 @@
+"""
+Cross-reference index test cases for TyC compiler
+"""
+
+import pytest
+
+import tests.utils  # noqa: F401  (sets up the build path)
+from src.utils import nodes
+from src.utils.visitor import ASTWalker
+from src.utils.xref import XRef
+from tests.utils import SOURCE, ASTGenerator
+
+
+PROGRAM = """
+struct Point { int x; int y; };
+int square(int v) { return v * v; }
+int norm(Point p) { return square(p.x) + square(p.y); }
+void main() {
+    Point p = {3, 4};
+    int n = norm(p);
+    p.x = n;
+    printInt(square(n) + p.x);
+}
+"""
+
+
+def ast_of(source):
+    program = ASTGenerator(source, cache=False).generate()
+    assert isinstance(program, nodes.Program), program
+    return program
+
+
+class Scan(ASTWalker):
+    """Reference answers by walking the whole tree."""
+
+    def __init__(self):
+        self.parents = {}
+        self.nodes = []
+
+    def pre(self, node, parent):
+        if isinstance(node, nodes.Type):
+            return False
+        self.parents[id(node)] = parent
+        self.nodes.append(node)
+
+
+def scan(program):
+    walker = Scan()
+    walker.walk(program)
+    return walker
+
+
+def of_type(root, cls, **fields):
+    return [
+        n for n in scan(root).nodes
+        if type(n) is cls and all(getattr(n, k) == v for k, v in fields.items())
+    ]  # fmt: skip
+
+
+def check_against_scan(xref):
+    program = xref.program
+    walker = scan(program)
+    for node in walker.nodes:
+        assert node in xref
+        assert xref.parent(node) is walker.parents[id(node)]
+    names = {n.name for n in walker.nodes if type(n) in (nodes.FuncCall, nodes.Identifier)}
+    for name in names:
+        assert {id(c) for c in xref.call_sites(name)} == {
+            id(c) for c in of_type(program, nodes.FuncCall, name=name)
+        }
+        callers = [d for d in program.decls if of_type(d, nodes.FuncCall, name=name)]
+        assert {id(d) for d in xref.callers(name)} == {id(d) for d in callers}
+        for decl in program.decls:
+            assert [id(u) for u in xref.uses(decl, name)] == [
+                id(u) for u in of_type(decl, nodes.Identifier, name=name)
+            ]
+    for member in {n.member for n in walker.nodes if type(n) is nodes.MemberAccess}:
+        assert {id(m) for m in xref.member_refs(member)} == {
+            id(m) for m in of_type(program, nodes.MemberAccess, member=member)
+        }
+
+
+def test_queries():
+    program = ast_of(PROGRAM)
+    xref = XRef(program)
+    point, square, norm, main = program.decls
+    assert xref.function("square") is square and xref.function("Point") is None
+    assert xref.callers("square") == [norm, main]
+    assert len(xref.call_sites("square")) == 3
+    assert sorted(xref.callees(main)) == ["norm", "printInt", "square"]
+    assert xref.callees(point) == {}
+    assert [u.name for u in xref.uses(norm, "p")] == ["p", "p"]
+    assert xref.uses(norm, "n") == []
+    assert len(xref.member_refs("x")) == 3 and xref.member_refs("z") == []
+    call = xref.call_sites("norm")[0]
+    assert isinstance(xref.parent(call), nodes.VarDecl)
+    assert xref.parent(main) is program and xref.parent(program) is None
+    assert xref.parent(square.return_type) is None  # shared type node
+    check_against_scan(xref)
+
+
+def test_matches_full_walk():
+    check_against_scan(XRef(ast_of(SOURCE)))
+
+
+def test_replace_func_decl():
+    program = ast_of(PROGRAM)
+    xref = XRef(program)
+    old_norm = program.decls[2]
+    old_nodes = scan(old_norm).nodes
+    new_norm = ast_of("int norm(Point q) { return q.y + abs(q.x); }").decls[0]
+    xref.replace(old_norm, new_norm)
+    assert program.decls[2] is new_norm
+    assert xref.function("norm") is new_norm
+    assert [d.name for d in xref.callers("square")] == ["main"]
+    assert xref.callers("abs") == [new_norm]
+    assert len(xref.member_refs("y")) == 1
+    assert not any(node in xref for node in old_nodes)
+    check_against_scan(xref)
+
+    renamed = ast_of("int square2(int v) { return v; }").decls[0]
+    xref.replace(program.decls[1], renamed)
+    assert xref.function("square") is None and xref.function("square2") is renamed
+    check_against_scan(xref)
+    with pytest.raises(ValueError):
+        xref.replace(old_norm, new_norm)
+
+
+def test_redeclared_function():
+    program = ast_of("int f() { return 1; }\nint f() { return g(); }")
+    xref = XRef(program)
+    first, second = program.decls
+    assert xref.function("f") in (first, second)
+    xref.replace(first, ast_of("void h() {}").decls[0])
+    assert xref.function("f") is second
@@ -2,7 +2,9 @@
 Utility functions and classes for testing TyC compiler
 """
 
+import ast
 import os
+import random
 import sys
 
 # Add project root and build directory to Python path
@@ -13,39 +15,54 @@ sys.path.insert(0, build_dir)
 
 from build.TyCLexer import TyCLexer
 from build.TyCParser import TyCParser
-from antlr4 import InputStream, CommonTokenStream
+from antlr4 import CommonTokenStream, InputStream
 from src.utils.error_listener import NewErrorListener
+from src.frontend.parsing import parse
+from src.frontend.scanner import TyCScanner
+from src.frontend.streams import make_input_stream
+from src.utils.nodes import ASTNode
 
 
 class ASTGenerator:
-    """Class to generate AST from TyC source code."""
+    """Class to generate AST from TyC source code.
 
-    def __init__(self, input_string: str):
+    With an ASTCache (by default the one named by $TYC_AST_CACHE; pass
+    cache=False for none), generate() serves unchanged sources from the cache.
+    """
+
+    def __init__(self, input_string: str, cache=None):
         self.input_string = input_string
-        self.input_stream = InputStream(input_string)
-        self.lexer = TyCLexer(self.input_stream)
-        self.token_stream = CommonTokenStream(self.lexer)
-        self.parser = TyCParser(self.token_stream)
-        self.parser.removeErrorListeners()
-        self.parser.addErrorListener(NewErrorListener.INSTANCE)
+        if cache is None:
+            from src.astgen.ast_cache import default_cache
+
+            cache = default_cache()
+        self.cache = None if cache is False else cache
+
+    def generate(self):
+        """Generate AST from the input string.
+
+        The lexer and parser are only built when the AST is not served
+        from the cache.
+        """
         # Import here to avoid circular dependency issues during build
         try:
             from src.astgen.ast_generation import ASTGeneration
-
-            self.ast_generator = ASTGeneration()
         except ImportError:
-            self.ast_generator = None
-
-    def generate(self):
-        """Generate AST from the input string."""
-        if self.ast_generator is None:
             return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
+        if self.cache is not None:
+            result = self.cache.generate(self.input_string)
+            return result.ast if result.ok else f"AST Generation Error: {result.diagnostics[0]}"
         try:
+            lexer = TyCLexer(make_input_stream(self.input_string))
+            parser = TyCParser(CommonTokenStream(lexer))
+            parser.removeErrorListeners()
+            parser.addErrorListener(NewErrorListener.INSTANCE)
+
             # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            parse_tree = parse(parser)
 
             # Generate AST using the visitor
-            ast = self.ast_generator.visit(parse_tree)
+            ast = ASTGeneration().visit(parse_tree)
             return ast
         except Exception as e:
             return f"AST Generation Error: {str(e)}"
@@ -59,7 +76,7 @@ class Tokenizer:
 
     def get_tokens_as_string(self) -> str:
         """Get tokens as comma-separated string (only token text)"""
-        input_stream = InputStream(self.source_code)
+        input_stream = make_input_stream(self.source_code)
         lexer = TyCLexer(input_stream)
 
         tokens = []
@@ -89,7 +106,7 @@ class Parser:
 
     def parse(self) -> str:
         """Parse source code and return result"""
-        input_stream = InputStream(self.source_code)
+        input_stream = make_input_stream(self.source_code)
         lexer = TyCLexer(input_stream)
         token_stream = CommonTokenStream(lexer)
         parser = TyCParser(token_stream)
@@ -97,7 +114,111 @@ class Parser:
         parser.addErrorListener(NewErrorListener.INSTANCE)
 
         try:
-            tree = parser.program()
+            tree = parse(parser)
             return "success"
         except Exception as e:
             return str(e)
+
+
+# Corpora and helpers shared by the test modules
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def corpus(filename):
+    """All string constants assigned to `source` in a test module."""
+    with open(os.path.join(TESTS_DIR, filename), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    sources = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == "source" for t in node.targets)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            sources.append(node.value.value)
+    return sources
+
+
+def lex(source, scanner=False):
+    """Token tuples up to EOF, plus the lexical error if one is raised."""
+    lexer = TyCScanner(source) if scanner else TyCLexer(InputStream(source))
+    tokens = []
+    while True:
+        try:
+            t = lexer.nextToken()
+        except Exception as e:
+            return tokens, (type(e).__name__, str(e))
+        tokens.append((t.type, t.text, t.channel, t.start, t.stop, t.line, t.column))
+        if t.type == -1:
+            return tokens, None
+
+
+FUZZ_ALPHABET = (
+    list("abcxyz_019.eE+-*/%=<>!&|(){}[];,:\"\\ \t\r\n\f@#$?~`'^")
+    + ["if", "int", "1.5e-3", "/*", "*/", "//", '\\"', "\\n", "\\q", "é"]
+)
+
+
+def fuzz_cases(count=600, seed=2026):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 40)))
+
+
+LEXER_CORPUS = corpus("test_lexer.py")
+PARSER_CORPUS = corpus("test_parser.py")
+
+
+def ast_gen_corpus():
+    """Sources of test_ast_gen.py: `source` constants and gen() bodies."""
+    sources = corpus("test_ast_gen.py")
+    with open(os.path.join(TESTS_DIR, "test_ast_gen.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "gen"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            sources.append("void main() { " + node.args[0].value + " }")
+    return sources
+
+
+SOURCE = """struct Point { int x; float y; };
+int f(int a, Point p) { return p.x * a + -a; }
+void main() {
+    auto s = "text";
+    Point p = {1, 2.5};
+    for (int i = 0; i < 10; i++) { if (i % 2 == 0) continue; else p.x = f(i, p); }
+    for (; ; ) break;
+    while (!(p.x >= 3)) --p.x;
+    switch (p.x) { case 1: case 2: printInt(1); break; default: return; }
+}"""
+
+
+def fields(node):
+    return [
+        getattr(node, name)
+        for cls in reversed(type(node).__mro__)
+        for name in getattr(cls, "__slots__", ())
+        if name not in ("span", "source", "_hash")
+    ]
+
+
+def positions(root):
+    """(type, (line, column), span) of every node, in a fixed depth-first order."""
+    source = getattr(root, "source", None)  # the LineIndex of a Program
+    result = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, ASTNode):
+            result.append((type(node).__name__, node.position(source), node.span))
+            stack.extend(reversed(fields(node)))
+    return result